@@ -33,8 +33,9 @@ import tarfile
 import time
 import warnings
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from configparser import ConfigParser
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from importlib.metadata import version
 from importlib.resources import files as read_files
 from pathlib import Path
@@ -56,6 +57,7 @@ from autosubmit.database.db_common import (
     create_db, delete_experiment, get_experiment_description, get_autosubmit_version, check_experiment_exists,
     update_experiment_description_version
 )
+from autosubmit.database import session
 from autosubmit.database.db_structure import get_structure
 from autosubmit.experiment.detail_updater import ExperimentDetails
 from autosubmit.experiment.experiment_common import copy_experiment, new_experiment, create_required_folders
@@ -63,15 +65,21 @@ from autosubmit.git.autosubmit_git import AutosubmitGit
 from autosubmit.git.autosubmit_git import check_unpushed_changes, clean_git
 from autosubmit.helpers.processes import process_id
 from autosubmit.helpers.utils import check_jobs_file_exists, get_rc_path, strtobool
+from autosubmit.history.database_backup import backup_database, restore_database, restore_sql_dump
 from autosubmit.history.experiment_history import ExperimentHistory
 from autosubmit.history.experiment_status import ExperimentStatus
 from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status
 from autosubmit.job.job_grouping import JobGrouping
 from autosubmit.job.job_list import JobList
-from autosubmit.job.job_list_persistence import JobListPersistence, JobListPersistenceDb, JobListPersistencePkl
+from autosubmit.job.job_list_persistence import (
+    JobListPersistence, JobListPersistenceDb, JobListPersistenceDbRows, JobListPersistencePkl,
+    JobListPersistencePklLog
+)
 from autosubmit.job.job_package_persistence import JobPackagePersistence
 from autosubmit.job.job_packager import JobPackager
+from autosubmit.job.job_polling import PollingInterval
+from autosubmit.job.job_stats_journal import stats_journal
 from autosubmit.job.job_utils import SubJob, SubJobManager
 from autosubmit.log.log import Log, AutosubmitError, AutosubmitCritical
 from autosubmit.migrate.migrate import Migrate
@@ -162,6 +170,9 @@ class Autosubmit:
 
     exit = False
 
+    _platform_checks: dict[str, Future] = {}
+    """Status checks of the platforms started by ``check_platforms_jobs``, by platform name."""
+
     @staticmethod
     def environ_init():
         """Initialise AS environment. """
@@ -620,6 +631,11 @@ class Autosubmit:
                 help="force restore without confirmation",
             )
 
+            # Stats Journal Migration
+            subparser = subparsers.add_parser(
+                'migratestats', description='moves the TOTAL_STATS and STAT files of the jobs to the stats journal')
+            subparser.add_argument('expid', help='experiment identifier')
+
             # Update Description
             subparser = subparsers.add_parser(
                 'updatedescrip', description="Updates the experiment's description.")
@@ -862,6 +878,8 @@ class Autosubmit:
             return Autosubmit.database_fix(args.expid)
         elif args.command == 'pklfix':
             return Autosubmit.pkl_fix(args.expid, args.force)
+        elif args.command == 'migratestats':
+            return Autosubmit.migrate_stats(args.expid)
         elif args.command == 'updatedescrip':
             return Autosubmit.update_description(args.expid, args.description)
         elif args.command == 'cat-log':
@@ -1204,6 +1222,7 @@ class Autosubmit:
         message_parts.append(f"{structure_db_path}\n")
         message_parts.append(f"{job_data_db_path}.db\n")
         message_parts.append(f"{job_data_db_path}.sql\n")
+        message_parts.append(f"{job_data_db_path}_backup.db\n")
         message = '\n'.join(message_parts)
         return message
 
@@ -1235,6 +1254,9 @@ class Autosubmit:
         except BaseException as e:
             error_message += f"Cannot delete experiment entry: {e}\n"
 
+        # The pooled connections to its databases (write-ahead logs included) are closed first.
+        session.dispose_engines()
+
         Log.info("Removing experiment directory...")
         try:
             shutil.rmtree(experiment_path)
@@ -1245,6 +1267,9 @@ class Autosubmit:
             Log.info("Removing Structure db...")
             try:
                 os.remove(structure_db_path)
+                for sidecar in ("-wal", "-shm"):
+                    with suppress(FileNotFoundError):
+                        os.remove(f"{structure_db_path}{sidecar}")
             except BaseException as e:
                 error_message += f"Cannot delete structure: {e}\n"
 
@@ -1252,10 +1277,10 @@ class Autosubmit:
             try:
                 db_path = job_data_db_path.with_suffix(".db")
                 sql_path = job_data_db_path.with_suffix(".sql")
-                if db_path.exists():
-                    os.remove(db_path)
-                if sql_path.exists():
-                    os.remove(sql_path)
+                backup_path = job_data_db_path.with_name(f"{job_data_db_path.name}_backup.db")
+                for path in (db_path, sql_path, backup_path):
+                    if path.exists():
+                        os.remove(path)
             except BaseException as e:
                 error_message += f"Cannot delete job_data: {e}\n"
 
@@ -1636,6 +1661,7 @@ class Autosubmit:
         as_conf.experiment_data['STARTDATES'] = []
         for date in job_list._date_list:
             as_conf.experiment_data['STARTDATES'].append(date2str(date, job_list.get_date_format()))
+        as_conf.clear_parameters_cache()
 
     @staticmethod
     def inspect(expid: str, lst: str, filter_chunks: str, filter_status: str, filter_section: str, force=False,
@@ -1980,6 +2006,109 @@ class Autosubmit:
                             jobs_to_check[platform_to_test.name] = [[job, job_prev_status]]
         return jobs_to_check, job_changes_tracker
 
+    @staticmethod
+    def check_platforms_jobs(
+            platforms_to_test: list[Platform],
+            jobs_to_check: dict[str, list[list[Job]]],
+            as_conf: AutosubmitConfig
+    ) -> tuple[list[Platform], Optional[BaseException]]:
+        """Check the status of the non-wrapped jobs of all the platforms at the same time.
+
+        Each platform is checked with ``Platform.check_all_jobs`` in its own thread, and
+        the check of a platform may take up to its ``CHECK_JOBS_TIMEOUT`` seconds. A
+        platform that takes longer is skipped in this iteration, and also in the next
+        ones until its check finishes, see ``platforms_without_pending_check``.
+
+        The threads only query the platforms and set the ``new_status`` of the jobs. The
+        caller applies it with ``Job.update_status``, in the main thread, for the platforms
+        returned.
+
+        The errors of a platform do not stop the check of the other ones. The first
+        error is returned, so the caller can raise it after updating the status of the
+        jobs of the platforms that were checked.
+
+        :param platforms_to_test: The active platforms.
+        :param jobs_to_check: The jobs to check and their status, by platform name, see ``check_wrappers``.
+        :param as_conf: The experiment configuration.
+        :return: The platforms whose jobs were checked, and the first error raised by a platform, if any.
+        """
+        checks: dict[Platform, Future] = {}
+        executor = ThreadPoolExecutor(max_workers=max(len(platforms_to_test), 1), thread_name_prefix='platform-check')
+        try:
+            for platform in platforms_to_test:
+                platform_jobs = jobs_to_check.get(platform.name, [])
+                if len(platform_jobs) == 0:
+                    Log.info(f"No jobs to check for platform {platform.name}")
+                    continue
+                previous_check = Autosubmit._platform_checks.get(platform.name)
+                if previous_check is not None and not previous_check.done():
+                    Log.warning(f"The previous check of the jobs of platform {platform.name} has not finished yet, "
+                                "skipping it")
+                    continue
+                Log.info(f"Checking {len(platform_jobs)} jobs for platform {platform.name}")
+                checks[platform] = executor.submit(platform.check_all_jobs, platform_jobs, as_conf)
+                Autosubmit._platform_checks[platform.name] = checks[platform]
+
+            checked_platforms = []
+            first_error: Optional[BaseException] = None
+            start = time.time()
+            for platform, check in checks.items():
+                timeout = float(getattr(platform, 'check_jobs_timeout', 600))
+                try:
+                    check.result(timeout=max(start + timeout - time.time(), 0))
+                    checked_platforms.append(platform)
+                except FutureTimeoutError:
+                    Log.warning(f"Checking the jobs of platform {platform.name} took more than {timeout} seconds, "
+                                "their status will be updated in a later iteration")
+                except BaseException as e:
+                    Log.warning(f"Error checking the jobs of platform {platform.name}: {e}")
+                    first_error = first_error or e
+        finally:
+            # Do not wait for the checks that timed out.
+            executor.shutdown(wait=False)
+        return checked_platforms, first_error
+
+    @staticmethod
+    def platforms_without_pending_check(platforms: list[Platform]) -> list[Platform]:
+        """Leave out the platforms whose jobs are still being checked by ``check_platforms_jobs``.
+
+        A check that timed out goes on in its thread, with the connection of the platform,
+        so the platform is not used until it finishes.
+
+        :param platforms: The active platforms.
+        :return: The platforms that can be used.
+        """
+        available_platforms = []
+        for platform_to_test in platforms:
+            check = Autosubmit._platform_checks.get(platform_to_test.name)
+            if check is not None and not check.done():
+                Log.warning(f"The previous check of the jobs of platform {platform_to_test.name} has not finished "
+                            "yet, it is not used in this iteration")
+                continue
+            available_platforms.append(platform_to_test)
+        return available_platforms
+
+    @staticmethod
+    def get_completed_job_names(platform: Platform, platform_jobs: list[list[Job]]) -> Optional[set[str]]:
+        """Look for the COMPLETED files of all the jobs that a platform check reported as finished.
+
+        The files are looked for with one call to ``Platform.get_completed_job_names``, instead of
+        one call for each job when ``Job.update_status`` checks its completion.
+
+        :param platform: A platform whose jobs were checked.
+        :param platform_jobs: The jobs checked and their previous status, see ``check_wrappers``.
+        :return: The names of the jobs with a COMPLETED file, or ``None`` if the files could not be
+            looked for at once, and each job must look for its own file.
+        """
+        job_names = [job.name for job, _ in platform_jobs if job.new_status in [Status.COMPLETED, Status.UNKNOWN]]
+        if not job_names:
+            return set()
+        try:
+            return set(platform.get_completed_job_names(job_names))
+        except Exception as e:
+            Log.debug(f"Could not look for the COMPLETED files of platform {platform.name} at once: {e}")
+            return None
+
     @staticmethod
     def check_wrapper_stored_status(as_conf: Any, job_list: Any, wrapper_wallclock: str) -> Any:
         """Check if the wrapper job has been submitted and the inner jobs are in the queue after a load.
@@ -2053,17 +2182,20 @@ class Autosubmit:
         return exp_history
 
     @staticmethod
-    def process_historical_data_iteration(job_list, job_changes_tracker, expid):
+    def process_historical_data_iteration(job_list, job_changes_tracker, expid,
+                                          exp_history: Optional[ExperimentHistory] = None):
         """Process the historical data for the current iteration.
 
         :param job_list: a JobList object.
         :param job_changes_tracker: a dictionary with the changes in the job status.
         :param expid: a string with the experiment id.
+        :param exp_history: the ExperimentHistory of the previous iteration, reused if it has a database manager.
         :return: an ExperimentHistory object.
         """
 
-        exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
-                                        historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
+        if exp_history is None or exp_history.manager is None:
+            exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                            historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
         if len(job_changes_tracker) > 0:
             exp_history.process_job_list_changes_to_experiment_totals(job_list.get_job_list())
             Autosubmit.database_backup(expid)
@@ -2362,8 +2494,11 @@ class Autosubmit:
                                                                                       3650)  # (72h - 122h )
                 recovery_retrials = 0
                 Autosubmit.check_logs_status(job_list, as_conf, new_run=True)
+                polling = PollingInterval.from_config(
+                    as_conf, Path(tmp_path, BasicConfig.LOCAL_ASLOG_DIR, 'polling_intervals.csv'))
                 while job_list.get_active():
                     try:
+                        previous_status_changes = job_list.status_change_count()
                         if Autosubmit.exit:
                             Autosubmit.check_logs_status(job_list, as_conf, new_run=False)
                             if job_list.get_failed():
@@ -2383,32 +2518,34 @@ class Autosubmit:
                             raise AutosubmitError("Config files seems to not be accessible", 6040, str(e))
                         total_jobs, safetysleeptime, default_retrials, check_wrapper_jobs_sleeptime = Autosubmit.get_iteration_info(
                             as_conf, job_list)
+                        polling.update_from_config(as_conf)
+                        available_platforms = Autosubmit.platforms_without_pending_check(platforms_to_test)
 
                         # This function name is totally misleading, yes it check the status of the wrappers, but also orders jobs the jobs that  are not wrapped by platform.
                         jobs_to_check, job_changes_tracker = Autosubmit.check_wrappers(as_conf, job_list,
-                                                                                       platforms_to_test, expid)
+                                                                                       available_platforms, expid)
                         # Jobs to check are grouped by platform.
                         # platforms_to_test could be renamed to active_platforms or something like that.
-                        for platform in platforms_to_test:
-                            platform_jobs = jobs_to_check.get(platform.name, [])
-                            if len(platform_jobs) == 0:
-                                Log.info(f"No jobs to check for platform {platform.name}")
-                                continue
-
-                            Log.info(f"Checking {len(platform_jobs)} jobs for platform {platform.name}")
-                            # Check all non-wrapped jobs status for the current platform
-                            platform.check_all_jobs(platform_jobs, as_conf)
+                        checked_platforms, check_error = Autosubmit.check_platforms_jobs(
+                            available_platforms, jobs_to_check, as_conf)
+                        for platform in checked_platforms:
+                            completed_job_names = Autosubmit.get_completed_job_names(
+                                platform, jobs_to_check[platform.name])
                             # mail notification ( in case of changes )
                             for job, job_prev_status in jobs_to_check[platform.name]:
-                                if job_prev_status != job.update_status(as_conf):
+                                if job_prev_status != job.update_status(as_conf,
+                                                                        completed_job_names=completed_job_names):
                                     Autosubmit.job_notify(as_conf, expid, job, job_prev_status, job_changes_tracker)
+                        if check_error is not None:
+                            raise check_error
                         # Updates all workflow status with the new information.
                         job_list.update_list(as_conf, submitter=submitter)
                         job_list.save()
                         # Submit jobs that are ready to run
                         if len(job_list.get_ready()) > 0:
-                            Autosubmit.submit_ready_jobs(as_conf, job_list, platforms_to_test, packages_persistence,
-                                                         hold=False)
+                            Autosubmit.submit_ready_jobs(as_conf, job_list,
+                                                         Autosubmit.platforms_without_pending_check(available_platforms),
+                                                         packages_persistence, hold=False)
                             job_list.update_list(as_conf, submitter=submitter)
                             job_list.save()
                             as_conf.save()
@@ -2416,7 +2553,7 @@ class Autosubmit:
                         # Safe spot to store changes
                         try:
                             exp_history = Autosubmit.process_historical_data_iteration(job_list, job_changes_tracker,
-                                                                                       expid)
+                                                                                       expid, exp_history)
                         except BaseException:
                             Log.printlog("Historic database seems corrupted, AS will repair it and resume the run",
                                          Log.INFO)
@@ -2431,7 +2568,8 @@ class Autosubmit:
                             Autosubmit.check_logs_status(job_list, as_conf, new_run=False)
                             job_list.save()
                             as_conf.save()
-                        time.sleep(safetysleeptime)
+                        changed = previous_status_changes != job_list.status_change_count()
+                        time.sleep(polling.next(job_list, changed))
                     except AutosubmitError as e:  # If an error is detected, restore all connections and job_list
                         Log.error(f"Trace: {e.trace}")
                         Log.error(f"{e.message} [eCode={e.code}]")
@@ -2687,17 +2825,21 @@ class Autosubmit:
             for platform in platforms_to_test:
                 packager = JobPackager(as_conf, platform, job_list)
                 packages_to_submit = packager.build_packages()
-                save_1, failed_packages, error_message, valid_packages_to_submit, any_job_submitted = (
-                    platform.submit_ready_jobs(as_conf, job_list, packages_persistence, packages_to_submit,
-                                               inspect=inspect, only_wrappers=only_wrappers)
-                )
+                # The jobs of these platforms are submitted together by process_batch_ready_jobs.
+                batch_submission = platform.type.lower() in ["slurm", "pjm"] and not inspect and not only_wrappers
+                # So the scripts of all the packages can be uploaded together before that.
+                with platform.upload_batch() if batch_submission else nullcontext():
+                    save_1, failed_packages, error_message, valid_packages_to_submit, any_job_submitted = (
+                        platform.submit_ready_jobs(as_conf, job_list, packages_persistence, packages_to_submit,
+                                                   inspect=inspect, only_wrappers=only_wrappers)
+                    )
                 wrapper_errors.update(packager.wrappers_with_error)
                 # Jobs that are being retrieved in batch. Right now, only available for slurm platforms.
 
                 if not inspect and len(valid_packages_to_submit) > 0:
                     job_list.save()
                 save_2 = False
-                if platform.type.lower() in ["slurm", "pjm"] and not inspect and not only_wrappers:
+                if batch_submission:
                     # Process the script generated in submit_ready_jobs
                     save_2, valid_packages_to_submit = platform.process_batch_ready_jobs(valid_packages_to_submit,
                                                                                          failed_packages,
@@ -2760,7 +2902,7 @@ class Autosubmit:
             # Getting output type from configuration
             output_type = as_conf.get_output_type()
             pkl_dir = os.path.join(BasicConfig.LOCAL_ROOT_DIR, expid, 'pkl')
-            job_list = Autosubmit.load_job_list(expid, as_conf, monitor=True, new=False)
+            job_list = Autosubmit.load_job_list(expid, as_conf, monitor=True, new=False, read_only=True)
             Log.debug(f"Job list restored from {pkl_dir} files")
         except AutosubmitError as e:
             if profile:
@@ -2930,6 +3072,7 @@ class Autosubmit:
         :param hide: hides plot window
         """
         from .monitor.monitor import Monitor
+        from .statistics.retrials import JobRetrials
 
         try:
             Log.info("Loading jobs...")
@@ -2937,19 +3080,24 @@ class Autosubmit:
             as_conf.check_conf_files(False)
 
             pkl_dir = os.path.join(BasicConfig.LOCAL_ROOT_DIR, expid, 'pkl')
-            job_list = Autosubmit.load_job_list(expid, as_conf, new=False)
+            job_list = Autosubmit.load_job_list(expid, as_conf, new=False, read_only=True)
             for job in job_list.get_job_list():
                 job._init_runtime_parameters()
                 job.update_dict_parameters(as_conf)
             Log.debug(f"Job list restored from {pkl_dir} files")
             jobs = StatisticsUtils.filter_by_section(job_list.get_job_list(), filter_type)
-            jobs, period_ini, period_fi = StatisticsUtils.filter_by_time_period(jobs, filter_period)
+            since = datetime.datetime.now() - datetime.timedelta(hours=filter_period) if filter_period else None
+            retrials = JobRetrials.load(expid, since)
+            if retrials is None:
+                Log.debug(f"No job_data database for {expid}, reading the TOTAL_STATS files")
+            jobs, period_ini, period_fi = StatisticsUtils.filter_by_time_period(jobs, filter_period, retrials)
             # Package information
             job_to_package, package_to_jobs, _, _ = JobList.retrieve_packages(BasicConfig, expid, [job.name for job in
                                                                                                    job_list.get_job_list()])
             queue_time_fixes = {}
             if job_to_package:
-                current_table_structure = get_structure(expid, Path(BasicConfig.STRUCTURES_DIR))
+                # Only the wrapped jobs are looked up in the structure.
+                current_table_structure = get_structure(expid, Path(BasicConfig.STRUCTURES_DIR), job_to_package)
                 subjobs = []
                 for job in job_list.get_job_list():
                     job_info = JobList.retrieve_times(job.status, job.name, job._tmp_path, make_exception=True,
@@ -2973,7 +3121,7 @@ class Autosubmit:
                     # noinspection PyTypeChecker
                     report_created = monitor_exp.generate_output_stats(expid, jobs, file_format, hide, section_summary,
                                                                        jobs_summary, period_ini, period_fi,
-                                                                       queue_time_fixes)
+                                                                       queue_time_fixes, retrials)
                     report_message = "Statistics plot ready" if report_created else "No statistics plot produced."
                     Log.result(report_message)
                 except Exception as e:
@@ -3357,7 +3505,7 @@ class Autosubmit:
                 submitter = ParamikoSubmitter(as_conf=as_conf)
                 hpcarch = submitter.platforms[as_conf.get_platform()]
 
-            job_list = Autosubmit.load_job_list(expid, as_conf)
+            job_list = Autosubmit.load_job_list(expid, as_conf, read_only=True)
             for job in job_list.get_job_list():
                 if job.platform_name is None or job.platform_name == "":
                     job.platform_name = hpcarch.name
@@ -4194,15 +4342,39 @@ class Autosubmit:
             raise AutosubmitCritical(e.message, e.code, e.trace)
 
     @staticmethod
-    def database_backup(expid):
+    def migrate_stats(expid: str) -> bool:
+        """Moves the ``TOTAL_STATS`` and ``STAT`` files of the jobs, written by previous versions, to the
+        stats journal of the experiment. Verifies that autosubmit is not running on this experiment.
+
+        :param expid: experiment identifier
+        :type expid: str
+        :return: True if the files were moved
+        :rtype: bool
+        """
+        Autosubmit._check_ownership(expid, raise_error=True)
+        tmp_path = os.path.join(BasicConfig.LOCAL_ROOT_DIR, expid, BasicConfig.LOCAL_TMP_DIR)
+        with Lock(os.path.join(tmp_path, 'autosubmit.lock'), timeout=1):
+            migrated = stats_journal(tmp_path).migrate()
+        Log.result(f"{migrated} statistics files moved to the stats journal of {expid}")
+        return True
+
+    @staticmethod
+    def database_backup(expid: str) -> None:
+        """Backs up the ``job_data`` database of the experiment.
+
+        The backup is skipped if the previous one is younger than the
+        ``[historicdb] backup_interval`` setting, or if the database did not
+        change since then.
+
+        :param expid: experiment identifier
+        """
         if BasicConfig.DATABASE_BACKEND == 'sqlite':
             try:
-                database_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
-                backup_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.sql")
-                command = f"sqlite3 {database_path} .dump > {backup_path} "
+                database_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
+                backup_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}_backup.db")
                 Log.debug("Backing up jobs_data...")
-                subprocess.call(command, shell=True)
-                Log.debug("Jobs_data database backup completed.")
+                if backup_database(database_path, backup_path, BasicConfig.JOBDATA_BACKUP_INTERVAL):
+                    Log.debug("Jobs_data database backup completed.")
             except BaseException:
                 Log.debug("Jobs_data database backup failed.")
         elif BasicConfig.DATABASE_BACKEND == 'postgres':
@@ -4211,35 +4383,41 @@ class Autosubmit:
 
     @staticmethod
     def database_fix(expid: str) -> bool:
-        """Database methods. Performs a sql dump of the database and restores it.
+        """Database methods. Moves the database aside and restores it from its backup.
+
+        The SQL dump written by previous versions is used if there is no backup.
 
         :param expid: experiment identifier
         :type expid: str
-        :return:
-        :rtype:
+        :return: ``True`` if the database was restored, ``False`` if a new blank database was created
+        :rtype: bool
         """
         os.umask(0)  # Overrides user permissions
-        corrupted_db_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}_corrupted.db")
+        corrupted_db_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}_corrupted.db")
 
-        database_path = os.path.join(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
-        dump_file_name = f'job_data_{expid}.sql'
-        dump_file_path = os.path.join(BasicConfig.JOBDATA_DIR, dump_file_name)
-        bash_command = f'cat {dump_file_path} | sqlite3 {database_path}'
+        database_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}.db")
+        backup_path = Path(BasicConfig.JOBDATA_DIR, f"job_data_{expid}_backup.db")
+        dump_file_path = Path(BasicConfig.JOBDATA_DIR, f'job_data_{expid}.sql')
         try:
-            if os.path.exists(database_path):
-                os.popen(f"mv {database_path} {corrupted_db_path}").read()
-                time.sleep(1)
+            if database_path.exists():
+                os.replace(database_path, corrupted_db_path)
                 Log.info("Original database moved.")
             try:
                 exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
                                                 historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
-                Log.info("Restoring from sql")
-                os.popen(bash_command).read()
+                if backup_path.exists():
+                    Log.info("Restoring from backup")
+                    restore_database(backup_path, database_path)
+                else:
+                    Log.info("Restoring from sql")
+                    restore_sql_dump(dump_file_path, database_path)
                 exp_history.initialize_database()
                 return True
 
             except Exception:
                 Log.warning("It was not possible to restore the jobs_data.db file... , a new blank db will be created")
+                with suppress(FileNotFoundError):
+                    database_path.unlink()
 
                 exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
                                                 historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
@@ -5280,9 +5458,10 @@ class Autosubmit:
                 else:
                     selected_members.add(member_json[member].upper())
 
-        matching_jobs = [job for job in matching_jobs if
-                         (not job.date or date2str(job.date).upper() in selected_dates) and
-                         (not job.member or job.member.upper() in selected_members)]
+        matching_jobs = set(job_list.get_jobs_by_coordinates(
+            dates=lambda job_date: not job_date or date2str(job_date).upper() in selected_dates,
+            members=lambda job_member: not job_member or job_member.upper() in selected_members
+        )).intersection(matching_jobs)
 
         # Now, build final list according to the structure in data
         for date_json in data[dates]:
@@ -5297,10 +5476,10 @@ class Autosubmit:
                     selected_members = {member_json[member].upper()}
 
                 selected_chunks = member_json[chunks] if "ANY" != str(member_json[chunks][-1]).upper() else [str(chunks) for chunks in job_list._chunk_list]
-                final_list.extend([job for job in matching_jobs if
-                                   (not job.date or date2str(job.date).upper() in selected_dates) and
-                                   (not job.member or job.member.upper() in selected_members) and
-                                   (not job.chunk or job.synchronize or str(job.chunk) in selected_chunks)])
+                final_list.extend([job for job in job_list.get_jobs_by_coordinates(
+                    dates=lambda job_date: not job_date or date2str(job_date).upper() in selected_dates,
+                    members=lambda job_member: not job_member or job_member.upper() in selected_members)
+                    if job in matching_jobs and (not job.chunk or job.synchronize or str(job.chunk) in selected_chunks)])
         return final_list
 
     @staticmethod
@@ -5432,9 +5611,8 @@ class Autosubmit:
                             final_list.append(job)
                     else:
                         for section in ft:
-                            for job in job_list.get_job_list():
-                                if job.section == section:
-                                    final_list.append(job)
+                            final_list.extend(job_list.get_jobs_by_coordinates(
+                                sections=lambda job_section: job_section == section))
                 # TODO: unify filters in the args. There is already an issue for that
                 if filter_chunks or filter_type_chunk or filter_chunk_section_split:
                     start = time.time()
@@ -5468,8 +5646,9 @@ class Autosubmit:
                         for job in job_list.get_job_list():
                             final_list.append(job)
                     else:
-                        for job in job_list.get_job_list():
-                            if job.name in jobs:
+                        for job_name in jobs:
+                            job = job_list.get_job_by_name(job_name)
+                            if job:
                                 final_list.append(job)
 
                 # Time to change status
@@ -5733,12 +5912,16 @@ class Autosubmit:
         :return: job_list_persistence
         :rtype: JobListPersistence
         """
+        storage_type = as_conf.get_storage_type()
+        if storage_type == 'db_rows':
+            return JobListPersistenceDbRows(expid)
         if BasicConfig.DATABASE_BACKEND != 'sqlite':
             return JobListPersistenceDb(expid)
 
-        storage_type = as_conf.get_storage_type()
         if storage_type == 'pkl':
             return JobListPersistencePkl()
+        elif storage_type == 'pkl_log':
+            return JobListPersistencePklLog()
         elif storage_type == 'db':
             return JobListPersistenceDb(expid)
         raise AutosubmitCritical('Storage type not known', 7014)
@@ -5766,7 +5949,12 @@ class Autosubmit:
 
     # TODO: To be moved to utils
     @staticmethod
-    def load_job_list(expid, as_conf, monitor=False, new=True) -> JobList:
+    def load_job_list(expid, as_conf, monitor=False, new=True, read_only=False) -> JobList:
+        """Loads the job list of an experiment.
+
+        :param read_only: the caller will not save the job list, so it can be loaded without
+            copying the persistence files first
+        """
         rerun = as_conf.get_rerun()
         job_list = JobList(expid, as_conf, YAMLParserFactory(),
                            Autosubmit._get_job_list_persistence(expid, as_conf))
@@ -5789,7 +5977,7 @@ class Autosubmit:
                           as_conf.get_chunk_ini(),
                           as_conf.experiment_data, date_format, as_conf.get_retrials(),
                           as_conf.get_default_job_type(), wrapper_jobs,
-                          new=new, run_only_members=run_only_members, monitor=monitor)
+                          new=new, run_only_members=run_only_members, monitor=monitor, read_only=read_only)
 
         if str(rerun).lower() == "true":
             rerun_jobs = as_conf.get_rerun_jobs()
@@ -5849,6 +6037,31 @@ class Autosubmit:
                 with suppress(KeyboardInterrupt):
                     return proc.wait() == 0
 
+        def view_stats(filename: str, mode: str) -> bool:
+            """Print a ``TOTAL_STATS`` file kept in the stats journal, following its records in tail mode."""
+            journal = stats_journal(tmp_path)
+            content = journal.read(filename)
+            if content is None:
+                Log.info('No logs found.')
+                return True
+            if mode == 'c':
+                print(content)
+                return True
+            sys.stdout.write(content)
+            sys.stdout.flush()
+            with suppress(KeyboardInterrupt):
+                while True:
+                    sleep(1)
+                    new_content = journal.read(filename) or ''
+                    if new_content != content:
+                        # Only appended to, unless it was removed and written again.
+                        sys.stdout.write(new_content[len(content):] if new_content.startswith(content)
+                                         else f'\n{new_content}')
+                        sys.stdout.flush()
+                        content = new_content
+            print()
+            return True
+
         MODES = {
             'c': 'cat',
             't': 'tail'
@@ -5915,7 +6128,8 @@ class Autosubmit:
             if file == 'j':
                 workflow_log_file = job_logs_path / f'{exp_or_job_id}.cmd'
             elif file == 's':
-                workflow_log_file = job_logs_path / f'{exp_or_job_id}_TOTAL_STATS'
+                # Written by the jobs to the stats journal, after the file of previous versions in tmp/, if any.
+                return view_stats(f'{exp_or_job_id}_TOTAL_STATS', mode)
             else:
                 search_pattern = f'{exp_or_job_id}.*.{"err" if file == "e" else "out"}'
                 workflow_log_files = sorted(job_logs_path.glob(search_pattern))
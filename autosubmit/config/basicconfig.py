@@ -46,6 +46,7 @@ class BasicConfig:
     DEFAULT_OUTPUT_DIR = os.path.join('/esarchive', 'autosubmit', 'as_output', 'stats')
     JOBDATA_DIR = os.path.join(
         '/esarchive', 'autosubmit', 'as_metadata', 'data')
+    JOBDATA_BACKUP_INTERVAL = 300
     HISTORICAL_LOG_DIR = os.path.join('/esarchive', 'autosubmit', 'as_metadata', 'logs')
     AUTOSUBMIT_API_URL = "http://192.168.11.91:8081"
     DB_FILE = 'autosubmit.db'
@@ -65,6 +66,7 @@ class BasicConfig:
     CONFIG_FILE_FOUND = False
     DATABASE_BACKEND = "sqlite"
     DATABASE_CONN_URL = ""
+    DATABASE_SQLITE_JOURNAL_MODE = "wal"
 
     @staticmethod
     def expid_dir(exp_id):
@@ -118,6 +120,8 @@ class BasicConfig:
             BasicConfig.DATABASE_BACKEND = parser.get('database', 'backend')
         if parser.has_option('database', 'connection_url'):
             BasicConfig.DATABASE_CONN_URL = parser.get('database', 'connection_url')
+        if parser.has_option('database', 'sqlite_journal_mode'):
+            BasicConfig.DATABASE_SQLITE_JOURNAL_MODE = parser.get('database', 'sqlite_journal_mode')
         if parser.has_option('local', 'path'):
             BasicConfig.LOCAL_ROOT_DIR = parser.get('local', 'path')
         if parser.has_option('conf', 'platforms'):
@@ -184,6 +188,8 @@ class BasicConfig:
             BasicConfig.DEFAULT_OUTPUT_DIR = parser.get('defaultstats', 'path')
         if parser.has_option('historicdb', 'path'):
             BasicConfig.JOBDATA_DIR = parser.get('historicdb', 'path')
+        if parser.has_option('historicdb', 'backup_interval'):
+            BasicConfig.JOBDATA_BACKUP_INTERVAL = int(parser.get('historicdb', 'backup_interval'))
         if parser.has_option('historiclog', 'path'):
             BasicConfig.HISTORICAL_LOG_DIR = parser.get('historiclog', 'path')
         if parser.has_option('autosubmitapi', 'url'):
@@ -40,6 +40,12 @@ from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.config.yamlparser import YAMLParserFactory
 from autosubmit.log.log import Log, AutosubmitCritical, AutosubmitError
 
+_DYNAMIC_VARIABLE = re.compile('%[a-zA-Z0-9_.-]*%', flags=re.IGNORECASE)
+"""Pattern of the placeholders, a string starting with % and ending with %."""
+
+_SPECIAL_DYNAMIC_VARIABLE = re.compile(r'%\^[a-zA-Z0-9_.-]*%', flags=re.IGNORECASE)
+"""Pattern of the placeholders substituted after all the files are loaded, starting with %^."""
+
 
 class AutosubmitConfig(object):
     """Class to handle experiment configuration coming from file or database.
@@ -83,6 +89,12 @@ class AutosubmitConfig(object):
         self._exp_parser_file = None
         self._conf_parser_file = None
         self.hpcarch = None
+        # The flat parameters of ``load_parameters``, exported once for each loaded experiment data.
+        self._parameters: Optional[dict[str, Any]] = None
+        # The top-level items of the experiment data when they were exported.
+        self._parameters_source: Optional[dict[str, Any]] = None
+        # The flat parameters whose value has placeholders, and if they are special (``%^``) ones.
+        self._parameters_placeholders: dict[str, bool] = {}
 
     @property
     def jobs_data(self) -> dict[str, Any]:
@@ -1338,6 +1350,7 @@ class AutosubmitConfig(object):
                 else:
                     mails = mails.split(' ')
                 self.experiment_data["MAIL"]["TO"] = mails
+                self.clear_parameters_cache()
 
                 for mail in self.experiment_data["MAIL"]["TO"]:
                     if not self.is_valid_mail_address(mail):
@@ -1857,6 +1870,7 @@ class AutosubmitConfig(object):
 
             self.load_workflow_commit()
             self.dynamic_variables = {}
+            self.clear_parameters_cache()
 
     def _add_autosubmit_dict(self) -> None:
         """Add the AUTOSUBMIT namespace to the experiment data."""
@@ -2047,12 +2061,98 @@ class AutosubmitConfig(object):
 
         return parameters_dict
 
+    @property
+    def experiment_data(self) -> dict[str, Any]:
+        """The loaded experiment data, replacing it exports the parameters again."""
+        return self._experiment_data
+
+    @experiment_data.setter
+    def experiment_data(self, experiment_data: dict[str, Any]) -> None:
+        self._experiment_data = experiment_data
+        self.clear_parameters_cache()
+
     def load_parameters(self):
         """Load all experiment data
+
+        The experiment data is exported once, and each call returns a copy of it, until the
+        experiment data, or one of its top-level values, is replaced or :meth:`clear_parameters_cache`
+        is called.
+
         :return: a dictionary containing tuples [parameter_name, parameter_value]
         :rtype: dict
         """
-        return self.deep_parameters_export(self.experiment_data, self.default_parameters)
+        return dict(self._cached_parameters())
+
+    def clear_parameters_cache(self) -> None:
+        """Export the experiment data again in the next :meth:`load_parameters`.
+
+        Needed after modifying the nested values of ``experiment_data`` in place, as the parameters
+        are exported again without it only when ``experiment_data`` or one of its top-level values
+        is replaced, or a top-level key is added or removed.
+        """
+        self._parameters = None
+        self._parameters_source = None
+        self._parameters_placeholders = {}
+
+    def _cached_parameters(self) -> dict[str, Any]:
+        if self._parameters is None or self._parameters_outdated():
+            parameters = self.deep_parameters_export(self.experiment_data, self.default_parameters)
+            placeholders = {}
+            for key, val in parameters.items():
+                special = self._has_placeholders(val)
+                if special is not None:
+                    placeholders[key] = special
+            self._parameters = parameters
+            self._parameters_source = dict(self.experiment_data)
+            self._parameters_placeholders = placeholders
+        return self._parameters
+
+    def _parameters_outdated(self) -> bool:
+        """Tell whether a top-level key of the experiment data was added, removed or given another value."""
+        source, data = self._parameters_source, self.experiment_data
+        if len(source) != len(data):
+            return True
+        return any(key not in data or data[key] is not val for key, val in source.items())
+
+    @staticmethod
+    def _has_placeholders(val: Any) -> Optional[bool]:
+        """Tell whether a value has placeholders, as searched by :meth:`deep_read_loops`.
+
+        :return: ``False`` for placeholders, ``True`` for special ones only, ``None`` if it has none.
+        """
+        if isinstance(val, collections.abc.Mapping):
+            return None
+        text = str(val)
+        if _DYNAMIC_VARIABLE.search(text) is not None:
+            return False
+        if _SPECIAL_DYNAMIC_VARIABLE.search(text) is not None:
+            return True
+        return None
+
+    def read_parameters_placeholders(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Same as :meth:`deep_read_loops`, for the flat parameters returned by :meth:`load_parameters`.
+
+        The values that are still the ones exported from the experiment data are not searched
+        again, the placeholders found when they were exported are used instead.
+
+        :param parameters: The flat parameters, they may have other values than the exported ones.
+        :return: The same parameters.
+        """
+        exported = self._cached_parameters()
+        placeholders = self._parameters_placeholders
+        for key, val in parameters.items():
+            if key in exported and exported[key] is val:
+                special = placeholders.get(key)
+            elif isinstance(val, collections.abc.Mapping) or key == "FOR":
+                self.deep_read_loops({key: val})
+                continue
+            else:
+                special = self._has_placeholders(val)
+            if special is False:
+                self.dynamic_variables[key] = val
+            elif special:
+                self.special_dynamic_variables[key] = val
+        return parameters
 
     def load_platform_parameters(self):
         """Load parameters from platform config files.
@@ -2510,6 +2610,22 @@ class AutosubmitConfig(object):
         """
         return int(self.get_section(['CONFIG', 'SAFETYSLEEPTIME'], 10))
 
+    def get_min_safetysleeptime(self, default: int) -> int:
+        """Returns the shortest interval between two iterations of the run loop.
+
+        :param default: Value to return if ``CONFIG.MIN_SAFETYSLEEPTIME`` is not set.
+        :return: The interval, in seconds.
+        """
+        return int(self.get_section(['CONFIG', 'MIN_SAFETYSLEEPTIME'], default))
+
+    def get_max_safetysleeptime(self, default: int) -> int:
+        """Returns the longest interval between two iterations of the run loop.
+
+        :param default: Value to return if ``CONFIG.MAX_SAFETYSLEEPTIME`` is not set.
+        :return: The interval, in seconds.
+        """
+        return int(self.get_section(['CONFIG', 'MAX_SAFETYSLEEPTIME'], default))
+
     def get_retrials(self):
         """Returns max number of retrials for job from autosubmit's config file.
 
@@ -2758,7 +2874,7 @@ class AutosubmitConfig(object):
 
     def is_valid_storage_type(self) -> bool:
         storage_type = self.get_storage_type()
-        return storage_type in ['pkl', 'db']
+        return storage_type in ['pkl', 'pkl_log', 'db', 'db_rows']
 
     def is_valid_jobs_in_wrapper(self, wrapper=None) -> bool:
         if wrapper is None:
@@ -17,14 +17,25 @@
 
 """Contains code to manage a database via SQLAlchemy."""
 
-from typing import Any, Optional, cast
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, cast
 
-from sqlalchemy import Engine, delete, func, insert, select
-from sqlalchemy.schema import CreateTable, CreateSchema, DropTable
+from sqlalchemy import Engine, and_, bindparam, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import DropTable
 
 from autosubmit.database import session
 from autosubmit.database.tables import get_table_from_name
 
+BATCH_SIZE = 10000
+"""Rows sent to the database by each ``executemany``, or fetched at once when streaming a table."""
+
+
+def _batches(rows: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
 
 class DbManager:
     """A database manager using SQLAlchemy.
@@ -38,18 +49,16 @@ class DbManager:
         self.schema = schema
 
     def create_table(self, table_name: str) -> None:
+        """Create a table, unless this process already did it."""
         table = get_table_from_name(schema=self.schema, table_name=table_name)
-        with self.engine.connect() as conn:
-            if self.schema:
-                conn.execute(CreateSchema(self.schema, if_not_exists=True))
-            conn.execute(CreateTable(table, if_not_exists=True))
-            conn.commit()
+        session.create_tables(self.engine, [table], self.schema)
 
     def drop_table(self, table_name: str) -> None:
         table = get_table_from_name(schema=self.schema, table_name=table_name)
         with self.engine.connect() as conn:
             conn.execute(DropTable(table, if_exists=True))
             conn.commit()
+        session.forget_tables(self.engine, [table])
 
     def insert(self, table_name: str, data: dict[str, Any]) -> None:
         if not data:
@@ -68,6 +77,80 @@ class DbManager:
             conn.commit()
         return cast(int, result.rowcount)
 
+    def upsert_many(self, table_name: str, data: list[dict[str, Any]], key_columns: list[str],
+                    deleted_keys: Optional[list[dict[str, Any]]] = None) -> int:
+        """Insert or update rows, and delete other rows, in a single transaction.
+
+        The rows of ``data`` whose ``key_columns`` already exist in the table are
+        updated, and the others are inserted. Both statements are executed with
+        ``executemany``.
+
+        :param table_name: The name of the table.
+        :param data: The rows to insert or update.
+        :param key_columns: The columns of the primary key (or of a unique constraint).
+        :param deleted_keys: The values of ``key_columns`` of the rows to delete.
+        :return: The number of rows inserted or updated.
+        """
+        if not data and not deleted_keys:
+            return 0
+        table = get_table_from_name(schema=self.schema, table_name=table_name)
+        dialect_insert = postgresql.insert if self.engine.dialect.name == 'postgresql' else sqlite.insert
+        query = dialect_insert(table)
+        query = query.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column.name: query.excluded[column.name] for column in table.columns
+                  if column.name not in key_columns}
+        )
+        with self.engine.begin() as conn:
+            if deleted_keys:
+                conn.execute(
+                    delete(table).where(and_(*(table.c[key] == bindparam(f'key_{key}') for key in key_columns))),
+                    [{f'key_{key}': row[key] for key in key_columns} for row in deleted_keys]
+                )
+            if data:
+                conn.execute(query, data)
+        return len(data)
+
+    def insert_and_delete_many(self, table_name: str, inserted: Iterable[dict[str, Any]],
+                               deleted: Iterable[dict[str, Any]], batch_size: int = BATCH_SIZE) -> tuple[int, int]:
+        """Delete rows and insert others in a single transaction, in batches of ``executemany``.
+
+        :param table_name: The name of the table.
+        :param inserted: The rows to insert.
+        :param deleted: The rows to delete, with the values of the columns they are matched by.
+        :param batch_size: The rows sent by each ``executemany``.
+        :return: The number of rows inserted and deleted.
+        """
+        table = get_table_from_name(schema=self.schema, table_name=table_name)
+        inserted_count = deleted_count = 0
+        with self.engine.begin() as conn:
+            for batch in _batches(deleted, batch_size):
+                query = delete(table).where(and_(*(table.c[key] == bindparam(f'key_{key}') for key in batch[0])))
+                conn.execute(query, [{f'key_{key}': value for key, value in row.items()} for row in batch])
+                deleted_count += len(batch)
+            for batch in _batches(inserted, batch_size):
+                conn.execute(insert(table), batch)
+                inserted_count += len(batch)
+        return inserted_count, deleted_count
+
+    def select_where(self, table_name: str, where: Optional[dict[str, Any]],
+                     columns: Optional[list[str]] = None) -> list[Any]:
+        """Select the rows that match all the ``where`` values.
+
+        :param table_name: The name of the table.
+        :param where: Column values the rows must have.
+        :param columns: The columns to select, all of them by default.
+        :return: The selected rows, as tuples.
+        """
+        table = get_table_from_name(schema=self.schema, table_name=table_name)
+        query = select(*(table.c[column] for column in columns)) if columns else select(table)
+        if where:
+            for key, value in where.items():
+                query = query.where(table.c[key] == value)
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+        return [tuple(row) for row in rows]
+
     def select_first_where(self, table_name: str, where: Optional[dict[str, str]]) -> Optional[Any]:
         table = get_table_from_name(schema=self.schema, table_name=table_name)
         query = select(table)
@@ -76,13 +159,28 @@ class DbManager:
                 query = query.where(getattr(table.c, key) == value)
         with self.engine.connect() as conn:
             row = conn.execute(query).first()
-        return row.tuple() if row else None
+        return tuple(row) if row else None
 
     def select_all(self, table_name: str) -> list[Any]:
         table = get_table_from_name(schema=self.schema, table_name=table_name)
         with self.engine.connect() as conn:
             rows = conn.execute(select(table)).all()
-        return [row.tuple() for row in rows]
+        return [tuple(row) for row in rows]
+
+    def select_all_iter(self, table_name: str, batch_size: int = BATCH_SIZE) -> Iterator[tuple]:
+        """Stream the rows of a table, fetched in batches instead of all at once.
+
+        The connection is kept until the iteration ends.
+
+        :param table_name: The name of the table.
+        :param batch_size: The rows fetched at once.
+        :return: The rows, as tuples.
+        """
+        table = get_table_from_name(schema=self.schema, table_name=table_name)
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(select(table))
+            for rows in result.partitions():
+                yield from map(tuple, rows)
 
     def count(self, table_name: str) -> int:
         table = get_table_from_name(schema=self.schema, table_name=table_name)
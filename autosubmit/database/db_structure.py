@@ -22,7 +22,7 @@ It uses the ``db_manager`` code to manage the database.
 """
 import traceback
 from pathlib import Path
-from typing import Optional
+from typing import Container, Iterator, Optional
 
 from networkx import DiGraph
 
@@ -48,7 +48,27 @@ def _get_db_manager(expid: str, sqlite_db_file: Optional[Path]) -> DbManager:
     return DbManager(connection_url=connection_url, schema=_schema)
 
 
-def get_structure(expid: str, structures_path: Path) -> Optional[dict[str, list[str]]]:
+def iter_structure(expid: str, structures_path: Path) -> Iterator[tuple[str, str]]:
+    """Stream the edges of the structure of the experiment identified by the given ``expid``.
+
+    The independent jobs are stored as an edge from the job to itself.
+
+    If the database used is SQLite, the structure database file will be created.
+    However, if the SQLIte database file parent directory does not exist, it will
+    raise an error instead.
+
+    :param expid: The experiment identifier.
+    :param structures_path: The path to the database structure file (only used for SQLite).
+    :return: The edges (from, to), read from the database as they are iterated.
+    """
+    _check_structures_path(structures_path)
+    db_manager = _get_db_manager(expid, None if not structures_path else structures_path / f"structure_{expid}.db")
+    db_manager.create_table(ExperimentStructureTable.name)
+    yield from db_manager.select_all_iter(ExperimentStructureTable.name)
+
+
+def get_structure(expid: str, structures_path: Path,
+                  jobs: Optional[Container[str]] = None) -> Optional[dict[str, list[str]]]:
     """Return the current structure for the experiment identified by the given ``expid``.
 
     If the database used is SQLite, the structure database file will be created.
@@ -60,22 +80,17 @@ def get_structure(expid: str, structures_path: Path) -> Optional[dict[str, list[
 
     :param expid: The experiment identifier.
     :param structures_path: The path to the database structure file (only used for SQLite).
+    :param jobs: If given, only these jobs are kept in the structure, with all their children.
     :return: The experiment graph structure (from=>to) or ``None`` if there is no
         structure persisted in the database.
     """
     try:
-        _check_structures_path(structures_path)
-        db_manager = _get_db_manager(expid, None if not structures_path else structures_path / f"structure_{expid}.db")
-
-        db_manager.create_table(ExperimentStructureTable.name)
-
-        current_structure = db_manager.select_all('experiment_structure')
-
         current_table_structure = {}
-        for item in current_structure:
-            _from, _to = item
-            current_table_structure.setdefault(_from, []).append(_to)
-            current_table_structure.setdefault(_to, [])
+        for _from, _to in iter_structure(expid, structures_path):
+            if jobs is None or _from in jobs:
+                current_table_structure.setdefault(_from, []).append(_to)
+            if jobs is None or _to in jobs:
+                current_table_structure.setdefault(_to, [])
 
         return current_table_structure
     except Exception as exp:
@@ -84,24 +99,30 @@ def get_structure(expid: str, structures_path: Path) -> Optional[dict[str, list[
     return None
 
 
+def _graph_edges(graph: DiGraph) -> set[tuple[str, str]]:
+    """The edges of the graph, and an edge from each independent node to itself."""
+    data = set(graph.edges())
+    data.update((u, u) for u, degree in graph.degree() if degree == 0)
+    return data
+
+
 def save_structure(graph: DiGraph, expid: str, structures_path: Optional[Path]):
-    """Save the experiment structure into the database."""
+    """Save the experiment structure into the database.
+
+    Only the edges added to or removed from the stored structure are written,
+    in a single transaction.
+    """
     _check_structures_path(structures_path)
     db_manager = _get_db_manager(expid, structures_path / f"structure_{expid}.db")
 
     # Create table if it doesn't exist
     db_manager.create_table(ExperimentStructureTable.name)
 
-    # Delete all rows in the table
-    db_manager.delete_all(ExperimentStructureTable.name)
-
-    # Save structure
-    nodes_edges = {u for u, v in graph.edges()}
-    nodes_edges.update({v for u, v in graph.edges()})
-    independent_nodes = {
-        u for u in graph.nodes() if u not in nodes_edges}
-    data = {(u, v) for u, v in graph.edges()}
-    data.update({(u, u) for u in independent_nodes})
-    # save
-    edges = [{"e_from": e[0], "e_to": e[1]} for e in data]
-    db_manager.insert_many(ExperimentStructureTable.name, edges)
+    data = _graph_edges(graph)
+    stored = set(db_manager.select_all_iter(ExperimentStructureTable.name))
+    inserted, deleted = db_manager.insert_and_delete_many(
+        ExperimentStructureTable.name,
+        ({"e_from": u, "e_to": v} for u, v in data - stored),
+        ({"e_from": u, "e_to": v} for u, v in stored - data)
+    )
+    Log.debug(f"Structure of {expid} saved: {inserted} edges added and {deleted} removed")
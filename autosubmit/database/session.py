@@ -15,20 +15,187 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
-from sqlalchemy import Engine, NullPool, create_engine as sqlalchemy_create_engine
+"""SQLAlchemy engines of the Autosubmit databases.
+
+The engines are kept for the whole life of the process, one for each connection
+URL, so that the databases opened again and again (job packages, structures,
+user metrics, ...) do not pay for a new engine and a new connection each time,
+and their tables are only created once (see :func:`create_tables`).
+
+The SQLite connections stay open in the pool of their engine. A connection is
+replaced when its database file was deleted or replaced, by ``autosubmit delete``
+for instance. Those databases use the journal mode of ``[database]
+sqlite_journal_mode`` (``WAL`` by default), except the main database, which is
+shared by all the users and is left as it is. Postgres engines have a bounded pool.
+"""
+
+import os
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, NullPool, Table, create_engine as sqlalchemy_create_engine, event, exc, make_url
+from sqlalchemy.schema import CreateSchema, CreateTable
+
+from autosubmit.config.basicconfig import BasicConfig
+
+SQLITE_BUSY_TIMEOUT = 30000
+"""Milliseconds a SQLite connection waits for the lock of another one."""
+
+POSTGRES_POOL_SIZE = 5
+"""Connections kept open in the pool of a Postgres engine."""
+
+POSTGRES_MAX_OVERFLOW = 10
+"""Connections opened above the pool size when all of them are in use."""
+
+_engines: dict[str, Engine] = {}
+_engines_pid = os.getpid()
+_created_tables: 'WeakKeyDictionary[Engine, set[tuple[Optional[str], str]]]' = WeakKeyDictionary()
+_sqlite_files: 'WeakKeyDictionary[Engine, tuple[str, Optional[tuple[int, int]]]]' = WeakKeyDictionary()
+"""The database file of the SQLite engines, and the file their tables were created in."""
+_lock = threading.RLock()
+
+
+def _sqlite_database(connection_url: str) -> Optional[str]:
+    """The database file of a SQLite URL, ``''`` for an in-memory database, ``None`` for other backends."""
+    url = make_url(connection_url)
+    if url.get_backend_name() != 'sqlite':
+        return None
+    if not url.database or url.database == ':memory:':
+        return ''
+    return url.database
+
+
+def _file_id(database: str) -> Optional[tuple[int, int]]:
+    """Identify a database file, to notice when it is replaced by another one."""
+    try:
+        stat = os.stat(database)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _create_sqlite_engine(connection_url: str, database: str) -> Engine:
+    engine = sqlalchemy_create_engine(connection_url)
+    journal_mode = BasicConfig.DATABASE_SQLITE_JOURNAL_MODE if BasicConfig.DATABASE_SQLITE_JOURNAL_MODE.isalpha() else ''
+    with suppress(OSError):
+        if Path(database).resolve() == Path(BasicConfig.DB_PATH).resolve():
+            journal_mode = ''
+
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f'PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT}')
+            if journal_mode:
+                # It needs a moment alone with the database, the connection is still usable without it.
+                with suppress(Exception):
+                    cursor.execute(f'PRAGMA journal_mode = {journal_mode}')
+                if journal_mode.lower() == 'wal':
+                    cursor.execute('PRAGMA synchronous = NORMAL')
+        finally:
+            cursor.close()
+        connection_record.info['file_id'] = _file_id(database)
+
+    @event.listens_for(engine, 'checkout')
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info.get('file_id') != _file_id(database):
+            # The pool opens a new connection instead.
+            raise exc.DisconnectionError(f'The database {database} was replaced')
+
+    _sqlite_files[engine] = (database, None)
+    return engine
+
+
+def _forget_inherited_engines() -> None:
+    """Drop the engines of the parent process, a forked child cannot use their connections."""
+    global _engines_pid
+    if _engines_pid != os.getpid():
+        for engine in _engines.values():
+            engine.dispose(close=False)
+        _engines.clear()
+        _created_tables.clear()
+        _engines_pid = os.getpid()
 
 
 def create_engine(connection_url: str) -> Engine:
-    """Create SQLAlchemy Core engine.
+    """Return the SQLAlchemy Core engine of a connection URL, shared by the whole process.
+
+    The in-memory SQLite databases get a new engine each time, as before.
 
     :param connection_url: A SQLAlchemy connection URL.
     """
     if not connection_url:
         raise ValueError(f'Invalid SQLAlchemy connection URL: {connection_url}')
 
-    is_sqlite = connection_url.startswith("sqlite")
-    pool_class = NullPool if is_sqlite else None
-    return sqlalchemy_create_engine(connection_url, poolclass=pool_class)
+    database = _sqlite_database(connection_url)
+    if database == '':
+        return sqlalchemy_create_engine(connection_url, poolclass=NullPool)
+    with _lock:
+        _forget_inherited_engines()
+        engine = _engines.get(connection_url)
+        if engine is None:
+            if database is None:
+                engine = sqlalchemy_create_engine(connection_url, pool_size=POSTGRES_POOL_SIZE,
+                                                  max_overflow=POSTGRES_MAX_OVERFLOW, pool_pre_ping=True)
+            else:
+                engine = _create_sqlite_engine(connection_url, database)
+            _engines[connection_url] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """Close the connections of all the engines, before deleting their databases for instance."""
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _created_tables.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def create_tables(engine: Engine, tables: Iterable[Table], schema: Optional[str] = None) -> None:
+    """Create the tables, and their schema, that were not created yet with an engine by this process.
+
+    :param engine: The engine of the database.
+    :param tables: The tables.
+    :param schema: The schema of the tables, if any.
+    """
+    with _lock:
+        sqlite_file = _sqlite_files.get(engine)
+        if sqlite_file is not None and sqlite_file[1] != _file_id(sqlite_file[0]):
+            # A new database file, without the tables created in the previous one.
+            _created_tables.pop(engine, None)
+        created = _created_tables.setdefault(engine, set())
+        missing = [table for table in tables if (table.schema, table.name) not in created]
+    if not missing:
+        return
+    with engine.connect() as conn:
+        if schema:
+            conn.execute(CreateSchema(schema, if_not_exists=True))
+        for table in missing:
+            conn.execute(CreateTable(table, if_not_exists=True))
+        conn.commit()
+    with _lock:
+        if sqlite_file is not None:
+            _sqlite_files[engine] = (sqlite_file[0], _file_id(sqlite_file[0]))
+        _created_tables.setdefault(engine, set()).update((table.schema, table.name) for table in missing)
+
+
+def forget_tables(engine: Engine, tables: Optional[Iterable[Table]] = None) -> None:
+    """Forget that the tables were created, after dropping them.
+
+    :param engine: The engine of the database.
+    :param tables: The dropped tables, all of them if not given.
+    """
+    with _lock:
+        if tables is None:
+            _created_tables.pop(engine, None)
+        else:
+            created = _created_tables.get(engine, set())
+            created.difference_update((table.schema, table.name) for table in tables)
 
 
-__all__ = ["create_engine"]
+__all__ = ["create_engine", "create_tables", "dispose_engines", "forget_tables"]
@@ -185,6 +185,30 @@ JobPklTable = Table(
     Column("modified", String),
 )
 
+JobStateTable = Table(
+    "job_state",
+    metadata_obj,
+    Column("expid", String, primary_key=True),
+    Column("name", String, primary_key=True),
+    Column("id", Integer),
+    Column("status", Integer),
+    Column("fail_count", Integer),
+    Column("platform", String),
+    Column("section", String),
+    Column("date", String),
+    Column("member", String),
+    Column("chunk", Integer),
+    Column("split", Integer),
+    Column("packed", Integer),
+    Column("submit_time", String),
+    Column("start_time", String),
+    Column("finish_time", String),
+    Column("modified", String),
+    Column("state", LargeBinary),
+)
+"""One row per job of the job list, used by the ``db_rows`` storage type. ``state`` is
+the pickled job, the other columns can be queried without unpickling it."""
+
 DetailsTable = Table(
     "details",
     metadata_obj,
@@ -218,6 +242,7 @@ TABLES = (
     JobListTable,
     WrapperJobPackageTable,
     JobPklTable,
+    JobStateTable,
     DetailsTable,
     UserMetricsTable,
 )
@@ -0,0 +1,105 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Backup and restore of the SQLite ``job_data_<EXPID>.db`` databases.
+
+The backup is a copy of the database made with the SQLite online backup
+API, instead of a ``sqlite3 .dump`` of the whole database as SQL text. The
+pages are copied in steps, so other connections can keep using the
+database meanwhile, and the copy is skipped when the previous backup is
+recent enough, or when the database did not change since then.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+BACKUP_PAGES = 1024
+"""Number of pages copied in each step of the backup."""
+
+
+def _last_modification(database_path: Path) -> float:
+    """Return the last modification time of the database, including its WAL file."""
+    mtimes = [database_path.stat().st_mtime]
+    wal_path = database_path.with_name(f'{database_path.name}-wal')
+    if wal_path.exists():
+        mtimes.append(wal_path.stat().st_mtime)
+    return max(mtimes)
+
+
+def backup_database(database_path: Path, backup_path: Path, min_interval: float = 0,
+                    pages: int = BACKUP_PAGES) -> bool:
+    """Copy a SQLite database into ``backup_path``.
+
+    The copy is written to a temporary file, and then moved over the previous
+    backup, so the backup is never left half-written.
+
+    :param database_path: Path of the database.
+    :param backup_path: Path of the backup.
+    :param min_interval: Minimum time, in seconds, since the previous backup.
+    :param pages: Number of pages copied in each step.
+    :return: ``True`` if a backup was made, ``False`` if it was not needed.
+    """
+    if not database_path.exists():
+        return False
+    if backup_path.exists():
+        backup_mtime = backup_path.stat().st_mtime
+        if time.time() - backup_mtime < min_interval or backup_mtime >= _last_modification(database_path):
+            return False
+    tmp_path = backup_path.with_name(f'{backup_path.name}.tmp')
+    source = sqlite3.connect(database_path)
+    try:
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target, pages=pages)
+        finally:
+            target.close()
+    finally:
+        source.close()
+    os.replace(tmp_path, backup_path)
+    return True
+
+
+def restore_database(backup_path: Path, database_path: Path) -> None:
+    """Restore a database from a backup made with :func:`backup_database`.
+
+    :param backup_path: Path of the backup.
+    :param database_path: Path of the database to write.
+    """
+    source = sqlite3.connect(f'{backup_path.as_uri()}?mode=ro', uri=True)
+    try:
+        target = sqlite3.connect(database_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def restore_sql_dump(dump_path: Path, database_path: Path) -> None:
+    """Restore a database from a ``sqlite3 .dump`` file made by previous versions.
+
+    :param dump_path: Path of the SQL dump.
+    :param database_path: Path of the database to write.
+    """
+    connection = sqlite3.connect(database_path)
+    try:
+        connection.executescript(dump_path.read_text())
+    finally:
+        connection.close()
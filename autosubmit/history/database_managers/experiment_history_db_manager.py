@@ -20,8 +20,7 @@ import textwrap
 from pathlib import Path
 from typing import Any, Optional, Protocol, cast
 
-from sqlalchemy import and_, func, inspect, desc, insert, select, update
-from sqlalchemy.schema import CreateTable, CreateSchema
+from sqlalchemy import and_, bindparam, func, inspect, desc, insert, or_, select, update
 
 import autosubmit.history.utils as HUtils
 from autosubmit.config.basicconfig import BasicConfig
@@ -44,6 +43,8 @@ DB_EXPERIMENT_HEADER_SCHEMA_CHANGES = 14
 DB_VERSION_SCHEMA_CHANGES = 12
 DEFAULT_DB_VERSION = 10
 DEFAULT_MAX_COUNTER = 0
+_MAX_QUERY_ARGUMENTS = 500
+"""Maximum number of job names in the ``IN`` clause of a query, below the SQLite limit of bound arguments."""
 
 
 class ExperimentHistoryDbManager(DatabaseManager):
@@ -307,22 +308,28 @@ class ExperimentHistoryDbManager(DatabaseManager):
     def _insert_job_data(self, job_data):
         # type : (JobData) -> int
         """ Insert data class JobData into job_data table. """
-        statement = ''' INSERT INTO job_data(counter, job_name, created, modified, 
+        return self.insert_statement_with_arguments(self.historicaldb_file_path, self._INSERT_JOB_DATA,
+                                                    self._get_insert_job_data_arguments(job_data))
+
+    _INSERT_JOB_DATA = ''' INSERT INTO job_data(counter, job_name, created, modified, 
                 submit, start, finish, status, rowtype, ncpus, 
                 wallclock, qos, energy, date, section, member, chunk, last, 
                 platform, job_id, extra_data, nnodes, run_id, MaxRSS, AveRSS, 
                 out, err, rowstatus, children, platform_output, workflow_commit) 
                 VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?) '''
-        arguments = (job_data.counter, job_data.job_name, HUtils.get_current_datetime(), HUtils.get_current_datetime(),
-                     job_data.submit, job_data.start, job_data.finish, job_data.status, job_data.rowtype,
-                     job_data.ncpus,
-                     job_data.wallclock, job_data.qos, job_data.energy, job_data.date, job_data.section,
-                     job_data.member, job_data.chunk, job_data.last,
-                     job_data.platform, job_data.job_id, job_data.extra_data, job_data.nnodes, job_data.run_id,
-                     job_data.MaxRSS, job_data.AveRSS,
-                     job_data.out, job_data.err, job_data.rowstatus, job_data.children, job_data.platform_output,
-                     job_data.workflow_commit)
-        return self.insert_statement_with_arguments(self.historicaldb_file_path, statement, arguments)
+
+    @staticmethod
+    def _get_insert_job_data_arguments(job_data):
+        # type : (JobData) -> Tuple
+        return (job_data.counter, job_data.job_name, HUtils.get_current_datetime(), HUtils.get_current_datetime(),
+                job_data.submit, job_data.start, job_data.finish, job_data.status, job_data.rowtype,
+                job_data.ncpus,
+                job_data.wallclock, job_data.qos, job_data.energy, job_data.date, job_data.section,
+                job_data.member, job_data.chunk, job_data.last,
+                job_data.platform, job_data.job_id, job_data.extra_data, job_data.nnodes, job_data.run_id,
+                job_data.MaxRSS, job_data.AveRSS,
+                job_data.out, job_data.err, job_data.rowstatus, job_data.children, job_data.platform_output,
+                job_data.workflow_commit)
 
     def _insert_experiment_run(self, experiment_run):
         """ Insert data class ExperimentRun into database """
@@ -354,18 +361,61 @@ class ExperimentHistoryDbManager(DatabaseManager):
         :param job_data_dc: The JobData data class instance containing job data to be updated.
         :type job_data_dc: JobData
         """
-        statement = ''' UPDATE job_data SET last=?, submit=?, start=?, finish=?, modified=?, 
+        self.execute_statement_with_arguments_on_dbfile(self.historicaldb_file_path, self._UPDATE_JOB_DATA,
+                                                        self._get_update_job_data_arguments(job_data_dc))
+
+    _UPDATE_JOB_DATA = ''' UPDATE job_data SET last=?, submit=?, start=?, finish=?, modified=?, 
                     job_id=?, status=?, energy=?, extra_data=?, 
                     nnodes=?, ncpus=?, rowstatus=?, out=?, err=?, 
                     children=?, platform_output=?, id=?, workflow_commit=? WHERE id=?'''
+
+    @staticmethod
+    def _get_update_job_data_arguments(job_data_dc: Any) -> tuple:
         # noinspection PyProtectedMember
-        arguments = (
+        return (
             job_data_dc.last, job_data_dc.submit, job_data_dc.start, job_data_dc.finish, HUtils.get_current_datetime(),
             job_data_dc.job_id, job_data_dc.status, job_data_dc.energy, job_data_dc.extra_data,
             job_data_dc.nnodes, job_data_dc.ncpus, job_data_dc.rowstatus, job_data_dc.out, job_data_dc.err,
             job_data_dc.children, job_data_dc.platform_output, job_data_dc._id, job_data_dc.workflow_commit, job_data_dc._id
             )
-        self.execute_statement_with_arguments_on_dbfile(self.historicaldb_file_path, statement, arguments)
+
+    def write_job_data_dcs(self, new_job_data_dcs: list[JobData], updated_job_data_dcs: list[JobData]) -> None:
+        """
+        Write many job_data rows in one transaction.
+
+        The updated rows are written first. Then the rows with last=1 of the jobs in ``new_job_data_dcs``
+        are set to last=0, and the new rows are inserted. The ``_id`` of the new data classes is set.
+
+        :param new_job_data_dcs: JobData data classes to insert, with their counter and run_id set.
+        :param updated_job_data_dcs: JobData data classes to update by id.
+        """
+        conn = self.get_connection(self.historicaldb_file_path)
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(self._UPDATE_JOB_DATA,
+                               [self._get_update_job_data_arguments(job_data_dc) for job_data_dc in updated_job_data_dcs])
+            ids = {}
+            if new_job_data_dcs:
+                modified = HUtils.get_current_datetime()
+                job_names = dict.fromkeys(job_data_dc.job_name for job_data_dc in new_job_data_dcs)
+                cursor.executemany("UPDATE job_data SET last=0, modified=? WHERE job_name=? AND last=1",
+                                   [(modified, job_name) for job_name in job_names])
+                max_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM job_data").fetchone()[0]
+                cursor.executemany(self._INSERT_JOB_DATA,
+                                   [self._get_insert_job_data_arguments(job_data_dc) for job_data_dc in new_job_data_dcs])
+                # No other connection can write until the commit, so the new rows are the ones after max_id.
+                cursor.execute("SELECT id, job_name, counter FROM job_data WHERE id > ?", (max_id,))
+                ids = {(job_name, counter): _id for _id, job_name, counter in cursor.fetchall()}
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        for job_data_dc in new_job_data_dcs:
+            job_data_dc._id = ids[(job_data_dc.job_name, job_data_dc.counter)]
 
     def _update_experiment_run(self, experiment_run_dc):
         """
@@ -423,6 +473,21 @@ class ExperimentHistoryDbManager(DatabaseManager):
             max_counter = Models.MaxCounter(*counter_result[0]).maxcounter
             return max_counter if max_counter else DEFAULT_MAX_COUNTER
 
+    def get_job_data_max_counters(self, job_names: list[str]) -> dict[str, int]:
+        """
+        Get the maximum counter value of each job name that has rows in the `job_data` table.
+
+        :param job_names: The job names.
+        :return: The maximum counter by job name. Job names without rows are not included.
+        """
+        max_counters = {}
+        for i in range(0, len(job_names), _MAX_QUERY_ARGUMENTS):
+            chunk = job_names[i:i + _MAX_QUERY_ARGUMENTS]
+            statement = "SELECT job_name, MAX(counter) FROM job_data WHERE job_name IN ({0}) GROUP BY job_name".format(
+                ",".join("?" * len(chunk)))
+            max_counters.update(self.get_from_statement_with_arguments(self.historicaldb_file_path, statement, chunk))
+        return max_counters
+
     def _set_historical_pragma_version(self, version=10):
         """ Sets the pragma version. """
         statement = "pragma user_version={v:d};".format(v=version)
@@ -481,6 +546,10 @@ class ExperimentHistoryDatabaseManager(Protocol):
 
     def get_job_data_max_counter(self, job_name: Optional[str] = None) -> int: ...
 
+    def get_job_data_max_counters(self, job_names: list[str]) -> dict[str, int]: ...
+
+    def write_job_data_dcs(self, new_job_data_dcs: list[JobData], updated_job_data_dcs: list[JobData]) -> None: ...
+
 
 class SqlAlchemyExperimentHistoryDbManager:
     """A SQLAlchemy experiment history database manager.
@@ -544,12 +613,11 @@ class SqlAlchemyExperimentHistoryDbManager:
         raise NotImplementedError("This feature has not been implemented yet with SQLAlchemy / Alembic.")
 
     def create_historical_database(self):
-        with self.engine.connect() as conn:
-            if BasicConfig.DATABASE_BACKEND != "sqlite":
-                conn.execute(CreateSchema(self.schema, if_not_exists=True))
-            conn.execute(CreateTable(get_table_with_schema(self.schema, ExperimentRunTable), if_not_exists=True))
-            conn.execute(CreateTable(get_table_with_schema(self.schema, JobDataTable), if_not_exists=True))
-            conn.commit()
+        session.create_tables(
+            self.engine,
+            [get_table_with_schema(self.schema, ExperimentRunTable), get_table_with_schema(self.schema, JobDataTable)],
+            self.schema if BasicConfig.DATABASE_BACKEND != "sqlite" else None
+        )
             # TODO: implement db migrations?
             # self._set_historical_pragma_version(CURRENT_DB_VERSION)
 
@@ -744,44 +812,48 @@ class SqlAlchemyExperimentHistoryDbManager:
         job_data_table = get_table_with_schema(self.schema, JobDataTable)
         insert_query = (
             insert(job_data_table).
-            values(
-                counter=job_data.counter,
-                job_name=job_data.job_name,
-                created=HUtils.get_current_datetime(),
-                modified=HUtils.get_current_datetime(),
-                submit=job_data.submit,
-                start=job_data.start,
-                finish=job_data.finish,
-                status=job_data.status,
-                rowtype=job_data.rowtype,
-                ncpus=job_data.ncpus,
-                wallclock=job_data.wallclock,
-                qos=job_data.qos,
-                energy=job_data.energy,
-                date=job_data.date,
-                section=job_data.section,
-                member=job_data.member,
-                chunk=job_data.chunk,
-                last=job_data.last,
-                platform=job_data.platform,
-                job_id=job_data.job_id,
-                extra_data=job_data.extra_data,
-                nnodes=job_data.nnodes,
-                run_id=job_data.run_id,
-                MaxRSS=job_data.MaxRSS,
-                AveRSS=job_data.AveRSS,
-                out=job_data.out,
-                err=job_data.err,
-                rowstatus=job_data.rowstatus,
-                children=job_data.children,
-                platform_output=job_data.platform_output
-            )
+            values(**self._get_insert_job_data_values(job_data))
         )
         with self.engine.connect() as conn:
             result = conn.execute(insert_query)
             conn.commit()
         return result.lastrowid
 
+    @staticmethod
+    def _get_insert_job_data_values(job_data) -> dict[str, Any]:
+        return dict(
+            counter=job_data.counter,
+            job_name=job_data.job_name,
+            created=HUtils.get_current_datetime(),
+            modified=HUtils.get_current_datetime(),
+            submit=job_data.submit,
+            start=job_data.start,
+            finish=job_data.finish,
+            status=job_data.status,
+            rowtype=job_data.rowtype,
+            ncpus=job_data.ncpus,
+            wallclock=job_data.wallclock,
+            qos=job_data.qos,
+            energy=job_data.energy,
+            date=job_data.date,
+            section=job_data.section,
+            member=job_data.member,
+            chunk=job_data.chunk,
+            last=job_data.last,
+            platform=job_data.platform,
+            job_id=job_data.job_id,
+            extra_data=job_data.extra_data,
+            nnodes=job_data.nnodes,
+            run_id=job_data.run_id,
+            MaxRSS=job_data.MaxRSS,
+            AveRSS=job_data.AveRSS,
+            out=job_data.out,
+            err=job_data.err,
+            rowstatus=job_data.rowstatus,
+            children=job_data.children,
+            platform_output=job_data.platform_output
+        )
+
     def update_many_job_data_change_status(self, changes):
         # type : (List[Tuple]) -> None
         """
@@ -809,29 +881,69 @@ class SqlAlchemyExperimentHistoryDbManager:
         query = (
             update(job_data_table).
             where(job_data_table.c.id == job_data_dc._id).  # type: ignore
-            values(
-                last=job_data_dc.last,
-                submit=job_data_dc.submit,
-                start=job_data_dc.start,
-                finish=job_data_dc.finish,
-                modified=HUtils.get_current_datetime(),
-                job_id=job_data_dc.job_id,
-                status=job_data_dc.status,
-                energy=job_data_dc.energy,
-                extra_data=job_data_dc.extra_data,
-                nnodes=job_data_dc.nnodes,
-                ncpus=job_data_dc.ncpus,
-                rowstatus=job_data_dc.rowstatus,
-                out=job_data_dc.out,
-                err=job_data_dc.err,
-                children=job_data_dc.children,
-                platform_output=job_data_dc.platform_output,
-            )
+            values(**self._get_update_job_data_values(job_data_dc))
         )
         with self.engine.connect() as conn:
             conn.execute(query)
             conn.commit()
 
+    @staticmethod
+    def _get_update_job_data_values(job_data_dc) -> dict[str, Any]:
+        return dict(
+            last=job_data_dc.last,
+            submit=job_data_dc.submit,
+            start=job_data_dc.start,
+            finish=job_data_dc.finish,
+            modified=HUtils.get_current_datetime(),
+            job_id=job_data_dc.job_id,
+            status=job_data_dc.status,
+            energy=job_data_dc.energy,
+            extra_data=job_data_dc.extra_data,
+            nnodes=job_data_dc.nnodes,
+            ncpus=job_data_dc.ncpus,
+            rowstatus=job_data_dc.rowstatus,
+            out=job_data_dc.out,
+            err=job_data_dc.err,
+            children=job_data_dc.children,
+            platform_output=job_data_dc.platform_output,
+        )
+
+    def write_job_data_dcs(self, new_job_data_dcs: list[JobData], updated_job_data_dcs: list[JobData]) -> None:
+        """Write many job_data rows in one transaction.
+
+        The updated rows are written first. Then the rows with last=1 of the jobs in ``new_job_data_dcs``
+        are set to last=0, and the new rows are inserted. The ``_id`` of the new data classes is set.
+
+        :param new_job_data_dcs: JobData data classes to insert, with their counter and run_id set.
+        :param updated_job_data_dcs: JobData data classes to update by id.
+        """
+        job_data_table = get_table_with_schema(self.schema, JobDataTable)
+        ids = {}
+        with self.engine.begin() as conn:
+            if updated_job_data_dcs:
+                # noinspection PyProtectedMember
+                conn.execute(
+                    update(job_data_table).where(job_data_table.c.id == bindparam('row_id')),  # type: ignore
+                    [{'row_id': job_data_dc._id, **self._get_update_job_data_values(job_data_dc)}
+                     for job_data_dc in updated_job_data_dcs]
+                )
+            if new_job_data_dcs:
+                job_names = dict.fromkeys(job_data_dc.job_name for job_data_dc in new_job_data_dcs)
+                conn.execute(
+                    update(job_data_table).
+                    where(and_(job_data_table.c.job_name == bindparam('row_job_name'), job_data_table.c.last == 1)).
+                    values(last=0, modified=HUtils.get_current_datetime()),
+                    [{'row_job_name': job_name} for job_name in job_names]
+                )
+                result = conn.execute(
+                    insert(job_data_table).returning(
+                        job_data_table.c.id, job_data_table.c.job_name, job_data_table.c.counter),
+                    [self._get_insert_job_data_values(job_data_dc) for job_data_dc in new_job_data_dcs]
+                )
+                ids = {(job_name, counter): _id for _id, job_name, counter in result.all()}
+        for job_data_dc in new_job_data_dcs:
+            job_data_dc._id = ids[(job_data_dc.job_name, job_data_dc.counter)]
+
     def get_job_data_by_job_id_name(self, job_id: int, job_name: str) -> JobData:
         """Get the job data by job ID and name."""
         job_data_table = get_table_with_schema(self.schema, JobDataTable)
@@ -856,6 +968,24 @@ class SqlAlchemyExperimentHistoryDbManager:
         max_counter = result.maxcounter
         return max_counter if max_counter else DEFAULT_MAX_COUNTER
 
+    def get_job_data_max_counters(self, job_names: list[str]) -> dict[str, int]:
+        """Get the maximum counter value of each job name that has rows in the `job_data` table.
+
+        :param job_names: The job names.
+        :return: The maximum counter by job name. Job names without rows are not included.
+        """
+        job_data_table = get_table_with_schema(self.schema, JobDataTable)
+        max_counters = {}
+        with self.engine.connect() as conn:
+            for i in range(0, len(job_names), _MAX_QUERY_ARGUMENTS):
+                query = (
+                    select(job_data_table.c.job_name, func.max(job_data_table.c.counter)).
+                    where(job_data_table.c.job_name.in_(job_names[i:i + _MAX_QUERY_ARGUMENTS])).
+                    group_by(job_data_table.c.job_name)
+                )
+                max_counters.update(conn.execute(query).all())
+        return max_counters
+
     def get_jobs_data_last_row(self, job_names) -> dict[str, Any]:
         job_data_table = get_table_with_schema(self.schema, JobDataTable)
         jobs_data = self.select_jobs_data(job_data_table, job_names)
@@ -883,6 +1013,29 @@ class SqlAlchemyExperimentHistoryDbManager:
         columns = table.c.keys()
         return [tuple(zip(columns, row)) for row in rows]
 
+    def select_retrials(self, since: Optional[int] = None) -> list[tuple[str, int, int, int, str]]:
+        """Get the name, submit, start, finish and status of every row of ``job_data``, in the order they were written.
+
+        :param since: If given, only the rows of the jobs that started or finished after this timestamp.
+        :return: The rows, as tuples.
+        """
+        job_data_table = get_table_with_schema(self.schema, JobDataTable)
+        query = select(
+            job_data_table.c.job_name,
+            job_data_table.c.submit,
+            job_data_table.c.start,
+            job_data_table.c.finish,
+            job_data_table.c.status
+        )
+        if since is not None:
+            active_jobs = select(job_data_table.c.job_name).where(
+                or_(job_data_table.c.start > since, job_data_table.c.finish > since)
+            )
+            query = query.where(job_data_table.c.job_name.in_(active_jobs))
+        query = query.order_by(job_data_table.c.id)
+        with self.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(query)]
+
 
 def create_experiment_history_db_manager(db_engine: str, **options: Any) -> ExperimentHistoryDatabaseManager:
     use_sql_alchemy = options.get("force_sql_alchemy", False) or db_engine == 'postgres'
@@ -21,7 +21,6 @@ from pathlib import Path
 from typing import Optional, Protocol, cast
 
 from sqlalchemy import insert, select, update
-from sqlalchemy.schema import CreateTable
 
 import autosubmit.history.utils as HUtils
 from autosubmit.config.basicconfig import BasicConfig
@@ -144,9 +143,7 @@ class SqlAlchemyExperimentStatusDbManager:
     def __init__(self) -> None:
         connection_url = get_connection_url(Path(BasicConfig.DATABASE_CONN_URL))
         self.engine = session.create_engine(connection_url=connection_url)
-        with self.engine.connect() as conn:
-            conn.execute(CreateTable(ExperimentStatusTable, if_not_exists=True))
-            conn.commit()
+        session.create_tables(self.engine, [ExperimentStatusTable])
 
     def set_existing_experiment_status_as_running(self, expid):
         self.update_exp_status(expid, Models.RunningStatus.RUNNING)
@@ -13,8 +13,10 @@
 # GNU General Public License for more details.
 
 import traceback
+from contextlib import contextmanager
+from threading import Thread
 from time import time, sleep
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
 import autosubmit.history.database_managers.database_models as Models
 import autosubmit.history.utils as HUtils
@@ -34,6 +36,25 @@ from autosubmit.log.log import Log
 SECONDS_WAIT_PLATFORM = 60
 
 
+class _JobDataBatch:
+    """Job data rows written inside an ``ExperimentHistory.batch`` block."""
+
+    def __init__(self):
+        self.new_job_data_dcs: list[JobData] = []
+        self.updated_job_data_dcs: dict[int, JobData] = {}
+        self.latest: dict[tuple[str, int], JobData] = {}
+        self.after_flush: list[Callable[[], Any]] = []
+
+    def add_new(self, job_data_dc: JobData) -> None:
+        self.new_job_data_dcs.append(job_data_dc)
+        self.latest[(str(job_data_dc.job_name), int(job_data_dc.job_id))] = job_data_dc
+
+    def add_updated(self, job_data_dc: JobData) -> None:
+        # noinspection PyProtectedMember
+        self.updated_job_data_dcs[job_data_dc._id] = job_data_dc
+        self.latest[(str(job_data_dc.job_name), int(job_data_dc.job_id))] = job_data_dc
+
+
 class ExperimentHistory:
     def __init__(self, expid, jobdata_dir_path=DEFAULT_JOBDATA_DIR, historiclog_dir_path=DEFAULT_HISTORICAL_LOGS_DIR, force_sql_alchemy=False):
         # Unused arguments, but I didn't want to change every call to this class in this PR
@@ -57,6 +78,52 @@ class ExperimentHistory:
             self._log.log(str(exp), traceback.format_exc())
             Log.debug(f'Historical Database error: {str(exp)} {traceback.format_exc()}')
             self.manager = None
+        self._batch: Optional[_JobDataBatch] = None
+
+    @contextmanager
+    def batch(self) -> Iterator['ExperimentHistory']:
+        """Buffer the rows written by ``write_submit_time``, ``write_start_time`` and
+        ``write_finish_time`` until the end of the block, and then write them all in
+        one transaction.
+
+        Inside the block, the counter and the run of the new rows are not known
+        yet, and the ``_id`` of the new rows is only set when the block ends.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = _JobDataBatch()
+        try:
+            yield self
+        finally:
+            batch, self._batch = self._batch, None
+            self._flush(batch)
+
+    def _flush(self, batch: _JobDataBatch) -> None:
+        """Write the rows of a batch, and then run the actions waiting for them."""
+        if not batch.new_job_data_dcs and not batch.updated_job_data_dcs:
+            return
+        try:
+            if batch.new_job_data_dcs:
+                run_id = self.manager.get_experiment_run_dc_with_max_id().run_id
+                job_names = list(dict.fromkeys(job_data_dc.job_name for job_data_dc in batch.new_job_data_dcs))
+                max_counters = self.manager.get_job_data_max_counters(job_names)
+                last_job_data_dcs = {}
+                for job_data_dc in batch.new_job_data_dcs:
+                    max_counter = max_counters.get(job_data_dc.job_name)
+                    job_data_dc.counter = 0 if max_counter is None else max_counter + 1
+                    job_data_dc.run_id = run_id
+                    max_counters[job_data_dc.job_name] = job_data_dc.counter
+                    last_job_data_dcs[job_data_dc.job_name] = job_data_dc
+                for job_data_dc in batch.new_job_data_dcs:
+                    job_data_dc.last = 1 if last_job_data_dcs[job_data_dc.job_name] is job_data_dc else 0
+            self.manager.write_job_data_dcs(batch.new_job_data_dcs, list(batch.updated_job_data_dcs.values()))
+        except Exception as exp:
+            self._log.log(str(exp), traceback.format_exc())
+            Log.debug(f'Historical Database error: {str(exp)} {traceback.format_exc()}')
+            return
+        for action in batch.after_flush:
+            action()
 
     def initialize_database(self):
         try:
@@ -77,10 +144,7 @@ class ExperimentHistory:
                           wrapper_code=None, children="", workflow_commit=""):
 
         try:
-            next_counter = self._get_next_counter_by_job_name(job_name)
-            current_experiment_run = self.manager.get_experiment_run_dc_with_max_id()
             job_data_dc = JobData(_id=0,
-                                  counter=next_counter,
                                   job_name=job_name,
                                   submit=submit,
                                   status=status,
@@ -95,8 +159,12 @@ class ExperimentHistory:
                                   platform=platform,
                                   job_id=job_id,
                                   children=children,
-                                  run_id=current_experiment_run.run_id,
                                   workflow_commit=workflow_commit)
+            if self._batch is not None:
+                self._batch.add_new(job_data_dc)
+                return job_data_dc
+            job_data_dc.counter = self._get_next_counter_by_job_name(job_name)
+            job_data_dc.run_id = self.manager.get_experiment_run_dc_with_max_id().run_id
             return self.manager.register_submitted_job_data_dc(job_data_dc)
         except Exception as exp:
             self._log.log(str(exp), traceback.format_exc())
@@ -128,15 +196,17 @@ class ExperimentHistory:
         :rtype: JobData
         """
         try:
-            job_data_dc_last = self.manager.get_job_data_by_job_id_name(job_id, job_name)
-            if not job_data_dc_last:
-                raise Exception("Job {0} has not been found in the database.".format(job_name))
+            job_data_dc_last = self._get_job_data_to_update(job_id, job_name)
             job_data_dc_last.start = start
-            job_data_dc_last.qos = self._get_defined_queue_name(wrapper_queue, wrapper_code, qos)
             job_data_dc_last.status = status
-            job_data_dc_last.rowtype = self._get_defined_rowtype(wrapper_code)
             job_data_dc_last.job_id = job_id
             job_data_dc_last.children = children
+            if self._batch is not None:
+                # The update of a row does not write the qos and rowtype, so a row inserted
+                # by the batch keeps the ones of its submission too.
+                return job_data_dc_last
+            job_data_dc_last.qos = self._get_defined_queue_name(wrapper_queue, wrapper_code, qos)
+            job_data_dc_last.rowtype = self._get_defined_rowtype(wrapper_code)
             return self.manager.update_job_data_dc_by_job_id_name(job_data_dc_last)
         except Exception as exp:
             self._log.log(str(exp), traceback.format_exc())
@@ -162,21 +232,51 @@ class ExperimentHistory:
         :rtype: JobData
         """
         try:
-            job_data_dc_last = self.manager.get_job_data_by_job_id_name(job_id, job_name)
-            if not job_data_dc_last:
-                raise Exception("Job {0} has not been found in the database.".format(job_name))
+            job_data_dc_last = self._get_job_data_to_update(job_id, job_name)
             job_data_dc_last.finish = finish if finish > 0 else int(time())
             job_data_dc_last.status = status
             job_data_dc_last.job_id = job_id
             job_data_dc_last.rowstatus = Models.RowStatus.PENDING_PROCESS
             job_data_dc_last.out = out_file if out_file else ""
             job_data_dc_last.err = err_file if err_file else ""
+            if self._batch is not None:
+                return job_data_dc_last
             return self.manager.update_job_data_dc_by_job_id_name(job_data_dc_last)
 
         except Exception as exp:
             self._log.log(str(exp), traceback.format_exc())
             Log.debug(f'Historical Database error: {str(exp)} {traceback.format_exc()}')
 
+    def _get_job_data_to_update(self, job_id: int, job_name: str) -> JobData:
+        """Return the latest row of a job, from the current batch if it is there."""
+        job_data_dc = None
+        if self._batch is not None:
+            job_data_dc = self._batch.latest.get((str(job_name), int(job_id)))
+        if not job_data_dc:
+            job_data_dc = self.manager.get_job_data_by_job_id_name(job_id, job_name)
+            if job_data_dc and self._batch is not None:
+                self._batch.add_updated(job_data_dc)
+        if not job_data_dc:
+            raise Exception("Job {0} has not been found in the database.".format(job_name))
+        return job_data_dc
+
+    def write_platform_data_after_finish_in_thread(self, job_data_dc: JobData, platform_obj: Any, name: str) -> None:
+        """Call :meth:`write_platform_data_after_finish` in a thread, once ``job_data_dc`` is in the database.
+
+        :param job_data_dc: The row written by ``write_finish_time``.
+        :param platform_obj: The platform of the job.
+        :param name: The name of the thread.
+        """
+        def start_thread():
+            thread = Thread(target=self.write_platform_data_after_finish, args=(job_data_dc, platform_obj))
+            thread.name = name
+            thread.start()
+
+        if self._batch is not None:
+            self._batch.after_flush.append(start_thread)
+        else:
+            start_thread()
+
     def write_platform_data_after_finish(self, job_data_dc, platform_obj):
         """
         Call it in a thread.
@@ -17,6 +17,7 @@
 
 import copy
 import datetime
+import itertools
 import json
 import locale
 import os
@@ -26,7 +27,6 @@ import time
 from collections import OrderedDict
 from functools import reduce
 from pathlib import Path
-from threading import Thread
 from time import sleep
 from typing import List, Optional, Tuple, TYPE_CHECKING
 
@@ -37,6 +37,8 @@ from autosubmit.config.configcommon import AutosubmitConfig
 from autosubmit.helpers.parameters import autosubmit_parameter, autosubmit_parameters
 from autosubmit.history.experiment_history import ExperimentHistory
 from autosubmit.job.job_common import Status, increase_wallclock_by_chunk
+from autosubmit.job.job_placeholders import substitute_placeholders
+from autosubmit.job.job_stats_journal import stats_journal
 from autosubmit.job.job_utils import get_job_package_code, get_split_size_unit, get_split_size
 from autosubmit.job.metrics_processor import UserMetricProcessor
 from autosubmit.job.template import get_template_snippet, Language
@@ -52,7 +54,44 @@ Log.get_logger("Autosubmit")
 
 # A wrapper for encapsulate threads , TODO: Python 3+ to be replaced by the < from concurrent.futures >
 
-EXCLUDED = ["_platform", "_children", "_parents", "submitter"]
+EXCLUDED = ["_platform", "_children", "_parents", "submitter", "_job_list_index", "_last_change",
+            "estimated_start_time"]
+
+_CHANGE_COUNTER = itertools.count(1)
+"""Monotonic counter to tell which jobs changed since a given moment (e.g. the last save)."""
+
+CHANGE_MARKING_SLOTS = (
+    'id', 'hold', 'ready_date', 'updated_log', 'current_checkpoint_step', 'max_checkpoint_step',
+    'wrapper_name', 'wrapper_type', 'is_wrapper', 'packed_during_building', 'platform_name',
+    'submit_time_timestamp', 'start_time_timestamp', 'finish_time_timestamp', 'start_time',
+    'prev_status', 'new_status', 'script_name', 'stat_file', 'delay_end', 'level', 'distance_weight',
+    'edge_info', 'workflow_commit'
+)
+"""Persisted attributes without a property that change while the experiment runs, and mark the job as
+changed when set. The ones taken from the configuration are marked by ``Job.update_parameters``."""
+
+
+class _ChangeMarkingSlot:
+    """A slot of ``Job`` that marks the job as changed when it is set, see ``Job.changed_since``.
+
+    :param slot: The descriptor of the slot, that stores the value.
+    """
+
+    def __init__(self, slot):
+        self._slot = slot
+
+    def __get__(self, job, owner=None):
+        if job is None:
+            return self
+        return self._slot.__get__(job, owner)
+
+    def __set__(self, job, value):
+        self._slot.__set__(job, value)
+        job._last_change = next(_CHANGE_COUNTER)
+
+    def __delete__(self, job):
+        self._slot.__delete__(job)
+        job._last_change = next(_CHANGE_COUNTER)
 
 
 # This decorator contains groups of parameters, with each
@@ -152,7 +191,8 @@ class Job(object):
         'ec_queue', 'platform_name', '_serial_platform',
         'submitter', '_shape', '_x11', '_x11_options', '_hyperthreading',
         '_scratch_free_space', '_delay_retrials', '_custom_directives',
-        '_log_recovered', 'packed_during_building', 'workflow_commit'
+        '_log_recovered', 'packed_during_building', 'workflow_commit',
+        '_job_list_index', '_last_change', 'estimated_start_time'
     )
 
     def __setstate__(self, state):
@@ -188,6 +228,9 @@ class Job(object):
             status = loaded_data['_status']
             priority = loaded_data['priority']
 
+        self._job_list_index = None
+        self._last_change = None
+        self.estimated_start_time = None
         self.rerun_only = False
         self.delay_end = None
         self.wrapper_type = None
@@ -444,6 +487,7 @@ class Job(object):
     @fail_count.setter
     def fail_count(self, value):
         self._fail_count = value
+        self.mark_changed()
 
     @property  # type: ignore
     @autosubmit_parameter(name='retrials')
@@ -649,6 +693,7 @@ class Job(object):
     @packed.setter
     def packed(self, value):
         self._packed = value
+        self.mark_changed()
 
     @property  # type: ignore
     @autosubmit_parameter(name='export')
@@ -784,7 +829,11 @@ class Job(object):
         """
         Sets the status of the job
         """
+        job_list_index = getattr(self, '_job_list_index', None)
+        if job_list_index is not None:
+            job_list_index.update_status(self, self._status, status)
         self._status = status
+        self.mark_changed()
 
     @property  # type: ignore
     @autosubmit_parameter(name='log_recovered')
@@ -797,6 +846,7 @@ class Job(object):
         Sets the log_recovered
         """
         self._log_recovered = log_recovered
+        self.mark_changed()
 
     @property  # type: ignore
     def status_str(self):
@@ -957,6 +1007,7 @@ class Job(object):
     @local_logs.setter
     def local_logs(self, value):
         self._local_logs = value
+        self.mark_changed()
 
     @property  # type: ignore
     def remote_logs(self):
@@ -965,6 +1016,7 @@ class Job(object):
     @remote_logs.setter
     def remote_logs(self, value):
         self._remote_logs = value
+        self.mark_changed()
 
     @property  # type: ignore
     def total_processors(self):
@@ -1009,6 +1061,27 @@ class Job(object):
         """Number of processors per node that the job can use."""
         self._processors_per_node = value
 
+    @staticmethod
+    def new_change_mark() -> int:
+        """Returns a mark to compare against with :meth:`changed_since`.
+
+        :return: a value greater than the one of any change made until now
+        """
+        return next(_CHANGE_COUNTER)
+
+    def mark_changed(self) -> None:
+        """Flags the job as changed, so the incremental job list persistence stores it again."""
+        self._last_change = next(_CHANGE_COUNTER)
+
+    def changed_since(self, mark: int) -> bool:
+        """Returns whether the job changed after ``mark`` was taken.
+
+        :param mark: a value returned by :meth:`new_change_mark`
+        :return: ``True`` if the job changed, or if it is unknown (e.g. copied jobs)
+        """
+        last_change = getattr(self, '_last_change', None)
+        return last_change is None or last_change > mark
+
     def set_ready_date(self) -> None:
         """
         Sets the ready start date for the job
@@ -1112,18 +1185,17 @@ class Job(object):
         :rtype: int
         """
         if fail_count == -1:
-            logname = os.path.join(self._tmp_path, f"{self.stat_file}0")
+            filename = f"{self.stat_file}0"
         else:
-            fail_count = fail_count
-            logname = os.path.join(self._tmp_path, f"{self.stat_file}{fail_count}")
-        if os.path.exists(logname):
-            lines = open(logname).readlines()
+            filename = f"{self.stat_file}{fail_count}"
+        lines = stats_journal(self._tmp_path).readlines(filename)
+        if lines is not None:
             if len(lines) >= index + 1:
                 return int(lines[index])
             else:
                 return 0
         else:
-            Log.warning(f"Log file {logname} does not exist")
+            Log.warning(f"Log file {os.path.join(self._tmp_path, filename)} does not exist")
             return 0
 
     def _get_from_total_stats(self, index) -> list[datetime.datetime]:
@@ -1135,15 +1207,11 @@ class Job(object):
         :return: list of values in column index position
         :rtype: list[datetime.datetime]
         """
-        log_name = Path(f"{self._tmp_path}/{self.name}_TOTAL_STATS")
         lst = []
-        if log_name.exists() and log_name.stat().st_size > 0:
-            with open(log_name) as f:
-                lines = f.readlines()
-                for line in lines:
-                    fields = line.split()
-                    if len(fields) >= index + 1:
-                        lst.append(parse_date(fields[index]))
+        for line in stats_journal(self._tmp_path).readlines(f"{self.name}_TOTAL_STATS") or []:
+            fields = line.split()
+            if len(fields) >= index + 1:
+                lst.append(parse_date(fields[index]))
 
         return lst
 
@@ -1192,12 +1260,12 @@ class Job(object):
         :return: list of dates of retrial [submit, start, finish] in datetime format
         :rtype: list of list
         """
-        log_name = os.path.join(self._tmp_path, self.name + '_TOTAL_STATS')
+        lines = stats_journal(self._tmp_path).readlines(self.name + '_TOTAL_STATS')
         retrials_list: list = []
-        if os.path.exists(log_name):
+        if lines is not None:
             already_completed = False
             # Read lines of the TOTAL_STATS file starting from last
-            for retrial in reversed(open(log_name).readlines()):
+            for retrial in reversed(lines):
                 retrial_fields: list = retrial.split()
                 if Job.is_a_completed_retrial(retrial_fields):
                     # It's a COMPLETED run
@@ -1329,34 +1397,36 @@ class Job(object):
     def update_stat_file(self):
         self.stat_file = f"{self.script_name[:-4]}_STAT_"
 
-    def write_stats(self, last_retrial: int) -> None:
+    def write_stats(self, last_retrial: int, exp_history: Optional[ExperimentHistory] = None) -> None:
         """
         Gathers the stat file, writes statistics into the job_data.db, and updates the total_stat file.
         Considers whether the job is a vertical wrapper and the number of retrials to gather.
 
         :param last_retrial: The last retrial count.
         :type last_retrial: int
+        :param exp_history: Experiment history to write to, a new one if not given.
+        :type exp_history: ExperimentHistory
         """
         # Write stats for vertical wrappers
         if self.wrapper_type == "vertical":  # Disable AS retrials for vertical wrappers to use internal ones
             first_submit_timestamp = self.submit_time_timestamp
             for i in range(0, int(last_retrial + 1)):
                 self.platform.get_stat_file(self, count=i)
-                self.write_vertical_time(i, first_submit_timestamp)
+                self.write_vertical_time(i, first_submit_timestamp, exp_history=exp_history)
                 self.inc_fail_count()
         else:
             # Update local logs without updating the submit time
             self.update_local_logs(update_submit_time=False)
             self.check_compressed_local_logs()
             self.platform.get_stat_file(self)
-            self.write_submit_time()
-            self.write_start_time(count=self.fail_count)
-            self.write_end_time(self.status == Status.COMPLETED, self.fail_count)
+            self.write_submit_time(exp_history=exp_history)
+            self.write_start_time(count=self.fail_count, exp_history=exp_history)
+            self.write_end_time(self.status == Status.COMPLETED, self.fail_count, exp_history=exp_history)
 
-    def retrieve_logfiles(self, raise_error: bool = False) -> None:
-        """Retrieves log files from the remote host.
+    def download_logfiles(self) -> Tuple[int, bool]:
+        """Retrieves the log files from the remote host, without writing the statistics of the job.
 
-        :param raise_error: If True, raises an error if the log files are not retrieved.
+        :return: The last retrial whose logs were retrieved, and whether any log was retrieved.
         """
         backup_logname = copy.copy(self.local_logs)
         if self.wrapper_type == "vertical":
@@ -1366,10 +1436,33 @@ class Job(object):
             last_retrial = 0
         if not log_recovered:
             self.local_logs = backup_logname
+        return last_retrial, log_recovered
+
+    def retrieve_logfiles(self, raise_error: bool = False, exp_history: Optional[ExperimentHistory] = None) -> None:
+        """Retrieves log files from the remote host.
+
+        :param raise_error: If True, raises an error if the log files are not retrieved.
+        :param exp_history: Experiment history where the job statistics are written, a new one if not given.
+        """
+        last_retrial, log_recovered = self.download_logfiles()
+        self.process_retrieved_logfiles(last_retrial, log_recovered, raise_error=raise_error, exp_history=exp_history)
+
+    def process_retrieved_logfiles(self, last_retrial: int = 0, log_recovered: bool = True, raise_error: bool = False,
+                                   exp_history: Optional[ExperimentHistory] = None) -> None:
+        """Writes the statistics of a job whose log files were already retrieved.
+
+        Used after ``download_logfiles``, or after ``Platform.retrieve_logfiles_in_bulk``.
+
+        :param last_retrial: The last retrial whose logs were retrieved.
+        :param log_recovered: Whether any log was retrieved.
+        :param raise_error: If True, raises an error if the log files were not retrieved.
+        :param exp_history: Experiment history where the job statistics are written, a new one if not given.
+        """
+        if not log_recovered:
             if raise_error and self.wrapper_name not in self.platform.processed_wrapper_logs:
                 raise AutosubmitCritical("Failed to retrieve logs for job {self.name}", 6000)
         else:
-            self.write_stats(last_retrial)
+            self.write_stats(last_retrial, exp_history=exp_history)
             if self.wrapper_type == "vertical":
                 for retrial in range(0, last_retrial + 1):
                     Log.result(
@@ -1441,11 +1534,14 @@ class Job(object):
             return True
         return False
 
-    def update_status(self, as_conf: AutosubmitConfig, failed_file: bool = False) -> Status:
+    def update_status(self, as_conf: AutosubmitConfig, failed_file: bool = False,
+                      completed_job_names: Optional[set[str]] = None) -> Status:
         """Updates job status, checking COMPLETED file if needed.
 
         :param as_conf: Autosubmit configuration.
         :param failed_file: boolean, if True, checks if the job failed
+        :param completed_job_names: Names of the jobs whose COMPLETED file was already found on the platform,
+            for a batch of jobs. If ``None``, the platform is asked for the COMPLETED file of this job.
         :return: The new status.
         """
         previous_status = self.status
@@ -1453,7 +1549,7 @@ class Job(object):
         new_status = self.new_status
         if new_status == Status.COMPLETED:
             Log.debug(f"{self.name} job seems to have completed: checking...")
-            self.check_completion()
+            self.check_completion(completed_job_names=completed_job_names)
         else:
             self.status = new_status
 
@@ -1473,7 +1569,7 @@ class Job(object):
                     self.update_children_status()
         elif self.status == Status.UNKNOWN:
             Log.printlog(f"Job {self.name} is UNKNOWN. Checking completed files to confirm the failure...", 3000)
-            self.check_completion(Status.UNKNOWN)
+            self.check_completion(Status.UNKNOWN, completed_job_names=completed_job_names)
             if self.status == Status.UNKNOWN:
                 Log.printlog(f"Job {self.name} is UNKNOWN. Checking completed files to confirm the failure...", 6009)
             elif self.status == Status.COMPLETED:
@@ -1526,14 +1622,21 @@ class Job(object):
                 child.status = Status.FAILED
                 children += list(child.children)
 
-    def check_completion(self, default_status=Status.FAILED, over_wallclock=False):
+    def check_completion(self, default_status=Status.FAILED, over_wallclock=False,
+                         completed_job_names: Optional[set[str]] = None):
         """ Fetches the COMPLETED file from the platform and to COMPLETED if *COMPLETED* file exists and to FAILED otherwise.
 
         :param over_wallclock:
         :param default_status: status to set if job is not completed. By default, it is FAILED
         :type default_status: Status
+        :param completed_job_names: Names of the jobs whose COMPLETED file was already found on the platform.
+            If ``None``, the platform is asked for the COMPLETED file of this job.
         """
-        if self.platform.get_completed_job_names([self.name]):
+        if completed_job_names is not None:
+            completed = self.name in completed_job_names
+        else:
+            completed = bool(self.platform.get_completed_job_names([self.name]))
+        if completed:
             if not over_wallclock:
                 self.status = Status.COMPLETED
             else:
@@ -2236,7 +2339,7 @@ class Job(object):
         :rtype: dict
         """
 
-        as_conf.deep_read_loops(parameters)
+        as_conf.read_parameters_placeholders(parameters)
         # At this point, the ^ and not ^ is the same
         for key, value in as_conf.special_dynamic_variables.items():
             if isinstance(value, str):
@@ -2305,6 +2408,8 @@ class Job(object):
         parameters.update(as_conf.default_parameters)
         if set_attributes:
             self.update_job_variables_final_values(parameters)
+            # The attributes taken from the configuration, e.g. ``het`` or ``exclusive``.
+            self.mark_changed()
         for event in self.platform.worker_events:  # keep alive log retrieval workers.
             if not event.is_set():
                 event.set()
@@ -2461,25 +2566,9 @@ class Job(object):
         :return: Content with placeholders substituted.
         :rtype: str
         """
-        if undefined_variables is None:
-            undefined_variables = []
-
-        placeholders = re.findall(r'%(?<!%%)[a-zA-Z0-9_.-]+%(?!%%)', content, flags=re.IGNORECASE)
-        for placeholder in placeholders:
-            if placeholder in as_conf.default_parameters.values():
-                continue
-            key = placeholder[1:-1]
-            value = str(parameters.get(key.upper(), ""))
-            if not value:
-                content = re.sub(r'%(?<!%%)' + key + r'%(?!%%)', '', content, flags=re.I)
-            else:
-                if "\\" in value:
-                    value = re.escape(value)
-                content = re.sub(r'%(?<!%%)' + key + r'%(?!%%)', value, content, flags=re.I)
-        if undefined_variables:
-            for variable in undefined_variables:
-                content = re.sub(r'%(?<!%%)' + variable + r'%(?!%%)', '', content, flags=re.I)
-        return content.replace("%%", "%")
+        return substitute_placeholders(
+            content, parameters, as_conf.default_parameters.values(), undefined_variables
+        )
 
     def _write_additional_file(self, additional_file: str, content: str, lang: str) -> None:
         """
@@ -2587,24 +2676,20 @@ class Job(object):
                     break
         self.local_logs = tuple(_aux_local_logs)
 
-    def write_submit_time(self) -> None:
-        """Writes submit date and time to the ``TOTAL_STATS`` file.
+    def write_submit_time(self, exp_history: Optional[ExperimentHistory] = None) -> None:
+        """Writes submit date and time to the ``TOTAL_STATS`` file, in the stats journal.
 
         It doesn't write if hold is True.
+
+        :param exp_history: Experiment history to write to, a new one if not given.
         """
         data_time = ["", int(datetime.datetime.strptime(self.submit_time_timestamp, "%Y%m%d%H%M%S").timestamp())]
-        path = os.path.join(self._tmp_path, self.name + '_TOTAL_STATS')
-        if os.path.exists(path):
-            with open(path, 'a') as f:
-                f.write('\n')
-                f.write(self.submit_time_timestamp)
-        else:
-            with open(path, 'w') as f:
-                f.write(self.submit_time_timestamp)
+        stats_journal(self._tmp_path).append_line(self.name + '_TOTAL_STATS', self.submit_time_timestamp)
 
         # Writing database
-        exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
-                                        historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
+        if exp_history is None:
+            exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                            historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
         exp_history.write_submit_time(self.name, submit=data_time[1],
                                       status=Status.VALUE_TO_KEY.get(self.status, "UNKNOWN"), ncpus=self.processors,
                                       wallclock=self.wallclock, qos=self.queue, date=self.date, member=self.member,
@@ -2648,22 +2733,22 @@ class Job(object):
                 else:
                     Log.debug(f"Log file {old_log_path} does not exist, skipping rename.")
 
-    def write_start_time(self, count=-1, vertical_wrapper=False):
+    def write_start_time(self, count=-1, vertical_wrapper=False, exp_history: Optional[ExperimentHistory] = None):
         """
         Writes start date and time to TOTAL_STATS file
+        :param exp_history: Experiment history to write to, a new one if not given.
         :return: True if successful, False otherwise
         :rtype: bool
         """
         if not vertical_wrapper:
             self.update_start_time(count)
-        path = os.path.join(self._tmp_path, self.name + '_TOTAL_STATS')
-        f = open(path, 'a')
-        f.write(' ')
         # noinspection PyTypeChecker
-        f.write(date2str(datetime.datetime.fromtimestamp(self.start_time_timestamp), 'S'))
+        stats_journal(self._tmp_path).append(self.name + '_TOTAL_STATS',
+                                             date2str(datetime.datetime.fromtimestamp(self.start_time_timestamp), 'S'))
         # Writing database
-        exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
-                                        historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
+        if exp_history is None:
+            exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                            historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
         exp_history.write_start_time(self.name, start=self.start_time_timestamp,
                                      status=Status.VALUE_TO_KEY.get(self.status, "UNKNOWN"), qos=self.queue,
                                      job_id=self.id, wrapper_queue=self._wrapper_queue,
@@ -2672,23 +2757,26 @@ class Job(object):
         return True
 
     def write_vertical_time(
-            self, count: int = -1, first_submit_timestamp: str = ''
+            self, count: int = -1, first_submit_timestamp: str = '',
+            exp_history: Optional[ExperimentHistory] = None
     ) -> None:
         self.update_start_time(count=count)
         self.update_local_logs(update_submit_time=False, count=count)
         self.fix_local_logs_timestamps(first_submit_timestamp, self.submit_time_timestamp)
         self.check_compressed_local_logs()
-        self.write_submit_time()
-        self.write_start_time(count=count, vertical_wrapper=True)
-        self.write_end_time(self.status == Status.COMPLETED, count=count)
+        self.write_submit_time(exp_history=exp_history)
+        self.write_start_time(count=count, vertical_wrapper=True, exp_history=exp_history)
+        self.write_end_time(self.status == Status.COMPLETED, count=count, exp_history=exp_history)
 
-    def write_end_time(self, completed, count=-1):
+    def write_end_time(self, completed, count=-1, exp_history: Optional[ExperimentHistory] = None):
         """
         Writes end timestamp to TOTAL_STATS file and jobs_data.db
         :param completed: True if the job has been completed, False otherwise
         :type completed: bool
         :param count: number of retrials
         :type count: int
+        :param exp_history: Experiment history to write to, a new one if not given.
+        :type exp_history: ExperimentHistory
         """
 
         end_time = self.check_end_time(count)
@@ -2696,31 +2784,24 @@ class Job(object):
             self.finish_time_timestamp = int(end_time)
         if not self.finish_time_timestamp:
             self.finish_time_timestamp = int(time.time())
-        with open(Path(self._tmp_path) / f"{self.name}_TOTAL_STATS", 'a') as stat_file:
-            stat_file.write(' ')
-            stat_file.write(date2str(datetime.datetime.fromtimestamp(int(self.finish_time_timestamp)), 'S'))
-            stat_file.write(' ')
-
-            if completed:
-                final_status = "COMPLETED"
-                stat_file.write('COMPLETED')
-            else:
-                final_status = "FAILED"
-                stat_file.write('FAILED')
+        if completed:
+            final_status = "COMPLETED"
+        else:
+            final_status = "FAILED"
+        finish_date = date2str(datetime.datetime.fromtimestamp(int(self.finish_time_timestamp)), 'S')
+        stats_journal(self._tmp_path).append(f"{self.name}_TOTAL_STATS", f"{finish_date} {final_status}")
         out, err = self.local_logs
         # Launch first as simple non-threaded function
-        exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
-                                        historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
+        if exp_history is None:
+            exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                            historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
         job_data_dc = exp_history.write_finish_time(self.name, finish=self.finish_time_timestamp, status=final_status,
                                                     job_id=self.id, out_file=out, err_file=err)
 
         # Launch second as threaded function only for slurm
         if job_data_dc and type(self.platform) is not str and self.platform.type == "slurm":
-            thread_write_finish = Thread(target=ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
-                                                                  historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR).write_platform_data_after_finish,
-                                         args=(job_data_dc, self.platform))
-            thread_write_finish.name = "JOB_data_{}".format(self.name)
-            thread_write_finish.start()
+            exp_history.write_platform_data_after_finish_in_thread(job_data_dc, self.platform,
+                                                                   "JOB_data_{}".format(self.name))
 
     def check_started_after(self, date_limit):
         """
@@ -2809,22 +2890,25 @@ class Job(object):
         Recovers the last ready date for this job
         """
         if not self.ready_date:
-            stat_file = Path(f"{self._tmp_path}/{self.name}_TOTAL_STATS")
-            if stat_file.exists():
-                output_by_lines = stat_file.read_text().splitlines()
-                if output_by_lines:
-                    line_info = output_by_lines[-1].split(" ")
-                    if line_info and line_info[0].isdigit():
-                        self.ready_date = line_info[0]
-                    else:
-                        self.ready_date = datetime.datetime.fromtimestamp(stat_file.stat().st_mtime).strftime(
-                            '%Y%m%d%H%M%S')
-                        Log.debug(f"Failed to recover ready date for the job {self.name}")
-                else:  # Default to last mod time
-                    self.ready_date = datetime.datetime.fromtimestamp(stat_file.stat().st_mtime).strftime(
-                        '%Y%m%d%H%M%S')
+            journal = stats_journal(self._tmp_path)
+            stat_file = f"{self.name}_TOTAL_STATS"
+            content = journal.read(stat_file)
+            if content is not None:
+                output_by_lines = content.splitlines()
+                line_info = output_by_lines[-1].split(" ") if output_by_lines else []
+                if line_info and line_info[0].isdigit():
+                    self.ready_date = line_info[0]
+                else:
+                    # The journal is shared by all the jobs, only the file of previous versions has a
+                    # modification time of this job.
+                    legacy_stat_file = Path(self._tmp_path) / stat_file
+                    if legacy_stat_file.exists():
+                        self.ready_date = datetime.datetime.fromtimestamp(
+                            legacy_stat_file.stat().st_mtime).strftime('%Y%m%d%H%M%S')
                     Log.debug(f"Failed to recover ready date for the job {self.name}")
 
+for _slot in CHANGE_MARKING_SLOTS:
+    setattr(Job, _slot, _ChangeMarkingSlot(getattr(Job, _slot)))
 
 class WrapperJob(Job):
     """Defines a wrapper from a package.
@@ -2969,7 +3053,7 @@ class WrapperJob(Job):
                         completed_jobs.append(job)
                         job.new_status = Status.COMPLETED
                         job.updated_log = False
-                        job.update_status(self.as_config)
+                        job.update_status(self.as_config, completed_job_names={job.name})
 
             for job in completed_jobs:
                 self.running_jobs_start.pop(job, None)
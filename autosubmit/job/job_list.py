@@ -38,7 +38,9 @@ from autosubmit.history.experiment_history import ExperimentHistory
 from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status, bcolors
 from autosubmit.job.job_dict import DicJobs
+from autosubmit.job.job_list_index import JobListIndex, is_optional_parent
 from autosubmit.job.job_package_persistence import JobPackagePersistence
+from autosubmit.job.job_stats_journal import stats_journal
 from autosubmit.job.job_packages import JobPackageThread
 from autosubmit.job.job_utils import Dependency
 from autosubmit.job.job_utils import transitive_reduction
@@ -59,6 +61,7 @@ class JobList(object):
         self._failed_file = "failed_job_list_" + expid + ".pkl"
         self._persistence_file = "job_list_" + expid
         self._job_list = list()
+        self._index = JobListIndex()
         self._base_job_list = list()
         self.jobs_edges = {}
         self._expid = expid
@@ -139,6 +142,7 @@ class JobList(object):
                 job.has_children()) and str(job.delete_when_edgeless).casefold() ==
                         "true".casefold()):
                     self._job_list.remove(job)
+                    self._index.discard(job)
                     self.graph.remove_node(job.name)
 
     @staticmethod
@@ -151,7 +155,7 @@ class JobList(object):
 
     def generate(self, as_conf, date_list, member_list, num_chunks, chunk_ini, parameters,
                  date_format, default_retrials, default_job_type, wrapper_jobs=dict(), new=True,
-                 run_only_members=[], show_log=True, monitor=False, force=False, create=False):
+                 run_only_members=[], show_log=True, monitor=False, force=False, create=False, read_only=False):
         """
         Creates all jobs needed for the current workflow.
         :param create:
@@ -186,6 +190,8 @@ class JobList(object):
         :type show_log: bool
         :param monitor: monitor
         :type monitor: bool
+        :param read_only: the job list will not be saved, see ``JobList.load``
+        :type read_only: bool
         """
         if create and self.check_split_set_to_auto(as_conf):
             force = True
@@ -206,7 +212,7 @@ class JobList(object):
                                  default_retrials, as_conf)
 
         try:
-            loaded_job_list = self.load(create)
+            loaded_job_list = self.load(create, read_only=read_only)
             Log.result("Load finished")
         except BaseException as e:
             Log.warning(f"Couldn't load the old job_list {e}")
@@ -1845,6 +1851,37 @@ class JobList(object):
         if len(self._ordered_jobs_by_date_member) > 0:
             return self._ordered_jobs_by_date_member[section]
 
+    def _get_by_status(self, *statuses) -> list[Job]:
+        """Returns the jobs with any of the given statuses, in job list order.
+
+        :param statuses: statuses to look for
+        :return: jobs with those statuses
+        :rtype: list
+        """
+        self._index.ensure(self._job_list)
+        return self._index.get(*statuses)
+
+    def status_change_count(self) -> int:
+        """Returns a counter increased on every status change of the jobs of the list.
+
+        Two equal values mean that no job changed its status in between, so the
+        caller does not need to keep and compare the status of every job.
+
+        :return: the current value of the counter
+        """
+        self._index.ensure(self._job_list)
+        return self._index.status_changes
+
+    def _get_by_status_excluding(self, *statuses) -> list[Job]:
+        """Returns the jobs whose status is none of the given ones, in job list order.
+
+        :param statuses: statuses to leave out
+        :return: jobs with any other status
+        :rtype: list
+        """
+        self._index.ensure(self._job_list)
+        return self._index.get(*[status for status in self._index.statuses() if status not in statuses])
+
     def get_completed(self, platform=None, wrapper=False):
         """Returns a list of completed jobs
 
@@ -1855,8 +1892,8 @@ class JobList(object):
         :rtype: list
         """
 
-        completed_jobs = [job for job in self._job_list if (platform is None or
-                                                            job.platform.name == platform.name) and job.status == Status.COMPLETED]
+        completed_jobs = [job for job in self._get_by_status(Status.COMPLETED) if
+                          platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in completed_jobs if job.packed is False]
         return completed_jobs
@@ -1869,8 +1906,7 @@ class JobList(object):
         :rtype: List[Job]
         """
 
-        completed_failed_jobs = [job for job in self._job_list if
-                                 (job.status == Status.COMPLETED or job.status == Status.FAILED) and
+        completed_failed_jobs = [job for job in self._get_by_status(Status.COMPLETED, Status.FAILED) if
                                  job.updated_log is False]
 
         return completed_failed_jobs
@@ -1884,9 +1920,8 @@ class JobList(object):
         :return: completed jobs
         :rtype: list
         """
-        uncompleted_jobs = [job for job in self._job_list if
-                            (platform is None or job.platform.name == platform.name) and
-                            job.status != Status.COMPLETED]
+        uncompleted_jobs = [job for job in self._get_by_status_excluding(Status.COMPLETED) if
+                            platform is None or job.platform.name == platform.name]
 
         if wrapper:
             return [job for job in uncompleted_jobs if job.packed is False]
@@ -1902,14 +1937,8 @@ class JobList(object):
         :return: submitted jobs
         :rtype: list
         """
-        submitted = list()
-        if hold:
-            submitted = [job for job in self._job_list if (platform is None or
-                                                           job.platform.name == platform.name) and job.status == Status.SUBMITTED
-                         and job.hold == hold]
-        else:
-            submitted = [job for job in self._job_list if (platform is None or
-                                                           job.platform.name == platform.name) and job.status == Status.SUBMITTED]
+        submitted = [job for job in self._get_by_status(Status.SUBMITTED) if
+                     (platform is None or job.platform.name == platform.name) and (not hold or job.hold == hold)]
         if wrapper:
             return [job for job in submitted if job.packed is False]
         return submitted
@@ -1923,8 +1952,8 @@ class JobList(object):
         :return: running jobs
         :rtype: list
         """
-        running = [job for job in self._job_list if (platform is None or
-                                                     job.platform.name == platform.name) and job.status == Status.RUNNING]
+        running = [job for job in self._get_by_status(Status.RUNNING) if
+                   platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in running if job.packed is False]
         return running
@@ -1938,8 +1967,8 @@ class JobList(object):
         :return: queuedjobs
         :rtype: list
         """
-        queuing = [job for job in self._job_list if (platform is None or
-                                                     job.platform.name == platform.name) and job.status == Status.QUEUING]
+        queuing = [job for job in self._get_by_status(Status.QUEUING) if
+                   platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in queuing if job.packed is False]
         return queuing
@@ -1953,8 +1982,8 @@ class JobList(object):
         :return: failed jobs
         :rtype: list
         """
-        failed = [job for job in self._job_list if (platform is None or
-                                                    job.platform.name == platform.name) and job.status == Status.FAILED]
+        failed = [job for job in self._get_by_status(Status.FAILED) if
+                  platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in failed if job.packed is False]
         return failed
@@ -1968,10 +1997,8 @@ class JobList(object):
         :return: all jobs
         :rtype: list
         """
-        unsubmitted = [job for job in self._job_list if (platform is None or
-                                                         job.platform.name == platform.name) and (
-                               job.status != Status.SUBMITTED and
-                               job.status != Status.QUEUING and job.status != Status.RUNNING)]
+        unsubmitted = [job for job in self._get_by_status_excluding(Status.SUBMITTED, Status.QUEUING, Status.RUNNING)
+                       if platform is None or job.platform.name == platform.name]
 
         if wrapper:
             return [job for job in unsubmitted if job.packed is False]
@@ -2065,20 +2092,13 @@ class JobList(object):
         jobs_date = []
         # First Filter {select job by name}
         if select_jobs_by_name != "":
-            jobs_by_name = [job for job in self._job_list if
-                            re.search("(^|[^0-9a-z_])" + job.name.lower() + "([^a-z0-9_]|$)",
-                                      select_jobs_by_name.lower()) is not None]
-            jobs_by_name_no_expid = [job for job in self._job_list if
-                                     re.search("(^|[^0-9a-z_])" + job.name.lower()[5:] +
-                                               "([^a-z0-9_]|$)", select_jobs_by_name.lower()) is not None]
-            ultimate_jobs_list.extend(jobs_by_name)
-            ultimate_jobs_list.extend(jobs_by_name_no_expid)
+            ultimate_jobs_list.extend(self._get_jobs_named_in(select_jobs_by_name.lower()))
 
         # Second Filter { select all }
         if select_all_jobs_by_section != "":
-            all_jobs_by_section = [job for job in self._job_list if
-                                   re.search("(^|[^0-9a-z_])" + job.section.upper() +
-                                             "([^a-z0-9_]|$)", select_all_jobs_by_section.upper()) is not None]
+            all_jobs_by_section = self._get_by_sections(
+                lambda section: re.search("(^|[^0-9a-z_])" + section.upper() + "([^a-z0-9_]|$)",
+                                          select_all_jobs_by_section.upper()) is not None)
             ultimate_jobs_list.extend(all_jobs_by_section)
         # Third Filter N section { date , member? , chunk?}
         # Section[date[member][chunk]]
@@ -2104,9 +2124,9 @@ class JobList(object):
                         section_members = section_list[3].strip('mM:[]')
 
                 if section_name != "":
-                    jobs_filtered = [job for job in self._job_list if
-                                     re.search("(^|[^0-9a-z_])" + job.section.upper() +
-                                               "([^a-z0-9_]|$)", section_name.upper()) is not None]
+                    jobs_filtered = self._get_by_sections(
+                        lambda section: re.search("(^|[^0-9a-z_])" + section.upper() + "([^a-z0-9_]|$)",
+                                                  section_name.upper()) is not None)
                 if section_dates != "":
                     jobs_date = [job for job in jobs_filtered if
                                  re.search("(^|[^0-9a-z_])" + date2str(job.date, job.date_format) +
@@ -2122,11 +2142,35 @@ class JobList(object):
                                           re.search("(^|[^0-9a-z_])" + str(job.member) + "([^a-z0-9_]|$)",
                                                     section_members.lower()) is not None)]
                 ultimate_jobs_list.extend(jobs_final)
-        # Duplicates out
-        ultimate_jobs_list = list(set(ultimate_jobs_list))
+        # Duplicates out, keeping the order of the filters
+        ultimate_jobs_list = list(dict.fromkeys(ultimate_jobs_list))
         Log.debug(f"List of jobs filtered by TWO_STEP_START parameter:\n{[job.name for job in ultimate_jobs_list]}")
         return ultimate_jobs_list
 
+    def _get_jobs_named_in(self, text: str) -> list[Job]:
+        """Returns the jobs whose name, with or without the expid prefix, is a word of ``text``.
+
+        Words are the runs of ``[0-9a-z_]`` characters, so this is a lookup per word
+        instead of a regular expression per job.
+
+        :param text: lower case text with job names
+        :return: matching jobs, in the order of the words, a job matched by both forms of its name is
+            returned twice
+        :rtype: list
+        """
+        self._index.ensure(self._job_list)
+        # In the order they are written, so the jobs are always returned in the same order.
+        words = dict.fromkeys(re.split("[^0-9a-z_]+", text))
+        jobs_by_name = [job for word in words for job in self._index.get_by_word(word)]
+        jobs_by_name_no_expid = [job for word in words for job in self._index.get_by_word(word, without_expid=True)]
+        # Names with other characters cannot be split in words, match them as before.
+        for job in self._index.get_not_words():
+            if re.search("(^|[^0-9a-z_])" + job.name.lower() + "([^a-z0-9_]|$)", text) is not None:
+                jobs_by_name.append(job)
+            if re.search("(^|[^0-9a-z_])" + job.name.lower()[5:] + "([^a-z0-9_]|$)", text) is not None:
+                jobs_by_name_no_expid.append(job)
+        return jobs_by_name + jobs_by_name_no_expid
+
     def get_ready(self, platform=None, hold=False, wrapper=False):
         """Returns a list of ready jobs.
 
@@ -2137,9 +2181,9 @@ class JobList(object):
         :return: ready jobs
         :rtype: list
         """
-        ready = [job for job in self._job_list if
+        ready = [job for job in self._get_by_status(Status.READY) if
                  (platform is None or platform == "" or job.platform.name == platform.name) and
-                 job.status == Status.READY and job.hold is hold]
+                 job.hold is hold]
 
         if wrapper:
             return [job for job in ready if job.packed is False]
@@ -2153,8 +2197,8 @@ class JobList(object):
         :return: prepared jobs
         :rtype: list
         """
-        prepared = [job for job in self._job_list if (platform is None or
-                                                      job.platform.name == platform.name) and job.status == Status.PREPARED]
+        prepared = [job for job in self._get_by_status(Status.PREPARED) if
+                    platform is None or job.platform.name == platform.name]
         return prepared
 
     def get_delayed(self, platform=None):
@@ -2165,8 +2209,8 @@ class JobList(object):
         :return: delayed jobs
         :rtype: list
         """
-        delayed = [job for job in self._job_list if (platform is None or
-                                                     job.platform.name == platform.name) and job.status == Status.DELAYED]
+        delayed = [job for job in self._get_by_status(Status.DELAYED) if
+                   platform is None or job.platform.name == platform.name]
         return delayed
 
     def get_waiting(self, platform=None, wrapper=False):
@@ -2178,8 +2222,8 @@ class JobList(object):
         :return: waiting jobs
         :rtype: list
         """
-        waiting_jobs = [job for job in self._job_list if (platform is None or
-                                                          job.platform.name == platform.name) and job.status == Status.WAITING]
+        waiting_jobs = [job for job in self._get_by_status(Status.WAITING) if
+                        platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in waiting_jobs if job.packed is False]
         return waiting_jobs
@@ -2193,8 +2237,8 @@ class JobList(object):
         :rtype: list
 
         """
-        waiting_jobs = [job for job in self._job_list if (
-                job.platform.type == platform_type and job.status == Status.WAITING)]
+        waiting_jobs = [job for job in self._get_by_status(Status.WAITING) if
+                        job.platform.type == platform_type]
         return waiting_jobs
 
     def get_held_jobs(self, platform=None):
@@ -2205,8 +2249,8 @@ class JobList(object):
         :return: jobs in platforms
         :rtype: list
         """
-        return [job for job in self._job_list if (platform is None or
-                                                  job.platform.name == platform.name) and job.status == Status.HELD]
+        return [job for job in self._get_by_status(Status.HELD) if
+                platform is None or job.platform.name == platform.name]
 
     def get_unknown(self, platform=None, wrapper=False):
         """Returns a list of jobs on unknown state.
@@ -2217,8 +2261,8 @@ class JobList(object):
         :return: unknown state jobs
         :rtype: list
         """
-        submitted = [job for job in self._job_list if (platform is None or
-                                                       job.platform.name == platform.name) and job.status == Status.UNKNOWN]
+        submitted = [job for job in self._get_by_status(Status.UNKNOWN) if
+                     platform is None or job.platform.name == platform.name]
         if wrapper:
             return [job for job in submitted if job.packed is False]
         return submitted
@@ -2271,10 +2315,8 @@ class JobList(object):
         :return: found job
         :rtype: job
         """
-        for job in self._job_list:
-            if job.name == name:
-                return job
-        return None
+        self._index.ensure(self._job_list)
+        return self._index.get_by_name(name)
 
     def get_jobs_by_section(self, section_list: list, banned_jobs: list = None,
                             get_only_non_completed: bool = False) -> list:
@@ -2297,8 +2339,8 @@ class JobList(object):
             banned_jobs = []
 
         jobs = []
-        for job in self._job_list:
-            if job.section.upper() in section_list and job.name not in banned_jobs:
+        for job in self._get_by_sections(lambda section: section.upper() in section_list):
+            if job.name not in banned_jobs:
                 if get_only_non_completed:
                     if job.status != Status.COMPLETED:
                         jobs.append(job)
@@ -2306,6 +2348,30 @@ class JobList(object):
                     jobs.append(job)
         return jobs
 
+    def _get_by_sections(self, accept_section) -> list[Job]:
+        """Returns the jobs of the sections accepted by ``accept_section``, in job list order.
+
+        :param accept_section: predicate over a section name
+        :return: jobs of the accepted sections
+        :rtype: list
+        """
+        self._index.ensure(self._job_list)
+        return self._index.select(sections=lambda section: section is not None and accept_section(section))
+
+    def get_jobs_by_coordinates(self, dates=None, members=None, chunks=None, splits=None,
+                                sections=None) -> list[Job]:
+        """Returns the jobs whose coordinates are accepted by the given predicates.
+
+        Each predicate is called with a date, member, chunk, split, or section
+        value (``None`` for jobs without it). A ``None`` predicate accepts any value.
+
+        :return: jobs that match every predicate, in job list order
+        :rtype: list
+        """
+        self._index.ensure(self._job_list)
+        return self._index.select(sections=sections, dates=dates, members=members,
+                                  chunks=chunks, splits=splits)
+
     def get_in_queue_grouped_id(self, platform) -> dict[int, list[Job]]:
         jobs = self.get_in_queue(platform)
         jobs_by_id = dict()
@@ -2350,19 +2416,20 @@ class JobList(object):
         """
         return sorted(self._job_list, key=lambda k: k.status)
 
-    def load(self, create=False, backup=False):
+    def load(self, create=False, backup=False, read_only=False):
         """Recreates a stored job list from the persistence.
 
+        :param read_only: the job list is loaded for a command that does not save it, e.g. ``monitor``
         :return: loaded job list object
         :rtype: JobList
         """
         try:
             if not backup:
                 Log.info("Loading JobList")
-                return self._persistence.load(self._persistence_path, self._persistence_file)
+                return self._persistence.load(self._persistence_path, self._persistence_file, read_only=read_only)
             else:
                 return self._persistence.load(self._persistence_path,
-                                              self._persistence_file + "_backup")
+                                              self._persistence_file + "_backup", read_only=read_only)
         except ValueError as e:
             if not create:
                 raise AutosubmitCritical(
@@ -2380,7 +2447,7 @@ class JobList(object):
         except BaseException as e:
             if not backup:
                 Log.debug("Autosubmit will use a backup to recover the job_list")
-                return self.load(create, True)
+                return self.load(create, True, read_only)
             else:
                 if not create:
                     raise AutosubmitCritical(f"JobList could not be loaded due: "
@@ -2755,48 +2822,7 @@ class JobList(object):
             for job in self.get_delayed():
                 if datetime.datetime.now() >= job.delay_end:
                     job.status = Status.READY
-            for job in self.get_waiting():
-                tmp = [parent for parent in job.parents if
-                       parent.status == Status.COMPLETED or parent.status == Status.SKIPPED]
-                tmp2 = [parent for parent in job.parents if
-                        parent.status == Status.COMPLETED or parent.status == Status.SKIPPED
-                        or parent.status == Status.FAILED]
-                tmp3 = [parent for parent in job.parents if
-                        parent.status == Status.SKIPPED or parent.status == Status.FAILED]
-                failed_ones = [parent for parent in job.parents if parent.status == Status.FAILED]
-                if job.parents is None or len(tmp) == len(job.parents):
-                    job.status = Status.READY
-                    job.hold = False
-                    Log.debug(f"Setting job: {job.name} status to: READY (all parents completed)...")
-                if job.status != Status.READY:
-                    if len(tmp3) != len(job.parents):
-                        if len(tmp2) == len(job.parents):
-                            strong_dependencies_failure = False
-                            weak_dependencies_failure = False
-                            for parent in failed_ones:
-                                if (parent.name in job.edge_info and job.edge_info[parent.name].
-                                        get('optional', False)):
-                                    weak_dependencies_failure = True
-                                elif parent.section in job.dependencies:
-                                    if parent.status not in [Status.COMPLETED, Status.SKIPPED]:
-                                        strong_dependencies_failure = True
-                                    break
-                            if not strong_dependencies_failure and weak_dependencies_failure:
-                                job.status = Status.READY
-                                job.hold = False
-                                Log.debug(f"Setting job: {job.name} status to: READY "
-                                          "(conditional jobs are completed/failed)...")
-                                break
-                    else:
-                        if len(tmp3) == 1 and len(job.parents) == 1:
-                            for parent in job.parents:
-                                if (parent.name in job.edge_info and job.edge_info[parent.name].
-                                        get('optional', False)):
-                                    job.status = Status.READY
-                                    job.hold = False
-                                    Log.debug(f"Setting job: {job.name} status to: READY"
-                                              " (conditional jobs are completed/failed)...")
-                                    break
+            self._update_waiting_jobs()
             jobs_to_skip = self.get_skippable_jobs(
                 as_conf.get_wrapper_jobs())  # Get A Dict with all jobs that are listed as skippable
 
@@ -2840,6 +2866,40 @@ class JobList(object):
         Log.debug('Update finished')
         return save
 
+    def _update_waiting_jobs(self) -> None:
+        """Changes to READY the WAITING jobs whose parents allow it.
+
+        Only the jobs that changed their status, or that have a parent that
+        changed its status, since the previous call are checked, see
+        ``JobListIndex.take_changed``. The parents of each job are counted
+        by status as they change, see ``JobListIndex.parent_counts``.
+        """
+        self._index.ensure(self._job_list)
+        changed_jobs = self._index.take_changed()
+        for position, job in enumerate(changed_jobs):
+            if job.status != Status.WAITING:
+                continue
+            counts = self._index.parent_counts(job)
+            if counts.completed_or_skipped == counts.parents:
+                job.status = Status.READY
+                job.hold = False
+                Log.debug(f"Setting job: {job.name} status to: READY (all parents completed)...")
+            elif counts.skipped + counts.failed != counts.parents:
+                if (counts.completed_or_skipped + counts.failed == counts.parents and
+                        not counts.strong_failed and counts.optional_failed):
+                    job.status = Status.READY
+                    job.hold = False
+                    Log.debug(f"Setting job: {job.name} status to: READY "
+                              "(conditional jobs are completed/failed)...")
+                    # The remaining jobs are checked in the next update.
+                    self._index.mark_changed(changed_jobs[position + 1:])
+                    break
+            elif counts.parents == 1 and is_optional_parent(job, next(iter(job.parents))):
+                job.status = Status.READY
+                job.hold = False
+                Log.debug(f"Setting job: {job.name} status to: READY"
+                          " (conditional jobs are completed/failed)...")
+
     def update_genealogy(self):
         """When we have created the job list, every type of job is created.
         Update genealogy remove jobs that have no templates. """
@@ -2918,6 +2978,7 @@ class JobList(object):
             parent.children.remove(job)
 
         self._job_list.remove(job)
+        self._index.discard(job)
 
     def rerun(self, job_list_unparsed, as_conf, monitor=False):
         """Updates job list to rerun the jobs specified by a job list.
@@ -3341,13 +3402,9 @@ class JobList(object):
         start_time = now
         finish_time = now
         current_status = status_from_job
-        path = os.path.join(tmp_path, name + '_TOTAL_STATS')
-        # print("Looking in " + path)
-        if os.path.exists(path):
-            request = 'tail -1 ' + path
-            last_line = os.popen(request).readline()
-            # print(last_line)
-
+        lines = stats_journal(tmp_path).readlines(name + '_TOTAL_STATS')
+        if lines is not None:
+            last_line = lines[-1] if lines else ''
             values = last_line.split()
             # print(last_line)
             try:
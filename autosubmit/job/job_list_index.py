@@ -0,0 +1,347 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Incremental indexes over the jobs of a ``JobList``.
+
+The ``JobList`` getters (``get_ready``, ``get_completed``, ...) used to walk
+the whole job list on every call. The index here keeps the jobs bucketed by
+status, and it is updated by the ``Job.status`` setter, so that a query only
+costs the size of the buckets it reads.
+
+It also maps job names to jobs, and keeps the jobs in a tree by section,
+date, member, chunk and split. Those fields are set when the jobs are
+created and do not change afterward, so that part of the index only
+changes when jobs are added to or removed from the list.
+
+Finally, it counts the parents of each job by status, and remembers which
+jobs had a status change or a parent with a status change, so that
+``JobList.update_list`` only checks the ``WAITING`` jobs that may have
+become ready.
+"""
+
+import re
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+
+from autosubmit.job.job_common import Status
+
+if TYPE_CHECKING:
+    from autosubmit.job.job import Job
+
+
+_WORD = re.compile("[0-9a-z_]+")
+"""Characters of the words in the job name filters (e.g. ``-fl``, ``TWO_STEP_START``)."""
+
+_EXPID_PREFIX_LENGTH = 5
+"""Length of the ``<expid>_`` prefix of the job names."""
+
+_Filter = Optional[Callable[[Any], bool]]
+"""A predicate over one of the coordinates of a job, ``None`` to accept any value."""
+
+
+def is_optional_parent(job: 'Job', parent: 'Job') -> bool:
+    """Whether the failure of ``parent`` is a weak dependency failure for ``job``."""
+    return parent.name in job.edge_info and job.edge_info[parent.name].get('optional', False)
+
+
+class ParentCounts:
+    """Number of parents of a job by status, as used by ``JobList.update_list``."""
+
+    __slots__ = ('parents', 'completed_or_skipped', 'skipped', 'failed', 'strong_failed', 'optional_failed')
+
+    def __init__(self, job: 'Job'):
+        self.parents = len(job.parents)
+        self.completed_or_skipped = 0
+        self.skipped = 0
+        self.failed = 0
+        self.strong_failed = 0
+        self.optional_failed = 0
+        for parent in job.parents:
+            self.add(job, parent, parent.status, 1)
+
+    def add(self, job: 'Job', parent: 'Job', status: Any, amount: int) -> None:
+        """Count (or uncount, with ``amount=-1``) ``parent`` with the given status.
+
+        :param job: The job whose parents are counted.
+        :param parent: One of its parents.
+        :param status: The status of the parent to count.
+        :param amount: 1 to count the parent, -1 to remove it from the counts.
+        """
+        if status == Status.COMPLETED:
+            self.completed_or_skipped += amount
+        elif status == Status.SKIPPED:
+            self.completed_or_skipped += amount
+            self.skipped += amount
+        elif status == Status.FAILED:
+            self.failed += amount
+            if is_optional_parent(job, parent):
+                self.optional_failed += amount
+            elif parent.section in job.dependencies:
+                self.strong_failed += amount
+
+
+class JobListIndex:
+    """Status, name, and coordinates index for a list of jobs.
+
+    The index is bound to one list object. It is rebuilt lazily whenever that
+    list is replaced or its length changes behind its back (e.g. a plain
+    ``append``), so callers only need to call :meth:`ensure` before reading.
+
+    A job can only notify one index. If another index claims a job, the
+    previous owner is marked as stale and rebuilds itself on its next read.
+    """
+
+    def __init__(self):
+        self._source: Optional[list['Job']] = None
+        self._size = 0
+        self._stale = True
+        self._position: dict['Job', int] = {}
+        self._by_status: dict[Any, dict['Job', None]] = {}
+        self._by_name: dict[str, 'Job'] = {}
+        self._by_word: dict[str, list['Job']] = {}
+        self._by_short_word: dict[str, list['Job']] = {}
+        self._not_words: list['Job'] = []
+        self._by_coordinates: dict[Any, dict[Any, dict[Any, dict[Any, dict[Any, dict['Job', None]]]]]] = {}
+        self._parent_counts: dict['Job', ParentCounts] = {}
+        self._changed: dict['Job', None] = {}
+        self.status_changes = 0
+        """Number of status changes of the indexed jobs, and of rebuilds, since the index was created."""
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next read."""
+        self._stale = True
+
+    def ensure(self, job_list: list['Job']) -> None:
+        """Rebuild the index if it does not reflect ``job_list`` anymore.
+
+        :param job_list: The list of jobs the index must describe.
+        """
+        if self._stale or job_list is not self._source or len(job_list) != self._size:
+            self.rebuild(job_list)
+
+    def rebuild(self, job_list: list['Job']) -> None:
+        """Index every job of ``job_list`` from scratch.
+
+        :param job_list: The list of jobs to index.
+        """
+        self._source = job_list
+        self._size = len(job_list)
+        self.status_changes += 1
+        self._position = {}
+        self._by_status = {}
+        self._by_name = {}
+        self._by_word = {}
+        self._by_short_word = {}
+        self._not_words = []
+        self._by_coordinates = {}
+        self._parent_counts = {}
+        self._changed = dict.fromkeys(job_list)
+        for position, job in enumerate(job_list):
+            self._position[job] = position
+            self._by_status.setdefault(job.status, {})[job] = None
+            self._by_name.setdefault(job.name, job)
+            word = job.name.lower()
+            short_word = word[_EXPID_PREFIX_LENGTH:]
+            if _WORD.fullmatch(word) and _WORD.fullmatch(short_word):
+                self._by_word.setdefault(word, []).append(job)
+                self._by_short_word.setdefault(short_word, []).append(job)
+            else:
+                self._not_words.append(job)
+            self._coordinates_bucket(job)[job] = None
+            previous_index = getattr(job, '_job_list_index', None)
+            if previous_index is not None and previous_index is not self:
+                previous_index.invalidate()
+            job._job_list_index = self
+        self._stale = False
+
+    def discard(self, job: 'Job') -> None:
+        """Remove a job that has been removed from the indexed list.
+
+        :param job: The removed job.
+        """
+        if self._position.pop(job, None) is None:
+            return
+        self._size -= 1
+        bucket = self._by_status.get(job.status)
+        if bucket is not None:
+            bucket.pop(job, None)
+        if self._by_name.get(job.name) is job:
+            del self._by_name[job.name]
+        word = job.name.lower()
+        for words, key in ((self._by_word, word), (self._by_short_word, word[_EXPID_PREFIX_LENGTH:])):
+            if job in words.get(key, []):
+                words[key].remove(job)
+        if job in self._not_words:
+            self._not_words.remove(job)
+        self._coordinates_bucket(job).pop(job, None)
+        self._parent_counts.pop(job, None)
+        self._changed.pop(job, None)
+        for child in job.children:
+            # Its parents changed.
+            self._parent_counts.pop(child, None)
+            if child in self._position:
+                self._changed[child] = None
+        if getattr(job, '_job_list_index', None) is self:
+            job._job_list_index = None
+
+    def update_status(self, job: 'Job', old_status: Any, new_status: Any) -> None:
+        """Move a job between status buckets. Called from the ``Job.status`` setter.
+
+        :param job: The job whose status changes.
+        :param old_status: The current status of the job.
+        :param new_status: The status being assigned.
+        """
+        if old_status == new_status or job not in self._position:
+            return
+        bucket = self._by_status.get(old_status)
+        if bucket is not None:
+            bucket.pop(job, None)
+        self._by_status.setdefault(new_status, {})[job] = None
+        self.status_changes += 1
+        self._changed[job] = None
+        for child in job.children:
+            if child not in self._position:
+                continue
+            self._changed[child] = None
+            counts = self._parent_counts.get(child)
+            if counts is None:
+                continue
+            if counts.parents != len(child.parents) or job not in child.parents:
+                del self._parent_counts[child]
+            else:
+                counts.add(child, job, old_status, -1)
+                counts.add(child, job, new_status, 1)
+
+    def parent_counts(self, job: 'Job') -> ParentCounts:
+        """Return the number of parents of ``job`` by status.
+
+        The counts are computed on the first call, and then updated by
+        :meth:`update_status` when a parent changes its status. They are
+        computed again if the parents of the job change, or if any of them
+        is not in the indexed list (and would not notify the index).
+
+        :param job: An indexed job.
+        :return: Its parent counts.
+        """
+        counts = self._parent_counts.get(job)
+        if counts is None or counts.parents != len(job.parents):
+            counts = ParentCounts(job)
+            if all(parent in self._position and job in parent.children for parent in job.parents):
+                self._parent_counts[job] = counts
+            else:
+                self._parent_counts.pop(job, None)
+                # Keep checking it, as some parents will not mark it as changed.
+                self._changed[job] = None
+        return counts
+
+    def take_changed(self) -> list['Job']:
+        """Return the jobs that had a status change, or a parent with a status change,
+        since the previous call, in the order of the indexed list.
+
+        Every job is returned after a rebuild of the index.
+        """
+        changed = sorted(self._changed, key=self._position.__getitem__)
+        self._changed = {}
+        return changed
+
+    def mark_changed(self, jobs: Iterable['Job']) -> None:
+        """Return ``jobs`` again on the next call to :meth:`take_changed`.
+
+        :param jobs: Indexed jobs.
+        """
+        for job in jobs:
+            if job in self._position:
+                self._changed[job] = None
+
+    def statuses(self) -> Iterable[Any]:
+        """Return the statuses that have at least one job."""
+        return [status for status, bucket in self._by_status.items() if bucket]
+
+    def get(self, *statuses: Any) -> list['Job']:
+        """Return the jobs with any of the given statuses.
+
+        The result keeps the order of the indexed list, so it is the same
+        as the one of a linear scan over it.
+
+        :param statuses: The statuses to look for.
+        :return: The list of matching jobs.
+        """
+        if len(statuses) == 1:
+            bucket = self._by_status.get(statuses[0], {})
+            return sorted(bucket, key=self._position.__getitem__)
+        jobs = []
+        for status in set(statuses):
+            jobs.extend(self._by_status.get(status, {}))
+        return sorted(jobs, key=self._position.__getitem__)
+
+    def get_by_name(self, name: str) -> Optional['Job']:
+        """Return the job with the given name.
+
+        :param name: The job name.
+        :return: The job, or ``None`` if there is no job with that name.
+        """
+        return self._by_name.get(name)
+
+    def get_by_word(self, word: str, without_expid: bool = False) -> list['Job']:
+        """Return the jobs whose lower case name is ``word``.
+
+        Only names made of ``[0-9a-z_]`` characters (once in lower case) are
+        indexed this way, the others are returned by :meth:`get_not_words`.
+
+        :param word: The lower case name.
+        :param without_expid: Compare with the name without the ``<expid>_`` prefix.
+        :return: The matching jobs.
+        """
+        words = self._by_short_word if without_expid else self._by_word
+        return list(words.get(word, []))
+
+    def get_not_words(self) -> list['Job']:
+        """Return the jobs that cannot be looked up with :meth:`get_by_word`."""
+        return list(self._not_words)
+
+    def sections(self) -> Iterable[Any]:
+        """Return the sections that have at least one job."""
+        return list(self._by_coordinates.keys())
+
+    def select(self, sections: _Filter = None, dates: _Filter = None, members: _Filter = None,
+               chunks: _Filter = None, splits: _Filter = None) -> list['Job']:
+        """Return the jobs whose coordinates are accepted by the given predicates.
+
+        Each predicate receives the value of that coordinate (e.g. the job
+        date, or ``None`` for jobs without date), and it is evaluated once per
+        node of the tree instead of once per job.
+
+        :param sections: Predicate over the job section.
+        :param dates: Predicate over the job date.
+        :param members: Predicate over the job member.
+        :param chunks: Predicate over the job chunk.
+        :param splits: Predicate over the job split.
+        :return: The matching jobs, in the order of the indexed list.
+        """
+        levels = [self._by_coordinates]
+        for accept in (sections, dates, members, chunks):
+            levels = [children for level in levels for key, children in level.items()
+                      if accept is None or accept(key)]
+        jobs = [job for level in levels for key, bucket in level.items()
+                if splits is None or splits(key) for job in bucket]
+        return sorted(jobs, key=self._position.__getitem__)
+
+    def _coordinates_bucket(self, job: 'Job') -> dict['Job', None]:
+        by_date = self._by_coordinates.setdefault(job.section, {})
+        by_member = by_date.setdefault(job.date, {})
+        by_chunk = by_member.setdefault(job.member, {})
+        by_split = by_chunk.setdefault(job.chunk, {})
+        return by_split.setdefault(job.split, {})
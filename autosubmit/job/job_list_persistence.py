@@ -16,26 +16,49 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 import gc
+import mmap
 import os
 import pickle
 import shutil
-from contextlib import suppress
+import struct
+import zlib
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from sys import setrecursionlimit, getrecursionlimit
-from typing import TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
+
+from bscearth.utils.date import date2str
 
 from autosubmit.config.basicconfig import BasicConfig
 
 from autosubmit.database.db_common import get_connection_url
 from autosubmit.database.db_manager import DbManager
-from autosubmit.database.tables import JobPklTable
+from autosubmit.database.tables import JobPklTable, JobStateTable
+from autosubmit.job.job import Job
 from autosubmit.log.log import Log
 
 if TYPE_CHECKING:
     from networkx import DiGraph
 
 
+@contextmanager
+def _gc_paused():
+    """Pauses the garbage collector while unpickling a job list.
+
+    Unpickling allocates hundreds of thousands of dicts, and every few of them
+    trigger a collection that traverses all the previous ones.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 class JobListPersistence(object):
     """
     Class to manage the persistence of the job lists
@@ -52,11 +75,13 @@ class JobListPersistence(object):
         """
         raise NotImplementedError  # pragma: no cover
 
-    def load(self, persistence_path, persistence_file):
+    def load(self, persistence_path, persistence_file, read_only=False):
         """
         Loads a job list from persistence
         :param persistence_file: str
         :param persistence_path: str
+        :param read_only: the caller will not save the job list, e.g. ``monitor``
+        :type read_only: bool
 
         """
         raise NotImplementedError  # pragma: no cover
@@ -78,14 +103,23 @@ class JobListPersistencePkl(JobListPersistence):
 
     EXT = '.pkl'
 
-    def load(self, persistence_path, persistence_file):
+    def load(self, persistence_path, persistence_file, read_only=False):
         """
         Loads a job list from a pkl file
+
+        A read-only load maps the pkl file in memory instead of copying it to a
+        temporary file first. ``save`` replaces the pkl file atomically, so the
+        mapped file stays complete even if the pkl file is saved meanwhile.
+
         :param persistence_file: str
         :param persistence_path: str
+        :param read_only: the caller will not save the job list, e.g. ``monitor``
+        :type read_only: bool
 
         """
         path = os.path.join(persistence_path, persistence_file + '.pkl')
+        if read_only:
+            return self._load_mapped(path)
         path_tmp = os.path.join(persistence_path[:-3]+"tmp", persistence_file + f'.pkl.tmp_{os.urandom(8).hex()}')
 
         try:
@@ -100,7 +134,7 @@ class JobListPersistencePkl(JobListPersistence):
             # copy the path to a tmp file random seed to avoid corruption
             try:
                 shutil.copy(str(path), str(path_tmp))
-                with open(path_tmp, 'rb') as fd:
+                with open(path_tmp, 'rb') as fd, _gc_paused():
                     current_limit = getrecursionlimit()
                     setrecursionlimit(100000)
                     job_list = pickle.load(fd)
@@ -110,6 +144,26 @@ class JobListPersistencePkl(JobListPersistence):
 
             return job_list
 
+    @staticmethod
+    def _load_mapped(path: str):
+        try:
+            with open(path, 'rb') as fd:
+                if os.fstat(fd.fileno()).st_size == 0:
+                    raise EOFError(f'File {path} is empty')
+                with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mapped, _gc_paused():
+                    current_limit = getrecursionlimit()
+                    setrecursionlimit(100000)
+                    try:
+                        return pickle.loads(mapped)
+                    finally:
+                        setrecursionlimit(current_limit)
+        except PermissionError:
+            Log.warning(f'Permission denied to read {path}')
+            raise
+        except FileNotFoundError:
+            Log.warning(f'File {path} does not exist. ')
+            raise
+
     def save(self, persistence_path, persistence_file, job_list, graph: 'DiGraph'):
         """
         Persists a job list in a pkl file
@@ -144,6 +198,176 @@ class JobListPersistencePkl(JobListPersistence):
         return os.path.exists(path)
 
 
+@dataclass
+class _ChangeLogState:
+    """What a ``JobListPersistencePklLog`` knows about one change log it writes."""
+
+    snapshot_id: tuple[int, int, int]
+    """Identity of the snapshot the change log applies to, see ``JobListPersistencePklLog._snapshot_id``."""
+    mark: int
+    """Change mark taken when the last save started, see ``Job.new_change_mark``."""
+    names: set[str] = field(default_factory=set)
+    """Names of the jobs stored in the snapshot and the change log."""
+    snapshot_size: int = 0
+    log_size: int = 0
+    records: int = 0
+
+
+class JobListPersistencePklLog(JobListPersistencePkl):
+    """Class to manage the persistence of the job lists as a pkl snapshot plus a change log.
+
+    The snapshot is the same pkl file written by ``JobListPersistencePkl``. Saves
+    append only the jobs that changed since the previous save to
+    ``<persistence_file>.pkl.changes``, and loading replays that file over the
+    snapshot.
+
+    The change log starts with the identity (inode, size, and modification time)
+    of the snapshot it applies to, and a change log that does not match the
+    snapshot is ignored. A compaction writes a new snapshot and then starts a
+    new change log, so a crash in between leaves a complete snapshot and a stale
+    change log. Each record carries its length and checksum, so a record
+    truncated by a crash is ignored together with anything after it.
+
+    A save is a compaction when it is the first one of the process for that
+    file, when jobs were added or removed, when most jobs changed, or when the
+    change log is larger than the snapshot or has too many records.
+    """
+
+    CHANGES_EXT = '.pkl.changes'
+    MAX_RECORDS = 1000
+    """Number of change log records that triggers a compaction."""
+    MAX_CHANGED_RATIO = 0.5
+    """Fraction of changed jobs from which it is cheaper to write a new snapshot."""
+
+    _HEADER = struct.Struct('<4sQQq')
+    _MAGIC = b'ASJL'
+    _RECORD = struct.Struct('<II')
+
+    def __init__(self):
+        self._states: dict[str, _ChangeLogState] = {}
+
+    def load(self, persistence_path, persistence_file, read_only=False):
+        """
+        Loads a job list from a pkl file and replays its change log
+        :param persistence_file: str
+        :param persistence_path: str
+        :param read_only: the caller will not save the job list, e.g. ``monitor``
+        :type read_only: bool
+
+        """
+        snapshot_path = os.path.join(persistence_path, persistence_file + self.EXT)
+        snapshot_id = self._snapshot_id(snapshot_path)
+        job_list = super().load(persistence_path, persistence_file, read_only)
+        if snapshot_id is not None:
+            for changes in self._read_changes(os.path.join(persistence_path, persistence_file + self.CHANGES_EXT),
+                                              snapshot_id):
+                job_list.update(changes)
+        return job_list
+
+    def save(self, persistence_path, persistence_file, job_list, graph: 'DiGraph'):
+        """
+        Persists the changes of a job list, or a new snapshot of it
+        :param job_list: JobList
+        :param persistence_file: str
+        :param persistence_path: str
+        :param graph: networkx graph object
+        :type graph: DiGraph
+        """
+        snapshot_path = os.path.join(persistence_path, persistence_file + self.EXT)
+        changes_path = os.path.join(persistence_path, persistence_file + self.CHANGES_EXT)
+        mark = Job.new_change_mark()
+        state = self._states.get(changes_path)
+        changed_jobs = None
+        if state is not None and state.snapshot_id == self._snapshot_id(snapshot_path):
+            changed_jobs = [job for job in job_list if job.changed_since(state.mark)]
+        if self._needs_compaction(state, job_list, changed_jobs):
+            self._compact(persistence_path, persistence_file, job_list, graph, mark)
+            return
+        if changed_jobs:
+            try:
+                written = self._append_changes(changes_path, {job.name: job.__getstate__() for job in changed_jobs})
+            except BaseException:
+                # The change log may end with a partial record now, start again from a snapshot.
+                del self._states[changes_path]
+                raise
+            state.log_size += written
+            state.records += 1
+            Log.debug(f'JobList changes ({len(changed_jobs)} jobs) saved in {changes_path}')
+        state.mark = mark
+
+    def _needs_compaction(self, state: Optional[_ChangeLogState], job_list, changed_jobs) -> bool:
+        if state is None or changed_jobs is None:
+            return True
+        if len(job_list) != len(state.names) or any(job.name not in state.names for job in changed_jobs):
+            return True
+        return (len(changed_jobs) > self.MAX_CHANGED_RATIO * len(job_list) or
+                state.records >= self.MAX_RECORDS or state.log_size > state.snapshot_size)
+
+    def _compact(self, persistence_path, persistence_file, job_list, graph: 'DiGraph', mark: int) -> None:
+        """Writes a new snapshot, and then an empty change log that applies to it."""
+        super().save(persistence_path, persistence_file, job_list, graph)
+        snapshot_path = os.path.join(persistence_path, persistence_file + self.EXT)
+        changes_path = os.path.join(persistence_path, persistence_file + self.CHANGES_EXT)
+        snapshot_id = self._snapshot_id(snapshot_path)
+        tmp_path = changes_path + '.tmp'
+        with open(tmp_path, 'wb') as fd:
+            fd.write(self._HEADER.pack(self._MAGIC, *snapshot_id))
+        os.replace(tmp_path, changes_path)
+        self._states[changes_path] = _ChangeLogState(
+            snapshot_id=snapshot_id,
+            mark=mark,
+            names={job.name for job in job_list},
+            snapshot_size=os.path.getsize(snapshot_path)
+        )
+
+    def _append_changes(self, changes_path: str, changes: dict[str, Any]) -> int:
+        """Appends one record to the change log.
+
+        :return: the number of bytes written
+        """
+        payload = pickle.dumps(changes, pickle.HIGHEST_PROTOCOL)
+        record = self._RECORD.pack(len(payload), zlib.crc32(payload)) + payload
+        with open(changes_path, 'ab') as fd:
+            fd.write(record)
+        return len(record)
+
+    def _read_changes(self, changes_path: str, snapshot_id: tuple[int, int, int]):
+        """Yields the records of the change log, if it applies to the snapshot ``snapshot_id``.
+
+        Stops at the first incomplete or corrupted record.
+        """
+        try:
+            with open(changes_path, 'rb') as fd:
+                header = fd.read(self._HEADER.size)
+                if len(header) < self._HEADER.size:
+                    return
+                magic, *log_snapshot_id = self._HEADER.unpack(header)
+                if magic != self._MAGIC or tuple(log_snapshot_id) != snapshot_id:
+                    Log.debug(f'Ignoring {changes_path} as it does not belong to the current snapshot')
+                    return
+                while True:
+                    record_header = fd.read(self._RECORD.size)
+                    if len(record_header) < self._RECORD.size:
+                        return
+                    length, checksum = self._RECORD.unpack(record_header)
+                    payload = fd.read(length)
+                    if len(payload) < length or zlib.crc32(payload) != checksum:
+                        Log.warning(f'Ignoring an incomplete record at the end of {changes_path}')
+                        return
+                    yield pickle.loads(payload)
+        except FileNotFoundError:
+            return
+
+    @staticmethod
+    def _snapshot_id(snapshot_path: str) -> Optional[tuple[int, int, int]]:
+        """Returns the inode, size, and modification time of the snapshot, or ``None`` if it does not exist."""
+        try:
+            stat = os.stat(snapshot_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
 class JobListPersistenceDb(JobListPersistence):
     """Class to manage the database persistence of the job lists."""
 
@@ -157,11 +381,12 @@ class JobListPersistenceDb(JobListPersistence):
         self.db_manager = DbManager(connection_url=connection_url)
         self.db_manager.create_table(JobPklTable.name)
 
-    def load(self, persistence_path, persistence_file):
+    def load(self, persistence_path, persistence_file, read_only=False):
         """Loads a job list from a database.
 
         :param persistence_file: str
         :param persistence_path: str
+        :param read_only: not used, database reads do not need a copy of the job list
         """
         row = self.db_manager.select_first_where(
             JobPklTable.name,
@@ -216,3 +441,130 @@ class JobListPersistenceDb(JobListPersistence):
         return self.db_manager.select_first_where(
             JobPklTable.name, {'expid': self.expid}
         ) is not None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return None if value in (None, '') else str(value)
+
+
+class JobListPersistenceDbRows(JobListPersistence):
+    """Class to manage the database persistence of the job lists, with one row per job.
+
+    The rows of ``JobStateTable`` have the pickled job, and typed columns with
+    its status, id, platform, coordinates, etc., so that other tools can query
+    the jobs without unpickling them.
+
+    The first save of a process writes every job, and deletes the rows of the
+    jobs that are not in the job list anymore. The following saves only write
+    the jobs whose columns changed, or that were changed since the previous
+    save (see ``Job.changed_since``).
+    """
+
+    KEY_COLUMNS = ['expid', 'name']
+
+    def __init__(self, expid):
+        self.expid = expid
+        database_file = Path(BasicConfig.LOCAL_ROOT_DIR, expid, 'pkl', f'job_list_{expid}.db')
+        connection_url = get_connection_url(db_path=database_file)
+        self.db_manager = DbManager(connection_url=connection_url)
+        self.db_manager.create_table(JobStateTable.name)
+        self._saved_rows: Optional[dict[str, tuple]] = None
+        self._mark = 0
+
+    def load(self, persistence_path, persistence_file, read_only=False):
+        """Loads a job list from a database.
+
+        :param persistence_file: str
+        :param persistence_path: str
+        :param read_only: not used, database reads do not need a copy of the job list
+        """
+        rows = self.db_manager.select_where(JobStateTable.name, {'expid': self.expid}, ['name', 'state'])
+        if not rows:
+            return None
+        return {name: pickle.loads(state) for name, state in rows}
+
+    def load_statuses(self) -> dict[str, int]:
+        """Loads the status of each job, without loading the jobs.
+
+        :return: The status of each job, by job name.
+        """
+        return dict(self.db_manager.select_where(JobStateTable.name, {'expid': self.expid}, ['name', 'status']))
+
+    def save(self, persistence_path, persistence_file, job_list, graph: 'DiGraph') -> None:
+        """Persists the jobs of a job list that changed since the previous save.
+
+        :param job_list: JobList
+        :param persistence_file: str
+        :param persistence_path: str
+        :param graph: networkx graph object
+        :type graph: DiGraph
+        """
+        mark = Job.new_change_mark()
+        if self._saved_rows is None:
+            saved_names = {name for name, in self.db_manager.select_where(
+                JobStateTable.name, {'expid': self.expid}, ['name'])}
+            saved_rows: dict[str, tuple] = {}
+        else:
+            saved_names = set(self._saved_rows)
+            saved_rows = self._saved_rows
+
+        modified = str(datetime.now())
+        current_rows: dict[str, tuple] = {}
+        changed_rows = []
+        for job in job_list:
+            columns = self._columns(job)
+            current_rows[job.name] = columns
+            if saved_rows.get(job.name) != columns or job.changed_since(self._mark):
+                changed_rows.append(dict(
+                    zip(JobStateTable.columns.keys(), (self.expid, job.name) + columns),
+                    modified=modified,
+                    state=pickle.dumps(job.__getstate__(), pickle.HIGHEST_PROTOCOL)
+                ))
+        deleted_names = saved_names - current_rows.keys()
+
+        Log.debug(f"Saving JobList on DB ({len(changed_rows)} jobs changed, {len(deleted_names)} jobs removed)")
+        self.db_manager.upsert_many(
+            JobStateTable.name,
+            changed_rows,
+            self.KEY_COLUMNS,
+            [{'expid': self.expid, 'name': name} for name in deleted_names]
+        )
+        self._saved_rows = current_rows
+        self._mark = mark
+        Log.debug("JobList saved in DB")
+
+    @staticmethod
+    def _columns(job) -> tuple:
+        """Returns the values of the typed columns of a job, from ``id`` to ``finish_time``."""
+        return (
+            _as_int(job.id),
+            _as_int(job.status),
+            _as_int(job.fail_count),
+            _as_str(job.platform_name),
+            _as_str(job.section),
+            date2str(job.date, 'S') if job.date else None,
+            _as_str(job.member),
+            _as_int(job.chunk),
+            _as_int(job.split),
+            int(bool(job.packed)),
+            _as_str(job.submit_time_timestamp),
+            _as_str(job.start_time_timestamp),
+            _as_str(job.finish_time_timestamp)
+        )
+
+    def pkl_exists(self, persistence_path, persistence_file):
+        """Check if the job list was saved in the database.
+
+        :param persistence_file: str
+        :param persistence_path: str
+        """
+        return self.db_manager.select_first_where(
+            JobStateTable.name, {'expid': self.expid}
+        ) is not None
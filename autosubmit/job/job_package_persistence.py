@@ -17,8 +17,9 @@
 
 """Database layer for the Job packages."""
 
+import os
 from pathlib import Path
-from typing import Any, List
+from typing import Any, ClassVar, List, Optional
 
 from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.database.db_common import get_connection_url
@@ -35,6 +36,9 @@ class JobPackagePersistence:
 
     VERSION = 1
 
+    _shared: ClassVar[dict[tuple[str, str], 'JobPackagePersistence']] = {}
+    """The last persistence created for each database of the process, see :meth:`shared`."""
+
     def __init__(self, expid: str):
         database_file = Path(BasicConfig.LOCAL_ROOT_DIR, expid, 'pkl', f'job_packages_{expid}.db')
         connection_url = get_connection_url(db_path=database_file)
@@ -48,6 +52,97 @@ class JobPackagePersistence:
         self.db_manager.create_table(JobPackageTable.name)
         self.db_manager.create_table(WrapperJobPackageTable.name)
 
+        # The package of each job in each table, and the number of rows they were read from.
+        self._job_packages: dict[str, dict[str, str]] = {}
+        self._row_counts: Optional[dict[str, int]] = None
+        # The SQLite files of the database, and their state when the rows were last counted.
+        self._database_files = [] if _schema else [database_file, Path(f'{database_file}-wal')]
+        self._files_state: Optional[list[Optional[tuple[int, int]]]] = None
+        JobPackagePersistence._shared[self._shared_key(expid)] = self
+
+    @classmethod
+    def shared(cls, expid: str) -> 'JobPackagePersistence':
+        """Return the persistence of an experiment used by this process, creating one if there is none.
+
+        The history of the jobs looks up their package for every event, the shared persistence
+        does not connect and create the tables again, and keeps the packages already read.
+
+        :param expid: Experiment ID.
+        :return: The persistence of the experiment packages.
+        """
+        persistence = cls._shared.get(cls._shared_key(expid))
+        if persistence is None:
+            persistence = cls(expid)
+        return persistence
+
+    @staticmethod
+    def _shared_key(expid: str) -> tuple[str, str]:
+        """The backend and the database file of the packages of an experiment."""
+        database_file = Path(BasicConfig.LOCAL_ROOT_DIR, expid, 'pkl', f'job_packages_{expid}.db')
+        return BasicConfig.DATABASE_BACKEND, str(database_file)
+
+    def get_package_name(self, job_name: str) -> Optional[str]:
+        """Find the package of a job, in the packages table or in the wrappers table if it has more rows.
+
+        The tables are only read again when their number of rows changed, as another process
+        saved packages, and the packages saved with this persistence are added as they are saved.
+        With SQLite, the rows are only counted again when the database files changed.
+
+        :param job_name: Name of the job.
+        :return: The name of the package, ``None`` if the job is not in a package.
+        """
+        files_state = self._read_files_state()
+        if self._row_counts is None or not files_state or files_state != self._files_state:
+            row_counts = {table: self.db_manager.count(table)
+                          for table in [WrapperJobPackageTable.name, JobPackageTable.name]}
+            if row_counts != self._row_counts:
+                self._job_packages = {
+                    WrapperJobPackageTable.name: self._index(self.load(wrapper=True)),
+                    JobPackageTable.name: self._index(self.load(wrapper=False))
+                }
+                self._row_counts = row_counts
+            self._files_state = files_state
+        row_counts = self._row_counts
+        if row_counts[WrapperJobPackageTable.name] > row_counts[JobPackageTable.name]:
+            return self._job_packages[WrapperJobPackageTable.name].get(job_name)
+        return self._job_packages[JobPackageTable.name].get(job_name)
+
+    def _read_files_state(self) -> list[Optional[tuple[int, int]]]:
+        """The modification time and size of the SQLite files, empty with other databases."""
+        files_state = []
+        for path in self._database_files:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                files_state.append(None)
+            else:
+                files_state.append((stat.st_mtime_ns, stat.st_size))
+        return files_state
+
+    @staticmethod
+    def _index(packages: List[Any]) -> dict[str, str]:
+        """Map the job names to the first package they are in."""
+        job_packages = {}
+        for _, package_name, job_name, _ in packages:
+            job_packages.setdefault(job_name, package_name)
+        return job_packages
+
+    def _add_rows(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Add the rows just inserted in a table to the packages read, if they were up to date."""
+        if self._row_counts is None:
+            return
+        job_packages = self._job_packages[table]
+        for row in rows:
+            job_packages.setdefault(row['job_name'], row['package_name'])
+        self._row_counts[table] += len(rows)
+
+    def _clear_rows(self, table: str) -> None:
+        """Forget the packages read from a table that was emptied."""
+        if self._row_counts is None:
+            return
+        self._job_packages[table] = {}
+        self._row_counts[table] = 0
+
     def load(self, wrapper=False) -> List[Any]:
         """
         Loads package of jobs from a database
@@ -87,18 +182,20 @@ class JobPackagePersistence:
             }]
 
         if preview_wrappers:
-            self.db_manager.insert_many(WrapperJobPackageTable.name, job_packages_data)
+            tables = [WrapperJobPackageTable.name]
         else:
-            self.db_manager.insert_many(JobPackageTable.name, job_packages_data)
-            self.db_manager.insert_many(WrapperJobPackageTable.name, job_packages_data)
+            tables = [JobPackageTable.name, WrapperJobPackageTable.name]
+        for table in tables:
+            self.db_manager.insert_many(table, job_packages_data)
+            self._add_rows(table, job_packages_data)
 
     def reset_table(self, wrappers=False):
         """Drops and recreates the database."""
         if wrappers:
-            self.db_manager.drop_table(WrapperJobPackageTable.name)
-            self.db_manager.create_table(WrapperJobPackageTable.name)
+            tables = [WrapperJobPackageTable.name]
         else:
-            self.db_manager.drop_table(JobPackageTable.name)
-            self.db_manager.create_table(JobPackageTable.name)
-            self.db_manager.drop_table(WrapperJobPackageTable.name)
-            self.db_manager.create_table(WrapperJobPackageTable.name)
+            tables = [JobPackageTable.name, WrapperJobPackageTable.name]
+        for table in tables:
+            self.db_manager.drop_table(table)
+            self.db_manager.create_table(table)
+            self._clear_rows(table)
@@ -23,7 +23,6 @@ import multiprocessing
 import os
 import random
 import re
-import tarfile
 import time
 from contextlib import suppress
 from datetime import timedelta
@@ -235,6 +234,9 @@ class JobPackageBase(object):
             if not only_generate:
                 Log.debug("Sending Files")
                 self._send_files()
+                if str(self.x11).lower() == "true":
+                    # X11 jobs are submitted at once, their scripts cannot wait for the rest of the submission.
+                    self.platform.flush_uploads()
                 Log.debug("Submitting")
                 self._do_submission(hold=hold)
         except AutosubmitCritical:
@@ -282,12 +284,16 @@ class JobPackageSimple(JobPackageBase):
             self._job_scripts[job.name] = job.create_script(configuration)
 
     def _send_files(self):
-        # TODO: Add tests when the slurm container is available.
+        self.platform.send_files(self._files_to_send())
+
+    def _files_to_send(self) -> list[str]:
+        """The scripts and additional files of the jobs, as sent to the platform."""
+        files = []
         for job in self.jobs:
-            self.platform.send_file(self._job_scripts[job.name])
+            files.append(self._job_scripts[job.name])
             for f in job.additional_files:
-                real_name = job.construct_real_additional_file_name(f)
-                self.platform.send_file(real_name)
+                files.append(job.construct_real_additional_file_name(f))
+        return files
 
     def _do_submission(self, job_scripts: dict[str, str] = "", hold: bool = False) -> None:
         """
@@ -335,10 +341,11 @@ class JobPackageSimpleWrapped(JobPackageSimple):
         for job in self.jobs:
             self._job_wrapped_scripts[job.name] = job.create_wrapped_script(configuration)
 
-    def _send_files(self):
-        super(JobPackageSimpleWrapped, self)._send_files()
+    def _files_to_send(self) -> list[str]:
+        files = super(JobPackageSimpleWrapped, self)._files_to_send()
         for job in self.jobs:
-            self.platform.send_file(self._job_wrapped_scripts[job.name])
+            files.append(self._job_wrapped_scripts[job.name])
+        return files
 
     def _do_submission(self, job_scripts=None, hold=False):
         if job_scripts is None or not job_scripts:
@@ -392,10 +399,12 @@ class JobPackageArray(JobPackageBase):
         return filename
 
     def _send_files(self):
+        files = []
         for job in self.jobs:
-            self.platform.send_file(self._job_scripts[job.name])
-            self.platform.send_file(self._job_inputs[job.name])
-        self.platform.send_file(self._common_script)
+            files.append(self._job_scripts[job.name])
+            files.append(self._job_inputs[job.name])
+        files.append(self._common_script)
+        self.platform.send_files(files)
 
     def _do_submission(self, job_scripts: dict[str, str] = None, hold: bool = False) -> None:
         """
@@ -631,30 +640,9 @@ class JobPackageThread(JobPackageBase):
         return script_file
 
     def _send_files(self):
-        Log.debug("Check remote dir")
-        self.platform.check_remote_log_dir()
-        compress_type = "w"
-        output_filepath = 'wrapper_scripts.tar'
-        if callable(getattr(self.platform, 'remove_multiple_files')):
-            filenames = str()
-            for job in self.jobs:
-                filenames += " " + self.platform.remote_log_dir + "/" + job.name + ".cmd"
-            self.platform.remove_multiple_files(filenames)
-        tar_path = os.path.join(self._tmp_path, output_filepath)
-        Log.debug("Compressing multiple_files")
-        with tarfile.open(tar_path, compress_type) as tar:
-            for job in self.jobs:
-                jfile = os.path.join(self._tmp_path, self._job_scripts[job.name])
-                with open(jfile, 'rb') as f:
-                    info = tar.gettarinfo(jfile, self._job_scripts[job.name])
-                    tar.addfile(info, f)
-        tar.close()
-        os.chmod(tar_path, 0o755)
-        self.platform.send_file(tar_path, check=False)
-        Log.debug("Uncompress - send_command")
-        self.platform.send_command(f"cd {self.platform.get_files_path()}; tar -xvf {output_filepath}")
-        Log.debug("Send_file: common_script")
-        self.platform.send_file(self._common_script)
+        # The platform packs the scripts in one archive, which replaces the previous scripts when extracted.
+        Log.debug("Send_files: inner scripts and common_script")
+        self.platform.send_files([self._job_scripts[job.name] for job in self.jobs] + [self._common_script])
 
     def _do_submission(self, job_scripts: dict[str, str] = None, hold: bool = False) -> None:
         """
@@ -750,9 +738,7 @@ class JobPackageThreadWrapped(JobPackageThread):
         return script_file
 
     def _send_files(self):
-        for job in self.jobs:
-            self.platform.send_file(self._job_scripts[job.name])
-        self.platform.send_file(self._common_script)
+        self.platform.send_files([self._job_scripts[job.name] for job in self.jobs] + [self._common_script])
 
     def _do_submission(self, job_scripts: dict[str, str] = None, hold: bool = False) -> None:
         """
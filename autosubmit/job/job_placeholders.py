@@ -0,0 +1,244 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Substitution of the ``%PLACEHOLDER%`` of the job scripts.
+
+The placeholders used to be replaced one after the other, with a ``re.sub``
+over the whole script for each placeholder found in it. With hundreds of
+placeholders in a model template that costs the number of placeholders times
+the size of the script, for each job.
+
+Here a script is split once into its literal parts and its placeholders, and
+the result is rendered with a single join. The split is not cached: the
+script of each job starts with its own header, which has the job name and
+log paths, so no two scripts are the same.
+
+The join must give the same script as the sequential substitution, whose
+result also depends on the order of the placeholders: a value may contain a
+placeholder replaced afterward, removing a placeholder may join two ``%``, and
+the dots of the placeholder names are regular expression wildcards, and two
+placeholders may share a ``%``. The split
+checks that the script has none of those cases, and the values are checked
+when the script is rendered; otherwise the placeholders are substituted one
+after the other, as before.
+"""
+
+import re
+from typing import Iterable, Optional
+
+_NAME = r'[a-zA-Z0-9_.-]'
+
+_PLACEHOLDER = re.compile(r'%(?<!%%)' + _NAME + r'+%(?!%%)', re.IGNORECASE)
+"""The placeholders found in a script, ``%%`` being an escaped ``%``."""
+
+_ANY_PLACEHOLDER = re.compile(r'(?=(%(?<!%%)' + _NAME + r'+%(?!%%)))', re.IGNORECASE)
+"""Every position where a placeholder starts, including the ones sharing a ``%`` with another."""
+
+_NOT_NAME = r'[^a-zA-Z0-9_.-]'
+
+
+def _sub_pattern(key: str) -> str:
+    """The pattern replaced for a placeholder, its name is not escaped, so its dots match any character."""
+    return r'%(?<!%%)' + key + r'%(?!%%)'
+
+
+def _replacement(key: str, parameters: dict) -> str:
+    """The text that replaces the placeholder ``key``, as written by ``re.sub``."""
+    value = str(parameters.get(key.upper(), ""))
+    if "\\" in value:
+        # The escaped value is a replacement template, expand it as re.sub does.
+        value = re.sub('%', re.escape(value), '%')
+    return value
+
+
+def _substitute_sequentially(content: str, parameters: dict, default_placeholders: Iterable[str]) -> str:
+    """Replace the placeholders one after the other, each one in the whole content."""
+    for placeholder in _PLACEHOLDER.findall(content):
+        if placeholder in default_placeholders:
+            continue
+        key = placeholder[1:-1]
+        value = str(parameters.get(key.upper(), ""))
+        if not value:
+            content = re.sub(_sub_pattern(key), '', content, flags=re.I)
+        else:
+            if "\\" in value:
+                value = re.escape(value)
+            content = re.sub(_sub_pattern(key), value, content, flags=re.I)
+    return content
+
+
+class CompiledTemplate:
+    """A script split into its literal parts and the placeholders that replace what is between them.
+
+    :param literals: The literal parts, one more than the keys.
+    :param keys: The name of the placeholder whose value goes after each literal part.
+    """
+
+    def __init__(self, literals: list[str], keys: list[str]):
+        self.literals = literals
+        self.keys = keys
+
+    def render(self, parameters: dict) -> Optional[str]:
+        """Join the literal parts and the values of the placeholders.
+
+        :param parameters: The job parameters.
+        :return: The script, or ``None`` if a value contains a ``%``, as it may be replaced afterward.
+        """
+        values = {}
+        for key in self.keys:
+            if key not in values:
+                value = _replacement(key, parameters)
+                if '%' in value:
+                    return None
+                values[key] = value
+        parts = [self.literals[0]]
+        for key, literal in zip(self.keys, self.literals[1:]):
+            parts.append(values[key])
+            parts.append(literal)
+        return ''.join(parts)
+
+
+def _owner_keys(names: list[str], keys: list[str]) -> list[Optional[str]]:
+    """For each placeholder, the first key whose substitution replaces it, ``None`` if none does."""
+    first_keys: dict[str, tuple[int, str]] = {}
+    for index, key in enumerate(keys):
+        first_keys.setdefault(key.upper(), (index, key))
+    # The dots match any character, but the text before the first dot and after the last one must be
+    # the same, so only the keys with the same length, beginning and end are tried.
+    dotted: dict[tuple[int, int, int, str, str], list[tuple[int, str]]] = {}
+    shapes: dict[int, set[tuple[int, int]]] = {}
+    for upper, first in first_keys.items():
+        if '.' in upper:
+            head, tail = upper.split('.', 1)[0], upper.rsplit('.', 1)[1]
+            shapes.setdefault(len(upper), set()).add((len(head), len(tail)))
+            dotted.setdefault((len(upper), len(head), len(tail), head, tail), []).append(first)
+    owners = []
+    for name in names:
+        upper = name.upper()
+        owner = first_keys.get(upper)
+        for head_length, tail_length in shapes.get(len(upper), ()):
+            bucket = (len(upper), head_length, tail_length, upper[:head_length], upper[len(upper) - tail_length:])
+            for index, key in dotted.get(bucket, ()):
+                if (owner is None or index < owner[0]) and re.fullmatch(key, name, re.I):
+                    owner = (index, key)
+        owners.append(owner[1] if owner else None)
+    return owners
+
+
+def _wildcards_match_other_text(content: str, keys: list[str], token_names: dict[int, str]) -> bool:
+    """Tell whether the dots of a key may match something else than a placeholder.
+
+    A dot matching a character that is not part of a name finds a text that is not a placeholder
+    in the script. With two dots or more, the two sides of a replaced placeholder may also
+    form a new match once it is replaced.
+    """
+    dotted = {key.upper(): key for key in keys if '.' in key}
+    if not dotted:
+        return False
+    variants = []
+    for key in dotted.values():
+        for position in [i for i, char in enumerate(key) if char == '.']:
+            variants.append(key[:position] + _NOT_NAME + key[position + 1:])
+    if re.search(_sub_pattern('(?:' + '|'.join(variants) + ')'), content, re.IGNORECASE):
+        return True
+    for upper, key in dotted.items():
+        if key.count('.') < 2:
+            continue
+        prefix = key.split('.', 1)[0]
+        for match in re.finditer('%' + re.escape(prefix), content, re.IGNORECASE):
+            name = token_names.get(match.start())
+            if name is None:
+                return True
+            if name.upper() == upper or len(name) >= len(key):
+                continue
+            if key[len(name)] == '.' and re.fullmatch(key[:len(name)], name, re.I):
+                return True
+    return False
+
+
+def compile_template(content: str, default_placeholders: frozenset[str]) -> Optional[CompiledTemplate]:
+    """Split a script into its literal parts and its placeholders.
+
+    :param content: The script.
+    :param default_placeholders: The placeholders that are not substituted, e.g. ``%Y%``.
+    :return: The compiled script, or ``None`` if only the sequential substitution gives the right result.
+    """
+    tokens = list(_PLACEHOLDER.finditer(content))
+    names = []
+    for token in tokens:
+        placeholder = token.group()
+        if not placeholder.isascii() or content.startswith('%', token.end()):
+            # Unicode case folding, or a % that would start a placeholder once this one is replaced.
+            return None
+        names.append(placeholder[1:-1])
+    keys = [name for token, name in zip(tokens, names) if token.group() not in default_placeholders]
+    owners = _owner_keys(names, keys)
+
+    # The placeholders sharing a % with another one, as in %Y%m%d, are left as they are if no key
+    # replaces them and the one they share the % with is not replaced either.
+    replaced = set()
+    for token, owner in zip(tokens, owners):
+        if owner is not None:
+            replaced.update((token.start(), token.end() - 1))
+    token_names = {token.start(): name for token, name in zip(tokens, names)}
+    overlapping = [match for match in _ANY_PLACEHOLDER.finditer(content) if match.start() not in token_names]
+    for match in overlapping:
+        placeholder = match.group(1)
+        if match.start() in replaced or match.end(1) - 1 in replaced or not placeholder.isascii():
+            return None
+    if any(_owner_keys([match.group(1)[1:-1] for match in overlapping], keys)):
+        return None
+    if _wildcards_match_other_text(content, keys, token_names):
+        return None
+
+    literals, placeholder_keys = [], []
+    start = 0
+    for token, owner in zip(tokens, owners):
+        if owner is None:
+            continue
+        literals.append(content[start:token.start()])
+        placeholder_keys.append(owner)
+        start = token.end()
+    literals.append(content[start:])
+    return CompiledTemplate(literals, placeholder_keys)
+
+
+def substitute_placeholders(
+        content: str,
+        parameters: dict,
+        default_placeholders: Iterable[str],
+        undefined_variables: Optional[list[str]] = None
+) -> str:
+    """Replace the placeholders of a script with the values of the job parameters.
+
+    The placeholders without a parameter are removed, the default placeholders are kept, and
+    the escaped ``%%`` become ``%``.
+
+    :param content: The script.
+    :param parameters: The job parameters.
+    :param default_placeholders: The placeholders that are not substituted, e.g. ``%Y%``.
+    :param undefined_variables: The names of other placeholders to remove.
+    :return: The script with its placeholders substituted.
+    """
+    default_placeholders = frozenset(default_placeholders)
+    compiled = compile_template(content, default_placeholders)
+    rendered = compiled.render(parameters) if compiled is not None else None
+    if rendered is None:
+        rendered = _substitute_sequentially(content, parameters, default_placeholders)
+    for variable in undefined_variables or []:
+        rendered = re.sub(_sub_pattern(variable), '', rendered, flags=re.I)
+    return rendered.replace("%%", "%")
@@ -0,0 +1,152 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Interval between two iterations of the ``autosubmit run`` loop.
+
+The loop used to sleep ``CONFIG.SAFETYSLEEPTIME`` seconds after every
+iteration. When ``CONFIG.MIN_SAFETYSLEEPTIME`` and ``CONFIG.MAX_SAFETYSLEEPTIME``
+are set, the interval adapts to the workflow instead: it is the minimum
+after an iteration where some job changed its status, it doubles with each
+iteration without changes, and it is never longer than the time left until
+the next expected event (a ``DELAYED`` job that can be retried, a running
+job that reaches its wallclock, or a queuing job whose expected start time
+arrives).
+"""
+
+import datetime
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+from autosubmit.log.log import Log
+
+if TYPE_CHECKING:
+    from autosubmit.config.configcommon import AutosubmitConfig
+    from autosubmit.job.job_list import JobList
+
+
+class PollingInterval:
+    """Chooses the sleep time between two iterations of the run loop.
+
+    :param min_interval: Shortest interval, in seconds.
+    :param max_interval: Longest interval, in seconds.
+    :param metrics_file: CSV file where each chosen interval is appended, if any.
+    """
+
+    METRICS_HEADER = 'time,interval,reason\n'
+
+    def __init__(self, min_interval: int, max_interval: int, metrics_file: Optional[Path] = None):
+        self.min_interval = 1
+        self.max_interval = 1
+        self.metrics_file = metrics_file
+        self.set_bounds(min_interval, max_interval)
+        self._idle_interval = self.min_interval
+
+    @staticmethod
+    def from_config(as_conf: 'AutosubmitConfig', metrics_file: Optional[Path] = None) -> 'PollingInterval':
+        """Creates the polling interval of an experiment.
+
+        :param as_conf: The experiment configuration.
+        :param metrics_file: CSV file where each chosen interval is appended, if any.
+        """
+        polling = PollingInterval(1, 1, metrics_file)
+        polling.update_from_config(as_conf)
+        return polling
+
+    def update_from_config(self, as_conf: 'AutosubmitConfig') -> None:
+        """Reads the bounds again, as the configuration can change during the run.
+
+        The bounds default to ``CONFIG.SAFETYSLEEPTIME``, which gives a fixed interval.
+
+        :param as_conf: The experiment configuration.
+        """
+        safetysleeptime = as_conf.get_safetysleeptime()
+        self.set_bounds(as_conf.get_min_safetysleeptime(safetysleeptime),
+                        as_conf.get_max_safetysleeptime(safetysleeptime))
+
+    def set_bounds(self, min_interval: int, max_interval: int) -> None:
+        """Sets the shortest and the longest interval.
+
+        :param min_interval: Shortest interval, in seconds.
+        :param max_interval: Longest interval, in seconds.
+        """
+        self.min_interval = max(int(min_interval), 1)
+        self.max_interval = max(int(max_interval), self.min_interval)
+
+    def next(self, job_list: 'JobList', changed: bool, now: Optional[datetime.datetime] = None) -> int:
+        """Returns the number of seconds to sleep before the next iteration.
+
+        :param job_list: The job list of the experiment.
+        :param changed: Whether any job changed its status in the last iteration.
+        :param now: The current time, ``datetime.now()`` by default.
+        :return: The interval, in seconds.
+        """
+        if self.min_interval == self.max_interval:
+            return self._record(self.min_interval, 'fixed', now)
+        now = now or datetime.datetime.now()
+        if changed:
+            self._idle_interval = self.min_interval
+            reason = 'status changes'
+        else:
+            self._idle_interval = min(max(self._idle_interval * 2, self.min_interval), self.max_interval)
+            reason = 'idle'
+        interval = self._idle_interval
+        next_event = self.seconds_to_next_event(job_list, now)
+        if next_event is not None and next_event < interval:
+            interval = next_event
+            reason = 'next event'
+        return self._record(min(max(int(interval), self.min_interval), self.max_interval), reason, now)
+
+    @staticmethod
+    def seconds_to_next_event(job_list: 'JobList', now: datetime.datetime) -> Optional[float]:
+        """Returns the time left until the next expected job status change.
+
+        :param job_list: The job list of the experiment.
+        :param now: The current time.
+        :return: The time left in seconds, or ``None`` if no change is expected.
+        """
+        events = []
+        for job in job_list.get_delayed():
+            if job.delay_end:
+                events.append(job.delay_end)
+        for job in job_list.get_running():
+            if job.start_time and job.wallclock_in_seconds:
+                events.append(job.start_time + datetime.timedelta(seconds=job.wallclock_in_seconds))
+        for job in job_list.get_queuing():
+            estimated_start_time = getattr(job, 'estimated_start_time', None)
+            if estimated_start_time:
+                events.append(estimated_start_time)
+        if not events:
+            return None
+        return max((min(events) - now).total_seconds(), 0)
+
+    def _record(self, interval: int, reason: str, now: Optional[datetime.datetime]) -> int:
+        if reason == 'fixed':
+            Log.debug(f"Sleep: {interval}")
+        else:
+            Log.info(f"Sleep: {interval} ({reason})")
+        if self.metrics_file:
+            try:
+                write_header = not self.metrics_file.exists()
+                with open(self.metrics_file, 'a') as metrics:
+                    if write_header:
+                        metrics.write(self.METRICS_HEADER)
+                    metrics.write(f"{(now or datetime.datetime.now()).isoformat(timespec='seconds')},"
+                                  f"{interval},{reason}\n")
+            except OSError as e:
+                Log.debug(f"Could not write the polling interval to {self.metrics_file}: {e}")
+        return interval
+
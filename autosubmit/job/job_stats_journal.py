@@ -0,0 +1,248 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""The statistics files of the jobs, kept in a single append-only journal.
+
+Each job used to append its submit, start and finish times to its own
+``<JOB>_TOTAL_STATS`` file, and the ``<JOB>_STAT_<N>`` files written by the
+job scripts stayed in the ``tmp`` directory once transferred. With hundreds of
+thousands of jobs that is millions of small files in a single directory.
+
+Those files are now records of the ``STATS_JOURNAL`` file of the ``tmp``
+directory, one line per record::
+
+    <OPERATION> <FILE> <TEXT>
+
+where ``OPERATION`` is ``N`` to append ``TEXT`` as a new line of ``FILE``,
+``A`` to append it to the last line after a space, ``W`` to replace the
+content of ``FILE`` with the words of ``TEXT``, one per line, and ``D`` to
+remove ``FILE``. The content of a file is the one of the file with its name
+in the ``tmp`` directory, if any, as written by previous versions, followed
+by its records in the journal.
+
+The offsets of the records of each file are indexed in memory. The index is
+only extended with the records appended since it was read, by this process or
+by another one, and it is built again when the journal is replaced.
+"""
+
+import io
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from autosubmit.log.log import Log
+
+JOURNAL_FILENAME = 'STATS_JOURNAL'
+
+_LEGACY_FILE = re.compile(r'.+_(TOTAL_STATS|STAT_\d+)')
+"""The files of the ``tmp`` directory that are moved to the journal by :meth:`StatsJournal.migrate`."""
+
+_journals: dict[str, 'StatsJournal'] = {}
+_journals_pid = os.getpid()
+_lock = threading.Lock()
+
+
+class StatsJournal:
+    """The journal of the statistics files of the jobs of an experiment.
+
+    :param tmp_path: The ``tmp`` directory of the experiment.
+    """
+
+    def __init__(self, tmp_path: Union[str, Path]):
+        self.tmp_path = Path(tmp_path)
+        self.path = self.tmp_path / JOURNAL_FILENAME
+        self._lock = threading.RLock()
+        self._offsets: dict[str, list[int]] = {}
+        self._indexed = 0
+        """The size of the journal already indexed, up to the end of its last complete record."""
+        self._file_id: Optional[tuple[int, int]] = None
+
+    def _reset(self) -> None:
+        self._offsets = {}
+        self._indexed = 0
+        self._file_id = None
+
+    def _refresh(self) -> None:
+        """Index the records appended to the journal since it was last read."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._indexed:
+            self._reset()
+            self._file_id = file_id
+        if stat.st_size == self._indexed:
+            return
+        with open(self.path, 'rb') as journal:
+            journal.seek(self._indexed)
+            data = journal.read(stat.st_size - self._indexed)
+        # A record being written by another process is indexed once it is complete.
+        end = data.rfind(b'\n') + 1
+        offset = self._indexed
+        for record in data[:end].splitlines(keepends=True):
+            parts = record.split(b' ', 2)
+            if len(parts) == 3:
+                self._offsets.setdefault(parts[1].decode(), []).append(offset)
+            offset += len(record)
+        self._indexed += end
+
+    def _records(self, filename: str) -> list[tuple[str, str]]:
+        """The operation and text of the records of a file, in the order they were written."""
+        with self._lock:
+            self._refresh()
+            offsets = list(self._offsets.get(filename, ()))
+        if not offsets:
+            return []
+        records = []
+        with open(self.path, 'rb') as journal:
+            for offset in offsets:
+                journal.seek(offset)
+                operation, _, text = journal.readline().decode().rstrip('\n').split(' ', 2)
+                records.append((operation, text))
+        return records
+
+    def _append(self, operation: str, filename: str, text: str = '') -> None:
+        record = f'{operation} {filename} {text}\n'.encode()
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                # A single write, so the records of other processes are not interleaved with this one.
+                written = os.write(fd, record)
+                while written < len(record):
+                    written += os.write(fd, record[written:])
+            finally:
+                os.close(fd)
+
+    def read(self, filename: str) -> Optional[str]:
+        """Read a file of the journal.
+
+        :param filename: The name of the file, e.g. ``a000_SIM_TOTAL_STATS``.
+        :return: The content of the file, ``None`` if it does not exist.
+        """
+        content = None
+        legacy_path = self.tmp_path / filename
+        if legacy_path.exists():
+            content = legacy_path.read_text()
+        for operation, text in self._records(filename):
+            if operation == 'N':
+                content = text if content is None else f'{content}\n{text}'
+            elif operation == 'A':
+                content = f'{content or ""} {text}'
+            elif operation == 'W':
+                content = ''.join(f'{word}\n' for word in text.split())
+            elif operation == 'D':
+                content = None
+        return content
+
+    def readlines(self, filename: str) -> Optional[list[str]]:
+        """Read the lines of a file of the journal, with their line end, as ``readlines`` does.
+
+        :param filename: The name of the file.
+        :return: The lines of the file, ``None`` if it does not exist.
+        """
+        content = self.read(filename)
+        return io.StringIO(content).readlines() if content is not None else None
+
+    def append_line(self, filename: str, text: str) -> None:
+        """Append a new line to a file, created if it does not exist.
+
+        :param filename: The name of the file.
+        :param text: The line, without line end.
+        """
+        self._append('N', filename, text)
+
+    def append(self, filename: str, text: str) -> None:
+        """Append a space and a text to the last line of a file, created if it does not exist.
+
+        :param filename: The name of the file.
+        :param text: The text, without line end.
+        """
+        self._append('A', filename, text)
+
+    def ingest(self, path: Union[str, Path]) -> None:
+        """Move a file of the ``tmp`` directory, a ``STAT`` file just transferred, to the journal.
+
+        The words of the file are kept, one per line.
+
+        :param path: The path of the file.
+        """
+        path = Path(path)
+        self._append('W', path.name, ' '.join(path.read_text().split()))
+        path.unlink()
+
+    def remove(self, filename: str) -> None:
+        """Remove a file from the journal, and from the ``tmp`` directory.
+
+        :param filename: The name of the file.
+        """
+        legacy_path = self.tmp_path / filename
+        if legacy_path.exists():
+            os.remove(legacy_path)
+        with self._lock:
+            self._refresh()
+            if filename in self._offsets:
+                self._append('D', filename)
+
+    def migrate(self) -> int:
+        """Move the ``TOTAL_STATS`` and ``STAT`` files of the ``tmp`` directory to the journal.
+
+        The journal is written again with the content of each file, so the files must not be
+        written at the same time, by a running experiment.
+
+        :return: The number of files moved.
+        """
+        with self._lock:
+            legacy_files = sorted(path for path in self.tmp_path.iterdir()
+                                  if _LEGACY_FILE.fullmatch(path.name) and path.is_file())
+            self._refresh()
+            filenames = sorted(set(self._offsets) | {path.name for path in legacy_files})
+            migrated_path = self.path.with_name(f'{JOURNAL_FILENAME}.tmp')
+            with open(migrated_path, 'w') as migrated:
+                for filename in filenames:
+                    content = self.read(filename)
+                    if content is not None:
+                        migrated.writelines(f'N {filename} {line}\n' for line in content.split('\n'))
+                migrated.flush()
+                os.fsync(migrated.fileno())
+            os.replace(migrated_path, self.path)
+            for path in legacy_files:
+                path.unlink()
+            self._reset()
+        Log.debug(f'{len(legacy_files)} statistics files moved to {self.path}')
+        return len(legacy_files)
+
+
+def stats_journal(tmp_path: Union[str, Path]) -> StatsJournal:
+    """The journal of the statistics files of an experiment, shared by the jobs of the process.
+
+    :param tmp_path: The ``tmp`` directory of the experiment.
+    """
+    global _journals_pid
+    key = os.path.abspath(tmp_path)
+    with _lock:
+        if _journals_pid != os.getpid():
+            # A forked process, the locks of the journals may be held by a thread of its parent.
+            _journals.clear()
+            _journals_pid = os.getpid()
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = StatsJournal(key)
+        return journal
@@ -21,7 +21,6 @@ from typing import Dict, Optional, TYPE_CHECKING
 from bscearth.utils.date import date2str, chunk_end_date, chunk_start_date, subs_dates
 from networkx.classes import DiGraph
 
-from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.job.job_common import Status
 from autosubmit.job.job_package_persistence import JobPackagePersistence
 from autosubmit.log.log import Log, AutosubmitCritical
@@ -249,16 +248,9 @@ def get_job_package_code(expid: str, job_name: str) -> int:
     :rtype: int or None
     """
     try:
-        basic_conf = BasicConfig()
-        basic_conf.read()
-        packages_wrapper = JobPackagePersistence(expid).load(wrapper=True)
-        packages_wrapper_plus = JobPackagePersistence(expid).load(wrapper=False)
-        if packages_wrapper or packages_wrapper_plus:
-            packages = packages_wrapper if len(packages_wrapper) > len(packages_wrapper_plus) else packages_wrapper_plus
-            for exp, package_name, _job_name in packages:
-                if job_name == _job_name:
-                    code = int(package_name.split("_")[-3])
-                    return code
+        package_name = JobPackagePersistence.shared(expid).get_package_name(job_name)
+        if package_name:
+            return int(package_name.split("_")[-3])
     except Exception:
         pass
     return 0
@@ -24,7 +24,6 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy.schema import CreateTable, CreateSchema
 
 from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.config.configcommon import AutosubmitConfig
@@ -134,12 +133,7 @@ class UserMetricRepository:
             schema=self.schema, table_name="user_metrics"
         )
         self.engine = session.create_engine(self.connection_url)
-
-        with self.engine.connect() as conn:
-            if self.schema:
-                conn.execute(CreateSchema(self.schema, if_not_exists=True))
-            conn.execute(CreateTable(self.table, if_not_exists=True))
-            conn.commit()
+        session.create_tables(self.engine, [self.table], self.schema)
 
     def store_metric(
         self, run_id: int, job_name: str, metric_name: str, metric_value: Any
@@ -259,8 +259,9 @@ class Migrate:
                 raise AutosubmitCritical("Can not read tar file", 7012, str(e))
 
     def migrate_offer_jobdata(self):
-        # archive job_data_{expid}.db and job_data_{expid}.sql
-        Log.info(f'Archiving job_data_{self.experiment_id}.db and job_data_{self.experiment_id}.sql')
+        # archive job_data_{expid}.db, job_data_{expid}_backup.db and job_data_{expid}.sql
+        Log.info(f'Archiving job_data_{self.experiment_id}.db, job_data_{self.experiment_id}_backup.db '
+                 f'and job_data_{self.experiment_id}.sql')
         job_data_dir = f"{self.basic_config.JOBDATA_DIR}/job_data_{self.experiment_id}"
         # Creating tar file
         Log.info("Creating tar file ... ")
@@ -268,14 +269,17 @@ class Migrate:
             compress_type = "w"
             output_filepath = f'{self.experiment_id}_jobdata.tar'
             db_exists = os.path.exists(f"{job_data_dir}.db")
+            backup_exists = os.path.exists(f"{job_data_dir}_backup.db")
             sql_exists = os.path.exists(f"{job_data_dir}.sql")
             if os.path.exists(os.path.join(self.basic_config.JOBDATA_DIR, output_filepath)) and (
-                    db_exists or sql_exists):
+                    db_exists or backup_exists or sql_exists):
                 os.remove(os.path.join(self.basic_config.JOBDATA_DIR, output_filepath))
-            elif db_exists or sql_exists:
+            elif db_exists or backup_exists or sql_exists:
                 with tarfile.open(os.path.join(self.basic_config.JOBDATA_DIR, output_filepath), compress_type) as tar:
                     if db_exists:
                         tar.add(f"{job_data_dir}.db", arcname=f"{self.experiment_id}.db")
+                    if backup_exists:
+                        tar.add(f"{job_data_dir}_backup.db", arcname=f"{self.experiment_id}_backup.db")
                     if sql_exists:
                         tar.add(f"{job_data_dir}.sql", arcname=f"{self.experiment_id}.sql")
                     tar.close()
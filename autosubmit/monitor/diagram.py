@@ -25,6 +25,7 @@ from typing import List, Dict, Union, Any, Optional
 
 import matplotlib as mtp
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import gridspec
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.patches import Rectangle
@@ -32,6 +33,7 @@ from typing_extensions import LiteralString
 
 from autosubmit.job.job import Job
 from autosubmit.statistics.jobs_stat import JobStat
+from autosubmit.statistics.retrials import JobRetrials
 from autosubmit.statistics.statistics import Statistics
 from autosubmit.log.log import Log
 
@@ -127,11 +129,12 @@ def populate_statistics(
         jobs_list: List[Job],
         period_ini: datetime,
         period_fi: datetime,
-        queue_time_fixes: dict[str, int]
+        queue_time_fixes: dict[str, int],
+        retrials: Optional[JobRetrials] = None
 ) -> Optional[Statistics]:
     try:
         return (
-            Statistics(jobs_list, period_ini, period_fi, queue_time_fixes).
+            Statistics(jobs_list, period_ini, period_fi, queue_time_fixes, retrials=retrials).
             calculate_statistics().
             calculate_summary().
             make_old_format().
@@ -145,18 +148,22 @@ def populate_statistics(
 def create_stats_report(
         expid: str, jobs_list: List[Job], output_file: str,
         section_summary: bool, jobs_summary: bool, period_ini: datetime = None,
-        period_fi: datetime = None, queue_fix_times: Dict[str, int] = None
+        period_fi: datetime = None, queue_fix_times: Dict[str, int] = None,
+        retrials: Optional[JobRetrials] = None
 ) -> bool:
     """Function to create the statistics report.
 
     Produces one or more PDF files, depending on the parameters.
 
     Also produces CSV files with the data from each PDF.
+
+    The retrials of the jobs are read from the ``TOTAL_STATS`` files, unless
+    ``retrials`` read from the experiment history are given.
     """
     # Close all figures first... just in case.
     plt.close('all')
 
-    exp_stats = populate_statistics(jobs_list, period_ini, period_fi, queue_fix_times)
+    exp_stats = populate_statistics(jobs_list, period_ini, period_fi, queue_fix_times, retrials)
     plot = create_bar_diagram(expid, exp_stats, jobs_list)
     create_csv_stats(exp_stats, jobs_list, output_file)
 
@@ -349,7 +356,7 @@ def create_csv_stats(exp_stats: Statistics, jobs_list: List[Job],
     with open(output_file, 'w') as file:
         file.write(
             "Job,Started,Ended,Queuing time (hours),Running time (hours)\n")
-        for i in range(len([job for job in jobs_list if job.get_last_retrials()])):
+        for i in range(len(job_names)):
             file.write("{0},{1},{2},{3},{4}\n".format(
                 job_names[i], start_times[i], end_times[i], queuing_times[i], running_times[i]))
 
@@ -408,11 +415,13 @@ def get_whites_array(length) -> list[Rectangle]:
 
 def _group_by_section(jobs_list: List[Job], jobs_stats: List[JobStat]) -> Dict[str, List[JobStat]]:
     """Return a dictionary with the jobs grouped by section."""
+    sections_by_name = defaultdict(list)
+    for job in jobs_list:
+        sections_by_name[job.name].append(job.section)
     grouped_jobs_by_section = defaultdict(list)
     for job_stats in jobs_stats:
-        for job in jobs_list:
-            if job.name == job_stats.name:
-                grouped_jobs_by_section[job.section].append(job_stats)
+        for section in sections_by_name.get(job_stats.name, []):
+            grouped_jobs_by_section[section].append(job_stats)
     return grouped_jobs_by_section
 
 
@@ -428,6 +437,12 @@ def _format_times(td: timedelta) -> str:
     return f"{days} days - {hours:02}:{minutes:02}:{seconds:02}"
 
 
+def _microseconds(deltas: List[timedelta]) -> np.ndarray:
+    """Return the time deltas as integer microseconds, to add them up exactly."""
+    return np.array([(delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds for delta in deltas],
+                    dtype=np.int64)
+
+
 def _filter_by_status(jobs_list: List[Job]) -> List[Job]:
     """Filter jobs by status."""
     ret = []
@@ -445,100 +460,75 @@ def _get_status(jobs_list: List[Job], job_name: str) -> Optional[str]:
     return None
 
 
-def _aggregate_jobs_by_section(jobs_list: List['Job'], jobs_stats: List['JobStat']) -> List[JobAggData]:
-    """Aggregate jobs by section."""
-    filtered_job_list = _filter_by_status(jobs_list)
-    grouped_by_section = _group_by_section(filtered_job_list, jobs_stats)
+def _get_statuses(jobs_list: List[Job]) -> Dict[str, str]:
+    """Return the status of each job by name, as ``_get_status`` finds it."""
+    statuses = {}
+    for job in jobs_list:
+        statuses.setdefault(job.name, job.status_str)
+    return statuses
+
 
-    # Order jobs by section
-    section_order = [section for section in grouped_by_section]
-    for job in filtered_job_list:
-        section = job.status_str
-        if section not in section_order:
-            section_order.append(section)
+def _run_times(jobs_stats: List[JobStat], statuses: Dict[str, str]) -> List[timedelta]:
+    """Return the run time of each job, until now for the running ones."""
+    now = datetime.now()
+    return [now - job_stat.start_time if statuses.get(job_stat.name) == "RUNNING"
+            else job_stat.completed_run_time + job_stat.failed_run_time
+            for job_stat in jobs_stats]
+
+
+def _aggregate_jobs_by_section(jobs_list: List['Job'], jobs_stats: List['JobStat']) -> List[JobAggData]:
+    """Aggregate jobs by section, in the order the sections appear in the list of jobs."""
+    grouped_by_section = _group_by_section(_filter_by_status(jobs_list), jobs_stats)
+    section_values = list(dict.fromkeys(job.section for job in jobs_list if job.section in grouped_by_section))
+    count_values = [len(grouped_by_section[section]) for section in section_values]
+    jobs_stats_by_section = [job_stat for section in section_values for job_stat in grouped_by_section[section]]
+    section_indexes = np.repeat(np.arange(len(section_values)), count_values)
 
     # Calculate values
-    section_values = [section for section in section_order if section in grouped_by_section]
-    jobs_values = [grouped_by_section[section] for section in section_values]
-    count_values = [len(values) for values in jobs_values]
-    time_delta = timedelta()
-    total_queue_time_values = [
-        sum([job_stat.completed_queue_time + job_stat.failed_queue_time
-             for job_stat in values], time_delta)
-        for values in jobs_values]
-
-    # Calculate total queue time
-    total_run_time_values = []
-    for section in jobs_values:
-        sum_run_time = timedelta()
-        for job_stat in section:
-            if _get_status(jobs_list, job_stat.name) == "RUNNING":
-                sum_run_time += datetime.now() - job_stat.start_time
-            else:
-                sum_run_time += job_stat.completed_run_time + job_stat.failed_run_time
-        total_run_time_values.append(sum_run_time)
-    avg_queue_time_values = [total_queue_time / count if count != 0 else timedelta()
-                             for total_queue_time, count in zip(total_queue_time_values, count_values)]
-    avg_run_time_values = [total_run_time / count if count != 0 else timedelta()
-                           for total_run_time, count in zip(total_run_time_values, count_values)]
-
-    # Format times
-    total_queue_time_values = [_format_times(td) for td in total_queue_time_values]
-    avg_queue_time_values = [_format_times(td) for td in avg_queue_time_values]
-    total_run_time_values = [_format_times(td) for td in total_run_time_values]
-    avg_run_time_values = [_format_times(td) for td in avg_run_time_values]
-
-    data = [JobAggData(section, count, total_queue, avg_queue, total_run, avg_run)
-            for section, count, total_queue, avg_queue, total_run, avg_run in
-            zip(section_values, count_values, total_queue_time_values, avg_queue_time_values, total_run_time_values, avg_run_time_values)]
-
-    # Order return data by section
-    ret = []
-    for job in jobs_list:
-        for job_data in data:
-            if job_data.section == job.section and job_data not in ret:
-                ret.append(job_data)
-                break
-    return ret
+    total_queue_time_values = np.zeros(len(section_values), dtype=np.int64)
+    np.add.at(total_queue_time_values, section_indexes, _microseconds(
+        [job_stat.completed_queue_time + job_stat.failed_queue_time for job_stat in jobs_stats_by_section]))
+    total_run_time_values = np.zeros(len(section_values), dtype=np.int64)
+    np.add.at(total_run_time_values, section_indexes,
+              _microseconds(_run_times(jobs_stats_by_section, _get_statuses(jobs_list))))
+
+    data = []
+    for section, count, total_queue, total_run in zip(
+            section_values, count_values, total_queue_time_values.tolist(), total_run_time_values.tolist()):
+        total_queue_time = timedelta(microseconds=total_queue)
+        total_run_time = timedelta(microseconds=total_run)
+        data.append(JobAggData(section, count,
+                               _format_times(total_queue_time), _format_times(total_queue_time / count),
+                               _format_times(total_run_time), _format_times(total_run_time / count)))
+    return data
 
 
 def _get_job_list_data(jobs_list: List[Job], jobs_stats: List[JobStat]) -> List[JobData]:
     """Return a list of jobs data."""
     filtered_job_list = sorted(_filter_by_status(jobs_list), key=lambda x: x.name)
+    statuses = _get_statuses(jobs_list)
 
-    jobs_stats_list = []
-    for job in filtered_job_list:
-        for job_stats in jobs_stats:
-            if job_stats.name == job.name:
-                jobs_stats_list.append(job_stats)
-                break
+    jobs_stats_by_name = {}
+    for job_stats in jobs_stats:
+        jobs_stats_by_name.setdefault(job_stats.name, job_stats)
     # Order initial jobs by name
-    jobs_stats_list = sorted(jobs_stats_list, key=lambda x: x.name)
+    jobs_stats_list = sorted([jobs_stats_by_name[job.name] for job in filtered_job_list
+                              if job.name in jobs_stats_by_name], key=lambda x: x.name)
 
     # Calculate values
     job_names = [job_aux.name for job_aux in filtered_job_list]
     queue_values = [_format_times(job_stat.completed_queue_time + job_stat.failed_queue_time) for job_stat in jobs_stats_list]
-    # Calculate run time
-    run_values = []
-    for job_stats in jobs_stats_list:
-        if _get_status(jobs_list, job_stats.name) == "RUNNING":
-            job_running_time = _format_times(datetime.now() - job_stats.start_time)
-        else:
-            job_running_time = _format_times(job_stats.completed_run_time + job_stats.failed_run_time)
-        run_values.append(job_running_time)
-    status = [_get_status(jobs_list, job_stat.name) for job_stat in jobs_stats_list]
+    run_values = [_format_times(run_time) for run_time in _run_times(jobs_stats_list, statuses)]
+    status = [statuses.get(job_stat.name) for job_stat in jobs_stats_list]
     data = [JobData(job_name, queue_time, run_time, status)
             for job_name, queue_time, run_time, status in
             zip(job_names, queue_values, run_values, status)]
 
     # Order return data by job name
-    res = []
-    for job in jobs_list:
-        for job_data in data:
-            if job_data.job_name == job.name:
-                res.append(job_data)
-                break
-    return res
+    data_by_name = {}
+    for job_data in data:
+        data_by_name.setdefault(job_data.job_name, job_data)
+    return [data_by_name[job.name] for job in jobs_list if job.name in data_by_name]
 
 
 def _create_table(
@@ -34,6 +34,7 @@ from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status
 from autosubmit.log.log import Log, AutosubmitCritical
 from autosubmit.monitor.diagram import create_stats_report
+from autosubmit.statistics.retrials import JobRetrials
 
 _GENERAL_STATS_OPTION_MAX_LENGTH = 1000
 """Maximum length used in the stats plot."""
@@ -597,7 +598,8 @@ class Monitor:
 
     def generate_output_stats(self, expid: str, joblist: list[Job], output_format="pdf", hide=False,
                               section_summary=False, jobs_summary=False, period_ini: Optional[datetime] = None,
-                              period_fi: Optional[datetime] = None, queue_time_fixes: dict[str, int] = None) -> bool:
+                              period_fi: Optional[datetime] = None, queue_time_fixes: dict[str, int] = None,
+                              retrials: Optional[JobRetrials] = None) -> bool:
         """Plots stats for joblist and stores it in a file.
 
         :param queue_time_fixes:
@@ -619,6 +621,9 @@ class Monitor:
         :type period_ini: datetime
         :param period_fi: final datetime of filtered period
         :type period_fi: datetime
+        :param retrials: retrials of the jobs read from the experiment history, if not given they are read from
+            the ``TOTAL_STATS`` files
+        :type retrials: JobRetrials
         :return: ``True`` if the report was generated successfully or ``False`` otherwise
         :rtype: bool
         """
@@ -648,7 +653,7 @@ class Monitor:
 
         report_created = create_stats_report(
             expid, joblist, str(output_complete_path_stats), section_summary, jobs_summary,
-            period_ini, period_fi, queue_time_fixes
+            period_ini, period_fi, queue_time_fixes, retrials
         )
         if hide or not report_created:
             return False
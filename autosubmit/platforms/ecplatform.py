@@ -249,6 +249,16 @@ class EcPlatform(ParamikoPlatform):
                                                                                        filename)), 6005, str(e))
         return True
 
+    def send_files(self, filenames: list[str]) -> bool:
+        """Sends the files one by one with ``send_file``, as this platform has no SFTP channel.
+
+        :param filenames: The names of the files to send.
+        :return: True if the files were sent.
+        """
+        for filename in filenames:
+            self.send_file(filename)
+        return True
+
     def move_file(self, src, dest, must_exist=False):
         command = (f"ecaccess-file-move {self.host}:{os.path.join(self.remote_log_dir, src)} "
                    f"{self.host}:{os.path.join(self.remote_log_dir, dest)}")
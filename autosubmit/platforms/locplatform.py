@@ -203,6 +203,16 @@ class LocalPlatform(ParamikoPlatform):
             raise
         return True
 
+    def send_files(self, filenames: list[str]) -> bool:
+        """Sends the files one by one with ``send_file``, as this platform has no SFTP channel.
+
+        :param filenames: The names of the files to send.
+        :return: True if the files were sent.
+        """
+        for filename in filenames:
+            self.send_file(filename)
+        return True
+
     def remove_multiple_files(self, filenames: str) -> str:
         """Creates a shell script to remove multiple files in the remote and sets the appropriate permissions.
 
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 import datetime
 import getpass
 import hashlib
@@ -24,15 +25,19 @@ import os
 import random
 import re
 import select
+import shlex
+import shutil
 import socket
 import sys
+import tarfile
+import textwrap
 import threading
 import time
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from threading import Thread
 from time import sleep
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Iterator, Optional, Union, TYPE_CHECKING
 
 import Xlib.support.connect as xlib_connect
 import paramiko
@@ -43,6 +48,8 @@ from autosubmit.job.job_common import Status
 from autosubmit.job.template import Language
 from autosubmit.log.log import AutosubmitError, AutosubmitCritical, Log
 from autosubmit.platforms.platform import Platform
+from autosubmit.platforms.remote_manifest import RemoteManifest
+from autosubmit.platforms.ssh_connection_pool import ConnectionKey, ssh_connection_pool
 
 if TYPE_CHECKING:
     # Avoid circular imports
@@ -51,6 +58,56 @@ if TYPE_CHECKING:
     from autosubmit.platforms.headers import PlatformHeader
 
 
+_MAX_ARGUMENTS_LENGTH = 65536
+"""Maximum length of the arguments built from a list of job names in a single command.
+
+The remote shell receives the whole command as one argument, and Linux limits
+the length of each argument to 128 KiB (``MAX_ARG_STRLEN``), below ``ARG_MAX``.
+"""
+
+
+def _join_in_chunks(arguments: list[str], separator: str = ' ',
+                    max_length: int = _MAX_ARGUMENTS_LENGTH) -> list[str]:
+    """Join a list of command arguments in chunks whose length is at most ``max_length``.
+
+    An argument longer than ``max_length`` gets a chunk for itself.
+
+    :param arguments: The arguments.
+    :param separator: The separator between two arguments of a chunk.
+    :param max_length: Maximum length of each chunk.
+    :return: The joined chunks, in order.
+    """
+    chunks: list[list[str]] = []
+    length = 0
+    for argument in arguments:
+        if not chunks or length + len(separator) + len(argument) > max_length:
+            chunks.append([])
+            length = -len(separator)
+        chunks[-1].append(argument)
+        length += len(separator) + len(argument)
+    return [separator.join(chunk) for chunk in chunks]
+
+
+_BULK_LOG_FUNCTION = textwrap.dedent("""\
+    _as_log() {{
+        if [ -f "$1" ]; then mv -f "$1" "$2"; fi
+        if [ -f "$2" ]; then
+            if ! head -n 1 "$2" | grep -q '^\\[INFO\\] JOBID='; then
+                {{ printf '[INFO] JOBID=%s\\n\\n' "$3"; cat "$2"; }} > "$2.as_tmp" && mv "$2.as_tmp" "$2"
+            fi
+            {compress}
+        fi
+        for log in "$2" "$2{extension}"; do
+            if [ -f "$log" ]; then printf '%s\\t%s\\n' "$4" "$log" >> {listing}; fi
+        done
+    }}
+""")
+"""Shell function that prepares a log for the bulk log retrieval, as ``Job._sync_retrieve_logfiles`` does.
+
+Its arguments are the remote name of the log, its local name, the job ID, and the job name.
+"""
+
+
 def threaded(fn):
     def wrapper(*args, **kwargs):
         thread = Thread(target=fn, args=args, kwargs=kwargs, name=f"{args[0].name}_X11")
@@ -91,8 +148,12 @@ class ParamikoPlatform(Platform):
         self._default_queue = None
         self.job_status: Optional[dict[str, list]] = None
         self._ssh: Optional[paramiko.SSHClient] = None
+        # The connection acquired from the pool, shared with the other platforms on the same host.
+        self._pooled_ssh: Optional[paramiko.SSHClient] = None
         self._ssh_config = None
         self._ssh_output = None
+        # The exit status of the last command of ``send_command``, None if it is not known (e.g. X11).
+        self._ssh_exit_status: Optional[int] = None
         self._user_config_file = None
         self._host_config = None
         self._host_config_id = None
@@ -107,10 +168,15 @@ class ParamikoPlatform(Platform):
         self._header = None
         self._wrapper = None
         self.remote_log_dir = ""
+        self._remote_manifest = RemoteManifest()
         # self.get_job_energy_cmd = ""
         self._init_local_x11_display()
 
         self.remove_log_files_on_transfer = False
+        self._pending_log_removals: Optional[dict[str, str]] = None
+        # Files sent with ``send_files`` inside ``upload_batch``, uploaded at the end of it.
+        self._pending_uploads: Optional[list[str]] = None
+        self._remote_checksum_supported = True
         if self.config:
             platform_config: dict = self.config.get("PLATFORMS", {}).get(
                 self.name.upper(), {}
@@ -143,6 +209,8 @@ class ParamikoPlatform(Platform):
         self._ssh = None
         self._ssh_config = None
         self._ssh_output = None
+        # The exit status of the last command of ``send_command``, None if it is not known (e.g. X11).
+        self._ssh_exit_status: Optional[int] = None
         self._user_config_file = None
         self._host_config = None
         self._host_config_id = None
@@ -345,7 +413,6 @@ class ParamikoPlatform(Platform):
         """
         try:
             self._init_local_x11_display()
-            self._ssh = _create_ssh_client()
             self._ssh_config = paramiko.SSHConfig()
             user_ssh_config = Path("~/.ssh/config").expanduser()
             if user_ssh_config.is_file():
@@ -367,58 +434,12 @@ class ParamikoPlatform(Platform):
             if 'identityfile' in self._host_config:
                 self._host_config_id = self._host_config['identityfile']
             port = int(self._host_config.get('port', 22))
-            if not self.two_factor_auth:
-                # Agent Auth
-                if not self.agent_auth(port):
-                    # Public Key Auth
-                    if 'proxycommand' in self._host_config:
-                        self._proxy = paramiko.ProxyCommand(self._host_config['proxycommand'])
-                        try:
-                            self._ssh.connect(self._host_config['hostname'], port, username=self.user,
-                                              key_filename=self._host_config_id, sock=self._proxy, timeout=60,
-                                              banner_timeout=60)
-                        except Exception as e:
-                            Log.warning(f'Failed to SSH connect to {self._host_config["hostname"]}: {e}')
-                            Log.warning('Will try disabling the rsa-sha2-256 and rsa-sha2-512 SSH '
-                                        'public key algorithms...')
-                            self._ssh.connect(self._host_config['hostname'], port, username=self.user,
-                                              key_filename=self._host_config_id, sock=self._proxy, timeout=60,
-                                              banner_timeout=60, disabled_algorithms={'pubkeys': ['rsa-sha2-256',
-                                                                                                  'rsa-sha2-512']})
-                    else:
-                        try:
-                            self._ssh.connect(self._host_config['hostname'], port, username=self.user,
-                                              key_filename=self._host_config_id, timeout=60, banner_timeout=60)
-                        except Exception as e:
-                            Log.warning(f'Failed to SSH connect to {self._host_config["hostname"]}: {e}')
-                            Log.warning('Will try disabling the rsa-sha2-256 and rsa-sha2-512 SSH '
-                                        'public key algorithms...')
-                            self._ssh.connect(self._host_config['hostname'], port, username=self.user,
-                                              key_filename=self._host_config_id, timeout=60, banner_timeout=60,
-                                              disabled_algorithms={'pubkeys': ['rsa-sha2-256', 'rsa-sha2-512']})
-                self.transport = self._ssh.get_transport()
-                self.transport.banner_timeout = 60
-            else:
-                Log.warning("2FA is enabled, this is an experimental feature and it may not work as expected")
-                Log.warning("nohup can't be used as the password will be asked")
-                Log.warning("If you are using a token, please type the token code when asked")
-                if self.pw is None:
-                    self.pw = getpass.getpass(f"Password for {self.name}: ")
-                if self.two_factor_method == "push":
-                    Log.warning("Please check your phone to complete the 2FA PUSH authentication")
-                self.transport = paramiko.Transport((self._host_config['hostname'], port))
-                self.transport.start_client()
-                try:
-                    self.transport.auth_interactive(self.user, self.interactive_auth_handler)
-                except Exception as e:
-                    Log.printlog(f"2FA authentication failed: {str(e)}", 7000)
-                    raise
-                if self.transport.is_authenticated():
-                    self._ssh._transport = self.transport
-                    self.transport.banner_timeout = 60
-                else:
-                    self.transport.close()
-                    raise SSHException
+            key = ConnectionKey(self._host_config['hostname'], self.user, port,
+                                self._host_config.get('proxycommand'))
+            ssh = ssh_connection_pool.acquire(key, lambda: self._open_ssh_client(port))
+            self._release_pooled_connection()
+            self._ssh = self._pooled_ssh = ssh
+            self.transport = ssh.get_transport()
             self._ftpChannel = paramiko.SFTPClient.from_transport(self.transport, window_size=pow(4, 12),
                                                                   max_packet_size=pow(4, 12))
             self._ftpChannel.get_channel().settimeout(120)
@@ -447,6 +468,76 @@ class ParamikoPlatform(Platform):
                 raise AutosubmitError(
                     "Couldn't establish a connection to the specified host, wrong configuration?", 6003, str(e))
 
+    def _open_ssh_client(self, port: int) -> paramiko.SSHClient:
+        """Open and authenticate a new SSH connection to the host.
+
+        :param port: The SSH port of the host.
+        :return: The SSH client, with its transport.
+        """
+        self._ssh = _create_ssh_client()
+        if not self.two_factor_auth:
+            # Agent Auth
+            if not self.agent_auth(port):
+                # Public Key Auth
+                if 'proxycommand' in self._host_config:
+                    self._proxy = paramiko.ProxyCommand(self._host_config['proxycommand'])
+                    try:
+                        self._ssh.connect(self._host_config['hostname'], port, username=self.user,
+                                          key_filename=self._host_config_id, sock=self._proxy, timeout=60,
+                                          banner_timeout=60)
+                    except Exception as e:
+                        Log.warning(f'Failed to SSH connect to {self._host_config["hostname"]}: {e}')
+                        Log.warning('Will try disabling the rsa-sha2-256 and rsa-sha2-512 SSH '
+                                    'public key algorithms...')
+                        self._ssh.connect(self._host_config['hostname'], port, username=self.user,
+                                          key_filename=self._host_config_id, sock=self._proxy, timeout=60,
+                                          banner_timeout=60, disabled_algorithms={'pubkeys': ['rsa-sha2-256',
+                                                                                              'rsa-sha2-512']})
+                else:
+                    try:
+                        self._ssh.connect(self._host_config['hostname'], port, username=self.user,
+                                          key_filename=self._host_config_id, timeout=60, banner_timeout=60)
+                    except Exception as e:
+                        Log.warning(f'Failed to SSH connect to {self._host_config["hostname"]}: {e}')
+                        Log.warning('Will try disabling the rsa-sha2-256 and rsa-sha2-512 SSH '
+                                    'public key algorithms...')
+                        self._ssh.connect(self._host_config['hostname'], port, username=self.user,
+                                          key_filename=self._host_config_id, timeout=60, banner_timeout=60,
+                                          disabled_algorithms={'pubkeys': ['rsa-sha2-256', 'rsa-sha2-512']})
+            self.transport = self._ssh.get_transport()
+            self.transport.banner_timeout = 60
+        else:
+            Log.warning("2FA is enabled, this is an experimental feature and it may not work as expected")
+            Log.warning("nohup can't be used as the password will be asked")
+            Log.warning("If you are using a token, please type the token code when asked")
+            if self.pw is None:
+                self.pw = getpass.getpass(f"Password for {self.name}: ")
+            if self.two_factor_method == "push":
+                Log.warning("Please check your phone to complete the 2FA PUSH authentication")
+            self.transport = paramiko.Transport((self._host_config['hostname'], port))
+            self.transport.start_client()
+            try:
+                self.transport.auth_interactive(self.user, self.interactive_auth_handler)
+            except Exception as e:
+                Log.printlog(f"2FA authentication failed: {str(e)}", 7000)
+                raise
+            if self.transport.is_authenticated():
+                self._ssh._transport = self.transport
+                self.transport.banner_timeout = 60
+            else:
+                self.transport.close()
+                raise SSHException
+        return self._ssh
+
+    def _release_pooled_connection(self) -> None:
+        """Close the SFTP channel of the platform, and release its SSH connection to the pool."""
+        with suppress(Exception):
+            if self._ftpChannel:
+                self._ftpChannel.close()
+        if self._pooled_ssh is not None:
+            ssh_connection_pool.release(self._pooled_ssh)
+            self._pooled_ssh = self._ssh = None
+
     def check_completed_files(self, sections=None) -> Optional[str]:
         if self.host == 'localhost':
             return None
@@ -491,6 +582,7 @@ class ParamikoPlatform(Platform):
         try:
             self._ftpChannel.put(local_path, remote_path)
             self._ftpChannel.chmod(remote_path, os.stat(local_path).st_mode)
+            self._remote_manifest.add(os.path.basename(filename))
             return True
         except socket.error as e:
             raise AutosubmitError(f'Cannot send file {local_path} to {remote_path}. '
@@ -499,6 +591,88 @@ class ParamikoPlatform(Platform):
             raise AutosubmitError(f'Cannot send file {local_path} to {remote_path}. '
                                   f'An unexpected error occurred: {str(e)}', 6004)
 
+    def send_files(self, filenames: list[str]) -> bool:
+        """Sends several local files to the platform in one compressed tar archive.
+
+        The archive is extracted on the platform with the permissions of the local files,
+        replacing the previous files, so it costs one transfer and one command instead of
+        the checks, deletions, transfers and ``chmod`` of ``send_file`` for each file.
+        Inside ``upload_batch``, the files are only uploaded at the end of the context.
+
+        :param filenames: The names of the files to send, relative to the tmp directory.
+        :return: True if the files were sent, or queued to be sent.
+        """
+        if self._pending_uploads is not None:
+            self._pending_uploads.extend(filenames)
+            return True
+        return self._send_files_in_archive(filenames)
+
+    @contextmanager
+    def upload_batch(self) -> Iterator[None]:
+        """Defer the uploads of ``send_files`` until the end of the context.
+
+        Used while the packages of a submission are prepared, so all their scripts are sent
+        together before the jobs are submitted, see ``Platform.submit_ready_jobs``. The files
+        not uploaded yet are uploaded at the end of the context, unless it raises. Nested
+        contexts are part of the outer one.
+        """
+        if self._pending_uploads is not None:
+            yield
+            return
+        self._pending_uploads = []
+        try:
+            yield
+            self.flush_uploads()
+        finally:
+            self._pending_uploads = None
+
+    def flush_uploads(self) -> None:
+        """Upload now the files sent with ``send_files`` in the current ``upload_batch``."""
+        if self._pending_uploads:
+            filenames, self._pending_uploads = self._pending_uploads, []
+            self._send_files_in_archive(filenames)
+
+    def _send_files_in_archive(self, filenames: list[str]) -> bool:
+        """Sends the files in one tar archive, or one by one if the archive cannot be extracted.
+
+        :param filenames: The names of the files to send.
+        :return: True if the files were sent.
+        """
+        # The last file with each name is the one sent, as with consecutive ``send_file`` calls.
+        files = {os.path.basename(filename): filename for filename in filenames}
+        if len(files) <= 1:
+            for filename in files.values():
+                self.send_file(filename)
+            return True
+        archive_name = f"{self.expid}_{self.name}_upload.tar.gz"
+        local_archive = os.path.join(self.tmp_path, archive_name)
+        remote_dir = self.get_files_path()
+        try:
+            with tarfile.open(local_archive, "w:gz", compresslevel=6) as tar:
+                for name, filename in files.items():
+                    tar.add(os.path.join(self.tmp_path, filename), arcname=name)
+            self.check_remote_log_dir()
+            remote_archive = shlex.quote(os.path.join(remote_dir, archive_name))
+            self._ftpChannel.put(local_archive, os.path.join(remote_dir, archive_name))
+            # The archive is removed in any case, and the command fails if any file was not extracted.
+            self.send_command(f"cd {shlex.quote(remote_dir)} && tar -xzpf {remote_archive} && rm -f {remote_archive}"
+                              f" || {{ rm -f {remote_archive}; exit 1; }}", ignore_log=True)
+            if self._ssh_exit_status != 0:
+                raise AutosubmitError(f"The archive was not extracted (exit status {self._ssh_exit_status}): "
+                                      f"{self._ssh_output_err}", 6005)
+        except Exception as e:
+            Log.warning(f"Could not send {len(files)} files to platform {self.name} in one archive, "
+                        f"sending them one by one: {str(e)}")
+            for filename in files.values():
+                self.send_file(filename)
+            return True
+        finally:
+            with suppress(OSError):
+                os.remove(local_archive)
+        for name in files:
+            self._remote_manifest.add(name)
+        return True
+
     def get_logs_files(self, exp_id: str, remote_logs: tuple[str, str]) -> None:
         (job_out_filename, job_err_filename) = remote_logs
         self.get_files(
@@ -523,6 +697,9 @@ class ParamikoPlatform(Platform):
     def _checksum_validation(self, local_path: str, remote_path: str) -> bool:
         """Validates that the checksum of the local file matches the checksum of the remote file.
 
+        The remote file is read through SFTP, see ``_remote_checksums`` to compute
+        the checksum on the platform instead.
+
         :param local_path: Path to the local file.
         :param remote_path: Path to the remote file.
         """
@@ -564,15 +741,11 @@ class ParamikoPlatform(Platform):
 
             # Remove file from remote if configured and checksum matches
             is_log_file = bool(re.match(r".*\.(out|err)(\.(xz|gz))?$", filename))
-            if (
-                is_log_file
-                and self.remove_log_files_on_transfer
-                and self._checksum_validation(file_path, remote_path)
-            ):
-                try:
-                    self._ftpChannel.remove(remote_path)
-                except Exception as e:
-                    Log.warning(f"Failed to remove remote file {remote_path}: {e}")
+            if is_log_file and self.remove_log_files_on_transfer:
+                if self._pending_log_removals is not None:
+                    self._pending_log_removals[remote_path] = file_path
+                else:
+                    self.remove_transferred_files({remote_path: file_path})
 
             return True
         except Exception as e:
@@ -591,6 +764,211 @@ class ParamikoPlatform(Platform):
                     Log.printlog(f"Log file couldn't be retrieved: {filename}", 5000)
         return False
 
+    def retrieve_logfiles_in_bulk(self, jobs: list['Job']) -> set['Job']:
+        """Retrieve the log and STAT files of several jobs in a single tar archive.
+
+        The logs of each job are prepared on the platform as ``Job._sync_retrieve_logfiles``
+        does (renamed, with the job ID at their top, and compressed if enabled), then all
+        the files are packed in one archive, which is transferred in a single SFTP stream
+        and unpacked in the local ``LOG_<EXPID>`` directory. The STAT files are unpacked in
+        the local tmp directory, where ``get_stat_file`` finds them without a transfer.
+
+        The logs of the jobs inside vertical wrappers, which have one log per internal
+        retrial, are not retrieved in bulk.
+
+        :param jobs: The jobs whose logs must be retrieved.
+        :return: The jobs whose logs were retrieved. The logs of the other jobs must be
+            retrieved one by one.
+        """
+        jobs_by_name = {job.name: job for job in jobs
+                        if job.wrapper_type != "vertical" and job.local_logs and job.local_logs[0]}
+        if not jobs_by_name or self.expid not in str(self.remote_log_dir):
+            return set()
+        archive_name = f"{self.expid}_{self.name}_logs.tar"
+        listing = shlex.quote(f"{archive_name}.list")
+        if self.compress_remote_logs and self.remote_logs_compress_type == "xz":
+            compress, extension = f'xz -{self.compression_level} -e -f "$2"', ".xz"
+        elif self.compress_remote_logs:
+            compress, extension = f'gzip -{self.compression_level} -f "$2"', ".gz"
+        else:
+            compress, extension = ":", ""
+        function = _BULK_LOG_FUNCTION.format(compress=compress, extension=extension, listing=listing)
+        stat_files = {}
+        sections = []
+        for job in jobs_by_name.values():
+            remote_logs = [shlex.quote(log) for log in job.get_new_remotelog_name()]
+            local_logs = [shlex.quote(log) for log in job.local_logs]
+            stat_file = f"{job.stat_file}{job.fail_count}"
+            stat_files[stat_file] = job
+            exists = " || ".join(f"[ -f {log} ]" for log in remote_logs + local_logs)
+            job_id, job_name, quoted_stat_file = shlex.quote(str(job.id)), shlex.quote(job.name), shlex.quote(stat_file)
+            sections.append(
+                f"if {exists}; then "
+                f"_as_log {remote_logs[0]} {local_logs[0]} {job_id} {job_name}; "
+                f"_as_log {remote_logs[1]} {local_logs[1]} {job_id} {job_name}; "
+                f"if [ -f {quoted_stat_file} ]; then printf '%s\\t%s\\n' {job_name} {quoted_stat_file} >> {listing}; fi; "
+                f"fi")
+        log_dir = shlex.quote(self.get_files_path())
+        try:
+            self.send_command(f"cd {log_dir} && rm -f {listing}", ignore_log=True)
+            for chunk in _join_in_chunks(sections, "\n", _MAX_ARGUMENTS_LENGTH - len(function) - len(log_dir) - 16):
+                self.send_command(f"cd {log_dir}\n{function}{chunk}", ignore_log=True)
+            self.send_command(f"cd {log_dir} && touch {listing} && cut -f2 {listing} | tar -cf {archive_name} -T - "
+                              f"&& cat {listing}; rm -f {listing}", ignore_log=True)
+            archived = [line.split("\t", 1) for line in self.get_ssh_output().splitlines() if "\t" in line]
+            # The logs were renamed or compressed.
+            self._remote_manifest.invalidate()
+            if not archived or not self.get_file(archive_name, must_exist=True, ignore_log=True):
+                return set()
+        except Exception as e:
+            Log.warning(f"Could not retrieve the logs of platform {self.name} in bulk, "
+                        f"retrieving them one by one: {str(e)}")
+            return set()
+        finally:
+            with suppress(Exception):
+                self.send_command(f"rm -f {shlex.quote(str(Path(self.get_files_path(), archive_name)))}",
+                                  ignore_log=True)
+
+        local_archive = Path(self.tmp_path, archive_name)
+        local_log_dir = Path(self.tmp_path, f"LOG_{self.expid}")
+        local_log_dir.mkdir(parents=True, exist_ok=True)
+        extracted = set()
+        try:
+            with tarfile.open(local_archive) as tar:
+                for member in tar:
+                    # Only plain files, with no directories in their name, are expected.
+                    if not member.isfile() or Path(member.name).name != member.name:
+                        continue
+                    target = Path(self.tmp_path if member.name in stat_files else local_log_dir, member.name)
+                    with tar.extractfile(member) as source, open(target, "wb") as target_file:
+                        shutil.copyfileobj(source, target_file)
+                    extracted.add(member.name)
+        except (OSError, tarfile.TarError) as e:
+            Log.warning(f"Could not unpack the logs of platform {self.name} retrieved in bulk: {str(e)}")
+        finally:
+            with suppress(OSError):
+                local_archive.unlink()
+
+        retrieved = set()
+        logs_by_job: dict[str, list[str]] = {}
+        for job_name, filename in archived:
+            if filename not in extracted or job_name not in jobs_by_name:
+                continue
+            if filename in stat_files:
+                self._prefetched_stat_files.add(filename)
+                continue
+            logs_by_job.setdefault(job_name, []).append(filename)
+            if self.remove_log_files_on_transfer:
+                remote_path = os.path.join(self.get_files_path(), filename)
+                local_path = str(local_log_dir / filename)
+                if self._pending_log_removals is not None:
+                    self._pending_log_removals[remote_path] = local_path
+                else:
+                    self.remove_transferred_files({remote_path: local_path})
+        for job_name, logs in logs_by_job.items():
+            job = jobs_by_name[job_name]
+            # The last name of each log, as the compressed one is listed after the plain one.
+            job.local_logs = tuple(next((log for log in reversed(logs) if log.startswith(local_log)), local_log)
+                                   for local_log in job.local_logs)
+            job.remote_logs = copy.deepcopy(job.local_logs)
+            retrieved.add(job)
+        return retrieved
+
+    @contextmanager
+    def log_recovery_channels(self, workers: int) -> Iterator[list['ParamikoPlatform']]:
+        """Context with the platforms used by the workers that download the logs.
+
+        The other workers use copies of this platform that share its SSH transport, each one
+        with a new SFTP channel, closed at the end of the context. Fewer workers are used if
+        the server refuses to open more channels.
+
+        :param workers: The number of workers.
+        :return: This platform, and its copies.
+        """
+        platforms = [self]
+        try:
+            for _ in range(workers - 1):
+                try:
+                    ftp_channel = paramiko.SFTPClient.from_transport(self.transport, window_size=pow(4, 12),
+                                                                     max_packet_size=pow(4, 12))
+                    ftp_channel.get_channel().settimeout(120)
+                except Exception as e:
+                    Log.warning(f"Could not open more SFTP channels on platform {self.name}, "
+                                f"recovering the logs with {len(platforms)} workers: {str(e)}")
+                    break
+                worker = copy.copy(self)
+                worker._ftpChannel = ftp_channel
+                worker._pooled_ssh = None
+                platforms.append(worker)
+            yield platforms
+        finally:
+            for worker in platforms[1:]:
+                with suppress(Exception):
+                    worker._ftpChannel.close()
+
+    @contextmanager
+    def log_transfer_batch(self) -> Iterator[None]:
+        """Defer the removal of the log files retrieved with ``REMOVE_LOG_FILES_ON_TRANSFER`` until the end of the context.
+
+        The checksums of all the log files retrieved meanwhile are then validated together.
+        """
+        if self._pending_log_removals is not None:
+            yield
+            return
+        self._pending_log_removals = {}
+        try:
+            yield
+        finally:
+            pending_log_removals, self._pending_log_removals = self._pending_log_removals, None
+            if pending_log_removals:
+                self.remove_transferred_files(pending_log_removals)
+
+    def remove_transferred_files(self, files: dict[str, str]) -> None:
+        """Remove the remote files whose checksum matches the one of their local copy.
+
+        :param files: Local path of the copy of each remote path.
+        """
+        remote_checksums = self._remote_checksums(list(files))
+        for remote_path, local_path in files.items():
+            if remote_checksums is None:
+                valid = self._checksum_validation(local_path, remote_path)
+            else:
+                valid = False
+                with suppress(OSError), open(local_path, "rb") as local_file:
+                    valid = self._chunked_md5(local_file) == remote_checksums.get(remote_path)
+                if not valid:
+                    Log.warning(f"Checksum validation failed: {remote_path} does not match {local_path}")
+            if valid:
+                try:
+                    self._ftpChannel.remove(remote_path)
+                    self._discard_from_manifest(remote_path)
+                except Exception as e:
+                    Log.warning(f"Failed to remove remote file {remote_path}: {e}")
+
+    def _remote_checksums(self, remote_paths: list[str]) -> Optional[dict[str, str]]:
+        """Compute the MD5 checksum of remote files with ``md5sum`` on the platform.
+
+        :param remote_paths: Paths of the remote files.
+        :return: Checksum by remote path, for the files that exist, or None if the checksums
+            could not be computed on the platform.
+        """
+        if not self._remote_checksum_supported:
+            return None
+        checksums: dict[str, str] = {}
+        for paths in _join_in_chunks([shlex.quote(remote_path) for remote_path in remote_paths]):
+            try:
+                self.send_command(f"md5sum -- {paths}", ignore_log=True)
+            except Exception as e:
+                if isinstance(e, AutosubmitError) and e.code == 7052:  # md5sum not found
+                    self._remote_checksum_supported = False
+                Log.debug(f"Could not compute the checksums of the log files in platform {self.name}: {str(e)}")
+                return None
+            for line in self.get_ssh_output().splitlines():
+                checksum, _, remote_path = line.partition('  ')
+                if remote_path:
+                    checksums[remote_path] = checksum
+        return checksums
+
     def delete_file(self, filename: str) -> bool:
         """Deletes a file from this platform
 
@@ -601,6 +979,7 @@ class ParamikoPlatform(Platform):
         """
         remote_file = Path(self.get_files_path()) / filename
         try:
+            self._discard_from_manifest(filename)
             self._ftpChannel.remove(str(remote_file))
             return True
         except IOError as e:
@@ -634,6 +1013,7 @@ class ParamikoPlatform(Platform):
             try:
                 self._ftpChannel.stat(dest)
             except IOError:
+                self._discard_from_manifest(src)
                 self._ftpChannel.rename(src, dest)
             return True
         except IOError as e:
@@ -750,6 +1130,10 @@ class ParamikoPlatform(Platform):
     def get_completed_job_names(self, job_names: Optional[list[str]] = None) -> list[str]:
         """Retrieve the names of all files ending with '_COMPLETED' from the remote log directory using SSH.
 
+        The files already found in the remote manifest are not looked for again. A
+        long list of job names is checked with one command per chunk of names, to
+        keep each command below the length limit of the remote shell.
+
         :param job_names: If provided, filters the results to include only these job names.
         :type job_names: Optional[List[str]]
         :return: List of job names with COMPLETED files.
@@ -758,16 +1142,101 @@ class ParamikoPlatform(Platform):
         final_job_names = []
         if self.expid in str(self.remote_log_dir):  # Ensure we are in the right experiment
             if not job_names:
-                pattern = "-name '*_COMPLETED'"
+                patterns = ["-name '*_COMPLETED'"]
             else:
-                pattern = ' -o '.join([f"-name '{name}_COMPLETED'" for name in job_names])
-            cmd = f"find {self.remote_log_dir} -maxdepth 1 \\( {pattern} \\) -type f"
-            self.send_command(cmd)
-            output = self.get_ssh_output()
-            completed_files = output.strip().split('\n') if output else []
-            final_job_names = [Path(file).name.replace('_COMPLETED', '') for file in completed_files]
+                final_job_names = [name for name in job_names if self._remote_manifest.lookup(f'{name}_COMPLETED')]
+                found = set(final_job_names)
+                patterns = _join_in_chunks([f"-name '{name}_COMPLETED'" for name in job_names if name not in found],
+                                           ' -o ')
+            for pattern in patterns:
+                cmd = f"find {self.remote_log_dir} -maxdepth 1 \\( {pattern} \\) -type f"
+                self.send_command(cmd)
+                output = self.get_ssh_output()
+                completed_files = output.strip().split('\n') if output else []
+                for file in completed_files:
+                    self._remote_manifest.add(Path(file).name)
+                    final_job_names.append(Path(file).name.replace('_COMPLETED', ''))
         return final_job_names
 
+    def refresh_remote_manifest(self) -> bool:
+        """List the files of the remote log directory in the remote manifest.
+
+        :return: True if the directory was listed, False otherwise, in which case the files must be checked one by one.
+        :rtype: bool
+        """
+        if not self._remote_manifest.enabled() or self.expid not in str(self.remote_log_dir):
+            return False
+        directory = self.get_files_path()
+        try:
+            self.send_command(RemoteManifest.command(directory), ignore_log=True)
+        except Exception as e:
+            error = str(e)
+        else:
+            output = self.get_ssh_output()
+            if self._ssh_exit_status is None:
+                failed = bool(self._ssh_output_err)
+            else:
+                failed = self._ssh_exit_status != 0
+            # ``find`` also fails for a file removed while listing, the other files are still listed.
+            if not failed or output:
+                if self._ssh_output_err:
+                    Log.debug(f"Listed the files of {directory} in platform {self.name} with errors: "
+                              f"{self._ssh_output_err}")
+                self._remote_manifest.update(output)
+                return True
+            error = self._ssh_output_err or f"exit status {self._ssh_exit_status}"
+        if self._remote_manifest.failed():
+            Log.warning(f"Could not list the files of {directory} in platform {self.name} "
+                        f"{self._remote_manifest.max_failures} times in a row, checking them one by one for the "
+                        f"next {self._remote_manifest.disabled_ttl} seconds: {error}")
+        else:
+            Log.debug(f"Could not list the files of {directory} in platform {self.name}, "
+                      f"checking them one by one: {error}")
+        return False
+
+    def file_exists_in_manifest(self, filename: str) -> Optional[bool]:
+        """Check if a file of the remote log directory exists, using the remote manifest.
+
+        The directory is listed again if the manifest is too old to tell, and a file missing from
+        a recent listing is checked alone.
+
+        :param filename: Name of the file, or its absolute path.
+        :type filename: str
+        :return: Whether the file exists, or None if it cannot be told from the manifest.
+        :rtype: Optional[bool]
+        """
+        name = self._manifest_file_name(filename)
+        if name is None:
+            return None
+        exists = self._remote_manifest.lookup(name)
+        if exists is None:
+            if self._remote_manifest.needs_listing():
+                if self.refresh_remote_manifest():
+                    exists = self._remote_manifest.lookup(name)
+            else:
+                try:
+                    self._ftpChannel.stat(os.path.join(self.get_files_path(), name))
+                except FileNotFoundError:
+                    exists = False
+                except Exception as e:
+                    Log.debug(f"Could not check the file {name} in platform {self.name}: {str(e)}")
+                else:
+                    self._remote_manifest.add(name)
+                    exists = True
+        return exists
+
+    def _manifest_file_name(self, filename: str) -> Optional[str]:
+        """Return the name of the file in the remote log directory, None if it is not directly in it."""
+        path = Path(filename)
+        if path.is_absolute():
+            return path.name if path.parent == Path(self.get_files_path()) else None
+        return filename if len(path.parts) == 1 else None
+
+    def _discard_from_manifest(self, filename: str) -> None:
+        name = self._manifest_file_name(filename)
+        if name is not None:
+            self._remote_manifest.discard(name)
+
     def delete_failed_and_completed_names(self, job_names: list[str]) -> None:
         """Deletes the COMPLETED and FAILED files for the given job names from the remote log directory.
 
@@ -778,6 +1247,9 @@ class ParamikoPlatform(Platform):
             if self.expid in str(self.remote_log_dir):  # Ensure we are in the right experiment
                 job_name_str = ' -o -name '.join([f"'{name}_COMPLETED' -o -name '{name}_FAILED'" for name in job_names])
                 cmd = f"find {self.remote_log_dir} -maxdepth 1 \\( -name {job_name_str} \\) -type f -delete"
+                for name in job_names:
+                    self._remote_manifest.discard(f'{name}_COMPLETED')
+                    self._remote_manifest.discard(f'{name}_FAILED')
                 self.send_command(cmd)
 
     def check_job(self, job, default_status=Status.COMPLETED, retries=5, submit_hold_check=False, is_wrapper=False):
@@ -878,15 +1350,15 @@ class ParamikoPlatform(Platform):
             job.new_status = job_status
 
     def _check_jobid_in_queue(self, ssh_output, job_list_cmd):
-        """
+        """Checks that every job of ``job_list_cmd`` is in the output of the check all jobs command.
 
         :param ssh_output: ssh output
         :type ssh_output: str
+        :param job_list_cmd: comma-separated job IDs, as returned by ``parse_job_list``
+        :type job_list_cmd: str
         """
-        for job in job_list_cmd[:-1].split(','):
-            if job not in ssh_output:
-                return False
-        return True
+        job_ids = {job_id for job_id in job_list_cmd.split(',') if job_id}
+        return job_ids.issubset(self.parse_all_jobs_statuses(ssh_output))
 
     def parse_job_list(self, job_list: list[list['Job']]) -> str:
         """Convert a list of job_list to job_list_cmd
@@ -924,7 +1396,9 @@ class ParamikoPlatform(Platform):
         job_list_cmd = self.parse_job_list(job_list)
         cmd = self.get_check_all_jobs_cmd(job_list_cmd)
         sleep_time = 5
-        sleep(sleep_time)
+        if any(prev_status == Status.SUBMITTED for _, prev_status in job_list):
+            # Give the scheduler some time to register the jobs that were just submitted.
+            sleep(sleep_time)
         slurm_error = False
         e_msg = ""
         try:
@@ -947,20 +1421,20 @@ class ParamikoPlatform(Platform):
                 sleep(sleep_time)
                 sleep_time = sleep_time + 5
 
-        job_list_status = self.get_ssh_output()
+        job_statuses = self.parse_all_jobs_statuses(self.get_ssh_output())
         if retries >= 0:
             Log.debug('Successful check job command')
             in_queue_jobs = []
             list_queue_jobid = ""
             for job, job_prev_status in job_list:
                 if not slurm_error:
-                    job_id = job.id
-                    job_status = self.parse_all_jobs_output(job_list_status, job_id)
+                    job_id = str(job.id)
+                    job_status = job_statuses.get(job_id, "")
                     while len(job_status) <= 0 <= retries:
                         retries -= 1
                         self.send_command(cmd)
-                        job_list_status = self.get_ssh_output()
-                        job_status = self.parse_all_jobs_output(job_list_status, job_id)
+                        job_statuses = self.parse_all_jobs_statuses(self.get_ssh_output())
+                        job_status = job_statuses.get(job_id, "")
                         if len(job_status) <= 0:
                             Log.debug(f'Retrying check job command: {cmd}')
                             Log.debug(f'retries left {retries}')
@@ -993,7 +1467,6 @@ class ParamikoPlatform(Platform):
                     job_status = Status.FAILED
                 elif retries == 0:
                     job_status = Status.COMPLETED
-                    job.update_status(as_conf)
                 else:
                     job_status = Status.UNKNOWN
                     Log.error(
@@ -1040,8 +1513,9 @@ class ParamikoPlatform(Platform):
         The job statuses are normally found via a command sent to the remote platform.
 
         Each ``job`` in ``in_queue_jobs`` must be updated. Implementations may check
-        for the reason for queueing cancellation, or if the job is held, and update
-        the ``job`` status appropriately.
+        for the reason for queueing cancellation, or if the job is held, and set the
+        ``new_status`` of the ``job`` appropriately. It is applied by the caller of
+        ``check_all_jobs``, as this may run in another thread.
         """
         raise NotImplementedError  # pragma: no cover
 
@@ -1223,6 +1697,7 @@ class ParamikoPlatform(Platform):
             Log.debug(f"send_command timeout used: {timeout} seconds (None = infinity)")
         stderr_readlines = []
         stdout_chunks = []
+        self._ssh_exit_status = None
 
         try:
             stdin, stdout, stderr = self.exec_command(command, x11=x11)
@@ -1287,6 +1762,8 @@ class ParamikoPlatform(Platform):
                 if len(aux_stderr) > 0:
                     stderr_readlines = aux_stderr
             else:
+                if channel.exit_status_ready():
+                    self._ssh_exit_status = channel.exit_status
                 # close all the pseudo files
                 stdout.close()
                 stderr.close()
@@ -1378,16 +1855,37 @@ class ParamikoPlatform(Platform):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def parse_all_jobs_statuses(self, output: str) -> dict[str, str]:
+        """Parses check all jobs command output once, for the whole batch of jobs.
+
+        By default, each line starts with the job ID followed by its state. If a
+        job appears in more than one line, the first one is used.
+
+        :param output: output to parse
+        :type output: str
+        :return: job status by job ID
+        :rtype: dict[str, str]
+        """
+        statuses: dict[str, str] = {}
+        for line in (output or "").splitlines():
+            fields = line.split()
+            if len(fields) > 1:
+                statuses.setdefault(fields[0], fields[1])
+        return statuses
+
     def parse_all_jobs_output(self, output, job_id):
         """Parses check jobs command output, so it can be interpreted by autosubmit
 
+        Use ``parse_all_jobs_statuses`` instead when looking for several jobs
+        in the same output, as this parses the whole output on each call.
+
         :param output: output to parse
         :param job_id: select the job to parse
         :type output: str
-        :return: job status
+        :return: job status, or an empty list if the job is not in the output
         :rtype: str
         """
-        raise NotImplementedError  # pragma: no cover
+        return self.parse_all_jobs_statuses(output).get(str(job_id), [])
 
     def generate_submit_script(self):
         pass  # pragma: no cover
@@ -1418,9 +1916,26 @@ class ParamikoPlatform(Platform):
         """
         raise NotImplementedError  # pragma: no cover
 
-    def parse_queue_reason(self, output, job_id):
+    def parse_queue_reasons(self, output: str) -> dict[str, str]:
+        """Parses queue status command output once, for the whole batch of jobs.
+
+        :param output: output to parse
+        :type output: str
+        :return: queue reason by job ID
+        :rtype: dict[str, str]
+        """
         raise NotImplementedError  # pragma: no cover
 
+    def parse_queue_reason(self, output, job_id):
+        """Parses the queue reason of one job from the queue status command output.
+
+        :param output: output to parse
+        :param job_id: select the job to parse
+        :return: queue reason, or an empty string if the job is not in the output
+        :rtype: str
+        """
+        return self.parse_queue_reasons(output).get(str(job_id), "")
+
     def get_ssh_output(self):
         """Gets output from last command executed.
 
@@ -1569,6 +2084,12 @@ class ParamikoPlatform(Platform):
     # noinspection PyProtectedMember
     def close_connection(self):
         # Ensure to delete all references to the ssh connection, so that it frees all the file descriptors
+        if self._pooled_ssh is not None:
+            # The connection is closed by the pool when no other platform uses it.
+            self._release_pooled_connection()
+            return
+        if self._ssh is None:  # Not connected, or already released to the pool.
+            return
         with suppress(Exception):
             if self._ftpChannel:
                 self._ftpChannel.close()
@@ -290,32 +290,20 @@ class PJMPlatform(ParamikoPlatform):
             return
         cmd = self.get_queue_status_cmd(list_queue_jobid)
         self.send_command(cmd)
-        queue_status = self._ssh_output
+        reasons = self.parse_queue_reasons(self._ssh_output)
         for job in in_queue_jobs:
-            reason = self.parse_queue_reason(queue_status, job.id)
+            reason = reasons.get(str(job.id), '')
             if job.queuing_reason_cancel(reason):
                 Log.printlog(f"Job {job.name} will be cancelled and set to FAILED as it was queuing due to {reason}",
                              6000)
                 self.send_command(self.cancel_cmd + f" {job.id}")
                 job.new_status = Status.FAILED
-                job.update_status(as_conf)
             elif reason.find('ASHOLD') != -1:
                 job.new_status = Status.HELD
                 if not job.hold:
                     self.send_command(f"{self.cancel_cmd} {job.id}")
                     job.new_status = Status.QUEUING  # If it was HELD and was released, it should be QUEUING next.
 
-    def parse_all_jobs_output(self, output, job_id):
-        status = ""
-        try:
-            status = [x.split()[1] for x in output.splitlines()
-                      if x.split()[0] == str(job_id)]
-        except BaseException:
-            pass
-        if len(status) == 0:
-            return status
-        return status[0]
-
     def parse_job_list(self, job_list: list[list['Job']]) -> str:
         """Convert a list of job_list to job_list_cmd.
 
@@ -337,10 +325,8 @@ class PJMPlatform(ParamikoPlatform):
         return job_list_cmd
 
     def _check_jobid_in_queue(self, ssh_output, job_list_cmd):
-        for job in job_list_cmd.split('+'):
-            if job not in ssh_output:
-                return False
-        return True
+        job_ids = {job_id for job_id in job_list_cmd.split('+') if job_id}
+        return job_ids.issubset(self.parse_all_jobs_statuses(ssh_output))
 
     def get_submitted_job_id(self, outputlines):
         try:
@@ -397,15 +383,16 @@ class PJMPlatform(ParamikoPlatform):
     # def get_job_energy_cmd(self, job_id):
     #     return 'sacct -n --jobs {0} -o JobId%25,State,NCPUS,NNodes,Submit,Start,End,ConsumedEnergy,MaxRSS%25,AveRSS%25'.format(job_id)
 
-    def parse_queue_reason(self, output, job_id):
-        # split() is used to remove the trailing whitespace but also \t and multiple spaces
-        # split(" ") is not enough
-        reason = [x.split()[2] for x in output.splitlines()
-                  if x.split()[0] == str(job_id)]
-        # In case of duplicates we take the first one
-        if len(reason) > 0:
-            return reason[0]
-        return reason
+    def parse_queue_reasons(self, output):
+        reasons = {}
+        for line in (output or "").splitlines():
+            # split() is used to remove the trailing whitespace but also \t and multiple spaces
+            # split(" ") is not enough
+            fields = line.split()
+            if len(fields) > 2:
+                # In case of duplicates we take the first one
+                reasons.setdefault(fields[0], fields[2])
+        return reasons
 
     def wrapper_header(self, **kwargs):
         wr_header = textwrap.dedent(f"""
@@ -456,6 +443,9 @@ class PJMPlatform(ParamikoPlatform):
         return """os.system("scontrol show hostnames $SLURM_JOB_NODELIST > node_list_{0}".format(node_id))"""
 
     def check_file_exists(self, filename: str, wrapper_failed: bool = False, sleeptime: int = 5, max_retries: int = 3):
+        file_exist = self.file_exists_in_manifest(filename)
+        if file_exist is not None:
+            return file_exist
         file_exist = False
         retries = 0
 
@@ -16,27 +16,32 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 import atexit
+import datetime
 import multiprocessing
 import os
-import queue  # only for the exception
+import queue
 import time
 import traceback
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
 from multiprocessing.queues import Queue
 from multiprocessing.synchronize import Event
 # noinspection PyProtectedMember
 from os import _exit  # type: ignore
 from pathlib import Path
-from typing import Any, Optional, Union, TYPE_CHECKING
+from typing import Any, Iterator, Optional, Union, TYPE_CHECKING
 
 import setproctitle
 
+from autosubmit.config.basicconfig import BasicConfig
 from autosubmit.helpers.parameters import autosubmit_parameter
 from autosubmit.job.job_common import Status
+from autosubmit.job.job_stats_journal import stats_journal
 from autosubmit.log.log import AutosubmitCritical, AutosubmitError, Log
 
 if TYPE_CHECKING:
     from autosubmit.config.configcommon import AutosubmitConfig
+    from autosubmit.history.experiment_history import ExperimentHistory
     from autosubmit.job.job_packages import JobPackageBase
     from autosubmit.job.job import Job
     from autosubmit.job.job_list import JobList
@@ -92,6 +97,13 @@ def recover_platform_job_logs_wrapper(
     _exit(0)
 
 
+LOG_RECOVERY_QUEUED_AT = '_log_recovery_queued_at'
+"""Key of the time a job was put in the recovery queue, in the state sent through the queue."""
+
+LOG_RECOVERY_METRICS_HEADER = 'time,jobs,workers,duration,mean_latency,max_latency\n'
+"""Header of the CSV file where the log recovery process writes the metrics of each recovery."""
+
+
 class CopyQueue(Queue):
     """
     A queue that copies the object gathered.
@@ -123,7 +135,9 @@ class CopyQueue(Queue):
         :param timeout: Timeout for blocking operations. Defaults to None.
         :type timeout: float
         """
-        super().put(job.__getstate__(), block, timeout)
+        state = job.__getstate__()
+        state[LOG_RECOVERY_QUEUED_AT] = time.time()
+        super().put(state, block, timeout)
 
 
 class Platform:
@@ -199,6 +213,8 @@ class Platform:
         self.otp_timeout = self.config.get("PLATFORMS", {}).get(self.name.upper(), {}).get("2FA_TIMEOUT", 60 * 5)
         self.two_factor_auth = self.config.get("PLATFORMS", {}).get(self.name.upper(), {}).get("2FA", False)
         self.two_factor_method = self.config.get("PLATFORMS", {}).get(self.name.upper(), {}).get("2FA_METHOD", "token")
+        self.check_jobs_timeout = self.config.get("PLATFORMS", {}).get(self.name.upper(), {}).get(
+            "CHECK_JOBS_TIMEOUT", 600)
         if not self.two_factor_auth:
             self.pw = None
         elif auth_password is not None and self.two_factor_auth:
@@ -219,6 +235,11 @@ class Platform:
         self.compress_remote_logs = False
         self.remote_logs_compress_type = "gzip"
         self.compression_level = 9
+        self.bulk_log_recovery = False
+        self._prefetched_stat_files: set[str] = set()
+        self.log_recovery_workers = 1
+        # Jobs taken from the recovery queue while waiting for work, with the time they were queued.
+        self._received_jobs: list[tuple[dict, Optional[float]]] = []
         log_queue_size = 200
         if self.config:
             platform_config: dict = self.config.get("PLATFORMS", {}).get(self.name.upper(), {})
@@ -232,6 +253,9 @@ class Platform:
             self.compress_remote_logs = platform_config.get("COMPRESS_REMOTE_LOGS", False)
             self.remote_logs_compress_type = platform_config.get("REMOTE_LOGS_COMPRESS_TYPE", "gzip")
             self.compression_level = platform_config.get("COMPRESSION_LEVEL", 9)
+            self.bulk_log_recovery = platform_config.get("BULK_LOG_RECOVERY", False)
+            default_workers = self.config.get("CONFIG", {}).get("LOG_RECOVERY_WORKERS", 1)
+            self.log_recovery_workers = max(int(platform_config.get("LOG_RECOVERY_WORKERS", default_workers)), 1)
 
         self.log_queue_size = log_queue_size
         self.remote_log_dir = None
@@ -459,6 +483,21 @@ class Platform:
                         raise
             except Exception:
                 raise
+        try:
+            # The scripts deferred by ``upload_batch``, sent before the packages are submitted.
+            self.flush_uploads()
+        except (IOError, OSError, AutosubmitError) as e:
+            for package in valid_packages_to_submit:
+                if package.jobs[0].id != 0:
+                    failed_packages.append(package.jobs[0].id)
+            if isinstance(e, AutosubmitError):
+                self.connected = False
+            Log.warning(f'An unexpected error happened while sending the scripts of '
+                        f'{len(valid_packages_to_submit)} packages: {str(e)}')
+            if valid_packages_to_submit:
+                # Their jobs are not submitted either.
+                valid_packages_to_submit = []
+                self.generate_submit_script()
         if valid_packages_to_submit:
             any_job_submitted = True
         return save, failed_packages, error_message, valid_packages_to_submit, any_job_submitted
@@ -578,6 +617,7 @@ class Platform:
         as_conf.experiment_data['HPCTYPE'] = self.type
         as_conf.experiment_data['HPCSCRATCH_DIR'] = self.scratch
         as_conf.experiment_data['HPCTEMP_DIR'] = self.temp_dir
+        as_conf.clear_parameters_cache()
         if self.temp_dir is None:
             self.temp_dir = ''
 
@@ -589,6 +629,22 @@ class Platform:
         """
         raise NotImplementedError  # pragma: no cover
 
+    def send_files(self, filenames: list[str]) -> bool:
+        """Sends several local files to the platform.
+
+        :param filenames: The names of the files to send.
+        """
+        for filename in filenames:
+            self.send_file(filename)
+        return True
+
+    def upload_batch(self):
+        """Context where the files sent with ``send_files`` are uploaded together at the end, see ``ParamikoPlatform``."""
+        return nullcontext()
+
+    def flush_uploads(self) -> None:
+        """Uploads now the files sent with ``send_files`` in the current ``upload_batch``, see ``ParamikoPlatform``."""
+
     def move_file(self, src, dest):
         """Moves a file on the platform.
 
@@ -630,6 +686,18 @@ class Platform:
         for filename in files:
             self.get_file(filename, must_exist, relative_path)
 
+    def retrieve_logfiles_in_bulk(self, jobs: list['Job']) -> set['Job']:
+        """Retrieve the log files of several jobs together, see ``ParamikoPlatform``.
+
+        :param jobs: The jobs whose logs must be retrieved.
+        :return: The jobs whose logs were retrieved, none by default.
+        """
+        return set()
+
+    def log_transfer_batch(self):
+        """Context where the log files retrieved are processed together at the end, see ``ParamikoPlatform``."""
+        return nullcontext()
+
     def delete_file(self, filename: str):
         """Deletes a file from this platform.
 
@@ -722,10 +790,17 @@ class Platform:
             filename = f'{job.name}_STAT_{str(count)}'
         stat_local_path = os.path.join(
             self.config.get("LOCAL_ROOT_DIR"), self.expid, self.config.get("LOCAL_TMP_DIR"), filename)
-        if os.path.exists(stat_local_path):
-            os.remove(stat_local_path)
+        journal = stats_journal(os.path.dirname(stat_local_path))
+        if filename in self._prefetched_stat_files:
+            # Already transferred with the logs, see ``retrieve_logfiles_in_bulk``.
+            self._prefetched_stat_files.discard(filename)
+            if os.path.exists(stat_local_path):
+                journal.ingest(stat_local_path)
+                return True
+        journal.remove(filename)
         if self.check_file_exists(filename):
             if self.get_file(filename, True):
+                journal.ingest(stat_local_path)
                 if count == -1:
                     Log.debug(f'{job.name}_STAT_{str(job.fail_count)} file have been transferred')
                 else:
@@ -944,15 +1019,8 @@ class Platform:
         :return: True if there is work to process, False otherwise.
         :rtype: bool
         """
-        process_log = False
-        for remaining in range(sleep_time, 0, -1):
-            time.sleep(1)
-            if self.work_event.is_set() or not self.recovery_queue.empty():
-                process_log = True
-            if self.cleanup_event.is_set():
-                process_log = True
-                break
-        return process_log
+        self.cleanup_event.wait(sleep_time)
+        return self._has_work()
 
     def wait_for_work(self, sleep_time: int = 60) -> bool:
         """
@@ -975,39 +1043,46 @@ class Platform:
         :param timeout: Maximum time to wait in seconds. Defaults to 60.
         :return: True if there is work to process, False otherwise.
         """
-        process_log = False
-        for _ in range(timeout, 0, -1):
-            time.sleep(1)
-            if self.work_event.is_set() or not self.recovery_queue.empty() or self.cleanup_event.is_set():
-                process_log = True
-                break
-        return process_log
+        deadline = time.monotonic() + timeout
+        while not self._has_work():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Block on the queue, so a new job wakes the process at once, and check the events between waits.
+            with suppress(queue.Empty):
+                data = self.recovery_queue.get(timeout=min(remaining, 1))
+                self._received_jobs.append((data, data.get(LOG_RECOVERY_QUEUED_AT)))
+        return True
+
+    def _has_work(self) -> bool:
+        """Whether there are jobs to recover, or the main process signalled work or cleanup."""
+        return bool(self._received_jobs) or self.work_event.is_set() or self.cleanup_event.is_set() or \
+            not self.recovery_queue.empty()
 
     def recover_job_log(self, identifier: str, jobs_pending_to_process: set[Any],
-                        as_conf: 'AutosubmitConfig') -> set[Any]:
+                        as_conf: 'AutosubmitConfig', exp_history: Optional['ExperimentHistory'] = None) -> set[Any]:
         """Recovers log files for jobs from the recovery queue and retries failed jobs.
 
+        The statistics of the recovered jobs are written to the experiment history
+        in one transaction, and the checksums of the retrieved log files are validated
+        together, once every job has been processed.
+
         :param identifier: Identifier for logging purposes.
         :param jobs_pending_to_process: Set of jobs that had issues during log retrieval.
         :param as_conf: The Autosubmit configuration object containing experiment data.
+        :param exp_history: Experiment history of the jobs, a new one for each job if not given.
         :return: Updated set of jobs pending to process.
         """
-        while not self.recovery_queue.empty():
-            try:
-                from autosubmit.job.job import Job
-                job = Job(loaded_data=self.recovery_queue.get(timeout=1))
-                job.platform_name = self.name  # Change the original platform to this process platform.
-                job.platform = self
-                job._log_recovery_retries = 0  # Reset the log recovery retries.
-                try:
-                    job.retrieve_logfiles(raise_error=True)
-                except Exception:
-                    jobs_pending_to_process.add(job)
-                    job._log_recovery_retries += 1
-                    Log.warning(
-                        f"{identifier} (Retry) Failed to recover log for job '{job.name}' and retry:'{job.fail_count}'.")
-            except queue.Empty:
-                pass
+        with exp_history.batch() if exp_history is not None else nullcontext(), self.log_transfer_batch():
+            return self._recover_job_log(identifier, jobs_pending_to_process, as_conf, exp_history)
+
+    def _recover_job_log(self, identifier: str, jobs_pending_to_process: set[Any],
+                         as_conf: 'AutosubmitConfig', exp_history: Optional['ExperimentHistory']) -> set[Any]:
+        jobs, queued_at = self._get_jobs_to_recover()
+        if jobs:
+            start = time.time()
+            self._recover_queued_job_logs(identifier, jobs, jobs_pending_to_process, exp_history)
+            self._record_log_recovery_metrics(identifier, len(jobs), start, queued_at)
 
         if len(jobs_pending_to_process) > 0:  # Restore the connection if there was an issue with one or more jobs.
             self.restore_connection(as_conf, log_recovery_process=True)
@@ -1018,7 +1093,7 @@ class Platform:
             job = jobs_pending_to_process.pop()
             job._log_recovery_retries += 1
             try:
-                job.retrieve_logfiles(raise_error=True)
+                job.retrieve_logfiles(raise_error=True, exp_history=exp_history)
                 job._log_recovery_retries += 1
             except Exception as e:
                 if job._log_recovery_retries < 5:
@@ -1034,6 +1109,133 @@ class Platform:
 
         return jobs_pending_to_process
 
+    def _get_jobs_to_recover(self) -> tuple[list['Job'], list[float]]:
+        """Take all the jobs from the recovery queue.
+
+        :return: The jobs, and the times when they were put in the queue.
+        """
+        from autosubmit.job.job import Job
+        received, self._received_jobs = self._received_jobs, []
+        while not self.recovery_queue.empty():
+            with suppress(queue.Empty):
+                data = self.recovery_queue.get(timeout=1)
+                received.append((data, data.get(LOG_RECOVERY_QUEUED_AT)))
+        jobs = []
+        for data, _ in received:
+            job = Job(loaded_data=data)
+            job.platform_name = self.name  # Change the original platform to this process platform.
+            job.platform = self
+            job._log_recovery_retries = 0  # Reset the log recovery retries.
+            jobs.append(job)
+        return jobs, [queued_at for _, queued_at in received if queued_at]
+
+    def _recover_queued_job_logs(self, identifier: str, jobs: list['Job'], jobs_pending_to_process: set[Any],
+                                 exp_history: Optional['ExperimentHistory']) -> None:
+        """Recovers the logs of the jobs taken from the recovery queue.
+
+        With ``BULK_LOG_RECOVERY``, the logs are first retrieved together. The remaining logs
+        are downloaded by ``LOG_RECOVERY_WORKERS`` threads, each one with its own file transfer
+        channel, and the statistics of the jobs are then written one by one in this thread.
+
+        :param identifier: Identifier for logging purposes.
+        :param jobs: The jobs taken from the recovery queue.
+        :param jobs_pending_to_process: Set of jobs that had issues during log retrieval.
+        :param exp_history: Experiment history of the jobs, a new one for each job if not given.
+        """
+        retrieved = self.retrieve_logfiles_in_bulk(jobs) if self.bulk_log_recovery else set()
+        downloads = self._download_job_logs([job for job in jobs if job not in retrieved])
+        for job in jobs:
+            try:
+                if job in retrieved:
+                    job.process_retrieved_logfiles(exp_history=exp_history)
+                else:
+                    download = downloads[job]
+                    if isinstance(download, Exception):
+                        raise download
+                    job.process_retrieved_logfiles(*download, raise_error=True, exp_history=exp_history)
+            except Exception:
+                jobs_pending_to_process.add(job)
+                job._log_recovery_retries += 1
+                Log.warning(
+                    f"{identifier} (Retry) Failed to recover log for job '{job.name}' and retry:'{job.fail_count}'.")
+
+    def _download_job_logs(self, jobs: list['Job']) -> dict['Job', Union[tuple[int, bool], Exception]]:
+        """Downloads the log files of the jobs, with up to ``log_recovery_workers`` at the same time.
+
+        :param jobs: The jobs whose logs are downloaded.
+        :return: The result of ``Job.download_logfiles`` for each job, or the error raised.
+        """
+        if not jobs:
+            return {}
+        with self.log_recovery_channels(min(self.log_recovery_workers, len(jobs))) as platforms:
+            channels: queue.Queue = queue.Queue()
+            for platform in platforms:
+                channels.put(platform)
+
+            def download(job: 'Job') -> Union[tuple[int, bool], Exception]:
+                platform = channels.get()
+                try:
+                    job.platform = platform
+                    last_retrial, log_recovered = job.download_logfiles()
+                    if log_recovered and job.wrapper_type != "vertical":
+                        platform.prefetch_stat_file(job)
+                    return last_retrial, log_recovered
+                except Exception as e:
+                    return e
+                finally:
+                    job.platform = self
+                    channels.put(platform)
+
+            if len(platforms) == 1:
+                return {job: download(job) for job in jobs}
+            with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+                return dict(zip(jobs, executor.map(download, jobs)))
+
+    @contextmanager
+    def log_recovery_channels(self, workers: int) -> Iterator[list['Platform']]:
+        """Context with the platforms used by the workers that download the logs.
+
+        Each platform has its own file transfer channel, see ``ParamikoPlatform``.
+
+        :param workers: The number of workers.
+        :return: The platforms, only this one by default.
+        """
+        yield [self]
+
+    def prefetch_stat_file(self, job: 'Job') -> None:
+        """Transfers the STAT file of a job now, so ``get_stat_file`` does not transfer it again.
+
+        :param job: The job, outside vertical wrappers.
+        """
+        if self.get_stat_file(job):
+            self._prefetched_stat_files.add(f"{job.stat_file}{job.fail_count}")
+
+    def _record_log_recovery_metrics(self, identifier: str, jobs: int, start: float, queued_at: list[float]) -> None:
+        """Logs the metrics of a recovery, and appends them to ``<PLATFORM>_log_recovery_metrics.csv`` in ASLOGS.
+
+        :param identifier: Identifier for logging purposes.
+        :param jobs: The number of jobs taken from the queue.
+        :param start: The time when the recovery started.
+        :param queued_at: The times when the jobs were put in the queue.
+        """
+        now = time.time()
+        duration = now - start
+        latencies = [now - queued for queued in queued_at]
+        mean_latency = sum(latencies) / len(latencies) if latencies else 0.0
+        max_latency = max(latencies, default=0.0)
+        Log.info(f"{identifier} Recovered the logs of {jobs} jobs with {self.log_recovery_workers} workers "
+                 f"in {duration:.1f}s, latency since queued: mean {mean_latency:.1f}s, max {max_latency:.1f}s")
+        metrics_file = Path(self.tmp_path, BasicConfig.LOCAL_ASLOG_DIR, f"{self.name.lower()}_log_recovery_metrics.csv")
+        try:
+            write_header = not metrics_file.exists()
+            with open(metrics_file, 'a') as metrics:
+                if write_header:
+                    metrics.write(LOG_RECOVERY_METRICS_HEADER)
+                metrics.write(f"{datetime.datetime.fromtimestamp(now).isoformat(timespec='seconds')},{jobs},"
+                              f"{self.log_recovery_workers},{duration:.3f},{mean_latency:.3f},{max_latency:.3f}\n")
+        except OSError as e:
+            Log.debug(f"Could not write the log recovery metrics to {metrics_file}: {e}")
+
     def recover_platform_job_logs(self, as_conf: 'AutosubmitConfig') -> None:
         """Recovers the logs of the jobs that have been submitted.
         When this is executed as a process, the exit is controlled by the work_event and cleanup_events of the main process.
@@ -1046,13 +1248,18 @@ class Platform:
             self.connected = False
             self.restore_connection(as_conf, log_recovery_process=True)
             Log.result(f"{identifier} successfully connected.")
+            from autosubmit.history.experiment_history import ExperimentHistory
+            # A single history for the whole life of the process, so its database manager is created once.
+            exp_history = ExperimentHistory(self.expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                            historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR)
             log_recovery_timeout = self.config.get("LOG_RECOVERY_TIMEOUT", 60)
             # Keep alive signal timeout is 5 minutes, but the sleeptime is 60 seconds.
             self.keep_alive_timeout = max(log_recovery_timeout * 5, 60 * 5)
             while self.wait_for_work(sleep_time=max(log_recovery_timeout, 60)):
-                jobs_pending_to_process = self.recover_job_log(identifier, jobs_pending_to_process, as_conf)
+                jobs_pending_to_process = self.recover_job_log(identifier, jobs_pending_to_process, as_conf,
+                                                               exp_history)
                 if self.cleanup_event.is_set():  # Check if the main process is waiting for this child to end.
-                    self.recover_job_log(identifier, jobs_pending_to_process, as_conf)
+                    self.recover_job_log(identifier, jobs_pending_to_process, as_conf, exp_history)
                     break
         except Exception as e:
             Log.error(f"{identifier} {e}")
@@ -0,0 +1,199 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cached listing of the files of the remote ``LOG_<EXPID>`` directory of a platform.
+
+Checking the ``_STAT_``, ``_COMPLETED`` and log files of the jobs one by one
+costs an SFTP ``stat`` for each of them, plus some sleeps between retries when
+a file is missing. The manifest lists the name, size and modification time of
+every file in the directory with a single ``find`` command instead, and it is
+kept for a short time.
+
+A file found in the manifest is assumed to exist until the manifest expires,
+as the jobs do not remove their files, and the files removed by Autosubmit are
+discarded from it. A file missing from the manifest may have been written after
+the listing, so that answer is only trusted for a much shorter time. After
+that, a missing file is checked alone, and it only lists the directory again
+once the listing is a few seconds older, so the misses of a few files do not
+list the whole directory each time.
+
+The files are checked one by one again when the directory cannot be listed. A
+few failed listings in a row, e.g. with a ``find`` without ``-printf``, stop
+the listings for a while.
+"""
+
+import time
+from typing import NamedTuple, Optional
+
+MANIFEST_TTL = 30
+"""Seconds during which the files listed in the manifest are assumed to exist."""
+
+MANIFEST_MISS_TTL = 2
+"""Seconds during which the files missing from the manifest are assumed to not exist."""
+
+MANIFEST_MISS_REFRESH = 10
+"""Seconds after which a file missing from the manifest lists the directory again, before it is checked alone."""
+
+MANIFEST_MAX_FAILURES = 3
+"""Failed listings in a row after which the directory is not listed for a while."""
+
+MANIFEST_DISABLED_TTL = 600
+"""Seconds during which the directory is not listed after too many failed listings."""
+
+
+class RemoteFile(NamedTuple):
+    """A file listed in the manifest."""
+
+    size: int
+    mtime: float
+
+
+class RemoteManifest:
+    """Names, sizes and modification times of the files of a remote directory.
+
+    It is shared by the workers that download the logs of a platform, so each method reads
+    the listing once, as another thread may replace or forget it meanwhile.
+
+    :param ttl: Seconds during which the listed files are assumed to exist.
+    :param miss_ttl: Seconds during which the files not listed are assumed to not exist.
+    :param miss_refresh: Seconds after which a file not listed lists the directory again.
+    :param max_failures: Failed listings in a row after which the directory is not listed for a while.
+    :param disabled_ttl: Seconds during which the directory is not listed after ``max_failures`` failures.
+    """
+
+    def __init__(self, ttl: float = MANIFEST_TTL, miss_ttl: float = MANIFEST_MISS_TTL,
+                 miss_refresh: float = MANIFEST_MISS_REFRESH, max_failures: int = MANIFEST_MAX_FAILURES,
+                 disabled_ttl: float = MANIFEST_DISABLED_TTL):
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.miss_refresh = miss_refresh
+        self.max_failures = max_failures
+        self.disabled_ttl = disabled_ttl
+        self._listing: Optional[tuple[dict[str, Optional[RemoteFile]], float]] = None
+        """The listed files and the time they were listed, replaced at once."""
+        self._failures = 0
+        self._disabled_until = 0.0
+
+    @staticmethod
+    def command(directory: str) -> str:
+        """Return the command that lists the files of ``directory``, as parsed by :meth:`update`.
+
+        :param directory: The remote directory.
+        """
+        return f"find {directory} -maxdepth 1 -type f -printf '%f\\t%s\\t%T@\\n'"
+
+    def age(self) -> float:
+        """Seconds since the directory was listed, infinite if it was never listed."""
+        listing = self._listing
+        if listing is None:
+            return float('inf')
+        return time.time() - listing[1]
+
+    def needs_listing(self) -> bool:
+        """Tell whether a file the manifest cannot tell about must list the directory again.
+
+        :return: ``True`` if the manifest expired, or if its missing files are old enough to list
+            the directory again, ``False`` if the file can be checked alone.
+        """
+        return self.age() > min(self.ttl, self.miss_refresh)
+
+    def update(self, output: str) -> None:
+        """Replace the listed files with the output of :meth:`command`.
+
+        :param output: The output of the command.
+        """
+        files: dict[str, Optional[RemoteFile]] = {}
+        for line in output.splitlines():
+            fields = line.rsplit('\t', 2)
+            if len(fields) != 3:
+                continue
+            try:
+                files[fields[0]] = RemoteFile(int(fields[1]), float(fields[2]))
+            except ValueError:
+                continue
+        self._listing = (files, time.time())
+        self._failures = 0
+
+    def invalidate(self) -> None:
+        """Forget the listed files, the next lookup needs a new listing."""
+        self._listing = None
+
+    def enabled(self) -> bool:
+        """Tell whether the directory can be listed, it is not for a while after too many failures."""
+        return time.time() >= self._disabled_until
+
+    def failed(self) -> bool:
+        """Record a failed listing, the listed files are forgotten.
+
+        :return: ``True`` if it was the ``max_failures`` failure in a row, and the directory is not
+            listed for the next ``disabled_ttl`` seconds.
+        """
+        self.invalidate()
+        self._failures += 1
+        if self._failures < self.max_failures:
+            return False
+        self._failures = 0
+        self._disabled_until = time.time() + self.disabled_ttl
+        return True
+
+    def lookup(self, name: str) -> Optional[bool]:
+        """Tell whether a file exists, according to the manifest.
+
+        :param name: The file name.
+        :return: ``True`` or ``False``, or ``None`` if the manifest is too old to tell.
+        """
+        listing = self._listing
+        if listing is None:
+            return None
+        files, listed_at = listing
+        age = time.time() - listed_at
+        if age > self.ttl:
+            return None
+        if name in files:
+            return True
+        if age > self.miss_ttl:
+            return None
+        return False
+
+    def get(self, name: str) -> Optional[RemoteFile]:
+        """Return the size and modification time of a listed file.
+
+        :param name: The file name.
+        :return: The file, or ``None`` if it is not listed, or was added with :meth:`add`.
+        """
+        listing = self._listing
+        if listing is None:
+            return None
+        return listing[0].get(name)
+
+    def add(self, name: str) -> None:
+        """Record a file that Autosubmit has just written or found.
+
+        :param name: The file name.
+        """
+        listing = self._listing
+        if listing is not None:
+            listing[0].setdefault(name, None)
+
+    def discard(self, name: str) -> None:
+        """Record a file that Autosubmit has just removed or moved.
+
+        :param name: The file name.
+        """
+        listing = self._listing
+        if listing is not None:
+            listing[0].pop(name, None)
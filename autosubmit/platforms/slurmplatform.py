@@ -22,7 +22,9 @@ This file contains code that interfaces between Autosubmit and a Slurm Platform.
 
 import locale
 import os
+import re
 from contextlib import suppress
+from datetime import datetime
 from time import sleep
 from typing import Any, Optional, Union, TYPE_CHECKING
 
@@ -37,6 +39,9 @@ if TYPE_CHECKING:
     # Avoid circular imports
     from autosubmit.job.job import Job
 
+_SACCT_JOB_ID_SUFFIX = re.compile(r'[._+]')
+"""Separator between the job ID and the array task, heterogeneous component, or step in ``sacct``."""
+
 
 class SlurmPlatform(ParamikoPlatform):
     """Class to manage jobs to host using SLURM scheduler."""
@@ -446,17 +451,22 @@ class SlurmPlatform(ParamikoPlatform):
         """
         return output.strip().split(' ')[0].strip()
 
-    def parse_all_jobs_output(self, output: str, job_id: int) -> Union[list[str], str]:
-        status = ""
-        with suppress(Exception):
-            status = [
-                x.split()[1]
-                for x in output.splitlines()
-                if x.split()[0][:len(str(job_id))] == str(job_id)
-            ]
-        if len(status) == 0:
-            return status
-        return status[0]
+    def parse_all_jobs_statuses(self, output: str) -> dict[str, str]:
+        """Parses the ``sacct`` output of the check all jobs command once, for the whole batch of jobs.
+
+        The rows of array and heterogeneous jobs (``1234_1``, ``1234+0``) and of
+        job steps (``1234.batch``) are reported under the ID of their job. If a
+        job appears in more than one row, the first one is used.
+
+        :param output: output of the command.
+        :return: job status by job ID.
+        """
+        statuses: dict[str, str] = {}
+        for line in (output or "").splitlines():
+            fields = line.split()
+            if len(fields) > 1:
+                statuses.setdefault(_SACCT_JOB_ID_SUFFIX.split(fields[0], 1)[0], fields[1])
+        return statuses
 
     def get_submitted_job_id(self, output: str, x11: bool = False) -> Union[list[int], int]:
         try:
@@ -531,7 +541,7 @@ class SlurmPlatform(ParamikoPlatform):
         :return: Gets estimated queue time.
         :rtype: str
         """
-        return f'squeue -j {job_id} -o %A,%R'
+        return f'squeue -j {job_id} -o %A,%S,%R'
 
     def get_jobid_by_jobname_cmd(self, job_name: str) -> str:
         """Looks for a job based on its name.
@@ -566,18 +576,44 @@ class SlurmPlatform(ParamikoPlatform):
         return (f'sacct -n --jobs {job_id} -o JobId%25,State,NCPUS,NNodes,Submit,'
                 f'Start,End,ConsumedEnergy,MaxRSS%25,AveRSS%25')
 
-    def parse_queue_reason(self, output: str, job_id: str) -> str:
-        """Parses the queue reason from the output of the command.
+    def parse_queue_reasons(self, output: str) -> dict[str, str]:
+        """Parses the queue reasons from the output of the queue status command once, for all the jobs.
+
+        :param output: output of the command.
+        :return: queue reason by job ID.
+        """
+        reasons: dict[str, str] = {}
+        for line in (output or "").splitlines():
+            fields = line.split(',', 2)
+            if len(fields) == 3:
+                reasons.setdefault(fields[0], fields[2])
+        return reasons
+
+    @staticmethod
+    def parse_queue_start_times(output: str) -> dict[str, Optional[datetime]]:
+        """Parses the expected start times from the output of the queue status command once, for all the jobs.
+
+        :param output: output of the command.
+        :return: expected start time by job ID, ``None`` if Slurm does not know it yet.
+        """
+        start_times: dict[str, Optional[datetime]] = {}
+        for line in (output or "").splitlines():
+            fields = line.split(',', 2)
+            if len(fields) == 3 and fields[0] not in start_times:
+                start_times[fields[0]] = None
+                with suppress(ValueError):
+                    start_times[fields[0]] = datetime.strptime(fields[1], '%Y-%m-%dT%H:%M:%S')
+        return start_times
+
+    @staticmethod
+    def parse_queue_start_time(output: str, job_id: str) -> Optional[datetime]:
+        """Parses the expected start time from the output of the queue status command.
 
         :param output: output of the command.
         :param job_id: job id
-        :return: queue reason.
+        :return: expected start time, or ``None`` if Slurm does not know it yet.
         """
-        return ''.join([
-            x.split(',')[1]
-            for x in output.splitlines()
-            if x.split(',')[0] == str(job_id)
-        ])
+        return SlurmPlatform.parse_queue_start_times(output).get(str(job_id))
 
     def get_queue_status(self, in_queue_jobs: list['Job'], list_queue_jobid: str, as_conf: AutosubmitConfig) -> None:
         """get_queue_status.
@@ -594,15 +630,17 @@ class SlurmPlatform(ParamikoPlatform):
         cmd = self.get_queue_status_cmd(list_queue_jobid)
         self.send_command(cmd)
         queue_status = self._ssh_output
+        start_times = self.parse_queue_start_times(queue_status)
+        reasons = self.parse_queue_reasons(queue_status)
         for job in in_queue_jobs:
-            reason = self.parse_queue_reason(queue_status, job.id)
+            job.estimated_start_time = start_times.get(str(job.id))
+            reason = reasons.get(str(job.id), '')
             if job.queuing_reason_cancel(reason):  # this should be a platform method to be implemented
                 Log.error(
                     f"Job {job.name} will be cancelled and set to FAILED as it was queuing due to {reason}")
                 self.send_command(
                     self.cancel_cmd + f" {job.id}")
                 job.new_status = Status.FAILED
-                job.update_status(as_conf)
             elif reason == '(JobHeldUser)':
                 if not job.hold:
                     # should be self.release_cmd or something like that, but it is not implemented
@@ -634,6 +672,9 @@ class SlurmPlatform(ParamikoPlatform):
                           max_retries: int = 3) -> bool:
         """Checks if a file exists on the FTP server.
 
+        The files of the remote log directory are looked for in the remote manifest
+        first, and only checked with SFTP when the directory cannot be listed.
+
         :param src: The name of the file to check.
         :type src: str
         :param wrapper_failed: Whether the wrapper has failed. Defaults to False.
@@ -645,6 +686,11 @@ class SlurmPlatform(ParamikoPlatform):
         :return: True if the file exists, False otherwise
         :rtype: bool
         """
+        file_exist = self.file_exists_in_manifest(src)
+        if file_exist is not None:
+            if not file_exist:
+                Log.warning(f"File {src} couldn't be found")
+            return file_exist
         # TODO check the sleeptime retrials of these function, previously it was waiting a lot of time
         file_exist = False
         retries = 0
@@ -0,0 +1,161 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""SSH connections shared by the platforms of a process that use the same login node.
+
+Several platforms of an experiment often point to the same host with the same
+user, for instance the serial and the parallel partitions of a cluster. Each one
+used to open its own SSH connection, with its own authentication. The pool keeps
+a single authenticated connection for each host, user, port and proxy command,
+and every platform opens its own SFTP and session channels on it, like the
+``ControlMaster`` option of OpenSSH.
+
+A pooled connection is checked before it is handed out again, and replaced only
+when it is no longer alive, so a platform that restores its connection reuses
+the one of the other platforms if it still works. The connections send
+keep-alive packets, so the login nodes and firewalls do not close them while
+the experiment waits for its jobs.
+
+The pool belongs to a process: the log recovery processes have their own.
+"""
+
+import os
+import threading
+from contextlib import suppress
+from typing import Callable, NamedTuple, Optional
+
+import paramiko
+
+KEEPALIVE_INTERVAL = 30
+"""Seconds between the keep-alive packets sent on the pooled connections."""
+
+
+class ConnectionKey(NamedTuple):
+    """What identifies a connection that can be shared."""
+
+    hostname: str
+    user: str
+    port: int
+    proxy_command: Optional[str]
+
+
+class _PooledConnection:
+
+    def __init__(self, ssh: paramiko.SSHClient):
+        self.ssh = ssh
+        self.users = 1
+
+
+def _is_alive(ssh: paramiko.SSHClient) -> bool:
+    """Tell whether the transport of a client is still active and authenticated."""
+    transport = ssh.get_transport()
+    if transport is None or not transport.is_active() or not transport.is_authenticated():
+        return False
+    try:
+        transport.send_ignore()
+    except Exception:
+        return False
+    return True
+
+
+def _close(ssh: paramiko.SSHClient) -> None:
+    """Close a client, its agent and its transport."""
+    # noinspection PyProtectedMember
+    with suppress(Exception):
+        if ssh._agent:  # May not be in all runs
+            ssh._agent.close()
+    transport = ssh.get_transport()
+    with suppress(Exception):
+        if transport:
+            transport.close()
+            transport.stop_thread()
+    with suppress(Exception):
+        ssh.close()
+
+
+class SSHConnectionPool:
+    """The SSH connections of a process, shared by the platforms that use the same login node.
+
+    :param keepalive: Seconds between the keep-alive packets, ``0`` to not send them.
+    """
+
+    def __init__(self, keepalive: int = KEEPALIVE_INTERVAL):
+        self.keepalive = keepalive
+        self._connections: dict[ConnectionKey, _PooledConnection] = {}
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def acquire(self, key: ConnectionKey, connect: Callable[[], paramiko.SSHClient]) -> paramiko.SSHClient:
+        """Return the connection of ``key``, opening it if there is none, or if it is not alive.
+
+        Each call must be followed by a :meth:`release` of the returned client.
+
+        :param key: The host, user, port and proxy command of the connection.
+        :param connect: Opens and authenticates a new connection.
+        :return: The SSH client, connected.
+        """
+        with self._lock:
+            self._forget_inherited_connections()
+            connection = self._connections.get(key)
+            if connection is not None:
+                if _is_alive(connection.ssh):
+                    connection.users += 1
+                    return connection.ssh
+                # The platforms still using it see it failing, and restore their connection.
+                del self._connections[key]
+            ssh = connect()
+            transport = ssh.get_transport()
+            if transport is not None and self.keepalive > 0:
+                transport.set_keepalive(self.keepalive)
+            self._connections[key] = _PooledConnection(ssh)
+            return ssh
+
+    def release(self, ssh: paramiko.SSHClient) -> None:
+        """Release a client returned by :meth:`acquire`, and close it if no platform uses it anymore.
+
+        :param ssh: The SSH client.
+        """
+        with self._lock:
+            for key, connection in self._connections.items():
+                if connection.ssh is ssh:
+                    connection.users -= 1
+                    if connection.users > 0:
+                        return
+                    del self._connections[key]
+                    break
+        # Not pooled anymore, it was replaced as it was not alive.
+        _close(ssh)
+
+    def close_all(self) -> None:
+        """Close all the connections of the pool."""
+        with self._lock:
+            connections, self._connections = self._connections, {}
+        for connection in connections.values():
+            _close(connection.ssh)
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def _forget_inherited_connections(self) -> None:
+        """Drop the connections of the parent process, a forked child cannot use its sockets."""
+        if self._pid != os.getpid():
+            self._connections = {}
+            self._pid = os.getpid()
+
+
+ssh_connection_pool = SSHConnectionPool()
+"""The pool of the current process."""
@@ -124,6 +124,10 @@ class JobStat(object):
     def name(self):
         return self._name
 
+    @property
+    def processors(self):
+        return self._processors
+
     def get_as_dict(self):
         return {
             "name": self._name,
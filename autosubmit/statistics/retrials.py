@@ -0,0 +1,118 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""The retrials of the jobs, read from the ``job_data`` table of the experiment history.
+
+Each row of ``job_data`` is a submission of a job, like each line of the
+``<JOB>_TOTAL_STATS`` files, which were read job by job to compute the
+statistics. Here all the rows are read with one query into NumPy arrays.
+
+The arrays hold what the ``TOTAL_STATS`` lines hold: the local date and time,
+as seconds since 1970, and only the times that were written, in the order
+they were written. A job that failed before starting has its finish time
+second in its line, so it is the start time of that retrial.
+"""
+
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.history.experiment_history import ExperimentHistory
+
+_EPOCH = datetime(1970, 1, 1)
+
+_UTC_OFFSET_PERIOD = 900
+"""Seconds of the periods with the same UTC offset, the offsets change at a quarter of an hour."""
+
+_MAX_UTC_OFFSET = 86400
+"""More seconds than any UTC offset, to select the rows of a period before converting their times."""
+
+
+def _local_seconds(timestamps: np.ndarray) -> np.ndarray:
+    """Convert timestamps to the seconds since 1970 of their local date and time, ``0`` stays ``0``."""
+    periods, inverse = np.unique(timestamps // _UTC_OFFSET_PERIOD, return_inverse=True)
+    offsets = np.array([time.localtime(int(period) * _UTC_OFFSET_PERIOD).tm_gmtoff for period in periods],
+                       dtype=np.int64)
+    return np.where(timestamps > 0, timestamps + offsets[inverse.reshape(timestamps.shape)], 0)
+
+
+def to_datetime(seconds: int) -> Optional[datetime]:
+    """Convert the seconds since 1970 of a local date and time to a ``datetime``, ``None`` for ``0``."""
+    return _EPOCH + timedelta(seconds=seconds) if seconds > 0 else None
+
+
+class JobRetrials:
+    """The retrials of the jobs, one element of each array per retrial, grouped by job.
+
+    :param rows: The name, submit, start, finish and status of each row of ``job_data``, in the
+        order they were written.
+    """
+
+    def __init__(self, rows: list[tuple[str, Any, Any, Any, str]]):
+        names = np.array([row[0] for row in rows], dtype=str)
+        self.names, inverse = np.unique(names, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        self.job: np.ndarray = inverse[order]
+        """The index in ``names`` of the job of each retrial."""
+        timestamps = np.array([row[1:4] for row in rows], dtype=np.int64).reshape(-1, 3)[order]
+        status = np.array([row[4] for row in rows], dtype=object)[order]
+
+        # Move the times that were written to the beginning of the line.
+        written = timestamps > 0
+        retrial, column = np.nonzero(written)
+        fields = np.zeros_like(timestamps)
+        fields[retrial, np.cumsum(written, axis=1)[retrial, column] - 1] = _local_seconds(timestamps[written])
+        self.submit, self.start, self.finish = fields.T
+        self.completed: np.ndarray = written.all(axis=1) & (status == 'COMPLETED')
+
+        self.last_of_job: np.ndarray = np.cumsum(np.bincount(self.job, minlength=len(self.names))) - 1
+        """The index of the last retrial of each job."""
+        # The last retrials of a job are the ones after its previous COMPLETED one.
+        completed_count = np.cumsum(self.completed)
+        completed_from_here = completed_count[self.last_of_job[self.job]] - completed_count + self.completed
+        self.last_retrials: np.ndarray = completed_from_here <= 1
+
+    @classmethod
+    def load(cls, expid: str, since: Optional[datetime] = None) -> Optional['JobRetrials']:
+        """Read the retrials of the jobs of an experiment.
+
+        :param expid: The experiment identifier.
+        :param since: If given, only the retrials of the jobs that started or finished after this date.
+        :return: The retrials, or ``None`` if the experiment has no history database.
+        """
+        if (BasicConfig.DATABASE_BACKEND == 'sqlite' and
+                not Path(BasicConfig.JOBDATA_DIR, f'job_data_{expid}.db').exists()):
+            return None
+        exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                        historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR, force_sql_alchemy=True)
+        timestamp = int(since.timestamp()) - _MAX_UTC_OFFSET if since else None
+        return cls(exp_history.manager.select_retrials(timestamp))
+
+    def active_after(self, date_limit: datetime) -> set[str]:
+        """Get the jobs that started or were running after a date, as ``Job.check_started_after``
+        and ``Job.check_running_after`` tell.
+
+        :param date_limit: The local date.
+        :return: The names of the jobs.
+        """
+        limit = (date_limit - _EPOCH) // timedelta(seconds=1)
+        active = (self.start > limit) | (self.finish > limit)
+        return set(self.names[np.unique(self.job[active])].tolist())
@@ -18,8 +18,11 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union
 
+import numpy as np
+
 from autosubmit.job.job import Job
 from autosubmit.statistics.jobs_stat import JobStat
+from autosubmit.statistics.retrials import JobRetrials, to_datetime
 from autosubmit.statistics.stats_summary import StatsSummary
 from autosubmit.statistics.utils import timedelta2hours, parse_number_processors
 
@@ -27,6 +30,31 @@ _COMPLETED_RETRIAL = 1
 _FAILED_RETRIAL = 0
 
 
+def _new_job_stat(job: Job) -> JobStat:
+    return JobStat(job.name, parse_number_processors(job.processors), job.total_wallclock, job.section, job.date,
+                   job.member, job.chunk, job.processors_per_node, job.tasks, job.nodes, job.exclusive)
+
+
+def _whole_seconds(deltas: list[timedelta], factors: Optional[np.ndarray] = None) -> np.ndarray:
+    """Get the whole seconds of each time delta, multiplied by its factor if given."""
+    seconds = np.array([delta.days * 86400 + delta.seconds for delta in deltas], dtype=np.int64)
+    microseconds = np.array([delta.microseconds for delta in deltas], dtype=np.int64)
+    if factors is not None:
+        seconds, microseconds = seconds * factors, microseconds * factors
+    return seconds + microseconds // 1000000
+
+
+def _hours(seconds: np.ndarray) -> np.ndarray:
+    """Convert seconds to hours with the same operations as ``timedelta2hours``, for the same rounding."""
+    days, seconds = np.divmod(seconds, 86400)
+    return days * 24 + seconds / 3600.0
+
+
+def _sum_in_order(values: np.ndarray) -> float:
+    """Add the values one after the other, as a loop does, for the same rounding."""
+    return float(np.add.accumulate(values)[-1]) if len(values) else 0.0
+
+
 class Statistics:
 
     def __init__(
@@ -35,12 +63,14 @@ class Statistics:
             start: Optional[datetime],
             end: Optional[datetime],
             queue_time_fix: dict[str, int],
-            jobs_stat=None
+            jobs_stat=None,
+            retrials: Optional[JobRetrials] = None
     ) -> None:
         self._jobs = jobs
         self._start = start
         self._end = end
         self._queue_time_fixes = queue_time_fix
+        self._retrials = retrials
         self._name_to_jobstat_dict: dict[str, JobStat] = dict()
         self.jobs_stat = jobs_stat
         # Old format
@@ -60,11 +90,17 @@ class Statistics:
         self.totals = [" Description text \n", "Line 1"]
 
     def calculate_statistics(self) -> "Statistics":
+        """Compute the statistics of each job from its last retrials.
+
+        The retrials are read from the ``job_data`` rows if they were given, or
+        else from the ``TOTAL_STATS`` file of each job.
+        """
+        if self._retrials is not None:
+            return self._calculate_statistics_from_retrials()
         for index, job in enumerate(self._jobs):
             retrials = job.get_last_retrials()
             for retrial in retrials:
-                job_stat = self._name_to_jobstat_dict.setdefault(job.name, JobStat(job.name, parse_number_processors(
-                    job.processors), job.total_wallclock, job.section, job.date, job.member, job.chunk, job.processors_per_node, job.tasks, job.nodes, job.exclusive))
+                job_stat = self._name_to_jobstat_dict.setdefault(job.name, _new_job_stat(job))
                 job_stat.inc_retrial_count()
                 if Job.is_a_completed_retrial(retrial):
                     job_stat.inc_completed_retrial_count()
@@ -87,28 +123,90 @@ class Statistics:
                                                     timedelta()) - timedelta(
                             seconds=self._queue_time_fixes.get(job.name, 0))
                         job_stat.failed_queue_time += max(adjusted_failed_queue, timedelta())
+        self._sort_jobs_stat()
+        return self
+
+    def _calculate_statistics_from_retrials(self) -> "Statistics":
+        """Compute the same statistics as ``calculate_statistics``, for all the jobs at once."""
+        retrials = self._retrials
+        jobs_count = len(retrials.names)
+        last = retrials.last_retrials
+        job = retrials.job[last]
+        submit, start, finish = retrials.submit[last], retrials.start[last], retrials.finish[last]
+        completed = retrials.completed[last]
+        failed = ~completed
+
+        queue_time_fixes = np.array([self._queue_time_fixes.get(name, 0) for name in retrials.names.tolist()],
+                                    dtype=np.int64)
+        queue = np.where((submit > 0) & (start > 0),
+                         np.maximum(np.maximum(start - submit, 0) - queue_time_fixes[job], 0), 0)
+        run = np.where((start > 0) & (finish > 0), np.maximum(finish - start, 0), 0)
+
+        def sum_by_job(values: np.ndarray, selected: np.ndarray) -> list[int]:
+            return np.bincount(job[selected], weights=values[selected], minlength=jobs_count).astype(np.int64).tolist()
+
+        completed_queue_time, completed_run_time = sum_by_job(queue, completed), sum_by_job(run, completed)
+        failed_queue_time, failed_run_time = sum_by_job(queue, failed), sum_by_job(run, failed)
+        retrial_count = np.bincount(job, minlength=jobs_count).tolist()
+        completed_retrial_count = np.bincount(job[completed], minlength=jobs_count).tolist()
+        submit_time, start_time, finish_time = (times[retrials.last_of_job].tolist()
+                                                for times in (retrials.submit, retrials.start, retrials.finish))
+
+        index_of_job = {name: index for index, name in enumerate(retrials.names.tolist())}
+        for job in self._jobs:
+            index = index_of_job.get(job.name)
+            if index is None or job.name in self._name_to_jobstat_dict:
+                continue
+            job_stat = self._name_to_jobstat_dict[job.name] = _new_job_stat(job)
+            job_stat.submit_time = to_datetime(submit_time[index])
+            job_stat.start_time = to_datetime(start_time[index])
+            job_stat.finish_time = to_datetime(finish_time[index])
+            job_stat.completed_queue_time = timedelta(seconds=completed_queue_time[index])
+            job_stat.completed_run_time = timedelta(seconds=completed_run_time[index])
+            job_stat.failed_queue_time = timedelta(seconds=failed_queue_time[index])
+            job_stat.failed_run_time = timedelta(seconds=failed_run_time[index])
+            job_stat.retrial_count = retrial_count[index]
+            job_stat.completed_retrial_count = completed_retrial_count[index]
+            job_stat.failed_retrial_count = job_stat.retrial_count - job_stat.completed_retrial_count
+        self._sort_jobs_stat()
+        return self
+
+    def _sort_jobs_stat(self) -> None:
         self.jobs_stat = sorted(list(self._name_to_jobstat_dict.values()), key=lambda x: (
             x.date if x.date else datetime.now(), x.member if x.member else "", x.section if x.section else "", x.chunk))
-        return self
 
     def calculate_summary(self) -> "Statistics":
+        """Add up the statistics of the jobs.
+
+        The values of the jobs are added one after the other, so the
+        floating point sums are the same as adding their ``get_as_dict`` values
+        in a loop.
+        """
         stat_summary = StatsSummary()
-        for job in self.jobs_stat:
-            job_stat_dict = job.get_as_dict()
-            # Counter
-            stat_summary.submitted_count += job_stat_dict["submittedCount"]
-            stat_summary.run_count += job_stat_dict["retrialCount"]
-            stat_summary.completed_count += job_stat_dict["completedCount"]
-            stat_summary.failed_count += job_stat_dict["failedCount"]
-            # Consumption
-            stat_summary.expected_consumption += job_stat_dict["expectedConsumption"]
-            stat_summary.real_consumption += job_stat_dict["realConsumption"]
-            stat_summary.failed_real_consumption += job_stat_dict["failedRealConsumption"]
-            # CPU Consumption
-            stat_summary.expected_cpu_consumption += job_stat_dict["expectedCpuConsumption"]
-            stat_summary.cpu_consumption += job_stat_dict["cpuConsumption"]
-            stat_summary.failed_cpu_consumption += job_stat_dict["failedCpuConsumption"]
-            stat_summary.total_queue_time += job_stat_dict["completedQueueTime"] + job_stat_dict["failedQueueTime"]
+        processors = np.array([job.processors for job in self.jobs_stat], dtype=np.int64)
+        wallclocks = np.array([job.expected_real_consumption for job in self.jobs_stat], dtype=np.float64)
+        completed_run_times = [job.completed_run_time for job in self.jobs_stat]
+        failed_run_times = [job.failed_run_time for job in self.jobs_stat]
+        failed_run_hours = _hours(_whole_seconds(failed_run_times))
+        failed_cpu_hours = _hours(_whole_seconds(failed_run_times, processors))
+        # Counter
+        stat_summary.submitted_count = sum(job.retrial_count for job in self.jobs_stat)
+        stat_summary.run_count = stat_summary.submitted_count
+        stat_summary.completed_count = sum(job.completed_retrial_count for job in self.jobs_stat)
+        stat_summary.failed_count = sum(job.failed_retrial_count for job in self.jobs_stat)
+        # Consumption
+        stat_summary.expected_consumption = _sum_in_order(wallclocks)
+        stat_summary.real_consumption = _sum_in_order(_hours(_whole_seconds(
+            [completed + failed for completed, failed in zip(completed_run_times, failed_run_times)])))
+        stat_summary.failed_real_consumption = _sum_in_order(failed_run_hours)
+        # CPU Consumption
+        stat_summary.expected_cpu_consumption = _sum_in_order(wallclocks * processors)
+        stat_summary.cpu_consumption = _sum_in_order(
+            _hours(_whole_seconds(completed_run_times, processors)) + failed_cpu_hours)
+        stat_summary.failed_cpu_consumption = _sum_in_order(failed_cpu_hours)
+        stat_summary.total_queue_time = _sum_in_order(
+            _hours(_whole_seconds([job.completed_queue_time for job in self.jobs_stat])) +
+            _hours(_whole_seconds([job.failed_queue_time for job in self.jobs_stat])))
         stat_summary.calculate_consumption_percentage()
         self.summary = stat_summary
         return self
@@ -19,11 +19,14 @@
 
 from datetime import datetime, timedelta
 from math import ceil
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from autosubmit.job.job import Job
 from autosubmit.log.log import AutosubmitCritical
 
+if TYPE_CHECKING:
+    from autosubmit.statistics.retrials import JobRetrials
+
 
 def filter_by_section(jobs: list[Job], section: Optional[str]) -> list[Job]:
     """Filter the list of jobs using the optional section.
@@ -43,7 +46,11 @@ def filter_by_section(jobs: list[Job], section: Optional[str]) -> list[Job]:
     return jobs
 
 
-def filter_by_time_period(jobs: list[Job], hours_span: Optional[int]) -> tuple[list[Job], Optional[datetime], datetime]:
+def filter_by_time_period(
+        jobs: list[Job],
+        hours_span: Optional[int],
+        retrials: Optional['JobRetrials'] = None
+) -> tuple[list[Job], Optional[datetime], datetime]:
     """Filter the list of jobs using the specified time period.
 
     The time period is used to compute the start time. It subtracts the given
@@ -58,8 +65,12 @@ def filter_by_time_period(jobs: list[Job], hours_span: Optional[int]) -> tuple[l
     Otherwise, it will filter the list of jobs using the specified time period,
     and return the filtered list of jobs, the start time, and the current time.
 
+    The jobs that started or were running are found in the ``retrials`` if given, or
+    else in the ``TOTAL_STATS`` file of each job.
+
     :param jobs: List of jobs.
     :param hours_span: the amount of hours.
+    :param retrials: The retrials of the jobs, read from the experiment history.
     :return: The list of jobs filtered by the time period.
     :raises AutosubmitCritical: If the ``hours_span`` is less than or equal to zero.
     """
@@ -73,10 +84,14 @@ def filter_by_time_period(jobs: list[Job], hours_span: Optional[int]) -> tuple[l
 
     start_time = current_time - timedelta(hours=int(hours_span))
 
-    filtered_jobs = [
-        job for job in jobs
-        if job.check_started_after(start_time) or job.check_running_after(start_time)
-    ]
+    if retrials is not None:
+        active_jobs = retrials.active_after(start_time)
+        filtered_jobs = [job for job in jobs if job.name in active_jobs]
+    else:
+        filtered_jobs = [
+            job for job in jobs
+            if job.check_started_after(start_time) or job.check_running_after(start_time)
+        ]
 
     return filtered_jobs, start_time, current_time
 
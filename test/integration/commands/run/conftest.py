@@ -32,6 +32,8 @@ from typing import Any, Callable, TYPE_CHECKING
 import pytest
 from threading import Thread
 
+from autosubmit.job.job_stats_journal import JOURNAL_FILENAME
+
 
 if TYPE_CHECKING:
     pass
@@ -284,7 +286,10 @@ def _check_files_recovered(as_conf, log_dir, expected_files) -> dict:
     for f in log_dir.glob('*'):
         files_check_list[f.name] = not any(
             str(f).endswith(f".{i}.err") or str(f).endswith(f".{i}.out") for i in range(retrials + 1))
-    stat_files = [str(f).split("_")[-1] for f in log_dir.parent.glob('*') if "STAT" in str(f)]
+    # The STAT files are moved to the stats journal once transferred.
+    journal = log_dir.parent / JOURNAL_FILENAME
+    stat_names = [record.split(' ')[1] for record in journal.read_text().splitlines()] if journal.exists() else []
+    stat_files = [name.split("_")[-1] for name in stat_names if "_STAT_" in name]
     for i in range(retrials + 1):
         files_check_list[f"STAT_{i}"] = str(i) in stat_files
 
@@ -52,6 +52,7 @@ from autosubmit.platforms.paramiko_platform import _create_ssh_client
 # noinspection PyProtectedMember
 from autosubmit.platforms.psplatform import PsPlatform
 from autosubmit.platforms.slurmplatform import SlurmPlatform
+from autosubmit.platforms.ssh_connection_pool import ssh_connection_pool
 from test.integration.test_utils.networking import get_free_port
 
 if TYPE_CHECKING:
@@ -471,6 +472,8 @@ def ssh_server(mocker, tmp_path, request) -> Generator[DockerContainer, None, No
             mocker.patch('autosubmit.platforms.paramiko_platform.paramiko.SSHConfig', return_value=paramiko_config)
 
         yield container
+        # Every test uses a new server on the same host and port of the SSH config.
+        ssh_connection_pool.close_all()
 
 
 @pytest.fixture(scope='session')
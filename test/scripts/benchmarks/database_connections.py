@@ -0,0 +1,85 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+# Requirements:
+# - autosubmit==4.1.*
+#
+# Opens the databases of each job of a synthetic run, as the submission, the
+# history and the user metrics of a job do, and counts the engines, the DBAPI
+# connections and the DDL statements (``CREATE``/``DROP``) of all the
+# databases, with the time taken.
+#
+# Usage: python database_connections.py [number_of_jobs]
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from sqlalchemy import Engine, Pool, event
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.database import session
+from autosubmit.database.db_manager import DbManager
+from autosubmit.database.tables import ExperimentStructureTable
+from autosubmit.job.job_package_persistence import JobPackagePersistence
+from autosubmit.job.metrics_processor import UserMetricRepository
+
+EXPID = 'a000'
+NUMBER_OF_JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+counts = {'engines': 0, 'connections': 0, 'ddl': 0}
+sqlalchemy_create_engine = session.sqlalchemy_create_engine
+
+
+def count_engine(*args, **kwargs):
+    counts['engines'] += 1
+    return sqlalchemy_create_engine(*args, **kwargs)
+
+
+def count_connection(*_):
+    counts['connections'] += 1
+
+
+def count_ddl(conn, cursor, statement, *_):
+    if statement.lstrip().upper().startswith(('CREATE', 'DROP')):
+        counts['ddl'] += 1
+
+
+session.sqlalchemy_create_engine = count_engine
+event.listen(Pool, 'connect', count_connection)
+event.listen(Engine, 'before_cursor_execute', count_ddl)
+
+with TemporaryDirectory() as tmp_dir:
+    BasicConfig.LOCAL_ROOT_DIR = tmp_dir
+    BasicConfig.STRUCTURES_DIR = tmp_dir
+    BasicConfig.DATABASE_BACKEND = 'sqlite'
+    Path(tmp_dir, EXPID, 'pkl').mkdir(parents=True)
+    Path(tmp_dir, EXPID, BasicConfig.LOCAL_TMP_DIR).mkdir(parents=True)
+
+    start = perf_counter()
+    for i in range(NUMBER_OF_JOBS):
+        JobPackagePersistence(EXPID).get_package_name(f'{EXPID}_{i}')
+        UserMetricRepository(EXPID).store_metric(1, f'{EXPID}_{i}', 'metric', i)
+        DbManager(f'sqlite:///{Path(BasicConfig.STRUCTURES_DIR, f"structure_{EXPID}.db")}').create_table(
+            ExperimentStructureTable.name)
+    elapsed = perf_counter() - start
+    session.dispose_engines()
+
+print(f'engines {counts["engines"]}, connections {counts["connections"]}, DDL statements {counts["ddl"]}')
+print(f'{elapsed * 1000 / NUMBER_OF_JOBS:.2f} ms per job')
+print(f'Jobs: {NUMBER_OF_JOBS}')
@@ -0,0 +1,112 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+# Requirements:
+# - autosubmit==4.1.*
+#
+# Compares the status-indexed ``JobList`` getters against the linear scans
+# they replaced, on a synthetic job list where most jobs are completed or
+# waiting (the usual shape of a long-running experiment).
+#
+# Usage: python job_list_getters.py [number_of_jobs] [repetitions]
+
+import sys
+from random import Random
+from timeit import timeit
+from types import SimpleNamespace
+
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list import JobList
+
+EXPID = 'a000'
+NUMBER_OF_JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+REPETITIONS = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+STATUS_WEIGHTS = {
+    Status.COMPLETED: 0.60,
+    Status.WAITING: 0.38,
+    Status.READY: 0.005,
+    Status.SUBMITTED: 0.005,
+    Status.QUEUING: 0.004,
+    Status.RUNNING: 0.004,
+    Status.FAILED: 0.001,
+    Status.DELAYED: 0.001
+}
+
+platforms = [SimpleNamespace(name=f'platform_{i}', serial_platform=None) for i in range(4)]
+rng = Random(0)
+
+job_list = JobList(EXPID, None, None, None)
+for i in range(NUMBER_OF_JOBS):
+    status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    job = Job(f'{EXPID}_{i}_SIM', i, status, 0)
+    job.processors = '2'
+    job.platform = platforms[i % len(platforms)]
+    job_list._job_list.append(job)
+
+
+def scan(status, platform=None):
+    return [job for job in job_list._job_list if (platform is None or
+                                                  job.platform.name == platform.name) and job.status == status]
+
+
+def scan_iteration():
+    for platform in platforms:
+        scan(Status.SUBMITTED, platform)
+        scan(Status.RUNNING, platform)
+        scan(Status.QUEUING, platform)
+        scan(Status.UNKNOWN, platform)
+        scan(Status.HELD, platform)
+    scan(Status.READY)
+    scan(Status.WAITING)
+    scan(Status.COMPLETED)
+    scan(Status.FAILED)
+    scan(Status.DELAYED)
+
+
+def indexed_iteration():
+    for platform in platforms:
+        job_list.get_in_queue(platform)
+    job_list.get_ready()
+    job_list.get_waiting()
+    job_list.get_completed()
+    job_list.get_failed()
+    job_list.get_delayed()
+
+
+def status_changes():
+    # A handful of transitions per iteration, like in ``update_list``.
+    for job in job_list.get_ready()[:50]:
+        job.status = Status.SUBMITTED
+    for job in job_list.get_submitted()[:50]:
+        job.status = Status.READY
+
+
+# Build the index outside the timed section, as it happens once per ``JobList``.
+indexed_iteration()
+assert job_list.get_completed() == scan(Status.COMPLETED)
+
+scan_time = timeit(scan_iteration, number=REPETITIONS) / REPETITIONS
+indexed_time = timeit(indexed_iteration, number=REPETITIONS) / REPETITIONS
+changes_time = timeit(status_changes, number=REPETITIONS) / REPETITIONS
+
+print(f'Jobs: {NUMBER_OF_JOBS}, repetitions: {REPETITIONS}')
+print(f'Linear scans per iteration:   {scan_time * 1000:10.2f} ms')
+print(f'Indexed getters per iteration: {indexed_time * 1000:9.2f} ms')
+print(f'Speed-up: {scan_time / indexed_time:.1f}x')
+print(f'100 status changes with index: {changes_time * 1000:9.2f} ms')
@@ -0,0 +1,67 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+# Requirements:
+# - autosubmit==4.1.*
+#
+# Compares the time of ``JobList.save`` with the ``pkl`` and ``pkl_log``
+# storage types, when only a few jobs change between two saves (as in the
+# main loop of ``autosubmit run``).
+#
+# Usage: python job_list_persistence_save.py [number_of_jobs] [changed_jobs_per_save] [saves]
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from networkx import DiGraph
+
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list_persistence import JobListPersistencePkl, JobListPersistencePklLog
+
+EXPID = 'a000'
+NUMBER_OF_JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+CHANGED_JOBS = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+SAVES = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+jobs = [Job(f'{EXPID}_{i}_SIM', i, Status.WAITING, 0) for i in range(NUMBER_OF_JOBS)]
+
+
+def measure(persistence, persistence_path: str) -> float:
+    """Returns the average time of a save, not counting the first one."""
+    persistence.save(persistence_path, f'job_list_{EXPID}', jobs, DiGraph())
+    elapsed = 0.0
+    for save in range(SAVES):
+        for job in jobs[save * CHANGED_JOBS:(save + 1) * CHANGED_JOBS]:
+            job.status = Status.COMPLETED
+        start = perf_counter()
+        persistence.save(persistence_path, f'job_list_{EXPID}', jobs, DiGraph())
+        elapsed += perf_counter() - start
+    return elapsed / SAVES
+
+
+with TemporaryDirectory() as tmp_dir:
+    for name, persistence in (('pkl', JobListPersistencePkl()), ('pkl_log', JobListPersistencePklLog())):
+        persistence_path = Path(tmp_dir, name)
+        persistence_path.mkdir()
+        for job in jobs:
+            job.status = Status.WAITING
+        print(f'{name:8} {measure(persistence, str(persistence_path)) * 1000:10.2f} ms per save')
+
+print(f'Jobs: {NUMBER_OF_JOBS}, changed jobs per save: {CHANGED_JOBS}, saves: {SAVES}')
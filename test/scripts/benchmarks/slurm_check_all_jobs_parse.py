@@ -0,0 +1,63 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+# Requirements:
+# - autosubmit==4.1.*
+#
+# Compares the time to read the state of every job from the ``sacct`` output
+# of the check all jobs command, and the reason of every job from the
+# ``squeue`` output of the queue status command, parsing the output once per
+# job (as ``check_all_jobs`` used to do) and once for the whole batch.
+#
+# Usage: python slurm_check_all_jobs_parse.py [number_of_jobs]
+
+import sys
+from time import perf_counter
+
+from autosubmit.platforms.slurmplatform import SlurmPlatform
+
+NUMBER_OF_JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+job_ids = [str(1_000_000 + i) for i in range(NUMBER_OF_JOBS)]
+sacct_output = ''.join(f'{job_id:>12}    PENDING\n' for job_id in job_ids)
+squeue_output = ''.join(f'{job_id},N/A,(Priority)\n' for job_id in job_ids)
+platform = SlurmPlatform.__new__(SlurmPlatform)
+
+
+def per_job_parse() -> None:
+    """The parsing of previous versions, which scanned the whole output for each job."""
+    for job_id in job_ids:
+        [x.split()[1] for x in sacct_output.splitlines() if x.split()[0][:len(job_id)] == job_id]
+    for job_id in job_ids:
+        ''.join([x.split(',', 2)[2] for x in squeue_output.splitlines()
+                 if x.split(',')[0] == job_id and x.count(',') >= 2])
+
+
+def batch_parse() -> None:
+    statuses = platform.parse_all_jobs_statuses(sacct_output)
+    reasons = platform.parse_queue_reasons(squeue_output)
+    for job_id in job_ids:
+        statuses.get(job_id)
+        reasons.get(job_id)
+
+
+for name, parse in (('per job', per_job_parse), ('batch', batch_parse)):
+    start = perf_counter()
+    parse()
+    print(f'{name:8} {(perf_counter() - start) * 1000:10.2f} ms')
+
+print(f'Jobs: {NUMBER_OF_JOBS}')
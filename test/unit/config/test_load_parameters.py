@@ -23,3 +23,57 @@ def test_load_parameters(autosubmit_config):
                                     'M': '%M%', 'M_': '%M_%', 'm': '%m%', 'm_': '%m_%'})
     parameters = as_conf.load_parameters()
     assert parameters['VAR.DEEP_VAR'] == ['%NOTFOUND%', '%TEST%', '%TEST2%']
+
+
+def test_load_parameters_exports_the_data_once(autosubmit_config, mocker):
+    as_conf = autosubmit_config(expid='a000', experiment_data={'VAR': {'DEEP_VAR': 'value'}})
+    deep_parameters_export = mocker.spy(as_conf, 'deep_parameters_export')
+
+    parameters = as_conf.load_parameters()
+    parameters['VAR.DEEP_VAR'] = 'changed'
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'value'
+    assert deep_parameters_export.call_count == 1
+
+    # A new key, a new top-level value, a new data, or a cleared cache export the data again.
+    as_conf.experiment_data['OTHER'] = 1
+    assert as_conf.load_parameters()['OTHER'] == 1
+    as_conf.experiment_data['OTHER'] = 2
+    assert as_conf.load_parameters()['OTHER'] == 2
+    as_conf.experiment_data['VAR'] = {'DEEP_VAR': 'replaced'}
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'replaced'
+    as_conf.experiment_data['VAR']['DEEP_VAR'] = 'in place'
+    as_conf.clear_parameters_cache()
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'in place'
+    as_conf.experiment_data = {'VAR': {'DEEP_VAR': 'new'}}
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'new'
+    assert deep_parameters_export.call_count == 6
+
+
+def test_load_parameters_after_reload(autosubmit_config, mocker):
+    as_conf = autosubmit_config(expid='a000', experiment_data={'VAR': {'DEEP_VAR': 'value'}})
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'value'
+
+    # The files changed, with the same keys and another value.
+    mocker.patch.object(as_conf, 'needs_reload', return_value=True)
+    mocker.patch.object(as_conf, 'load_custom_config_section', return_value={'VAR': {'DEEP_VAR': 'reloaded'}})
+    as_conf.reload()
+    assert as_conf.load_parameters()['VAR.DEEP_VAR'] == 'reloaded'
+
+
+def test_read_parameters_placeholders(autosubmit_config):
+    as_conf = autosubmit_config(expid='a000', experiment_data={
+        'JOBS': {'SIM': {'PATH': '%ROOTDIR%/sim', 'LATE': '%^SDATE%', 'PLAIN': 'plain'}}})
+    expected = as_conf.load_parameters()
+    expected['CURRENT_PATH'] = '%CHUNK%'
+    expected['JOBS.SIM.PLAIN'] = '%MEMBER%'
+    parameters = dict(expected)
+
+    as_conf.read_parameters_placeholders(parameters)
+    dynamic_variables, special_dynamic_variables = as_conf.dynamic_variables, as_conf.special_dynamic_variables
+    as_conf.dynamic_variables, as_conf.special_dynamic_variables = {}, {}
+    as_conf.deep_read_loops(expected)
+
+    assert parameters == expected
+    assert dynamic_variables == as_conf.dynamic_variables == {
+        'JOBS.SIM.PATH': '%ROOTDIR%/sim', 'JOBS.SIM.PLAIN': '%MEMBER%', 'CURRENT_PATH': '%CHUNK%'}
+    assert special_dynamic_variables == as_conf.special_dynamic_variables == {'JOBS.SIM.LATE': '%^SDATE%'}
@@ -21,7 +21,7 @@ from contextlib import nullcontext as does_not_raise
 import pytest
 
 from autosubmit.database.db_manager import DbManager
-from autosubmit.database.tables import ExperimentTable
+from autosubmit.database.tables import ExperimentStructureTable, ExperimentTable, JobStateTable
 
 
 def test_insert_rejects_empty_data():
@@ -39,3 +39,57 @@ def test_delete_where_raises_empty_data():
     db_manager = DbManager('sqlite:///:memory:', schema='abc')
     with pytest.raises(ValueError):
         db_manager.delete_where(ExperimentTable.name, {})
+
+
+def test_upsert_many(tmp_path):
+    db_manager = DbManager(f'sqlite:///{tmp_path / "test.db"}')
+    db_manager.create_table(JobStateTable.name)
+    db_manager.insert_many(JobStateTable.name, [
+        {'expid': 'a000', 'name': 'a000_1', 'status': 0},
+        {'expid': 'a000', 'name': 'a000_2', 'status': 0},
+        {'expid': 'a001', 'name': 'a000_2', 'status': 0}
+    ])
+
+    assert 2 == db_manager.upsert_many(
+        JobStateTable.name,
+        [{'expid': 'a000', 'name': 'a000_1', 'status': 5}, {'expid': 'a000', 'name': 'a000_3', 'status': 1}],
+        ['expid', 'name'],
+        [{'expid': 'a000', 'name': 'a000_2'}]
+    )
+
+    assert sorted(db_manager.select_where(JobStateTable.name, None, ['expid', 'name', 'status'])) == [
+        ('a000', 'a000_1', 5), ('a000', 'a000_3', 1), ('a001', 'a000_2', 0)
+    ]
+
+
+def test_insert_and_delete_many(tmp_path):
+    db_manager = DbManager(f'sqlite:///{tmp_path / "test.db"}')
+    db_manager.create_table(ExperimentStructureTable.name)
+    db_manager.insert_many(ExperimentStructureTable.name, [{'e_from': 'a', 'e_to': str(i)} for i in range(5)])
+
+    assert (3, 4) == db_manager.insert_and_delete_many(
+        ExperimentStructureTable.name,
+        ({'e_from': 'b', 'e_to': str(i)} for i in range(3)),
+        ({'e_from': 'a', 'e_to': str(i)} for i in range(1, 5)),
+        batch_size=2
+    )
+    assert sorted(db_manager.select_all_iter(ExperimentStructureTable.name, batch_size=2)) == [
+        ('a', '0'), ('b', '0'), ('b', '1'), ('b', '2')
+    ]
+    assert (0, 0) == db_manager.insert_and_delete_many(ExperimentStructureTable.name, [], [])
+
+
+def test_insert_and_delete_many_is_one_transaction(tmp_path):
+    db_manager = DbManager(f'sqlite:///{tmp_path / "test.db"}')
+    db_manager.create_table(ExperimentStructureTable.name)
+    db_manager.insert_many(ExperimentStructureTable.name, [{'e_from': 'a', 'e_to': 'b'}])
+
+    with pytest.raises(Exception):
+        # The second row is inserted twice.
+        db_manager.insert_and_delete_many(
+            ExperimentStructureTable.name,
+            [{'e_from': 'c', 'e_to': 'd'}, {'e_from': 'c', 'e_to': 'd'}],
+            [{'e_from': 'a', 'e_to': 'b'}, {'e_from': 'x', 'e_to': 'y'}],
+            batch_size=1
+        )
+    assert db_manager.select_all(ExperimentStructureTable.name) == [('a', 'b')]
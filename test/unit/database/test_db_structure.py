@@ -23,10 +23,13 @@ the ``test/integration/test_db_structure.py`` for more tests.
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import networkx as nx
 import pytest
 
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.database.db_manager import DbManager
 from autosubmit.database.db_structure import (
-    get_structure, save_structure
+    get_structure, iter_structure, save_structure
 )
 
 if TYPE_CHECKING:
@@ -71,3 +74,39 @@ def test_save_structure_exception_raises(tmp_path):
         save_structure(None, '', Path(tmp_path) / 'does not exist yet')  # type: ignore
 
     assert 'Structures folder not found' in str(cm.value)
+
+
+def test_save_structure_writes_the_changed_edges(tmp_path, mocker):
+    mocker.patch.object(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    graph = nx.DiGraph([(f'a000_{i}', f'a000_{i + 1}') for i in range(100)])
+    graph.add_node('a000_Z')
+    save_structure(graph, 'a000', tmp_path)
+    insert_and_delete_many = mocker.spy(DbManager, 'insert_and_delete_many')
+
+    graph.remove_edge('a000_50', 'a000_51')
+    graph.add_edge('a000_Z', 'a000_0')
+    graph.add_node('a000_Y')
+    save_structure(graph, 'a000', tmp_path)
+
+    # The self-loop of a000_Z is replaced by its edge, and a000_Y gets one.
+    assert insert_and_delete_many.spy_return == (2, 2)
+    assert sorted(iter_structure('a000', tmp_path)) == sorted(
+        list(graph.edges()) + [('a000_Y', 'a000_Y')])
+    assert get_structure('a000', tmp_path) == {
+        **{f'a000_{i}': [f'a000_{i + 1}'] if i != 50 and i < 100 else [] for i in range(101)},
+        'a000_Z': ['a000_0'], 'a000_Y': ['a000_Y']
+    }
+
+    save_structure(graph, 'a000', tmp_path)
+    assert insert_and_delete_many.spy_return == (0, 0)
+
+
+def test_get_structure_of_some_jobs(tmp_path, mocker):
+    mocker.patch.object(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('a', 'd')])
+    graph.add_node('z')
+    save_structure(graph, 'a000', tmp_path)
+
+    structure = get_structure('a000', tmp_path, {'a', 'c', 'z'})
+    assert {job: sorted(children) for job, children in structure.items()} == {'a': ['b', 'd'], 'c': [], 'z': ['z']}
+    assert get_structure('a000', tmp_path, set()) == {}
@@ -15,11 +15,19 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+from pathlib import Path
 from typing import Union
 
 import pytest
+from sqlalchemy import Engine, Pool, event, text
 
-from autosubmit.database.session import create_engine
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.database import session
+from autosubmit.database.db_manager import DbManager
+from autosubmit.database.session import create_engine, dispose_engines
+from autosubmit.database.tables import ExperimentStructureTable, JobPackageTable
+from autosubmit.job.job_package_persistence import JobPackagePersistence
+from autosubmit.job.metrics_processor import UserMetricRepository
 
 
 @pytest.mark.parametrize(
@@ -37,3 +45,84 @@ def test_create_engine(url: str, expected: Union[str, Exception]):
     else:
         engine = create_engine(connection_url=url)
         assert engine.name == expected
+
+
+@pytest.fixture
+def counters():
+    """Count the DBAPI connections opened and the DDL statements run by all the engines."""
+    counts = {'connections': 0, 'ddl': 0}
+
+    def on_connect(*_):
+        counts['connections'] += 1
+
+    def on_execute(conn, cursor, statement, *_):
+        if statement.lstrip().upper().startswith(('CREATE', 'DROP')):
+            counts['ddl'] += 1
+
+    event.listen(Pool, 'connect', on_connect)
+    event.listen(Engine, 'before_cursor_execute', on_execute)
+    yield counts
+    event.remove(Pool, 'connect', on_connect)
+    event.remove(Engine, 'before_cursor_execute', on_execute)
+
+
+def test_create_engine_is_shared_by_connection_url(tmp_path):
+    url = f'sqlite:///{tmp_path / "shared.db"}'
+
+    assert create_engine(url) is create_engine(url)
+    assert create_engine(url) is not create_engine(f'sqlite:///{tmp_path / "other.db"}')
+    # Each in-memory database is a new one.
+    assert create_engine('sqlite://') is not create_engine('sqlite://')
+
+
+def test_sqlite_journal_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(BasicConfig, 'DB_PATH', str(tmp_path / 'autosubmit.db'))
+
+    def journal_mode(name: str) -> str:
+        with create_engine(f'sqlite:///{tmp_path / name}').connect() as conn:
+            return conn.execute(text('PRAGMA journal_mode')).scalar()
+
+    assert journal_mode('job_packages_a000.db') == 'wal'
+    # The main database is shared by all the users.
+    assert journal_mode('autosubmit.db') == 'delete'
+
+
+def test_replaced_database_is_reconnected(tmp_path):
+    database = tmp_path / 'pkl' / 'job_packages_a000.db'
+    database.parent.mkdir()
+    db_manager = DbManager(f'sqlite:///{database}')
+    db_manager.create_table(JobPackageTable.name)
+    db_manager.insert(JobPackageTable.name, {'exp_id': 'a000', 'package_name': 'p', 'job_name': 'j'})
+    assert db_manager.count(JobPackageTable.name) == 1
+
+    # Deleted while the connection is in the pool: a new connection, and the table is created again.
+    for path in database.parent.iterdir():
+        path.unlink()
+    db_manager.create_table(JobPackageTable.name)
+    assert db_manager.count(JobPackageTable.name) == 0
+
+    # Deleted after closing the connections, as ``autosubmit delete`` does.
+    dispose_engines()
+    for path in database.parent.iterdir():
+        path.unlink()
+    db_manager = DbManager(f'sqlite:///{database}')
+    db_manager.create_table(JobPackageTable.name)
+    assert db_manager.count(JobPackageTable.name) == 0
+
+
+def test_jobs_reuse_the_engines_and_tables(autosubmit_config, counters, mocker):
+    """The databases opened for each job of a run get one engine, one connection and their tables once."""
+    autosubmit_config('a000', {})
+    engines = mocker.spy(session, 'sqlalchemy_create_engine')
+
+    for i in range(5):
+        # What the submission, the history and the user metrics of a job open.
+        JobPackagePersistence('a000').get_package_name(f'a000_{i}')
+        UserMetricRepository('a000').store_metric(1, f'a000_{i}', 'metric', i)
+        DbManager(f'sqlite:///{Path(BasicConfig.STRUCTURES_DIR, "structure_a000.db")}').create_table(
+            ExperimentStructureTable.name)
+
+    # One engine, one connection and one CREATE TABLE statement for each database and table.
+    assert engines.call_count == 3
+    assert counters['connections'] == 3
+    assert counters['ddl'] == 4
@@ -0,0 +1,91 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.history.database_backup``."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from autosubmit.history.database_backup import backup_database, restore_database, restore_sql_dump
+
+
+def _create_database(path: Path, rows: int) -> None:
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE IF NOT EXISTS job_data (id INTEGER PRIMARY KEY, job_name TEXT)')
+        connection.executemany('INSERT INTO job_data (job_name) VALUES (?)', [(f'a000_{i}',) for i in range(rows)])
+    connection.close()
+
+
+def _count(path: Path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute('SELECT COUNT(*) FROM job_data').fetchone()[0]
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def database_path(tmp_path) -> Path:
+    path = tmp_path / 'job_data_a000.db'
+    _create_database(path, 2000)
+    return path
+
+
+def test_backup_and_restore(database_path, tmp_path):
+    backup_path = tmp_path / 'job_data_a000_backup.db'
+
+    assert backup_database(database_path, backup_path, pages=5)
+    database_path.unlink()
+    restore_database(backup_path, database_path)
+
+    assert _count(database_path) == 2000
+    assert not (tmp_path / 'job_data_a000_backup.db.tmp').exists()
+
+
+def test_backup_is_skipped_if_recent_or_unchanged(database_path, tmp_path):
+    backup_path = tmp_path / 'job_data_a000_backup.db'
+    assert backup_database(database_path, backup_path)
+
+    # Unchanged since the previous backup.
+    assert not backup_database(database_path, backup_path)
+
+    _create_database(database_path, 1)
+    old = backup_path.stat().st_mtime - 60
+    os.utime(backup_path, (old, old))
+    assert not backup_database(database_path, backup_path, min_interval=120)
+    assert backup_database(database_path, backup_path, min_interval=30)
+    assert _count(backup_path) == 2001
+
+
+def test_missing_database_is_not_backed_up(tmp_path):
+    assert not backup_database(tmp_path / 'missing.db', tmp_path / 'backup.db')
+    assert not (tmp_path / 'backup.db').exists()
+
+
+def test_restore_sql_dump(database_path, tmp_path):
+    dump_path = tmp_path / 'job_data_a000.sql'
+    connection = sqlite3.connect(database_path)
+    dump_path.write_text('\n'.join(connection.iterdump()))
+    connection.close()
+    restored_path = tmp_path / 'restored.db'
+
+    restore_sql_dump(dump_path, restored_path)
+
+    assert _count(restored_path) == 2000
@@ -0,0 +1,104 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the batched writes of ``ExperimentHistory``."""
+
+import pytest
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.history.experiment_history import ExperimentHistory
+
+_IGNORED_COLUMNS = ('id', 'created', 'modified')
+
+
+def _history(expid: str, force_sql_alchemy: bool) -> ExperimentHistory:
+    exp_history = ExperimentHistory(expid, jobdata_dir_path=BasicConfig.JOBDATA_DIR,
+                                    historiclog_dir_path=BasicConfig.HISTORICAL_LOG_DIR,
+                                    force_sql_alchemy=force_sql_alchemy)
+    exp_history.initialize_database()
+    exp_history.create_new_experiment_run(chunk_unit='month', chunk_size=1, job_list=[])
+    return exp_history
+
+
+def _write_job(exp_history: ExperimentHistory, name: str, job_id: int, completed: bool = True) -> None:
+    # An empty queue, as in the local platform, is stored as ``debug`` at submission.
+    exp_history.write_submit_time(name, submit=100, status='SUBMITTED', job_id=job_id, section='SIM', qos='')
+    exp_history.write_start_time(name, start=200, status='RUNNING', job_id=job_id, qos='')
+    exp_history.write_finish_time(name, finish=300, status='COMPLETED' if completed else 'FAILED', job_id=job_id,
+                                  out_file=f'{name}.out', err_file=f'{name}.err')
+
+
+def _rows(exp_history: ExperimentHistory) -> list[tuple]:
+    rows = exp_history.manager.get_job_data_all()
+    return sorted(tuple(value for column, value in row._asdict().items() if column not in _IGNORED_COLUMNS)
+                  for row in rows)
+
+
+@pytest.mark.parametrize('force_sql_alchemy', [False, True], ids=['sqlite', 'sqlalchemy'])
+def test_batch_writes_the_same_rows(force_sql_alchemy):
+    unbatched = _history('a000', force_sql_alchemy)
+    batched = _history('a001', force_sql_alchemy)
+    for exp_history in (unbatched, batched):
+        # A previous retrial, written before the batch.
+        _write_job(exp_history, 'a000_SIM', 1, completed=False)
+
+    _write_job(unbatched, 'a000_SIM', 2)
+    _write_job(unbatched, 'a000_POST', 3, completed=False)
+    _write_job(unbatched, 'a000_POST', 4)
+    unbatched.write_start_time('a000_SIM', start=250, status='RUNNING', job_id=1)
+    with batched.batch():
+        _write_job(batched, 'a000_SIM', 2)
+        _write_job(batched, 'a000_POST', 3, completed=False)
+        _write_job(batched, 'a000_POST', 4)
+        batched.write_start_time('a000_SIM', start=250, status='RUNNING', job_id=1)
+        assert _rows(batched) != _rows(unbatched)
+
+    assert _rows(batched) == _rows(unbatched)
+    assert {row.qos for row in batched.manager.get_job_data_all()} == {'debug'}
+    assert [(row.counter, row.last) for row in batched.manager.get_job_data_all() if row.job_name == 'a000_POST'] == \
+           [(0, 0), (1, 1)]
+
+
+def test_batch_uses_one_connection_to_write(mocker):
+    exp_history = _history('a000', False)
+    get_connection = mocker.spy(exp_history.manager, 'get_connection')
+
+    with exp_history.batch():
+        for i in range(200):
+            _write_job(exp_history, f'a000_{i}_SIM', i)
+        assert get_connection.call_count == 0
+
+    # The current run, the counters, and the write.
+    assert get_connection.call_count == 3
+    assert len(exp_history.manager.get_job_data_all()) == 200
+
+
+def test_platform_data_is_written_after_the_batch(mocker):
+    exp_history = _history('a000', False)
+    thread = mocker.patch('autosubmit.history.experiment_history.Thread')
+    platform = mocker.MagicMock()
+
+    with exp_history.batch():
+        exp_history.write_submit_time('a000_SIM', submit=100, job_id=1)
+        job_data_dc = exp_history.write_finish_time('a000_SIM', finish=300, status='COMPLETED', job_id=1)
+        exp_history.write_platform_data_after_finish_in_thread(job_data_dc, platform, 'JOB_data_a000_SIM')
+        assert job_data_dc._id == 0
+        assert not thread.called
+
+    assert job_data_dc._id > 0
+    thread.assert_called_once_with(target=exp_history.write_platform_data_after_finish, args=(job_data_dc, platform))
+    thread.return_value.start.assert_called_once()
@@ -0,0 +1,172 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.job.job_list_index``."""
+
+import pytest
+
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list_index import JobListIndex
+
+_EXPID = 'a000'
+
+
+@pytest.fixture
+def jobs() -> list[Job]:
+    statuses = [Status.WAITING, Status.READY, Status.COMPLETED, Status.WAITING, Status.READY]
+    return [Job(f'{_EXPID}_{i}', i, status, 0) for i, status in enumerate(statuses)]
+
+
+def test_get_keeps_list_order(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    assert index.get(Status.WAITING) == [jobs[0], jobs[3]]
+    assert index.get(Status.READY, Status.WAITING) == [jobs[0], jobs[1], jobs[3], jobs[4]]
+    assert index.get(Status.FAILED) == []
+
+
+def test_status_setter_updates_the_index(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    jobs[3].status = Status.COMPLETED
+    jobs[1].status = Status.COMPLETED
+
+    assert index.get(Status.COMPLETED) == [jobs[1], jobs[2], jobs[3]]
+    assert index.get(Status.WAITING) == [jobs[0]]
+    assert index.get(Status.READY) == [jobs[4]]
+
+
+def test_status_changes(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+    status_changes = index.status_changes
+
+    jobs[0].status = Status.WAITING
+    assert index.status_changes == status_changes
+    jobs[0].status = Status.READY
+    jobs[1].status = Status.COMPLETED
+    assert index.status_changes == status_changes + 2
+    index.ensure(jobs[:2])
+    assert index.status_changes == status_changes + 3
+
+
+def test_ensure_rebuilds_after_append_and_replace(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    new_job = Job(f'{_EXPID}_new', 99, Status.FAILED, 0)
+    jobs.append(new_job)
+    index.ensure(jobs)
+    assert index.get(Status.FAILED) == [new_job]
+
+    replaced = jobs[:2]
+    index.ensure(replaced)
+    assert index.get(Status.FAILED) == []
+    assert index.get(Status.WAITING, Status.READY) == replaced
+
+
+def test_discard(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    removed = jobs.pop(1)
+    index.discard(removed)
+    index.ensure(jobs)
+    removed.status = Status.WAITING
+
+    assert index.get(Status.READY) == [jobs[3]]
+    assert removed not in index.get(Status.WAITING)
+
+
+def test_other_index_claiming_a_job_invalidates_the_previous_one(jobs):
+    first, second = JobListIndex(), JobListIndex()
+    first.ensure(jobs)
+    second.ensure(jobs[:2])
+
+    # Only ``second`` is notified by the setter now, ``first`` must rebuild itself.
+    jobs[0].status = Status.FAILED
+    first.ensure(jobs)
+
+    assert first.get(Status.FAILED) == [jobs[0]]
+    assert second.get(Status.FAILED) == [jobs[0]]
+
+
+def test_index_is_not_persisted(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    assert '_job_list_index' not in jobs[0].__getstate__()
+
+
+def test_get_by_name_and_word(jobs):
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    assert index.get_by_name(f'{_EXPID}_3') is jobs[3]
+    assert index.get_by_name('missing') is None
+    assert index.get_by_word(f'{_EXPID}_3') == [jobs[3]]
+    assert index.get_by_word('3', without_expid=True) == [jobs[3]]
+    assert index.get_not_words() == []
+
+
+def test_names_with_other_characters_are_not_words():
+    job = Job(f'{_EXPID}_SIM-1', 1, Status.WAITING, 0)
+    index = JobListIndex()
+    index.ensure([job])
+
+    assert index.get_by_word(f'{_EXPID}_sim-1') == []
+    assert index.get_not_words() == [job]
+
+
+def test_select(jobs):
+    for i, job in enumerate(jobs):
+        job.section = 'SIM' if i % 2 else 'POST'
+        job.member = f'fc{i % 3}'
+        job.chunk = i
+    index = JobListIndex()
+    index.ensure(jobs)
+
+    assert index.select(sections=lambda section: section == 'SIM') == [jobs[1], jobs[3]]
+    assert index.select(members=lambda member: member == 'fc0') == [jobs[0], jobs[3]]
+    assert index.select(sections=lambda section: section == 'POST', chunks=lambda chunk: chunk > 1) == [jobs[2], jobs[4]]
+    assert index.select() == jobs
+
+    index.discard(jobs[3])
+    assert index.select(sections=lambda section: section == 'SIM') == [jobs[1]]
+    assert index.get_by_name(jobs[3].name) is None
+
+
+def test_parent_counts_follow_status_changes(jobs):
+    child = jobs[4]
+    child.add_parent(jobs[0], jobs[1], jobs[2])
+    index = JobListIndex()
+    index.ensure(jobs)
+    assert set(index.take_changed()) == set(jobs)
+
+    counts = index.parent_counts(child)
+    assert (counts.parents, counts.completed_or_skipped, counts.failed) == (3, 1, 0)
+
+    jobs[0].status = Status.FAILED
+    jobs[1].status = Status.SKIPPED
+
+    assert index.take_changed() == [jobs[0], jobs[1], child]
+    assert index.parent_counts(child) is counts
+    assert (counts.completed_or_skipped, counts.skipped, counts.failed) == (2, 1, 1)
+    assert index.take_changed() == []
@@ -0,0 +1,227 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``JobListPersistencePklLog`` and ``JobListPersistenceDbRows``."""
+
+import os
+import shutil
+
+import pytest
+from networkx import DiGraph
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.job.job import CHANGE_MARKING_SLOTS, Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list_persistence import (
+    JobListPersistenceDbRows, JobListPersistencePkl, JobListPersistencePklLog
+)
+
+_EXPID = 'a000'
+_FILE = f'job_list_{_EXPID}'
+
+
+@pytest.fixture
+def pkl_dir(tmp_path) -> str:
+    persistence_path = tmp_path / 'pkl'
+    persistence_path.mkdir()
+    (tmp_path / 'tmp').mkdir()
+    return str(persistence_path)
+
+
+@pytest.fixture
+def db_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(BasicConfig, 'LOCAL_ROOT_DIR', str(tmp_path))
+    monkeypatch.setattr(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    (tmp_path / _EXPID / 'pkl').mkdir(parents=True)
+    return lambda: JobListPersistenceDbRows(_EXPID)
+
+
+@pytest.fixture
+def jobs() -> list[Job]:
+    return [Job(f'{_EXPID}_{i}', i, Status.WAITING, 0) for i in range(10)]
+
+
+_PERSISTED_ATTRIBUTES = CHANGE_MARKING_SLOTS + (
+    'status', 'fail_count', 'packed', 'log_recovered', 'local_logs', 'remote_logs'
+)
+"""The attributes set after the jobs are created, the ones with a property are stored in a slot with a ``_``."""
+
+
+def _statuses(job_list: dict) -> dict[str, int]:
+    return {name: state['_status'] for name, state in job_list.items()}
+
+
+def _saved_value(state: dict, attribute: str):
+    return state[attribute] if attribute in state else state[f'_{attribute}']
+
+
+def test_load_is_compatible_with_pkl(pkl_dir, jobs):
+    JobListPersistencePklLog().save(pkl_dir, _FILE, jobs, DiGraph())
+
+    assert JobListPersistencePkl().load(pkl_dir, _FILE).keys() == {job.name for job in jobs}
+
+
+@pytest.mark.parametrize('persistence', [JobListPersistencePkl(), JobListPersistencePklLog()])
+def test_read_only_load(pkl_dir, jobs, persistence, mocker):
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    jobs[1].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    copy = mocker.patch('autosubmit.job.job_list_persistence.shutil.copy')
+
+    loaded = persistence.load(pkl_dir, _FILE, read_only=True)
+
+    assert _statuses(loaded) == {job.name: job.status for job in jobs}
+    assert not copy.called
+
+
+def test_read_only_load_of_a_missing_file(pkl_dir):
+    with pytest.raises(FileNotFoundError):
+        JobListPersistencePkl().load(pkl_dir, _FILE, read_only=True)
+
+
+def test_save_appends_the_changed_jobs(pkl_dir, jobs):
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    snapshot = os.path.join(pkl_dir, _FILE + '.pkl')
+    snapshot_stat = os.stat(snapshot)
+
+    jobs[1].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    jobs[2].status = Status.COMPLETED
+    jobs[1].status = Status.SUBMITTED
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    assert os.stat(snapshot).st_mtime_ns == snapshot_stat.st_mtime_ns
+    loaded = JobListPersistencePklLog().load(pkl_dir, _FILE)
+    assert _statuses(loaded) == {job.name: job.status for job in jobs}
+    # The snapshot alone still has the old statuses.
+    assert JobListPersistencePkl().load(pkl_dir, _FILE)[jobs[1].name]['_status'] == Status.WAITING
+
+
+def test_save_compacts_when_jobs_are_added(pkl_dir, jobs):
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    jobs.append(Job(f'{_EXPID}_new', 99, Status.READY, 0))
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    assert JobListPersistencePkl().load(pkl_dir, _FILE).keys() == {job.name for job in jobs}
+
+
+@pytest.mark.parametrize('attribute', _PERSISTED_ATTRIBUTES)
+def test_save_appends_a_job_with_any_attribute_changed(pkl_dir, jobs, attribute):
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    setattr(jobs[1], attribute, Status.RUNNING)
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    assert _saved_value(JobListPersistencePklLog().load(pkl_dir, _FILE)[jobs[1].name], attribute) == Status.RUNNING
+    assert _saved_value(JobListPersistencePkl().load(pkl_dir, _FILE)[jobs[1].name], attribute) != Status.RUNNING
+
+
+def test_load_ignores_a_truncated_record(pkl_dir, jobs):
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    jobs[1].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    jobs[2].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    changes = os.path.join(pkl_dir, _FILE + '.pkl.changes')
+    with open(changes, 'r+b') as fd:
+        fd.truncate(os.path.getsize(changes) - 3)
+
+    loaded = JobListPersistencePklLog().load(pkl_dir, _FILE)
+    assert loaded[jobs[1].name]['_status'] == Status.READY
+    assert loaded[jobs[2].name]['_status'] == Status.WAITING
+
+
+def test_load_ignores_the_changes_of_another_snapshot(pkl_dir, jobs):
+    """E.g. a crash between writing a snapshot and its change log, or ``pklfix``."""
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    snapshot = os.path.join(pkl_dir, _FILE + '.pkl')
+    shutil.copy(snapshot, snapshot + '.old')
+    jobs[1].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    os.replace(snapshot + '.old', snapshot)
+
+    loaded = JobListPersistencePklLog().load(pkl_dir, _FILE)
+    assert loaded[jobs[1].name]['_status'] == Status.WAITING
+
+
+def test_save_compacts_when_the_snapshot_was_replaced(pkl_dir, jobs):
+    persistence = JobListPersistencePklLog()
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+    JobListPersistencePkl().save(pkl_dir, _FILE, jobs[:5], DiGraph())
+
+    jobs[1].status = Status.READY
+    persistence.save(pkl_dir, _FILE, jobs, DiGraph())
+
+    loaded = JobListPersistencePklLog().load(pkl_dir, _FILE)
+    assert _statuses(loaded) == {job.name: job.status for job in jobs}
+
+
+def test_db_rows_round_trip(db_rows, jobs):
+    persistence = db_rows()
+    assert not persistence.pkl_exists('', _FILE)
+    jobs[3].id = 1234
+    jobs[3].status = Status.RUNNING
+    persistence.save('', _FILE, jobs, DiGraph())
+
+    assert persistence.pkl_exists('', _FILE)
+    loaded = db_rows().load('', _FILE)
+    assert _statuses(loaded) == {job.name: job.status for job in jobs}
+    assert loaded[jobs[3].name]['id'] == 1234
+    assert db_rows().load_statuses() == {job.name: job.status for job in jobs}
+
+
+def test_db_rows_writes_only_the_changed_jobs(db_rows, jobs, mocker):
+    persistence = db_rows()
+    persistence.save('', _FILE, jobs, DiGraph())
+    upsert_many = mocker.spy(persistence.db_manager, 'upsert_many')
+
+    jobs[1].status = Status.READY
+    jobs[2].fail_count = 1
+    jobs.pop(5)
+    persistence.save('', _FILE, jobs, DiGraph())
+
+    changed_rows, deleted_keys = upsert_many.call_args.args[1], upsert_many.call_args.args[3]
+    assert [row['name'] for row in changed_rows] == [jobs[1].name, jobs[2].name]
+    assert deleted_keys == [{'expid': _EXPID, 'name': f'{_EXPID}_5'}]
+    assert db_rows().load_statuses() == {job.name: job.status for job in jobs}
+
+
+@pytest.mark.parametrize('attribute', _PERSISTED_ATTRIBUTES)
+def test_db_rows_writes_a_job_with_any_attribute_changed(db_rows, jobs, attribute):
+    persistence = db_rows()
+    persistence.save('', _FILE, jobs, DiGraph())
+
+    setattr(jobs[1], attribute, Status.RUNNING)
+    persistence.save('', _FILE, jobs, DiGraph())
+
+    assert _saved_value(db_rows().load('', _FILE)[jobs[1].name], attribute) == Status.RUNNING
+
+
+def test_db_rows_first_save_removes_the_jobs_not_in_the_list(db_rows, jobs):
+    db_rows().save('', _FILE, jobs, DiGraph())
+
+    db_rows().save('', _FILE, jobs[:4], DiGraph())
+
+    assert db_rows().load('', _FILE).keys() == {job.name for job in jobs[:4]}
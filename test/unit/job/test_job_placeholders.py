@@ -0,0 +1,91 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.job.job_placeholders``."""
+
+import random
+import re
+
+import pytest
+
+from autosubmit.job.job_placeholders import (
+    _substitute_sequentially, compile_template, substitute_placeholders
+)
+
+_DEFAULTS = ['%d%', '%d_%', '%Y%', '%Y_%', '%M%', '%M_%', '%m%', '%m_%']
+
+
+def _sequential(content, parameters, undefined_variables=None):
+    """The substitution of the placeholders one after the other, the reference for the rendering."""
+    content = _substitute_sequentially(content, parameters, _DEFAULTS)
+    for variable in undefined_variables or []:
+        content = re.sub(r'%(?<!%%)' + variable + r'%(?!%%)', '', content, flags=re.I)
+    return content.replace('%%', '%')
+
+
+@pytest.mark.parametrize('content,parameters,expected', [
+    ('echo %EXPID% %expid%', {'EXPID': 'a000'}, 'echo a000 a000'),
+    ('date +%Y%m%d %CHUNK%', {'CHUNK': 1}, 'date +%Y%m%d 1'),
+    ('printf "%%s" %%EXPID%% %EXPID%', {'EXPID': 'a000'}, 'printf "%s" %EXPID% a000'),
+    ('%MISSING%|%EMPTY%|', {'EMPTY': ''}, '||'),
+    ('%A.B%', {'A.B': 'v'}, 'v'),
+    ('%PATH%', {'PATH': 'C:\\tmp\\a.b c'}, 'C:\\tmp\\a\\.b\\ c'),
+], ids=['case', 'dates', 'escaped', 'empty', 'dotted', 'backslash'])
+def test_substitute_placeholders(content, parameters, expected):
+    assert substitute_placeholders(content, parameters, _DEFAULTS) == expected
+    assert _sequential(content, parameters) == expected
+
+
+@pytest.mark.parametrize('content,parameters', [
+    ('%A% %B%', {'A': '%B%', 'B': 'b'}),
+    ('%A%%B% %B%', {'A': '', 'B': 'b'}),
+    ('%X%K% %K% %X%', {'K': 'k', 'X': 'x'}),
+    ('%A.B% %AXB% %A B%', {'A.B': '1', 'AXB': '2'}),
+    ('%A %X% C% %A.B.C%', {'X': 'B', 'A.B.C': 'v'}),
+    ('%d% %D%', {'D': 'day'}),
+], ids=['value-placeholder', 'joined', 'shared', 'wildcard', 'wildcards-around-value', 'default-case'])
+def test_substitute_placeholders_depending_on_the_order(content, parameters):
+    assert substitute_placeholders(content, parameters, _DEFAULTS) == _sequential(content, parameters)
+
+
+def test_substitute_placeholders_removes_undefined_variables():
+    content = '%A% %UNDEFINED% %undefined%'
+    assert substitute_placeholders(content, {'A': 'a'}, _DEFAULTS, ['UNDEFINED']) == 'a  '
+
+
+def test_compiled_template_renders_other_parameters():
+    content = '\n'.join(f'echo %VAR_{i}% %EXPERIMENT.VAR_{i}% $(date +%Y%m%d)' for i in range(100))
+    parameters = {f'VAR_{i}': i for i in range(100)}
+
+    compiled = compile_template(content, frozenset(_DEFAULTS))
+    assert compiled is not None
+    for values in [parameters, {**parameters, 'VAR_0': 'x'}]:
+        assert compiled.render(values) == _substitute_sequentially(content, values, _DEFAULTS)
+        assert substitute_placeholders(content, values, _DEFAULTS) == _sequential(content, values)
+
+
+def test_substitute_placeholders_as_the_sequential_substitution():
+    pieces = ['%', '%%', 'A', 'a', 'B', '.', '_', ' ', '\n', 'd', 'K', '%A%', '%A.B%', '%A.B.C%', '%AXB.C%',
+              '%a.b%', '%axb%', '%D%', '%d%', '%Y%', '%K%']
+    values = ['', 'v', '\\', 'a\\b.c', '%', '%A%', '%B%', 'A', 'x y', '%%', 'B%']
+    keys = ['A', 'B', 'A.B', 'AXB', 'A.B.C', 'AXB.C', 'D', 'C', 'K']
+    generator = random.Random(20)
+    for _ in range(2000):
+        content = ''.join(generator.choice(pieces) for _ in range(generator.randint(1, 12)))
+        parameters = {key: generator.choice(values) for key in keys if generator.random() < 0.7}
+        assert substitute_placeholders(content, parameters, _DEFAULTS, ['B']) == \
+               _sequential(content, parameters, ['B']), content
@@ -0,0 +1,103 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.job.job_polling``."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list import JobList
+from autosubmit.job.job_polling import PollingInterval
+
+_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def job_list(mocker):
+    job_list = mocker.MagicMock(spec=JobList)
+    job_list.get_delayed.return_value = []
+    job_list.get_running.return_value = []
+    job_list.get_queuing.return_value = []
+    return job_list
+
+
+def test_equal_bounds_give_a_fixed_interval(job_list):
+    polling = PollingInterval(10, 10)
+
+    assert [polling.next(job_list, changed=False, now=_NOW) for _ in range(3)] == [10, 10, 10]
+
+
+def test_interval_backs_off_while_idle_and_resets_on_changes(job_list):
+    polling = PollingInterval(10, 60)
+
+    intervals = [polling.next(job_list, changed, now=_NOW) for changed in (False, False, False, True, False)]
+
+    assert intervals == [20, 40, 60, 10, 20]
+
+
+def test_interval_is_capped_by_the_next_event(job_list):
+    running = Job('a000_SIM', 1, Status.RUNNING, 0)
+    running.start_time = _NOW - timedelta(seconds=100)
+    running._wallclock_in_seconds = 130
+    queuing = Job('a000_POST', 2, Status.QUEUING, 0)
+    queuing.estimated_start_time = _NOW + timedelta(seconds=45)
+    job_list.get_running.return_value = [running]
+    job_list.get_queuing.return_value = [queuing]
+    polling = PollingInterval(10, 600)
+    polling._idle_interval = 300
+
+    assert PollingInterval.seconds_to_next_event(job_list, _NOW) == 30
+    assert polling.next(job_list, changed=False, now=_NOW) == 30
+
+    running.start_time = _NOW
+    assert polling.next(job_list, changed=False, now=_NOW) == 45
+
+    job_list.get_queuing.return_value = []
+    delayed = Job('a000_CLEAN', 3, Status.DELAYED, 0)
+    delayed.delay_end = _NOW - timedelta(seconds=5)
+    job_list.get_delayed.return_value = [delayed]
+    assert polling.next(job_list, changed=False, now=_NOW) == 10
+
+
+def test_update_from_config(autosubmit_config):
+    as_conf = autosubmit_config('a000', experiment_data={})
+    as_conf.experiment_data['CONFIG'] = {'SAFETYSLEEPTIME': 15, 'MAX_SAFETYSLEEPTIME': 120}
+
+    polling = PollingInterval.from_config(as_conf)
+
+    assert (polling.min_interval, polling.max_interval) == (15, 120)
+
+    as_conf.experiment_data['CONFIG'] = {'SAFETYSLEEPTIME': 30}
+    polling.update_from_config(as_conf)
+    assert (polling.min_interval, polling.max_interval) == (30, 30)
+
+
+def test_intervals_are_written_to_the_metrics_file(job_list, tmp_path):
+    metrics_file = tmp_path / 'polling_intervals.csv'
+    polling = PollingInterval(10, 40, metrics_file)
+
+    polling.next(job_list, changed=True, now=_NOW)
+    polling.next(job_list, changed=False, now=_NOW)
+
+    assert metrics_file.read_text() == (
+        'time,interval,reason\n'
+        '2025-01-01T12:00:00,10,status changes\n'
+        '2025-01-01T12:00:00,20,idle\n'
+    )
@@ -0,0 +1,169 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.job.job_stats_journal``."""
+
+import random
+from datetime import datetime
+from pathlib import Path
+
+from autosubmit.autosubmit import Autosubmit
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.job.job_list import JobList
+from autosubmit.job.job_stats_journal import JOURNAL_FILENAME, StatsJournal, stats_journal
+
+
+def _write_legacy(path: Path, operation: str, text: str) -> None:
+    """Write a ``TOTAL_STATS`` file as ``write_submit_time``, ``write_start_time`` and ``write_end_time`` did."""
+    if operation == 'N':
+        exists = path.exists()
+        with open(path, 'a') as f:
+            f.write(f'\n{text}' if exists else text)
+    else:
+        with open(path, 'a') as f:
+            f.write(f' {text}')
+
+
+def test_read_is_the_content_of_the_legacy_files(tmp_path):
+    legacy_path, journal_path = tmp_path / 'legacy', tmp_path / 'tmp'
+    legacy_path.mkdir()
+    journal_path.mkdir()
+    journal = StatsJournal(journal_path)
+    generator = random.Random(24)
+    names = [f'a000_{i}_SIM_TOTAL_STATS' for i in range(10)]
+    # Some files were written by previous versions, and go on in the journal.
+    for name in names[:5]:
+        _write_legacy(journal_path / name, 'N', '20240101000000')
+        _write_legacy(legacy_path / name, 'N', '20240101000000')
+
+    for _ in range(500):
+        name = generator.choice(names)
+        operation = generator.choice('NA')
+        text = generator.choice(['20240101000000', '20240101000001 COMPLETED', '20240101000002 FAILED', ''])
+        _write_legacy(legacy_path / name, operation, text)
+        if operation == 'N':
+            journal.append_line(name, text)
+        else:
+            journal.append(name, text)
+
+        assert journal.read(name) == (legacy_path / name).read_text()
+    for name in names:
+        assert journal.readlines(name) == open(legacy_path / name).readlines()
+    assert journal.read('a000_UNKNOWN_TOTAL_STATS') is None
+    assert journal.readlines('a000_UNKNOWN_TOTAL_STATS') is None
+
+
+def test_index_reads_the_records_of_other_processes(tmp_path):
+    journal, other = StatsJournal(tmp_path), StatsJournal(tmp_path)
+    journal.append_line('a000_SIM_TOTAL_STATS', '1')
+    assert other.read('a000_SIM_TOTAL_STATS') == '1'
+
+    # A record is only read once it is complete.
+    with open(tmp_path / JOURNAL_FILENAME, 'a') as f:
+        f.write('A a000_SIM_TOTAL_STATS 2')
+    assert other.read('a000_SIM_TOTAL_STATS') == '1'
+    with open(tmp_path / JOURNAL_FILENAME, 'a') as f:
+        f.write(' COMPLETED\n')
+    assert other.read('a000_SIM_TOTAL_STATS') == '1 2 COMPLETED'
+
+    # The journal is read again when it is replaced.
+    (tmp_path / JOURNAL_FILENAME).unlink()
+    journal.append_line('a000_POST_TOTAL_STATS', '3')
+    assert other.read('a000_SIM_TOTAL_STATS') is None
+    assert other.read('a000_POST_TOTAL_STATS') == '3'
+
+
+def test_stat_files(tmp_path):
+    journal = stats_journal(tmp_path)
+    job = Job('a000_SIM', 1, Status.COMPLETED, 0)
+    job._tmp_path = str(tmp_path)
+    assert job.check_start_time() == 0
+
+    (tmp_path / 'a000_SIM_STAT_0').write_text('100\n200\n')
+    (tmp_path / 'a000_SIM_STAT_1').write_text('300\n')
+    journal.ingest(tmp_path / 'a000_SIM_STAT_0')
+    journal.ingest(tmp_path / 'a000_SIM_STAT_1')
+
+    assert not list(tmp_path.glob('*_STAT_*'))
+    assert (job.check_start_time(), job.check_end_time()) == (100, 200)
+    assert (job.check_start_time(1), job.check_end_time(1)) == (300, 0)
+
+    # A new run of the job with the same fail count.
+    journal.remove('a000_SIM_STAT_0')
+    assert job.check_start_time() == 0
+    (tmp_path / 'a000_SIM_STAT_0').write_text('400\n500\n')
+    journal.ingest(tmp_path / 'a000_SIM_STAT_0')
+    assert (job.check_start_time(), job.check_end_time()) == (400, 500)
+
+
+def test_total_stats(tmp_path):
+    job = Job('a000_SIM', 1, Status.COMPLETED, 0)
+    job._tmp_path = str(tmp_path)
+    journal = stats_journal(tmp_path)
+    journal.append_line('a000_SIM_TOTAL_STATS', '20240101000000')
+    journal.append('a000_SIM_TOTAL_STATS', '20240101000100 20240101000200 COMPLETED')
+    journal.append_line('a000_SIM_TOTAL_STATS', '20240101000300')
+    journal.append('a000_SIM_TOTAL_STATS', '20240101000400')
+
+    assert job.get_last_retrials() == [
+        [datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 0, 1), datetime(2024, 1, 1, 0, 2), 'COMPLETED'],
+        [datetime(2024, 1, 1, 0, 3), datetime(2024, 1, 1, 0, 4)]
+    ]
+    assert job.check_retrials_start_time() == [datetime(2024, 1, 1, 0, 1), datetime(2024, 1, 1, 0, 4)]
+    job.recover_last_ready_date()
+    assert job.ready_date == '20240101000300'
+    assert JobList._job_running_check(Status.RUNNING, 'a000_SIM', str(tmp_path))[:2] == (
+        datetime(2024, 1, 1, 0, 3), datetime(2024, 1, 1, 0, 4))
+
+
+def test_recover_last_ready_date_without_date(tmp_path):
+    job = Job('a000_SIM', 1, Status.READY, 0)
+    job._tmp_path = str(tmp_path)
+    journal = stats_journal(tmp_path)
+    journal.append_line('a000_SIM_TOTAL_STATS', 'FAILED')
+    journal.append_line('a000_INI_TOTAL_STATS', '20240101000000')
+
+    # The modification time of the journal is the one of the last record of any job.
+    job.recover_last_ready_date()
+    assert job.ready_date is None
+
+
+def test_migrate(tmp_path, mocker):
+    mocker.patch.object(BasicConfig, 'LOCAL_ROOT_DIR', str(tmp_path))
+    mocker.patch.object(BasicConfig, 'LOCAL_TMP_DIR', 'tmp')
+    mocker.patch('autosubmit.autosubmit.Autosubmit._check_ownership')
+    exp_tmp_path = tmp_path / 'a000' / 'tmp'
+    exp_tmp_path.mkdir(parents=True)
+    journal = stats_journal(exp_tmp_path)
+    (exp_tmp_path / 'a000_SIM_TOTAL_STATS').write_text('20240101000000 20240101000100')
+    journal.append('a000_SIM_TOTAL_STATS', '20240101000200 COMPLETED')
+    journal.append_line('a000_POST_TOTAL_STATS', '20240101000300')
+    (exp_tmp_path / 'a000_SIM_STAT_0').write_text('100\n200\n')
+    (exp_tmp_path / 'a000_INI_STAT_0').write_text('')
+    (exp_tmp_path / 'a000_SIM.cmd').write_text('')
+    contents = {name: journal.read(name) for name in
+                ['a000_SIM_TOTAL_STATS', 'a000_POST_TOTAL_STATS', 'a000_SIM_STAT_0', 'a000_INI_STAT_0']}
+
+    assert Autosubmit.migrate_stats('a000')
+
+    assert sorted(path.name for path in exp_tmp_path.iterdir()) == [JOURNAL_FILENAME, 'a000_SIM.cmd', 'autosubmit.lock']
+    assert {name: journal.read(name) for name in contents} == contents
+    assert {name: StatsJournal(exp_tmp_path).read(name) for name in contents} == contents
+    assert stats_journal(exp_tmp_path).migrate() == 0
+    assert {name: journal.read(name) for name in contents} == contents
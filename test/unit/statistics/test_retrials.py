@@ -0,0 +1,186 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.statistics.retrials``."""
+
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from bscearth.utils.date import date2str
+
+from autosubmit.config.basicconfig import BasicConfig
+from autosubmit.history.data_classes.job_data import JobData
+from autosubmit.history.database_managers.experiment_history_db_manager import SqlAlchemyExperimentHistoryDbManager
+from autosubmit.job.job import Job
+from autosubmit.job.job_common import Status
+from autosubmit.statistics.retrials import JobRetrials
+from autosubmit.statistics.statistics import Statistics
+
+_DST_CHANGE = 1711846800
+"""2024-03-31 01:00 UTC, when the clocks go forward in Madrid."""
+
+_STATS_ATTRIBUTES = [
+    'name', 'processors', 'submit_time', 'start_time', 'finish_time', 'completed_queue_time', 'completed_run_time',
+    'failed_queue_time', 'failed_run_time', 'retrial_count', 'completed_retrial_count', 'failed_retrial_count'
+]
+
+
+@pytest.fixture
+def madrid_time(monkeypatch):
+    """Use a time zone with daylight saving time, so the local times are not the timestamps."""
+    monkeypatch.setenv('TZ', 'Europe/Madrid')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _random_retrials(generator: random.Random, failed_before_start: bool) -> list[tuple[int, int, int, str]]:
+    """Submit, start, finish and status of the runs of a job, ``0`` for the times not written."""
+    retrials = []
+    submit = _DST_CHANGE + generator.randint(-6, 6) * 3600
+    kinds = ['COMPLETED', 'FAILED', 'RUNNING', 'SUBMITTED'] + (['NOT STARTED'] if failed_before_start else [])
+    for _ in range(generator.randint(1, 6)):
+        submit += generator.randint(0, 3600)
+        start = submit + generator.randint(-60, 3600)
+        finish = start + generator.randint(-60, 7200)
+        kind = generator.choice(kinds)
+        if kind == 'NOT STARTED':
+            retrials.append((submit, 0, finish, generator.choice(['FAILED', 'COMPLETED'])))
+        elif kind == 'RUNNING':
+            retrials.append((submit, start, 0, kind))
+        elif kind == 'SUBMITTED':
+            retrials.append((submit, 0, 0, kind))
+        else:
+            retrials.append((submit, start, finish, kind))
+        submit = max(submit, start, finish)
+    return retrials
+
+
+def _write_total_stats(job: Job, retrials: list[tuple[int, int, int, str]]) -> None:
+    """Write the ``TOTAL_STATS`` file as ``write_submit_time``, ``write_start_time`` and ``write_end_time`` do."""
+    lines = []
+    for submit, start, finish, status in retrials:
+        line = date2str(datetime.fromtimestamp(submit), 'S')
+        if start:
+            line += ' ' + date2str(datetime.fromtimestamp(start), 'S')
+        if finish:
+            line += ' ' + date2str(datetime.fromtimestamp(finish), 'S') + ' ' + status
+        lines.append(line)
+    Path(job._tmp_path, f'{job.name}_TOTAL_STATS').write_text('\n'.join(lines))
+
+
+def _create_jobs(tmp_path: Path, jobs_count: int, failed_before_start: bool = True):
+    generator = random.Random(23)
+    jobs, rows = [], []
+    for i in range(jobs_count):
+        job = Job(f'a000_{i}_SIM', i, Status.COMPLETED, 0)
+        job._tmp_path = str(tmp_path)
+        job.processors = str(generator.randint(1, 128))
+        job.wallclock = '02:00'
+        job.section = generator.choice(['INI', 'SIM', 'POST'])
+        job.date = generator.choice([datetime(2000, 1, 1), datetime(2000, 2, 1)])
+        if i % 7:
+            retrials = _random_retrials(generator, failed_before_start)
+            _write_total_stats(job, retrials)
+            rows.extend((job.name,) + retrial for retrial in retrials)
+        jobs.append(job)
+    rows.append(('a000_UNKNOWN', _DST_CHANGE, _DST_CHANGE + 1, _DST_CHANGE + 2, 'COMPLETED'))
+    # The rows are read in the order they were written, not grouped by job.
+    generator.shuffle(rows)
+    rows.sort(key=lambda row: row[1])
+    return jobs, rows
+
+
+def test_statistics_are_the_ones_of_the_total_stats_files(tmp_path, madrid_time):
+    jobs, rows = _create_jobs(tmp_path, 300)
+    queue_time_fixes = {job.name: 600 for job in jobs[::5]}
+
+    from_files = Statistics(jobs, None, None, queue_time_fixes).calculate_statistics().calculate_summary()
+    from_job_data = Statistics(jobs, None, None, queue_time_fixes, retrials=JobRetrials(rows)).\
+        calculate_statistics().calculate_summary()
+
+    assert len(from_job_data.jobs_stat) == len([job for job in jobs if job.get_last_retrials()])
+    for expected, job_stat in zip(from_files.jobs_stat, from_job_data.jobs_stat):
+        for attribute in _STATS_ATTRIBUTES:
+            assert getattr(job_stat, attribute) == getattr(expected, attribute), (job_stat.name, attribute)
+    assert from_job_data.summary.__dict__ == from_files.summary.__dict__
+    assert from_job_data.make_old_format().max_time == from_files.make_old_format().max_time
+
+
+def test_active_after_is_the_check_of_the_total_stats_files(tmp_path, madrid_time):
+    # A job that failed before starting has no end time in the TOTAL_STATS file, which Job.check_running_after can't parse.
+    jobs, rows = _create_jobs(tmp_path, 100, failed_before_start=False)
+    retrials = JobRetrials(rows)
+
+    for hours in range(-7, 8):
+        date_limit = datetime.fromtimestamp(_DST_CHANGE + hours * 3600 + 1799)
+        expected = {job.name for job in jobs
+                    if job.check_started_after(date_limit) or job.check_running_after(date_limit)}
+        assert retrials.active_after(date_limit) - {'a000_UNKNOWN'} == expected
+
+
+def test_last_retrials_start_after_the_previous_completed_one():
+    rows = [
+        ('a', 10, 20, 30, 'COMPLETED'),
+        ('b', 10, 0, 15, 'FAILED'),
+        ('a', 40, 50, 60, 'FAILED'),
+        ('a', 70, 80, 90, 'COMPLETED'),
+        ('a', 100, 110, 0, 'RUNNING'),
+        ('b', 20, 25, 30, 'COMPLETED'),
+    ]
+    retrials = JobRetrials(rows)
+
+    assert retrials.names.tolist() == ['a', 'b']
+    assert retrials.last_retrials.tolist() == [False, True, True, True, True, True]
+    assert retrials.completed.tolist() == [True, False, True, False, False, True]
+    assert retrials.last_of_job.tolist() == [3, 5]
+    # The finish time of a job that did not start is the second time of its line.
+    assert retrials.start[4] - retrials.submit[4] == 5
+    assert retrials.finish[4] == 0
+
+
+def test_no_retrials():
+    retrials = JobRetrials([])
+    statistics = Statistics([Job('a', 1, Status.COMPLETED, 0)], None, None, {}, retrials=retrials)
+
+    assert statistics.calculate_statistics().calculate_summary().jobs_stat == []
+    assert retrials.active_after(datetime.now()) == set()
+
+
+def test_load(tmp_path, monkeypatch):
+    monkeypatch.setattr(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    monkeypatch.setattr(BasicConfig, 'JOBDATA_DIR', str(tmp_path))
+    monkeypatch.setattr(BasicConfig, 'read', lambda: None)
+    assert JobRetrials.load('a000') is None
+
+    manager = SqlAlchemyExperimentHistoryDbManager('a000', str(tmp_path))
+    manager.initialize()
+    for counter, (name, submit, start, finish, status) in enumerate([
+        ('a000_SIM', 1000, 2000, 3000, 'COMPLETED'),
+        ('a000_INI', 1000, 0, 0, 'SUBMITTED'),
+        ('a000_POST', 1000, 1500, 0, 'RUNNING'),
+    ]):
+        manager._insert_job_data(JobData(0, counter=counter, job_name=name, submit=submit, start=start,
+                                          finish=finish, status=status))
+
+    assert JobRetrials.load('a000').names.tolist() == ['a000_INI', 'a000_POST', 'a000_SIM']
+    assert JobRetrials.load('a000', datetime.fromtimestamp(1000 + 86400)).names.tolist() == ['a000_POST', 'a000_SIM']
+    assert manager.select_retrials(1999) == [('a000_SIM', 1000, 2000, 3000, 'COMPLETED')]
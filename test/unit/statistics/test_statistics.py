@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import random
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Tuple
 
@@ -365,3 +366,40 @@ def test_build_failed_job_only(statistics: Statistics, failed_jobs, job_stats: L
     statistics.build_failed_jobs()
 
     assert statistics.failed_jobs_dict == failed_jobs
+
+
+def test_calculate_summary_adds_up_as_a_loop() -> None:
+    """Test that the summary has the same floating point sums as adding the values of the jobs in a loop."""
+    generator = random.Random(7)
+    jobs_stat = []
+    for i in range(500):
+        job_stat = JobStat(f"job_{i}", generator.randint(1, 2000), generator.random() * 48, "", "", "", "",
+                           "", "", "", "")
+        job_stat.completed_queue_time = timedelta(seconds=generator.randint(0, 10 ** 6))
+        job_stat.completed_run_time = timedelta(seconds=generator.randint(0, 10 ** 6),
+                                                microseconds=generator.randint(0, 999999))
+        job_stat.failed_queue_time = timedelta(seconds=generator.randint(0, 10 ** 5))
+        job_stat.failed_run_time = timedelta(seconds=generator.randint(0, 10 ** 5),
+                                             microseconds=generator.randint(0, 999999))
+        job_stat.retrial_count = generator.randint(1, 5)
+        job_stat.completed_retrial_count = generator.randint(0, 1)
+        job_stat.failed_retrial_count = job_stat.retrial_count - job_stat.completed_retrial_count
+        jobs_stat.append(job_stat)
+
+    expected = StatsSummary()
+    for job_stat_dict in (job_stat.get_as_dict() for job_stat in jobs_stat):
+        expected.submitted_count += job_stat_dict["submittedCount"]
+        expected.run_count += job_stat_dict["retrialCount"]
+        expected.completed_count += job_stat_dict["completedCount"]
+        expected.failed_count += job_stat_dict["failedCount"]
+        expected.expected_consumption += job_stat_dict["expectedConsumption"]
+        expected.real_consumption += job_stat_dict["realConsumption"]
+        expected.failed_real_consumption += job_stat_dict["failedRealConsumption"]
+        expected.expected_cpu_consumption += job_stat_dict["expectedCpuConsumption"]
+        expected.cpu_consumption += job_stat_dict["cpuConsumption"]
+        expected.failed_cpu_consumption += job_stat_dict["failedCpuConsumption"]
+        expected.total_queue_time += job_stat_dict["completedQueueTime"] + job_stat_dict["failedQueueTime"]
+    expected.calculate_consumption_percentage()
+
+    statistics = Statistics(jobs=[], start=None, end=None, queue_time_fix={}, jobs_stat=jobs_stat)
+    assert statistics.calculate_summary().summary.__dict__ == expected.__dict__
@@ -17,14 +17,18 @@
 
 """Tests for ``AutosubmitGit``."""
 
+import sqlite3
 from pathlib import Path
 from textwrap import dedent
+from threading import Event
+from time import sleep, time
 
 import pytest
 
 from autosubmit.autosubmit import Autosubmit
 from autosubmit.config.basicconfig import BasicConfig
-from autosubmit.log.log import AutosubmitCritical
+from autosubmit.job.job_common import Status
+from autosubmit.log.log import AutosubmitCritical, AutosubmitError
 from test.unit.conftest import AutosubmitConfigFactory
 
 
@@ -79,3 +83,98 @@ def test_database_backup_postgres(monkeypatch, autosubmit, mocker):
     mocked_log = mocker.patch('autosubmit.autosubmit.Log')
     autosubmit.database_backup('a000')
     assert mocked_log.debug.called
+
+
+class _FakePlatform:
+    """A platform whose ``check_all_jobs`` sleeps, or raises."""
+
+    def __init__(self, name: str, delay: float = 0, error: Exception = None, check_jobs_timeout: float = 600):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.check_jobs_timeout = check_jobs_timeout
+        self.checked = Event()
+
+    def check_all_jobs(self, job_list, as_conf):
+        sleep(self.delay)
+        self.checked.set()
+        if self.error:
+            raise self.error
+
+
+def test_check_platforms_jobs_checks_platforms_at_the_same_time(mocker):
+    platforms = [_FakePlatform(f'platform_{i}', delay=0.5) for i in range(4)]
+    jobs_to_check = {platform.name: [[mocker.Mock(), Status.RUNNING]] for platform in platforms}
+    mocker.patch.object(Autosubmit, '_platform_checks', {})
+
+    start = time()
+    checked, error = Autosubmit.check_platforms_jobs(platforms, jobs_to_check, mocker.Mock())
+
+    assert time() - start < 1.5
+    assert checked == platforms
+    assert error is None
+
+
+def test_check_platforms_jobs_isolates_errors_and_timeouts(mocker):
+    failing = _FakePlatform('failing', error=AutosubmitError('connection lost', 6000))
+    slow = _FakePlatform('slow', delay=1, check_jobs_timeout=0.1)
+    ok = _FakePlatform('ok')
+    idle = _FakePlatform('idle')
+    platforms = [failing, slow, ok, idle]
+    jobs_to_check = {platform.name: [[mocker.Mock(), Status.RUNNING]] for platform in [failing, slow, ok]}
+    mocker.patch.object(Autosubmit, '_platform_checks', {})
+
+    checked, error = Autosubmit.check_platforms_jobs(platforms, jobs_to_check, mocker.Mock())
+
+    assert checked == [ok]
+    assert error is failing.error
+    assert not idle.checked.is_set()
+
+    # The slow platform is not checked again, nor used, while its previous check is running.
+    checked, _ = Autosubmit.check_platforms_jobs([slow, ok], jobs_to_check, mocker.Mock())
+    assert checked == [ok]
+    assert Autosubmit.platforms_without_pending_check(platforms) == [failing, ok, idle]
+    assert slow.checked.wait(5)
+    Autosubmit._platform_checks['slow'].result(timeout=5)
+    assert Autosubmit.platforms_without_pending_check(platforms) == platforms
+
+
+def test_get_completed_job_names_checks_the_finished_jobs_at_once(mocker):
+    platform = mocker.Mock()
+    platform.get_completed_job_names.return_value = ['a000_1']
+    jobs = [mocker.Mock(new_status=status) for status in [Status.COMPLETED, Status.RUNNING, Status.UNKNOWN]]
+    for i, job in enumerate(jobs):
+        job.name = f'a000_{i}'
+    platform_jobs = [[job, Status.RUNNING] for job in jobs]
+
+    assert Autosubmit.get_completed_job_names(platform, platform_jobs) == {'a000_1'}
+    platform.get_completed_job_names.assert_called_once_with(['a000_0', 'a000_2'])
+
+    # Each job looks for its own file if the platform cannot do it at once.
+    platform.get_completed_job_names.side_effect = AutosubmitError('connection lost', 6000)
+    assert Autosubmit.get_completed_job_names(platform, platform_jobs) is None
+
+    platform.get_completed_job_names.reset_mock()
+    assert Autosubmit.get_completed_job_names(platform, platform_jobs[1:2]) == set()
+    assert not platform.get_completed_job_names.called
+
+
+def test_database_backup_and_fix_sqlite(monkeypatch, autosubmit, tmp_path):
+    """Test that a corrupted ``job_data`` database is restored from its backup."""
+    monkeypatch.setattr(BasicConfig, 'DATABASE_BACKEND', 'sqlite')
+    monkeypatch.setattr(BasicConfig, 'JOBDATA_DIR', str(tmp_path))
+    monkeypatch.setattr(BasicConfig, 'HISTORICAL_LOG_DIR', str(tmp_path))
+    database_path = tmp_path / 'job_data_a000.db'
+    with sqlite3.connect(database_path) as connection:
+        connection.execute('CREATE TABLE notes (note TEXT)')
+        connection.execute("INSERT INTO notes VALUES ('kept')")
+    connection.close()
+
+    autosubmit.database_backup('a000')
+    database_path.write_bytes(b'corrupted')
+
+    assert autosubmit.database_fix('a000')
+    assert (tmp_path / 'job_data_a000_corrupted.db').read_bytes() == b'corrupted'
+    connection = sqlite3.connect(database_path)
+    assert connection.execute('SELECT note FROM notes').fetchall() == [('kept',)]
+    connection.close()
@@ -23,6 +23,7 @@ from pathlib import Path
 import pytest
 
 from autosubmit.autosubmit import AutosubmitCritical
+from autosubmit.job.job_stats_journal import stats_journal
 
 _EXPID = 'a000'
 
@@ -164,7 +165,46 @@ def test_is_jobs_out_tail(mocker, autosubmit, exp_logs_dir):
         assert args[0] == 'tail'
         assert str(args[-1]) == str(log_file)
 
-        # --- command-line
+
+@pytest.mark.parametrize('inspect', [False, True])
+def test_is_jobs_status_in_stats_journal(mocker, autosubmit, exp_path, as_conf, capsys, inspect):
+    popen = mocker.patch('subprocess.Popen')
+    journal = stats_journal(exp_path / as_conf.basic_config.LOCAL_TMP_DIR)
+    journal.append_line(f'{_EXPID}_INI_TOTAL_STATS', '20240101000000')
+    journal.append(f'{_EXPID}_INI_TOTAL_STATS', '20240101000100 20240101000200 COMPLETED')
+
+    assert autosubmit.cat_log(f'{_EXPID}_INI', file='s', mode='c', inspect=inspect)
+    assert not popen.called
+    assert capsys.readouterr().out == '20240101000000 20240101000100 20240101000200 COMPLETED\n'
+
+
+def test_is_jobs_status_tail_in_stats_journal(mocker, autosubmit, exp_path, as_conf, capsys):
+    journal = stats_journal(exp_path / as_conf.basic_config.LOCAL_TMP_DIR)
+    journal.append_line(f'{_EXPID}_INI_TOTAL_STATS', '20240101000000')
+
+    def _sleep(_):
+        if journal.read(f'{_EXPID}_INI_TOTAL_STATS').endswith('COMPLETED'):
+            raise KeyboardInterrupt
+        journal.append(f'{_EXPID}_INI_TOTAL_STATS', '20240101000100 20240101000200 COMPLETED')
+
+    mocker.patch('autosubmit.autosubmit.sleep', side_effect=_sleep)
+    assert autosubmit.cat_log(f'{_EXPID}_INI', file='s', mode='t')
+    assert capsys.readouterr().out == '20240101000000 20240101000100 20240101000200 COMPLETED\n'
+
+
+@pytest.mark.parametrize('inspect', [False, True])
+def test_is_jobs_status_legacy_file(mocker, autosubmit, exp_path, as_conf, capsys, inspect):
+    popen = mocker.patch('subprocess.Popen')
+    tmp_dir = exp_path / as_conf.basic_config.LOCAL_TMP_DIR
+    (tmp_dir / f'{_EXPID}_INI_TOTAL_STATS').write_text('20240101000000 20240101000100 20240101000200 FAILED')
+    stats_journal(tmp_dir).append_line(f'{_EXPID}_INI_TOTAL_STATS', '20240102000000')
+
+    assert autosubmit.cat_log(f'{_EXPID}_INI', file='s', mode='c', inspect=inspect)
+    assert not popen.called
+    assert capsys.readouterr().out == '20240101000000 20240101000100 20240101000200 FAILED\n20240102000000\n'
+
+
+# --- command-line
 
 
 def test_command_line_help(mocker, autosubmit):
@@ -26,8 +26,9 @@ from autosubmit.job.job import Job
 from autosubmit.job.job_common import Status
 from autosubmit.monitor.diagram import (
     JobData, JobAggData, build_legends, create_bar_diagram, create_csv_stats, create_stats_report, populate_statistics,
-    _get_status, _filter_by_status, _seq
+    _aggregate_jobs_by_section, _get_job_list_data, _get_status, _filter_by_status, _seq
 )
+from autosubmit.statistics.jobs_stat import JobStat
 
 _EXPID = 't001'
 
@@ -275,3 +276,32 @@ def test_get_status(jobs: list[Job], job_name: str, status: int, expected: str):
 def test_filter_by_status(jobs: list[Job], expected_length: int):
     """Test that jobs are filtered by status (only completed and running)."""
     assert len(_filter_by_status(jobs)) == expected_length
+
+
+def test_aggregate_jobs_by_section():
+    """Test that the jobs are added up by section, in the order of the sections in the job list."""
+    jobs = []
+    jobs_stats = []
+    for name, section, status, queue_seconds, run_seconds in [
+        ('a', 'SIM', Status.COMPLETED, 60, 3600),
+        ('b', 'INI', Status.COMPLETED, 30, 90000),
+        ('c', 'SIM', Status.COMPLETED, 120, 7200),
+        ('d', 'SIM', Status.FAILED, 1000, 1000),
+    ]:
+        job = Job(name, 1, status)
+        job.section = section
+        jobs.append(job)
+        job_stat = JobStat(name, 1, 1.0, section, '', '', '', '', '', '', '')
+        job_stat.completed_queue_time = datetime.timedelta(seconds=queue_seconds)
+        job_stat.completed_run_time = datetime.timedelta(seconds=run_seconds)
+        jobs_stats.append(job_stat)
+
+    assert [job_agg_data.values() for job_agg_data in _aggregate_jobs_by_section(jobs, jobs_stats[::-1])] == [
+        ['SIM', 2, '00:03:00', '00:01:30', '03:00:00', '01:30:00'],
+        ['INI', 1, '00:00:30', '00:00:30', '1 day - 01:00:00', '1 day - 01:00:00']
+    ]
+    assert [job_data.values() for job_data in _get_job_list_data(jobs, jobs_stats)] == [
+        ['a', '00:01:00', '01:00:00', 'COMPLETED'],
+        ['b', '00:00:30', '1 day - 01:00:00', 'COMPLETED'],
+        ['c', '00:02:00', '02:00:00', 'COMPLETED']
+    ]
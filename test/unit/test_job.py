@@ -35,10 +35,13 @@ from mock.mock import patch  # type: ignore
 from autosubmit.autosubmit import Autosubmit
 from autosubmit.config.configcommon import AutosubmitConfig
 from autosubmit.config.configcommon import BasicConfig, YAMLParserFactory
+from autosubmit.database.tables import JobPackageTable, WrapperJobPackageTable
 from autosubmit.job.job import Job, WrapperJob
 from autosubmit.job.job_common import Status
 from autosubmit.job.job_list import JobList
 from autosubmit.job.job_list_persistence import JobListPersistencePkl
+from autosubmit.job.job_package_persistence import JobPackagePersistence
+from autosubmit.job.job_stats_journal import stats_journal
 from autosubmit.job.job_utils import calendar_chunk_section
 from autosubmit.job.job_utils import get_job_package_code, SubJob, SubJobManager
 from autosubmit.job.template import Language
@@ -1206,6 +1209,26 @@ def test_update_parameters_current_variables(autosubmit_config, experiment_data,
         assert parameters[key] == value
 
 
+def test_update_parameters_exports_the_configuration_once(autosubmit_config, mocker):
+    experiment_data = {
+        'JOBS': {'RANDOM-SECTION': {'FILE': 'test.sh', 'PLATFORM': 'DUMMY_PLATFORM', 'TEST': '%OTHER%'}},
+        'PLATFORMS': {'dummy_platform': {'type': 'ps', 'whatever': 'dummy_value'}},
+        'OTHER': '%CURRENT_WHATEVER%/%JOBNAME%',
+        'ROOTDIR': 'dummy_rootdir',
+    }
+    job, as_conf, parameters = create_job_and_update_parameters(autosubmit_config, experiment_data)
+    deep_parameters_export = mocker.spy(as_conf, 'deep_parameters_export')
+    other_job = Job('B', '2', 0, 1)
+    other_job.section = job.section
+    other_job.platform = job.platform
+
+    other_parameters = other_job.update_parameters(as_conf, set_attributes=True)
+
+    assert deep_parameters_export.call_count == 0
+    assert (parameters['CURRENT_TEST'], other_parameters['CURRENT_TEST']) == ('dummy_value/A', 'dummy_value/B')
+    assert job.update_parameters(as_conf, set_attributes=True) == parameters
+
+
 @pytest.mark.parametrize('test_with_file, file_is_empty, last_line_empty', [
     (False, False, False),
     (True, True, False),
@@ -1397,18 +1420,49 @@ def test_no_start_time(autosubmit_config, experiment_data):
     assert isinstance(job.start_time, datetime)
 
 
+def _save_package(persistence: JobPackagePersistence, package_name: str, jobs: list[Job]) -> None:
+    package = Mock(jobs=jobs, _expid=jobs[0].expid, _wallclock='00:30')
+    package.name = package_name
+    persistence.save(package)
+
+
 def test_get_job_package_code(autosubmit_config):
     autosubmit_config('dummy', {})
     experiment_id = 'dummy'
     job = Job(experiment_id, '1', 0, 1)
 
-    with patch("autosubmit.job.job_utils.JobPackagePersistence") as mock_persistence:
-        mock_persistence.return_value.load.return_value = [
-            ['dummy', '0005_job_packages', 'dummy']
-        ]
-        code = get_job_package_code(job.expid, job.name)
+    _save_package(JobPackagePersistence(experiment_id), 'dummy_ASThread_0005_1_1', [job])
+    code = get_job_package_code(job.expid, job.name)
+
+    assert code == 5
+    assert get_job_package_code(job.expid, 'other') == 0
 
-        assert code == 5
+
+def test_get_job_package_code_reads_the_packages_once(autosubmit_config, mocker):
+    autosubmit_config('a000', {})
+    first, second, third = [Job(f'a000_{i}', i, 0, 1) for i in range(3)]
+    persistence = JobPackagePersistence('a000')
+    _save_package(persistence, 'a000_ASThread_0005_1_1', [first])
+    load = mocker.spy(persistence, 'load')
+    count = mocker.spy(persistence.db_manager, 'count')
+
+    assert get_job_package_code('a000', first.name) == 5
+    assert get_job_package_code('a000', second.name) == 0
+    assert load.call_count == 2
+    # The database file did not change, the rows are not counted again.
+    assert count.call_count == 2
+
+    # Saved by this process, the package is added to the ones read.
+    _save_package(persistence, 'a000_ASThread_0006_1_1', [second])
+    assert get_job_package_code('a000', second.name) == 6
+    assert load.call_count == 2
+
+    # Saved by another process, the tables are read again.
+    row = {'exp_id': 'a000', 'package_name': 'a000_ASThread_0007_1_1', 'job_name': third.name, 'wallclock': '00:30'}
+    for table in [JobPackageTable.name, WrapperJobPackageTable.name]:
+        persistence.db_manager.insert_many(table, [row])
+    assert get_job_package_code('a000', third.name) == 7
+    assert load.call_count == 4
 
 
 def test_sub_job_instantiation(tmp_path, autosubmit_config):
@@ -1636,13 +1690,15 @@ def test_write_submit_time_ignore_exp_history(total_stats_exists: bool, autosubm
     job.write_submit_time()
 
     # It will exist regardless of the argument ``total_stats_exists``, as ``write_submit_time()``
-    # must have created it.
-    assert total_stats.exists()
+    # must have created it in the stats journal.
+    content = stats_journal(tmp_path).read(total_stats.name)
+    assert content is not None
+    assert total_stats.exists() == total_stats_exists
 
     # When the file already exists, it will append a new line. Otherwise,
     # a new file is created with a single line.
     expected_lines = 2 if total_stats_exists else 1
-    assert len(total_stats.read_text().split('\n')) == expected_lines
+    assert len(content.split('\n')) == expected_lines
 
 
 @pytest.mark.parametrize(
@@ -1683,8 +1739,9 @@ def test_write_end_time_ignore_exp_history(completed: bool, existing_lines: str,
     job.write_end_time(completed=completed, count=count)
 
     # It will exist regardless of the argument ``total_stats_exists``, as ``write_submit_time()``
-    # must have created it.
-    assert total_stats.exists()
+    # must have created it in the stats journal.
+    content = stats_journal(tmp_path).read(total_stats.name)
+    assert content is not None
 
     # When the file already exists, it will append new content. It must never
     # delete the existing lines, so this assertion just verifies the content
@@ -1694,7 +1751,8 @@ def test_write_end_time_ignore_exp_history(completed: bool, existing_lines: str,
     else:
         lines = 0
     expected_lines = lines + 1
-    assert len(total_stats.read_text().split('\n')) == expected_lines
+    assert len(content.split('\n')) == expected_lines
+    assert content.endswith(' COMPLETED' if completed else ' FAILED')
 
 
 def test_job_repr():
@@ -1814,6 +1872,23 @@ def test_update_status_logs(status: Status, autosubmit_config, mocker):
     assert mocked_log.info.call_args_list[0][0][0] == f'Job {job.name} is {Status.VALUE_TO_KEY[status].upper()}'
 
 
+@pytest.mark.parametrize('completed_job_names,expected', [
+    ({'t000_1'}, Status.COMPLETED),
+    (set(), Status.FAILED),
+], ids=['completed file', 'no completed file'])
+def test_update_status_with_completed_job_names(completed_job_names, expected, autosubmit_config, mocker):
+    """Test that the COMPLETED files found for a batch of jobs are not looked for again."""
+    as_conf = autosubmit_config('t000', experiment_data={})
+    job = Job('t000_1', '1', status=Status.RUNNING, priority=0, loaded_data=None)
+    job.new_status = Status.COMPLETED
+    job.platform = mocker.MagicMock()
+    job.platform.name = 'local'
+    mocker.patch('autosubmit.job.job.ExperimentHistory')
+
+    assert job.update_status(as_conf, completed_job_names=completed_job_names) == expected
+    assert not job.platform.get_completed_job_names.called
+
+
 @pytest.mark.parametrize(
     'has_completed_files,job_id',
     [
@@ -18,9 +18,10 @@
 """Tests for the ``JobList`` class."""
 
 import shutil
+from datetime import datetime
 from copy import copy
 from pathlib import Path
-from random import randrange
+from random import Random, randrange
 
 import networkx
 import pytest
@@ -813,3 +814,161 @@ def test_retrieve_times(job_list, jobs_as_dict, tmp_path, make_exception, second
                                                     job_times=None, seconds=seconds, job_data_collection=None)
             assert retrieve_data.name == job.name
             assert retrieve_data.status == Status.VALUE_TO_KEY[job.status]
+
+
+@pytest.fixture
+def coordinates_job_list(as_conf):
+    """A job list with two sections, one date, two members, and two chunks."""
+    job_list = JobList(_EXPID, as_conf, YAMLParserFactory(), JobListPersistencePkl())
+    date = datetime(2000, 1, 1)
+    for section in ["SIM", "POST"]:
+        for member in ["fc0", "fc1"]:
+            for chunk in [1, 2]:
+                job = Job(f"{_EXPID}_20000101_{member}_{chunk}_{section}", chunk, Status.WAITING, 0)
+                job.section = section
+                job.date = date
+                job.member = member
+                job.chunk = chunk
+                job_list._job_list.append(job)
+    job = Job(f"{_EXPID}_INI", 0, Status.READY, 0)
+    job.section = "INI"
+    job_list._job_list.append(job)
+    return job_list
+
+
+def test_get_job_by_name_uses_the_index(coordinates_job_list):
+    name = f"{_EXPID}_20000101_fc1_2_POST"
+    job = coordinates_job_list.get_job_by_name(name)
+
+    assert job.name == name
+    assert coordinates_job_list.get_job_by_name("unknown") is None
+
+
+def test_get_jobs_by_coordinates(coordinates_job_list):
+    jobs = coordinates_job_list.get_jobs_by_coordinates(
+        sections=lambda section: section == "SIM",
+        members=lambda member: member == "fc1")
+    assert [job.name for job in jobs] == [f"{_EXPID}_20000101_fc1_1_SIM", f"{_EXPID}_20000101_fc1_2_SIM"]
+
+    jobs = coordinates_job_list.get_jobs_by_coordinates(
+        dates=lambda date: not date, members=lambda member: not member)
+    assert [job.name for job in jobs] == [f"{_EXPID}_INI"]
+
+
+def test_get_job_related(coordinates_job_list):
+    jobs = coordinates_job_list.get_job_related(
+        select_jobs_by_name=f"{_EXPID}_20000101_fc0_1_SIM 20000101_fc1_2_POST",
+        select_all_jobs_by_section="INI",
+        filter_jobs_by_section="SIM[20000101[C:2]]")
+
+    assert sorted(job.name for job in jobs) == sorted([
+        f"{_EXPID}_20000101_fc0_1_SIM",
+        f"{_EXPID}_20000101_fc0_2_SIM",
+        f"{_EXPID}_20000101_fc1_2_POST",
+        f"{_EXPID}_20000101_fc1_2_SIM",
+        f"{_EXPID}_INI"
+    ])
+
+
+def test_jobs_named_in_follow_the_text(coordinates_job_list):
+    names = [f"{_EXPID}_20000101_fc1_2_POST", f"{_EXPID}_INI", f"{_EXPID}_20000101_fc0_1_SIM"]
+
+    jobs = coordinates_job_list.get_job_related(select_jobs_by_name=" ".join(names + names[:1]))
+
+    assert [job.name for job in jobs] == names
+
+
+def test_index_is_consistent_after_removing_jobs(coordinates_job_list):
+    coordinates_job_list.get_all()
+    job = coordinates_job_list.get_job_by_name(f"{_EXPID}_20000101_fc0_1_SIM")
+    job.rerun_only = "true"
+
+    coordinates_job_list._remove_job(job)
+
+    assert coordinates_job_list.get_job_by_name(job.name) is None
+    assert job not in coordinates_job_list.get_jobs_by_section(["SIM"])
+    assert job not in coordinates_job_list.get_waiting()
+    assert len(coordinates_job_list.get_jobs_by_section(["SIM"])) == 3
+
+
+def _legacy_update_waiting_jobs(job_list: list[Job]) -> None:
+    """The WAITING jobs check of ``JobList.update_list`` before the parents were counted by status."""
+    for job in [job for job in job_list if job.status == Status.WAITING]:
+        tmp = [parent for parent in job.parents if parent.status in [Status.COMPLETED, Status.SKIPPED]]
+        tmp2 = [parent for parent in job.parents if
+                parent.status in [Status.COMPLETED, Status.SKIPPED, Status.FAILED]]
+        tmp3 = [parent for parent in job.parents if parent.status in [Status.SKIPPED, Status.FAILED]]
+        failed_ones = [parent for parent in job.parents if parent.status == Status.FAILED]
+        if len(tmp) == len(job.parents):
+            job.status = Status.READY
+        if job.status != Status.READY:
+            if len(tmp3) != len(job.parents):
+                if len(tmp2) == len(job.parents):
+                    strong_dependencies_failure = False
+                    weak_dependencies_failure = False
+                    for parent in failed_ones:
+                        if parent.name in job.edge_info and job.edge_info[parent.name].get('optional', False):
+                            weak_dependencies_failure = True
+                        elif parent.section in job.dependencies:
+                            strong_dependencies_failure = True
+                            break
+                    if not strong_dependencies_failure and weak_dependencies_failure:
+                        job.status = Status.READY
+                        break
+            elif len(tmp3) == 1 and len(job.parents) == 1:
+                parent = next(iter(job.parents))
+                if parent.name in job.edge_info and job.edge_info[parent.name].get('optional', False):
+                    job.status = Status.READY
+
+
+def _random_workflow(seed: int) -> list[Job]:
+    rng = Random(seed)
+    jobs = []
+    for i in range(60):
+        job = Job(f"{_EXPID}_{i}", i, Status.WAITING, 0)
+        job.section = rng.choice(["SIM", "POST"])
+        job.dependencies = {"SIM": None}
+        for parent in rng.sample(jobs, min(len(jobs), rng.randrange(4))):
+            job.add_parent(parent)
+            if rng.random() < 0.3:
+                job.edge_info[parent.name] = {'optional': True}
+        jobs.append(job)
+    return jobs
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_update_waiting_jobs_decides_like_the_full_scan(as_conf, seed):
+    expected_jobs = _random_workflow(seed)
+    job_list = JobList(_EXPID, as_conf, YAMLParserFactory(), JobListPersistencePkl())
+    job_list._job_list = _random_workflow(seed)
+    rng = Random(seed)
+
+    for _ in range(30):
+        for position in rng.sample(range(len(expected_jobs)), 5):
+            status = rng.choice([Status.WAITING, Status.READY, Status.RUNNING, Status.COMPLETED,
+                                 Status.FAILED, Status.SKIPPED])
+            expected_jobs[position].status = status
+            job_list._job_list[position].status = status
+
+        _legacy_update_waiting_jobs(expected_jobs)
+        job_list._update_waiting_jobs()
+
+        assert [job.status for job in job_list._job_list] == [job.status for job in expected_jobs]
+
+
+def test_update_waiting_jobs_only_checks_changed_jobs(coordinates_job_list, mocker):
+    ini = coordinates_job_list.get_job_by_name(f"{_EXPID}_INI")
+    sims = coordinates_job_list.get_jobs_by_section(["SIM"])
+    for sim in sims:
+        sim.add_parent(ini)
+    coordinates_job_list._update_waiting_jobs()
+    parent_counts = mocker.spy(coordinates_job_list._index, "parent_counts")
+
+    coordinates_job_list._update_waiting_jobs()
+    assert parent_counts.call_count == 0
+
+    ini.status = Status.COMPLETED
+    coordinates_job_list._update_waiting_jobs()
+
+    assert parent_counts.call_count == len(sims)
+    assert all(sim.status == Status.READY for sim in sims)
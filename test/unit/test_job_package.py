@@ -239,3 +239,23 @@ def test_job_package_submission(mocker, local, tmp_path):
     job_package._create_scripts.is_called_once_with()
     job_package._send_files.is_called_once_with()
     job_package._do_submission.is_called_once_with()
+
+
+def test_send_files_of_the_packages_together(jobs, platform, create_job_package_wrapper, mocker):
+    jobs[0].additional_files = ['dummy1_config.yml']
+    jobs[1].additional_files = []
+    mocker.patch.object(Job, 'construct_real_additional_file_name', autospec=True, side_effect=lambda job, f: f)
+    simple = JobPackageSimple(jobs)
+    simple._job_scripts = {job.name: f'{job.name}.cmd' for job in jobs}
+    wrapper = create_job_package_wrapper({'TYPE': 'vertical'})
+    wrapper._job_scripts = simple._job_scripts
+    wrapper._common_script = 'a000_ASThread_0.cmd'
+
+    simple._send_files()
+    wrapper._send_files()
+
+    assert [call.args[0] for call in platform.send_files.call_args_list] == [
+        ['dummy1.cmd', 'dummy1_config.yml', 'dummy2.cmd'],
+        ['dummy1.cmd', 'dummy2.cmd', 'a000_ASThread_0.cmd']
+    ]
+    assert not platform.send_file.called
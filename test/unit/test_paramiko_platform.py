@@ -15,8 +15,15 @@
 # You should have received a copy of the GNU General Public License
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
+import gzip
+import hashlib
+import re
+import shlex
+import subprocess
+import threading
 from getpass import getuser
 from pathlib import Path
+from queue import Queue
 from tempfile import TemporaryDirectory
 from typing import Generator, Optional
 
@@ -495,3 +502,316 @@ def test_get_file_errors(exception_message: bool, must_exist: bool, ignore_log:
         assert mocked_log.printlog.call_count == 0
     else:
         assert mocked_log.printlog.call_count == len(messages)
+
+
+def test_get_completed_job_names_in_chunks(paramiko_platform: ParamikoPlatform, mocker):
+    paramiko_platform.remote_log_dir = '/scratch/a000/LOG_a000'
+    job_names = [f'a000_{i}_SIM' for i in range(10_000)]
+    completed_files = {f'{name}_COMPLETED' for name in job_names[::2]}
+    commands = []
+
+    def send_command(command, *_, **__):
+        commands.append(command)
+        found = [name for name in re.findall(r"-name '(\S+)'", command) if name in completed_files]
+        paramiko_platform._ssh_output = '\n'.join(f'/scratch/a000/LOG_a000/{name}' for name in found)
+        return True
+
+    mocker.patch.object(paramiko_platform, 'send_command', side_effect=send_command)
+
+    completed = paramiko_platform.get_completed_job_names(job_names)
+
+    assert len(commands) > 1
+    assert all(len(command) < 128 * 1024 for command in commands)
+    assert completed == job_names[::2]
+
+
+def _log_transfer_platform(paramiko_platform: ParamikoPlatform, mocker, tmp_path: Path) -> ParamikoPlatform:
+    paramiko_platform.remote_log_dir = str(tmp_path / 'remote' / 'LOG_a000')
+    paramiko_platform.remove_log_files_on_transfer = True
+    mocker.patch.object(ParamikoPlatform, 'tmp_path', str(tmp_path / 'local'), create=True)
+    paramiko_platform._ftpChannel = mocker.MagicMock()
+    paramiko_platform._ftpChannel.get.side_effect = lambda remote, local: Path(local).write_text(Path(remote).name)
+    return paramiko_platform
+
+
+def _md5sum(paths: list[str]) -> str:
+    return ''.join(f'{hashlib.md5(Path(path).name.encode()).hexdigest()}  {path}\n' for path in paths)
+
+
+def test_get_file_validates_the_checksum_on_the_platform(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _log_transfer_platform(paramiko_platform, mocker, tmp_path)
+    mismatch = f'{platform.remote_log_dir}/a000_POST.cmd.err'
+
+    def send_command(command, *_, **__):
+        paths = shlex.split(command)[2:]
+        platform._ssh_output = _md5sum(paths).replace(hashlib.md5(b'a000_POST.cmd.err').hexdigest(), '0' * 32)
+        return True
+
+    send_command = mocker.patch.object(platform, 'send_command', side_effect=send_command)
+
+    with platform.log_transfer_batch():
+        assert platform.get_file('a000_SIM.cmd.out', relative_path='LOG_a000')
+        assert platform.get_file('a000_POST.cmd.err', relative_path='LOG_a000')
+        assert not platform._ftpChannel.remove.called
+
+    send_command.assert_called_once()
+    platform._ftpChannel.remove.assert_called_once_with(f'{platform.remote_log_dir}/a000_SIM.cmd.out')
+    assert mismatch not in [call.args[0] for call in platform._ftpChannel.remove.call_args_list]
+    # The remote files are not read back.
+    assert not platform._ftpChannel.file.called
+
+
+def test_get_file_streams_the_file_without_md5sum(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _log_transfer_platform(paramiko_platform, mocker, tmp_path)
+    send_command = mocker.patch.object(platform, 'send_command',
+                                       side_effect=AutosubmitError('md5sum: command not found', 7052))
+    checksum_validation = mocker.patch.object(platform, '_checksum_validation', return_value=True)
+
+    assert platform.get_file('a000_SIM.cmd.out', relative_path='LOG_a000')
+    assert platform.get_file('a000_SIM.cmd.err.gz', relative_path='LOG_a000')
+
+    # md5sum is not tried again.
+    send_command.assert_called_once()
+    assert checksum_validation.call_count == 2
+    assert platform._ftpChannel.remove.call_count == 2
+
+
+@pytest.mark.parametrize('compress', [False, True], ids=['plain', 'gzip'])
+def test_retrieve_logfiles_in_bulk(compress: bool, paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    remote_dir = tmp_path / 'remote' / 'LOG_a000'
+    remote_dir.mkdir(parents=True)
+    local_dir = Path(paramiko_platform.tmp_path)
+    paramiko_platform.remote_log_dir = str(remote_dir)
+    paramiko_platform.compress_remote_logs = compress
+    paramiko_platform._ftpChannel = mocker.MagicMock()
+    paramiko_platform._ftpChannel.get.side_effect = lambda remote, local: Path(local).write_bytes(
+        Path(remote).read_bytes())
+    commands = []
+
+    def send_command(command, *_, **__):
+        commands.append(command)
+        result = subprocess.run(['bash', '-c', command], capture_output=True, text=True)
+        paramiko_platform._ssh_output = result.stdout
+        return True
+
+    mocker.patch.object(paramiko_platform, 'send_command', side_effect=send_command)
+
+    jobs = []
+    for i, name in enumerate(['a000_SIM', 'a000_POST', 'a000_CLEAN']):
+        job = Job(name, i + 1, Status.COMPLETED, 0)
+        job.local_logs = (f'{name}.20251017000000.out', f'{name}.20251017000000.err')
+        jobs.append(job)
+        if name != 'a000_CLEAN':
+            (remote_dir / f'{name}.cmd.out.0').write_text(f'{name} out\n')
+            (remote_dir / f'{name}.cmd.err.0').write_text(f'{name} err\n')
+            (remote_dir / f'{name}_STAT_0').write_text('1\n2\n')
+
+    retrieved = paramiko_platform.retrieve_logfiles_in_bulk(jobs)
+
+    assert retrieved == set(jobs[:2])
+    assert paramiko_platform._ftpChannel.get.call_count == 1
+    extension = '.gz' if compress else ''
+    sim = jobs[0]
+    assert sim.local_logs == (f'a000_SIM.20251017000000.out{extension}', f'a000_SIM.20251017000000.err{extension}')
+    out_file = local_dir / 'LOG_a000' / sim.local_logs[0]
+    content = gzip.decompress(out_file.read_bytes()) if compress else out_file.read_bytes()
+    assert content == b'[INFO] JOBID=1\n\na000_SIM out\n'
+    assert (local_dir / 'a000_POST_STAT_0').read_text() == '1\n2\n'
+    assert paramiko_platform._prefetched_stat_files == {'a000_SIM_STAT_0', 'a000_POST_STAT_0'}
+    # The logs stay on the platform with their new names, the archive is removed.
+    assert sorted(path.name for path in remote_dir.iterdir()) == sorted(
+        [f'{name}.20251017000000.{log}{extension}' for name in ('a000_SIM', 'a000_POST') for log in ('out', 'err')]
+        + ['a000_SIM_STAT_0', 'a000_POST_STAT_0'])
+    assert not list(local_dir.glob('*.tar'))
+
+    # The STAT files are not transferred again.
+    assert paramiko_platform.get_stat_file(sim)
+    assert paramiko_platform._ftpChannel.get.call_count == 1
+
+
+def test_recover_job_log_in_bulk(paramiko_platform: ParamikoPlatform, mocker):
+    paramiko_platform.bulk_log_recovery = True
+    paramiko_platform.recovery_queue = Queue()
+    for i, name in enumerate(['a000_SIM', 'a000_POST']):
+        paramiko_platform.recovery_queue.put(Job(name, i + 1, Status.COMPLETED, 0).__getstate__())
+    retrieve_logfiles_in_bulk = mocker.patch.object(
+        paramiko_platform, 'retrieve_logfiles_in_bulk', side_effect=lambda jobs: {jobs[0]})
+    process_retrieved_logfiles = mocker.patch.object(Job, 'process_retrieved_logfiles', autospec=True)
+    download_logfiles = mocker.patch.object(Job, 'download_logfiles', autospec=True, return_value=(0, True))
+    mocker.patch.object(paramiko_platform, 'get_stat_file', return_value=True)
+
+    pending = paramiko_platform.recover_job_log('local(log_recovery):', set(), mocker.MagicMock())
+
+    assert pending == set()
+    assert [job.name for job in retrieve_logfiles_in_bulk.call_args.args[0]] == ['a000_SIM', 'a000_POST']
+    assert [call.args[0].name for call in download_logfiles.call_args_list] == ['a000_POST']
+    assert [(call.args[0].name, call.args[1:]) for call in process_retrieved_logfiles.call_args_list] == \
+           [('a000_SIM', ()), ('a000_POST', (0, True))]
+    assert paramiko_platform.recovery_queue.empty()
+
+
+def test_recover_job_log_with_workers(paramiko_platform: ParamikoPlatform, mocker):
+    paramiko_platform.log_recovery_workers = 3
+    paramiko_platform.recovery_queue = Queue()
+    metrics_file = Path(paramiko_platform.tmp_path, 'ASLOGS', 'local_log_recovery_metrics.csv')
+    metrics_file.parent.mkdir(parents=True)
+    names = [f'a000_{i}_SIM' for i in range(12)]
+    for i, name in enumerate(names):
+        paramiko_platform.recovery_queue.put(Job(name, i + 1, Status.COMPLETED, 0).__getstate__())
+    sftp_client = mocker.patch('autosubmit.platforms.paramiko_platform.paramiko.SFTPClient')
+    channels = [mocker.MagicMock(name=f'channel{i}') for i in range(2)]
+    sftp_client.from_transport.side_effect = channels
+    paramiko_platform._ftpChannel = mocker.MagicMock(name='channel')
+    used_channels = set()
+    barrier = threading.Barrier(3, timeout=10)
+
+    def download_logfiles(job):
+        used_channels.add(job.platform._ftpChannel)
+        if job.name in names[:3]:
+            # The first three downloads run at the same time.
+            barrier.wait()
+        return 0, job.name != names[-1]
+
+    mocker.patch.object(Job, 'download_logfiles', autospec=True, side_effect=download_logfiles)
+    prefetch_stat_file = mocker.patch.object(ParamikoPlatform, 'prefetch_stat_file', autospec=True)
+    processed = []
+    mocker.patch.object(Job, 'process_retrieved_logfiles', autospec=True,
+                        side_effect=lambda job, *args, **kwargs: processed.append((job.name, job.platform)))
+
+    pending = paramiko_platform.recover_job_log('local(log_recovery):', set(), mocker.MagicMock())
+
+    assert pending == set()
+    assert used_channels == {paramiko_platform._ftpChannel, *channels}
+    assert prefetch_stat_file.call_count == len(names) - 1
+    # The statistics are written in the order of the queue, with the platform of the process.
+    assert processed == [(name, paramiko_platform) for name in names]
+    for channel in channels:
+        channel.close.assert_called_once()
+    assert not paramiko_platform._ftpChannel.close.called
+    metrics = metrics_file.read_text().splitlines()
+    assert metrics[0] == 'time,jobs,workers,duration,mean_latency,max_latency'
+    assert metrics[1].split(',')[1:3] == ['12', '3']
+
+
+def _upload_platform(paramiko_platform: ParamikoPlatform, mocker, tmp_path: Path) -> ParamikoPlatform:
+    remote_dir = tmp_path / 'remote' / 'LOG_a000'
+    remote_dir.mkdir(parents=True)
+    Path(paramiko_platform.tmp_path).mkdir(parents=True)
+    paramiko_platform.remote_log_dir = str(remote_dir)
+    mocker.patch.object(paramiko_platform, 'check_remote_log_dir')
+    paramiko_platform._ftpChannel = mocker.MagicMock()
+    paramiko_platform._ftpChannel.put.side_effect = lambda local, remote: Path(remote).write_bytes(
+        Path(local).read_bytes())
+
+    def send_command(command, *_, **__):
+        process = subprocess.run(['bash', '-c', command], capture_output=True, text=True)
+        paramiko_platform._ssh_output, paramiko_platform._ssh_output_err = process.stdout, process.stderr
+        paramiko_platform._ssh_exit_status = process.returncode
+        return True
+
+    mocker.patch.object(paramiko_platform, 'send_command', side_effect=send_command)
+    return paramiko_platform
+
+
+def test_send_files_in_one_archive(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _upload_platform(paramiko_platform, mocker, tmp_path)
+    remote_dir = Path(platform.remote_log_dir)
+    (remote_dir / 'a000_SIM.cmd').write_text('old')
+    for i, name in enumerate(['a000_SIM.cmd', 'a000_POST.cmd', 'a000_CLEAN.cmd']):
+        local_file = Path(platform.tmp_path, name)
+        local_file.write_text(f'echo {i}')
+        local_file.chmod(0o750 if i else 0o700)
+    send_file = mocker.patch.object(platform, 'send_file')
+
+    assert platform.send_files(['a000_SIM.cmd', 'a000_POST.cmd', 'a000_CLEAN.cmd'])
+
+    platform._ftpChannel.put.assert_called_once()
+    assert not send_file.called
+    assert sorted(path.name for path in remote_dir.iterdir()) == ['a000_CLEAN.cmd', 'a000_POST.cmd', 'a000_SIM.cmd']
+    assert (remote_dir / 'a000_SIM.cmd').read_text() == 'echo 0'
+    assert (remote_dir / 'a000_SIM.cmd').stat().st_mode & 0o777 == 0o700
+    assert (remote_dir / 'a000_POST.cmd').stat().st_mode & 0o777 == 0o750
+    assert sorted(path.name for path in Path(platform.tmp_path).iterdir()) == [
+        'a000_CLEAN.cmd', 'a000_POST.cmd', 'a000_SIM.cmd']
+
+
+def test_upload_batch_sends_the_files_at_the_end(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _upload_platform(paramiko_platform, mocker, tmp_path)
+    names = [f'a000_{i}_SIM.cmd' for i in range(5)]
+    for name in names:
+        Path(platform.tmp_path, name).write_text(name)
+
+    with platform.upload_batch():
+        platform.send_files(names[:2])
+        with platform.upload_batch():
+            platform.send_files(names[2:])
+        assert not platform._ftpChannel.put.called
+
+    platform._ftpChannel.put.assert_called_once()
+    assert sorted(path.name for path in Path(platform.remote_log_dir).iterdir()) == names
+    assert platform._pending_uploads is None
+
+
+def test_send_files_one_by_one_if_the_archive_fails(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _upload_platform(paramiko_platform, mocker, tmp_path)
+    mocker.patch.object(platform, 'send_command', side_effect=AutosubmitError('tar: command not found', 7052))
+    send_file = mocker.patch.object(platform, 'send_file')
+    for name in ['a000_SIM.cmd', 'a000_POST.cmd']:
+        Path(platform.tmp_path, name).write_text(name)
+
+    assert platform.send_files(['a000_SIM.cmd', 'a000_POST.cmd', 'a000_SIM.cmd'])
+
+    assert [call.args[0] for call in send_file.call_args_list] == ['a000_SIM.cmd', 'a000_POST.cmd']
+
+
+def test_send_files_one_by_one_if_tar_fails(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _upload_platform(paramiko_platform, mocker, tmp_path)
+    remote_dir = Path(platform.remote_log_dir)
+    # A truncated archive, the first files may be extracted before tar fails.
+    platform._ftpChannel.put.side_effect = lambda local, remote: Path(remote).write_bytes(
+        Path(local).read_bytes()[:40])
+    send_file = mocker.patch.object(platform, 'send_file')
+    for name in ['a000_SIM.cmd', 'a000_POST.cmd']:
+        Path(platform.tmp_path, name).write_text(name * 100)
+
+    assert platform.send_files(['a000_SIM.cmd', 'a000_POST.cmd'])
+
+    assert [call.args[0] for call in send_file.call_args_list] == ['a000_SIM.cmd', 'a000_POST.cmd']
+    assert not list(remote_dir.glob('*.tar.gz'))
+
+
+def test_upload_batch_does_not_upload_after_an_error(paramiko_platform: ParamikoPlatform, mocker, tmp_path):
+    platform = _upload_platform(paramiko_platform, mocker, tmp_path)
+    for name in ['a000_SIM.cmd', 'a000_POST.cmd']:
+        Path(platform.tmp_path, name).write_text(name)
+
+    with pytest.raises(AutosubmitCritical):
+        with platform.upload_batch():
+            platform.send_files(['a000_SIM.cmd', 'a000_POST.cmd'])
+            raise AutosubmitCritical('Invalid job', 7014)
+
+    assert not platform._ftpChannel.put.called
+    assert platform._pending_uploads is None
+
+
+def test_submit_ready_jobs_fails_the_packages_if_the_upload_fails(paramiko_platform: ParamikoPlatform, mocker):
+    platform = paramiko_platform
+    generate_submit_script = mocker.patch.object(platform, 'generate_submit_script', create=True)
+    mocker.patch.object(platform, '_send_files_in_archive',
+                        side_effect=AutosubmitError('Cannot send file a000_POST.cmd', 6004))
+    packages = []
+    for job_id, name in [(0, 'a000_SIM'), (42, 'a000_POST')]:
+        package = mocker.Mock(x11='false', jobs=[mocker.Mock(id=job_id)])
+        package.submit.side_effect = lambda *_, name=name, **__: platform.send_files([f'{name}.cmd'])
+        packages.append(package)
+
+    with platform.upload_batch():
+        save, failed_packages, _, valid_packages, any_job_submitted = platform.submit_ready_jobs(
+            mocker.Mock(), mocker.MagicMock(), mocker.Mock(), packages)
+
+    platform._send_files_in_archive.assert_called_once_with(['a000_SIM.cmd', 'a000_POST.cmd'])
+    assert failed_packages == [42]
+    assert valid_packages == []
+    assert not any_job_submitted
+    # The submission commands of the packages are discarded.
+    assert generate_submit_script.call_count == 2
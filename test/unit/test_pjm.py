@@ -153,6 +153,16 @@ def test_parse_all_jobs_output(remote_platform):
         assert remote_platform.parse_all_jobs_output(_EXPECTED_OUTPUT, job_id) == []
 
 
+def test_parse_all_jobs_statuses(remote_platform):
+    """Test parsing of all jobs output at once."""
+    statuses = remote_platform.parse_all_jobs_statuses(_EXPECTED_OUTPUT)
+    for job_id in _EXPECTED_COMPLETED_JOBS:
+        assert statuses[job_id] == remote_platform.parse_all_jobs_output(_EXPECTED_OUTPUT, job_id)
+    assert remote_platform._check_jobid_in_queue(_EXPECTED_OUTPUT, '+'.join(_EXPECTED_COMPLETED_JOBS))
+    # Only whole job IDs are found.
+    assert not remote_platform._check_jobid_in_queue(_EXPECTED_OUTPUT, _EXPECTED_COMPLETED_JOBS[0][:-1])
+
+
 def test_get_submitted_job_id(remote_platform):
     """Test parsing of submitted job id."""
     submitted_ok = "[INFO] PJM 0000 pjsub Job 167661 submitted."
@@ -207,7 +217,8 @@ def test_get_queue_status(mocker, create_jobs: list[Job], pjm_platform: 'PJMPlat
         if 'WAITING' in parse_queue_reason:
             job.hold = True
     mocker.patch('autosubmit.platforms.pjmplatform.PJMPlatform.send_command', return_value = True)
-    mocker.patch('autosubmit.platforms.pjmplatform.PJMPlatform.parse_queue_reason', return_value = parse_queue_reason)
+    mocker.patch('autosubmit.platforms.pjmplatform.PJMPlatform.parse_queue_reasons',
+                 return_value={str(job_id): parse_queue_reason for job_id in jobs_id})
     pjm_platform.get_queue_status(in_queue_jobs, jobs_id, as_conf)
     assert result == in_queue_jobs[0].new_status
 
@@ -0,0 +1,193 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.platforms.remote_manifest`` and its use by the Slurm platform."""
+
+from pathlib import Path
+
+import pytest
+
+from autosubmit.platforms.remote_manifest import (
+    MANIFEST_DISABLED_TTL, MANIFEST_MAX_FAILURES, MANIFEST_MISS_REFRESH, MANIFEST_MISS_TTL, RemoteFile,
+    RemoteManifest
+)
+from autosubmit.platforms.slurmplatform import SlurmPlatform
+
+_LOG_DIR = '/scratch/a000/LOG_a000'
+_LISTING = 'a000_SIM_STAT_0\t24\t1700000000.5\na000_SIM_COMPLETED\t0\t1700000001.0\nmalformed line\n'
+
+
+def test_manifest_lookup(mocker):
+    now = mocker.patch('autosubmit.platforms.remote_manifest.time.time', return_value=1000.0)
+    manifest = RemoteManifest(ttl=30, miss_ttl=2)
+    assert manifest.lookup('a000_SIM_STAT_0') is None
+
+    manifest.update(_LISTING)
+    assert manifest.get('a000_SIM_STAT_0') == RemoteFile(24, 1700000000.5)
+    assert manifest.lookup('a000_SIM_STAT_0') is True
+    assert manifest.lookup('a000_POST_STAT_0') is False
+
+    # A missing file may have been written since the listing.
+    now.return_value = 1010.0
+    assert manifest.lookup('a000_SIM_STAT_0') is True
+    assert manifest.lookup('a000_POST_STAT_0') is None
+
+    manifest.discard('a000_SIM_STAT_0')
+    manifest.add('a000_SIM.cmd')
+    assert manifest.lookup('a000_SIM_STAT_0') is None
+    assert manifest.lookup('a000_SIM.cmd') is True
+
+    now.return_value = 1031.0
+    assert manifest.lookup('a000_SIM_COMPLETED') is None
+
+
+def test_manifest_forgotten_by_another_thread(mocker):
+    manifest = RemoteManifest()
+    manifest.update(_LISTING)
+
+    def time():
+        # Another worker fails to list the directory while this one reads the manifest.
+        manifest.failed()
+        return 1000.0
+
+    mocker.patch('autosubmit.platforms.remote_manifest.time.time', side_effect=time)
+    manifest.update(_LISTING)
+    assert manifest.lookup('a000_SIM_STAT_0') is True
+    assert manifest.lookup('a000_SIM_STAT_0') is None
+
+
+@pytest.fixture
+def platform(autosubmit_config, mocker):
+    as_conf = autosubmit_config('a000', experiment_data={})
+    platform = SlurmPlatform(expid='a000', name='remote', config=as_conf.experiment_data)
+    platform.remote_log_dir = _LOG_DIR
+    platform._ftpChannel = mocker.MagicMock()
+    mocker.patch('autosubmit.platforms.slurmplatform.sleep')
+    return platform
+
+
+def _listing_command(platform, mocker, output=_LISTING, error='', exit_status=0):
+    def send_command(command, *_, **__):
+        platform._ssh_output = output
+        platform._ssh_output_err = error
+        platform._ssh_exit_status = exit_status
+        return True
+
+    return mocker.patch.object(platform, 'send_command', side_effect=send_command)
+
+
+def test_check_file_exists_lists_the_directory_once(platform, mocker):
+    send_command = _listing_command(platform, mocker)
+
+    assert platform.check_file_exists('a000_SIM_STAT_0')
+    assert platform.check_file_exists(f'{_LOG_DIR}/a000_SIM_COMPLETED')
+    assert not platform.check_file_exists('a000_POST_STAT_0')
+
+    assert send_command.call_count == 1
+    assert not platform._ftpChannel.stat.called
+
+
+def test_missing_file_is_checked_alone(platform, mocker):
+    now = mocker.patch('autosubmit.platforms.remote_manifest.time.time', return_value=1000.0)
+    send_command = _listing_command(platform, mocker)
+    assert platform.check_file_exists('a000_SIM_STAT_0')
+
+    # Missing from a listing a few seconds old, only that file is checked.
+    now.return_value += MANIFEST_MISS_TTL + 1
+    platform._ftpChannel.stat.side_effect = [FileNotFoundError(), mocker.MagicMock()]
+    assert not platform.check_file_exists('a000_POST_STAT_0')
+    assert platform.check_file_exists('a000_POST_STAT_0')
+    assert platform.check_file_exists('a000_POST_STAT_0')
+    assert platform._ftpChannel.stat.call_count == 2
+    assert send_command.call_count == 1
+
+    now.return_value += MANIFEST_MISS_REFRESH
+    assert not platform.check_file_exists('a000_INI_STAT_0')
+    assert send_command.call_count == 2
+    assert platform._ftpChannel.stat.call_count == 2
+
+
+def test_deleted_files_are_not_found(platform, mocker):
+    _listing_command(platform, mocker)
+
+    assert platform.check_file_exists('a000_SIM_STAT_0')
+    platform.delete_file('a000_SIM_STAT_0')
+    assert not platform.check_file_exists('a000_SIM_STAT_0')
+
+
+def test_check_file_exists_falls_back_to_stat(platform, mocker):
+    now = mocker.patch('autosubmit.platforms.remote_manifest.time.time', return_value=1000.0)
+    log = mocker.patch('autosubmit.platforms.paramiko_platform.Log')
+    send_command = _listing_command(platform, mocker, output='', error="find: unknown predicate '-printf'",
+                                    exit_status=1)
+
+    for _ in range(MANIFEST_MAX_FAILURES + 2):
+        assert platform.check_file_exists('a000_SIM_COMPLETED')
+
+    # The listing is not tried again for a while after a few failures.
+    assert send_command.call_count == MANIFEST_MAX_FAILURES
+    assert log.warning.call_count == 1
+    assert "unknown predicate '-printf'" in log.warning.call_args[0][0]
+    platform._ftpChannel.stat.assert_called_with(str(Path(_LOG_DIR, 'a000_SIM_COMPLETED')))
+
+    now.return_value += MANIFEST_DISABLED_TTL
+    assert platform.check_file_exists('a000_SIM_COMPLETED')
+    assert send_command.call_count == MANIFEST_MAX_FAILURES + 1
+
+
+def test_listing_with_errors_is_used(platform, mocker):
+    # Warnings of a successful listing, and a file removed while listing.
+    for error, exit_status in (('warning: something harmless', 0),
+                               ("find: 'a000_POST_STAT_0': No such file or directory", 1)):
+        send_command = _listing_command(platform, mocker, error=error, exit_status=exit_status)
+        platform._remote_manifest.invalidate()
+
+        assert platform.check_file_exists('a000_SIM_STAT_0')
+        assert not platform.check_file_exists('a000_POST_STAT_0')
+        assert send_command.call_count == 1
+        assert not platform._ftpChannel.stat.called
+
+    assert platform._remote_manifest.enabled()
+
+
+def test_listing_failures_must_be_in_a_row(platform, mocker):
+    for _ in range(MANIFEST_MAX_FAILURES):
+        _listing_command(platform, mocker, output='', error='Connection reset', exit_status=255)
+        assert not platform.refresh_remote_manifest()
+        _listing_command(platform, mocker)
+        assert platform.refresh_remote_manifest()
+
+    assert platform._remote_manifest.enabled()
+
+
+def test_files_outside_the_log_directory_are_stat(platform, mocker):
+    send_command = _listing_command(platform, mocker)
+
+    assert platform.check_file_exists('/scratch/a000/other/a000_SIM_STAT_0')
+
+    assert not send_command.called
+    assert platform._ftpChannel.stat.called
+
+
+def test_get_completed_job_names_uses_the_manifest(platform, mocker):
+    _listing_command(platform, mocker)
+    platform.refresh_remote_manifest()
+    send_command = _listing_command(platform, mocker, output=f'{_LOG_DIR}/a000_POST_COMPLETED\n')
+
+    assert platform.get_completed_job_names(['a000_SIM', 'a000_POST']) == ['a000_SIM', 'a000_POST']
+    send_command.assert_called_once()
+    assert "a000_SIM_COMPLETED" not in send_command.call_args[0][0]
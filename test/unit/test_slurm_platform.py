@@ -16,6 +16,7 @@
 # along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -189,3 +190,58 @@ def test_submit_job(mocker, slurm_platform):
     slurm_platform._ssh_output = "10000\n"
     jobs_id = slurm_platform.submit_job(job, "dummy")
     assert jobs_id == 10000
+
+
+def test_parse_queue_status(platform):
+    output = '1001,2025-03-01T10:30:00,(Priority)\n1002,N/A,(JobHeldUser)\n1003,N/A,node[1,3]'
+
+    assert platform.parse_queue_reason(output, '1001') == '(Priority)'
+    assert platform.parse_queue_reason(output, '1002') == '(JobHeldUser)'
+    assert platform.parse_queue_reason(output, '1003') == 'node[1,3]'
+    assert platform.parse_queue_start_time(output, '1001') == datetime(2025, 3, 1, 10, 30)
+    assert platform.parse_queue_start_time(output, '1002') is None
+    assert platform.parse_queue_start_time(output, '9999') is None
+
+
+def test_parse_all_jobs_statuses(platform):
+    output = ('     1234  COMPLETED\n'
+              '    12345    RUNNING\n'
+              '   2000_1    PENDING\n'
+              '   2000_2    RUNNING\n'
+              '   3000+0     FAILED\n'
+              '   3000+1  COMPLETED\n'
+              '\n')
+
+    statuses = platform.parse_all_jobs_statuses(output)
+
+    assert statuses == {'1234': 'COMPLETED', '12345': 'RUNNING', '2000': 'PENDING', '3000': 'FAILED'}
+    assert platform.parse_all_jobs_output(output, 1234) == 'COMPLETED'
+    assert platform.parse_all_jobs_output(output, 123) == []
+    assert platform._check_jobid_in_queue(output, '1234,12345,2000')
+    assert not platform._check_jobid_in_queue(output, '1234,123')
+
+
+def test_check_all_jobs_parses_the_output_once(mocker, platform):
+    mocker.patch('autosubmit.platforms.paramiko_platform.sleep')
+    jobs = [Job(f'a000_{i}', str(1000 + i), Status.QUEUING, 0) for i in range(3)]
+    platform.max_wallclock = ''
+    for job in jobs:
+        job.platform = platform
+        job.wallclock = '00:00'
+    outputs = {
+        'sacct': '1000 COMPLETED\n1001 RUNNING\n1002 PENDING\n',
+        'squeue': '1002,N/A,(Priority)\n',
+    }
+
+    def send_command(command, *_, **__):
+        platform._ssh_output = outputs[command.split()[0]]
+        return True
+
+    mocker.patch.object(platform, 'send_command', side_effect=send_command)
+    parse = mocker.spy(platform, 'parse_all_jobs_statuses')
+
+    platform.check_all_jobs([[job, Status.QUEUING] for job in jobs], mocker.MagicMock())
+
+    assert [job.new_status for job in jobs] == [Status.COMPLETED, Status.RUNNING, Status.QUEUING]
+    # Once to check that every job is in the output, and once to read the statuses.
+    assert parse.call_count == 2
@@ -0,0 +1,107 @@
+# Copyright 2015-2025 Earth Sciences Department, BSC-CNS
+#
+# This file is part of Autosubmit.
+#
+# Autosubmit is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Autosubmit is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Autosubmit.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for ``autosubmit.platforms.ssh_connection_pool`` and its use by the Paramiko platforms."""
+
+import pytest
+
+from autosubmit.platforms.paramiko_platform import ParamikoPlatform
+from autosubmit.platforms.ssh_connection_pool import ConnectionKey, SSHConnectionPool
+
+_KEY = ConnectionKey('login1.example.org', 'user', 22, None)
+
+
+@pytest.fixture
+def pool() -> SSHConnectionPool:
+    return SSHConnectionPool(keepalive=15)
+
+
+def test_acquire_shares_the_connection_of_a_key(pool, mocker):
+    connect = mocker.Mock(side_effect=lambda: mocker.MagicMock(name='ssh'))
+
+    first = pool.acquire(_KEY, connect)
+    second = pool.acquire(_KEY, connect)
+    other = pool.acquire(_KEY._replace(user='other'), connect)
+
+    assert first is second
+    assert other is not first
+    assert connect.call_count == 2
+    first.get_transport.return_value.set_keepalive.assert_called_once_with(15)
+
+
+def test_release_closes_the_connection_when_it_is_not_used(pool, mocker):
+    ssh = pool.acquire(_KEY, lambda: mocker.MagicMock(name='ssh'))
+    pool.acquire(_KEY, lambda: mocker.MagicMock(name='other'))
+
+    pool.release(ssh)
+    assert not ssh.close.called
+    assert len(pool) == 1
+
+    pool.release(ssh)
+    ssh.close.assert_called_once()
+    ssh.get_transport.return_value.close.assert_called_once()
+    assert len(pool) == 0
+
+
+def test_connection_not_alive_is_replaced(pool, mocker):
+    dead = pool.acquire(_KEY, lambda: mocker.MagicMock(name='dead'))
+    dead.get_transport.return_value.is_active.return_value = False
+
+    new = pool.acquire(_KEY, lambda: mocker.MagicMock(name='new'))
+    assert new is not dead
+
+    # The platform still holding the dead connection closes it when it restores its own.
+    pool.release(dead)
+    dead.close.assert_called_once()
+    assert not new.close.called
+    assert len(pool) == 1
+
+
+def test_platforms_on_the_same_host_share_the_connection(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    pool = SSHConnectionPool()
+    mocker.patch('autosubmit.platforms.paramiko_platform.ssh_connection_pool', pool)
+    create_ssh_client = mocker.patch('autosubmit.platforms.paramiko_platform._create_ssh_client',
+                                     side_effect=lambda: mocker.MagicMock(name='ssh'))
+    mocker.patch.object(ParamikoPlatform, 'agent_auth', return_value=True)
+    from_transport = mocker.patch('autosubmit.platforms.paramiko_platform.paramiko.SFTPClient.from_transport')
+    config = {'LOCAL_ROOT_DIR': str(tmp_path), 'LOCAL_TMP_DIR': 'tmp'}
+
+    platforms = []
+    for name in ['serial', 'parallel']:
+        platform = ParamikoPlatform(expid='a000', name=name, config=config)
+        platform.host = 'login1.example.org'
+        platform.user = 'user'
+        platform.connect(None, log_recovery_process=True)
+        platforms.append(platform)
+
+    assert create_ssh_client.call_count == 1
+    assert platforms[0].transport is platforms[1].transport
+    # Each platform has its own SFTP channel.
+    assert from_transport.call_count == 2
+
+    # Restoring the connection reuses it while it is alive.
+    platforms[0].restore_connection(None, log_recovery_process=True)
+    assert create_ssh_client.call_count == 1
+
+    ssh = platforms[1]._ssh
+    platforms[0].close_connection()
+    platforms[0].close_connection()
+    assert not ssh.close.called
+    platforms[1].close_connection()
+    ssh.close.assert_called_once()
+    assert len(pool) == 0